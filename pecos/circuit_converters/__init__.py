@@ -22,3 +22,4 @@ data-structures.
 """
 
 from .std2chs import std2chs
+from .fuse_cliffords import fuse_cliffords
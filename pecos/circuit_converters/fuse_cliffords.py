@@ -0,0 +1,189 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Optimization pass that fuses runs of one-qubit Cliffords.
+
+Each one-qubit Clifford (up to a global phase) is one of 24 elements, which are identified by how they conjugate X and
+Z. A multiplication table of these elements is computed once, and consecutive one-qubit Cliffords acting on the same
+qubit are replaced by the single gate symbol (bound by the simulators) of their product.
+"""
+
+from itertools import product
+from ..circuits import QuantumCircuit
+
+# Symbol => (image of X, image of Z)
+one_qubit_cliffords = {
+    'I': ('+X', '+Z'),
+
+    # Paulis
+    'X': ('+X', '-Z'),
+    'Y': ('-X', '-Z'),
+    'Z': ('-X', '+Z'),
+
+    # Square root of Paulis
+    'Q': ('+X', '-Y'),
+    'Qd': ('+X', '+Y'),
+    'R': ('-Z', '+X'),
+    'Rd': ('+Z', '-X'),
+    'S': ('+Y', '+Z'),
+    'Sd': ('-Y', '+Z'),
+
+    # Hadamard-like
+    'H': ('+Z', '+X'),
+    'H2': ('-Z', '-X'),
+    'H3': ('+Y', '-Z'),
+    'H4': ('-Y', '-Z'),
+    'H5': ('-X', '+Y'),
+    'H6': ('-X', '-Y'),
+
+    # Face rotations
+    'F1': ('+Y', '+X'),
+    'F1d': ('+Z', '+Y'),
+    'F2': ('-Z', '+Y'),
+    'F2d': ('-Y', '-X'),
+    'F3': ('+Y', '-X'),
+    'F3d': ('-Z', '-Y'),
+    'F4': ('+Z', '-Y'),
+    'F4d': ('-Y', '+X'),
+}
+
+# Other symbols the simulators bind to the same gates
+aliases = {
+    'H1': 'H',
+    'H+z+x': 'H',
+    'H-z-x': 'H2',
+    'H+y-z': 'H3',
+    'H-y-z': 'H4',
+    'H-x+y': 'H5',
+    'H-x-y': 'H6',
+}
+
+_PAULIS = ('X', 'Y', 'Z')
+
+
+def _pauli_product(pauli1, pauli2):
+    """
+    Product of two signed Paulis (e.g., '+X', '-Z'), returned as the power of i and the resulting signed Pauli.
+    """
+
+    sign = (pauli1[0] == '-') ^ (pauli2[0] == '-')
+    p1, p2 = pauli1[1], pauli2[1]
+
+    if p1 == p2:
+        return 2 * sign, '+I'
+
+    # XY = iZ, YZ = iX, ZX = iY (and the reverse orders pick up -i)
+    p3 = ({'X', 'Y', 'Z'} - {p1, p2}).pop()
+    phase = 1 if (_PAULIS.index(p2) - _PAULIS.index(p1)) % 3 == 1 else 3
+
+    return (phase + 2 * sign) % 4, '+' + p3
+
+
+def _image(clifford, pauli):
+    """
+    Image of a signed Pauli under a Clifford given as (image of X, image of Z).
+    """
+
+    image_x, image_z = clifford
+    sign = pauli[0] == '-'
+
+    if pauli[1] == 'X':
+        image = image_x
+    elif pauli[1] == 'Z':
+        image = image_z
+    else:
+        # Y = iXZ
+        phase, image = _pauli_product(image_x, image_z)
+        phase = (phase + 1) % 4
+        if phase == 2:
+            sign = not sign
+        elif phase != 0:
+            raise Exception('Images %s do not describe a Clifford.' % str(clifford))
+
+    if sign:
+        return ('-' if image[0] == '+' else '+') + image[1]
+    return image
+
+
+def _multiplication_table():
+    """
+    Returns the table of symbol1, symbol2 => symbol of applying symbol1 and then symbol2.
+    """
+
+    symbols = {images: symbol for symbol, images in one_qubit_cliffords.items()}
+
+    table = {}
+    for first, second in product(one_qubit_cliffords, repeat=2):
+        images = tuple(_image(one_qubit_cliffords[second], p) for p in one_qubit_cliffords[first])
+        table[first, second] = symbols[images]
+
+    return table
+
+
+multiplication_table = _multiplication_table()
+
+
+def fuse_cliffords(quantum_circuit: QuantumCircuit) -> QuantumCircuit:
+    """
+    Returns a copy of a circuit in which the consecutive one-qubit Cliffords (without parameters) on each qubit are
+    replaced by a single gate.
+
+    A fused gate is placed in the tick of the last gate it replaces, so the number of ticks is unchanged. Runs that
+    multiply to the identity are removed. All other gates act as barriers and are kept as they are.
+
+    Args:
+        quantum_circuit (QuantumCircuit): The circuit to optimize.
+
+    Returns: QuantumCircuit
+
+    """
+
+    fused = QuantumCircuit(len(quantum_circuit), **quantum_circuit.metadata)
+
+    # qubit => (product of the pending gates, tick of the last one)
+    pending = {}
+
+    def flush(qubit):
+        symbol, tick = pending.pop(qubit)
+
+        if symbol != 'I':
+            fused.update(symbol, {qubit}, tick=tick)
+
+    for tick in range(len(quantum_circuit)):
+        for symbol, locations, params in quantum_circuit.items(tick=tick):
+
+            gate = aliases.get(symbol, symbol)
+
+            if gate in one_qubit_cliffords and not params:
+                for qubit in locations:
+                    if qubit in pending:
+                        pending[qubit] = (multiplication_table[pending[qubit][0], gate], tick)
+                    else:
+                        pending[qubit] = (gate, tick)
+
+            else:
+                for location in locations:
+                    for qubit in (location if isinstance(location, tuple) else (location, )):
+                        if qubit in pending:
+                            flush(qubit)
+
+                fused.update(symbol, set(locations), tick=tick, **params)
+
+    for qubit in list(pending):
+        flush(qubit)
+
+    return fused
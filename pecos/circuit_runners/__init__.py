@@ -18,3 +18,5 @@
 
 from . standard import Standard
 from .timing_runner import TimingRunner
+from .frame_sampler import FrameSampler
+from .compiled_sampler import CompiledSampler
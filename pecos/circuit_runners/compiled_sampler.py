@@ -0,0 +1,434 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+from ..misc.std_ouput import StdOutput
+from ..simulators import PauliFrameProp
+
+
+class _ColumnFrames(PauliFrameProp):
+    """
+    Pauli frames in which each bit (column) stands for one possible fault instead of one shot.
+
+    The random components that ``PauliFrameProp`` adds on initializations and measurements (and with
+    ``seed_stabilizers``) are given a new column each, so that after propagation every column holds the effect of
+    a single fault or of a single random stabilizer component.
+    """
+
+    def __init__(self, num_qubits):
+        super().__init__(num_qubits, 64, randomize=True)
+        self.columns = 0
+        self.gauge = []
+
+    def new_columns(self, num):
+        """
+        Reserves ``num`` new columns and returns the index of the first one.
+        """
+
+        self.reserve(num)
+
+        first = self.columns
+        self.columns += num
+
+        return first
+
+    def reserve(self, num):
+        """
+        Makes room for ``num`` more columns.
+
+        The gates update the frames in place with the rows returned by ``random_row``, so the frames can not be resized
+        while a gate is applied and the columns of the gates need to be reserved beforehand.
+        """
+
+        words = (self.columns + num + 63) // 64
+        if words > self.words:
+            self._grow(max(words, 2 * self.words))
+
+    def _grow(self, words):
+        padding = ((0, 0), (0, words - self.words))
+        self.x = np.pad(self.x, padding)
+        self.z = np.pad(self.z, padding)
+        self.meas_record = [np.pad(row, (0, words - self.words)) for row in self.meas_record]
+        self.words = words
+        self.shots = 64 * words
+
+    def column_row(self, column):
+        """
+        Returns a row with only the bit of ``column`` set.
+        """
+
+        row = np.zeros(self.words, dtype=np.uint64)
+        word, bit = divmod(column, 64)
+        row[word] = np.uint64(1) << np.uint64(bit)
+
+        return row
+
+    def random_row(self):
+        if self.columns >= 64 * self.words:
+            raise Exception('Not enough columns were reserved.')
+
+        column = self.columns
+        self.columns += 1
+        self.gauge.append(column)
+
+        return self.column_row(column)
+
+    def add_columns(self, columns):
+        """
+        Adds the Paulis of columns, given as (column, {qubit: Pauli symbol}) pairs, to the frames.
+        """
+
+        for column, paulis in columns:
+            row = self.column_row(column)
+
+            for qubit, symbol in paulis.items():
+                if symbol != 'Z':
+                    self.x[qubit] ^= row
+                if symbol != 'X':
+                    self.z[qubit] ^= row
+
+
+class CompiledSampler:
+    """
+    Samples shots of a noisy Clifford circuit from a map compiled from the circuit and its error model.
+
+    The Pauli errors generated by an error generator are independent choices, each made at one gate location: with some
+    probability one of a set of equally likely Paulis occurs. ``compile`` runs the circuit once without errors to get
+    reference measurement outcomes and propagates every possible Pauli of every location (as well as the random
+    stabilizer components of initializations and measurements, see ``PauliFrameProp``) as a separate Pauli frame through
+    the circuit, recording which measurements and logical operators each one flips.
+
+    Drawing a shot then no longer involves the circuit or the error generator: ``sample`` draws the faults of many shots
+    as NumPy arrays and flips the reference outcomes by the sum of their recorded effects. The compiled map can be reused
+    for any number of shots.
+
+    Attributes:
+        meas_keys (List[Tuple[Any, Any]]): (time, location) of each measurement, in the order of the columns of the
+            sampled outcomes.
+        reference (np.ndarray): Outcomes of the noiseless reference run.
+        num_faults (int): Number of faults (including the random stabilizer components) that flip a measurement or a
+            logical operator.
+        num_channels (int): Number of independent choices the faults are drawn from.
+    """
+
+    def __init__(self, meas_keys, reference, channel_probs, flip_indptr, flip_indices, logical_indptr=None,
+                 logical_indices=None, num_logicals=0):
+        """
+
+        Args:
+            meas_keys: (time, location) of each measurement.
+            reference: Outcomes of the noiseless reference run.
+            channel_probs: For each channel, the list of the probabilities of its faults. The faults of channel ``i``
+                are the next ``len(channel_probs[i])`` columns.
+            flip_indptr: CSR index pointer of the columns (faults) into ``flip_indices``.
+            flip_indices: Measurements flipped by each fault.
+            logical_indptr: CSR index pointer of the faults into ``logical_indices``.
+            logical_indices: Logical operators flipped by each fault.
+            num_logicals: Number of logical operators.
+        """
+
+        self.meas_keys = list(meas_keys)
+        self.reference = np.asarray(reference, dtype=np.uint8)
+        self.num_logicals = num_logicals
+
+        self.flip_indptr = np.asarray(flip_indptr, dtype=np.int64)
+        self.flip_indices = np.asarray(flip_indices, dtype=np.int64)
+
+        if logical_indptr is None:
+            logical_indptr = np.zeros(len(self.flip_indptr), dtype=np.int64)
+            logical_indices = np.zeros(0, dtype=np.int64)
+
+        self.logical_indptr = np.asarray(logical_indptr, dtype=np.int64)
+        self.logical_indices = np.asarray(logical_indices, dtype=np.int64)
+
+        self.num_channels = len(channel_probs)
+        self.num_faults = len(self.flip_indptr) - 1
+
+        # cumulative probabilities of the faults of each channel (padded so that no padding entry is chosen)
+        width = max([len(probs) for probs in channel_probs] + [1])
+        self._cumulative = np.full((self.num_channels, width), np.inf)
+        self._first = np.zeros(self.num_channels, dtype=np.int64)
+
+        first = 0
+        for i, probs in enumerate(channel_probs):
+            self._cumulative[i, :len(probs)] = np.cumsum(probs)
+            self._first[i] = first
+            first += len(probs)
+
+        self._total = np.array([sum(probs) for probs in channel_probs], dtype=float)
+
+    @classmethod
+    def compile(cls, state, circuit, error_gen=None, error_params=None, logical_ops=None):
+        """
+        Compiles a circuit and the errors of an error generator into a sampler.
+
+        Args:
+            state: A stabilizer simulator holding the initial (ideal) state. It is used for the reference run and ends
+                in the final noiseless state.
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_gen: Error generator. Its errors must be given by ``ErrorStaticSymbol``, ``ErrorSet``, or
+                ``ErrorSetMultiQuditGate`` (see ``Generator.error_channel``).
+            error_params (dict): Parameters for the error generator.
+            logical_ops: Logical operators (see ``PauliFrameProp.logical_signs``) whose flips are also sampled.
+
+        Returns: CompiledSampler
+
+        """
+
+        frames = _ColumnFrames(state.num_qubits)
+        frames.reserve(state.num_qubits)
+        frames.seed_stabilizers(state)
+
+        # (first column, fault probabilities)
+        channels = []
+        meas_keys = []
+        reference = []
+
+        if error_gen is not None:
+            error_gen.start(circuit, error_params)
+
+        for tick_circuit, time, params in circuit.iter_ticks():
+
+            # ------------------
+            # COMPILE THE ERRORS
+            # ------------------
+            before, after = [], []
+
+            if error_gen is not None and not params.get('error_free', False):
+                for location, is_after, probability, options in error_gen.tick_fault_channels(tick_circuit, time,
+                                                                                              **params):
+
+                    first = frames.new_columns(len(options))
+                    channels.append((first, [probability / len(options)] * len(options)))
+
+                    qubits = location if isinstance(location, tuple) else (location, )
+                    for column, option in enumerate(options, first):
+                        (after if is_after else before).append((column, cls._paulis(qubits, option)))
+
+            frames.add_columns(before)
+
+            # Gates add at most one random component per location.
+            frames.reserve(sum(len(locations) for _, locations, _ in tick_circuit.items()))
+
+            # ideal tick circuit
+            # ------------------
+            for symbol, locations, gate_params in tick_circuit.items():
+                is_meas = symbol.startswith('measure')
+
+                results = state.run_gate(symbol, locations, **gate_params)
+
+                for location in locations:
+                    frames.bindings[symbol](frames, location, **gate_params)
+
+                    if is_meas:
+                        meas_keys.append((time, location))
+                        reference.append(1 if results.get(location) else 0)
+
+            frames.add_columns(after)
+
+        for column in frames.gauge:
+            channels.append((column, [0.5]))
+
+        channels.sort(key=lambda channel: channel[0])
+
+        num_columns = frames.columns
+        flips = cls._column_indices(frames, frames.meas_record, num_columns)
+
+        if logical_ops:
+            logical_rows = [frames.pack(signs) for signs in frames.logical_signs(logical_ops)]
+            logicals = cls._column_indices(frames, logical_rows, num_columns)
+        else:
+            logical_ops = []
+            logicals = [[] for _ in range(num_columns)]
+
+        # Only keep the channels with a fault that has an effect.
+        channel_probs = []
+        flip_indices, logical_indices = [], []
+        for first, probs in channels:
+            columns = range(first, first + len(probs))
+
+            if any(flips[c] or logicals[c] for c in columns):
+                channel_probs.append(probs)
+                flip_indices.extend(flips[c] for c in columns)
+                logical_indices.extend(logicals[c] for c in columns)
+
+        flip_indptr, flip_indices = cls._to_csr(flip_indices)
+        logical_indptr, logical_indices = cls._to_csr(logical_indices)
+
+        return cls(meas_keys, reference, channel_probs, flip_indptr, flip_indices, logical_indptr, logical_indices,
+                   len(logical_ops))
+
+    @staticmethod
+    def _paulis(qubits, option):
+        """
+        Returns the {qubit: Pauli symbol} of one fault.
+        """
+
+        if len(option) != len(qubits):
+            raise Exception('Error %s does not match the qudits of location %s.' % (str(option), str(qubits)))
+
+        paulis = {}
+        for qubit, symbol in zip(qubits, option):
+            if symbol == 'I':
+                continue
+
+            if symbol not in ('X', 'Y', 'Z'):
+                raise Exception('Can only handle Pauli errors.')
+
+            paulis[qubit] = symbol
+
+        return paulis
+
+    @staticmethod
+    def _column_indices(frames, rows, num_columns, block=64):
+        """
+        Returns, for each column, the list of the indices of the packed rows that have its bit set.
+        """
+
+        indices = [[] for _ in range(num_columns)]
+
+        if not len(rows):
+            return indices
+
+        rows = np.array(rows)
+
+        # unpack a block of words at a time to limit memory
+        for start in range(0, rows.shape[1], block):
+            bits = np.unpackbits(np.ascontiguousarray(rows[:, start:start + block]).view(np.uint8), axis=-1,
+                                 bitorder='little')
+            for row, column in zip(*np.nonzero(bits)):
+                column += 64 * start
+                if column < num_columns:
+                    indices[column].append(int(row))
+
+        return indices
+
+    @staticmethod
+    def _to_csr(indices):
+        indptr = np.zeros(len(indices) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(ids) for ids in indices])
+        flat = np.array([i for ids in indices for i in ids], dtype=np.int64)
+
+        return indptr, flat
+
+    def sample(self, shots, detectors=None, separate_logicals=False, chunk_size=None, rng=None):
+        """
+        Samples the measurement outcomes of ``shots`` runs.
+
+        Args:
+            shots (int): Number of shots.
+            detectors (Iterable[Iterable[int]]): If given, the parities of these sets of measurement indices (columns of
+                the outcomes) are returned instead of the outcomes.
+            separate_logicals (bool): Whether to also return the flips of the logical operators given to ``compile``.
+            chunk_size (int): Number of shots drawn at once (chosen to limit memory if None). The samples drawn from a
+                ``np.random.Generator`` do not depend on it.
+            rng (np.random.Generator): Random number generator (the global state of ``np.random`` if None).
+
+        Returns: A (shots, measurements) array of outcomes (or (shots, detectors) array of parities). If
+            ``separate_logicals`` is True, a tuple of it and a (shots, logical operators) array of flips.
+
+        """
+
+        if rng is None:
+            rng = np.random
+
+        num_meas = len(self.reference)
+
+        outcomes = np.zeros((shots, num_meas), dtype=np.uint8)
+        logicals = np.zeros((shots, self.num_logicals), dtype=np.uint8)
+
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 22) // max(1, self.num_channels))
+
+        for start in range(0, shots, chunk_size):
+            stop = min(shots, start + chunk_size)
+            shot_ids, columns = self._draw(stop - start, rng)
+
+            outcomes[start:stop] = self._parities(shot_ids, columns, self.flip_indptr, self.flip_indices,
+                                                  stop - start, num_meas)
+
+            if separate_logicals:
+                logicals[start:stop] = self._parities(shot_ids, columns, self.logical_indptr, self.logical_indices,
+                                                      stop - start, self.num_logicals)
+
+        outcomes ^= self.reference
+
+        if detectors is not None:
+            detectors = [list(d) for d in detectors]
+            parities = np.zeros((shots, len(detectors)), dtype=np.uint8)
+            for i, detector in enumerate(detectors):
+                parities[:, i] = np.bitwise_xor.reduce(outcomes[:, detector], axis=1)
+            outcomes = parities
+
+        if separate_logicals:
+            return outcomes, logicals
+
+        return outcomes
+
+    def _draw(self, shots, rng):
+        """
+        Draws the faults of ``shots`` shots from ``rng``.
+
+        Returns: The shot index and column of each fault that occurred.
+
+        """
+
+        rand = rng.random((shots, self.num_channels))
+        shot_ids, channels = np.nonzero(rand < self._total)
+
+        # index of the fault chosen within each channel that fired
+        choices = (rand[shot_ids, channels][:, None] >= self._cumulative[channels]).sum(axis=1)
+
+        return shot_ids, self._first[channels] + choices
+
+    @staticmethod
+    def _parities(shot_ids, columns, indptr, indices, shots, width):
+        """
+        Returns the (shots, width) parities of the entries flipped by the faults.
+        """
+
+        counts = indptr[columns + 1] - indptr[columns]
+        total = counts.sum()
+
+        if not total:
+            return np.zeros((shots, width), dtype=np.uint8)
+
+        offsets = np.repeat(indptr[columns] - np.cumsum(counts) + counts, counts) + np.arange(total)
+        entries = np.repeat(shot_ids, counts) * width + indices[offsets]
+
+        parities = np.bincount(entries, minlength=shots * width) & 1
+
+        return parities.reshape(shots, width).astype(np.uint8)
+
+    def shot_output(self, outcomes, shot):
+        """
+        Returns the outcomes of one shot in the format ``Standard.run`` records them.
+
+        Args:
+            outcomes (np.ndarray): Outcomes returned by ``sample``.
+            shot (int): Index of the shot.
+
+        Returns: StdOutput
+
+        """
+
+        output = StdOutput()
+
+        for (time, location), result in zip(self.meas_keys, outcomes[shot]):
+            if result:
+                output.record({location: 1}, time)
+
+        return output
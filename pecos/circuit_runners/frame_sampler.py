@@ -0,0 +1,186 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+from .standard import Standard
+from ..misc.std_ouput import StdOutput
+from ..misc.random_streams import using_rng
+from ..simulators import PauliFrameProp
+
+
+class FrameSampler(Standard):
+    """
+    Samples many shots of a noisy Clifford circuit at once.
+
+    The circuit is run once without errors on a stabilizer simulator to get reference measurement outcomes. The errors of
+    all the shots are drawn together up front (see ``ParentErrorGen.generate_pauli_faults``) and carried as Pauli frames
+    (see ``PauliFrameProp``) through the same ticks, and the outcome of each shot is the reference outcome flipped by its
+    frame.
+
+    Attributes:
+        meas_keys (List[Tuple[Any, Any]]): (time, location) of each measurement, in the order of the columns of the
+            sampled outcomes.
+        reference (np.ndarray): Outcomes of the noiseless reference run.
+    """
+
+    def __init__(self, seed=None):
+        """
+
+        Args:
+            seed:
+        """
+
+        super().__init__(seed)
+
+        self.meas_keys = []
+        self.reference = None
+
+    def run(self, state, circuit, shots=1, error_gen=None, error_params=None, randomize=True, rng=None):
+        """
+        Samples the measurement outcomes of ``shots`` runs of ``circuit``.
+
+        Args:
+            state: A stabilizer simulator holding the initial (ideal) state. It is used for the reference run and ends
+                in the final noiseless state.
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            shots (int): Number of shots.
+            error_gen: Error generator. The errors of all the shots are drawn at once with its
+                ``generate_pauli_faults``, so they must be Pauli errors. Generators with custom error functions raise an
+                exception before the circuit is run (see ``Generator.unlisted_gates``).
+            error_params (dict): Parameters for the error generator.
+            randomize (bool): Whether the frames are randomized by stabilizers (see ``PauliFrameProp``).
+            rng (np.random.Generator): If given, the errors, the random components of the frames, and the random
+                outcomes of the reference run are drawn from it instead of from the global state of ``np.random``.
+
+        Returns: Tuple of a (shots, measurements) array of outcomes and the final ``PauliFrameProp``.
+
+        """
+
+        if rng is not None:
+            with using_rng(rng, state, error_gen):
+                return self.run(state, circuit, shots, error_gen, error_params, randomize)
+
+        frames = PauliFrameProp(state.num_qubits, shots, randomize=randomize)
+        # The frames draw their random stabilizer components from the same generator as the state.
+        frames.rng = state.rng
+        frames.seed_stabilizers(state)
+
+        meas_keys = []
+        reference = []
+
+        # time => (errors before the tick, errors after the tick)
+        if error_gen is None:
+            errors = {}
+        else:
+            errors = self._pack_errors(*error_gen.generate_pauli_faults(circuit, error_params, shots))
+
+        for tick_circuit, time, params in circuit.iter_ticks():
+
+            before, after = errors.get(time, (None, None))
+
+            if before is not None:
+                self._apply(frames, before)
+
+            # ideal tick circuit
+            # ------------------
+            for symbol, locations, gate_params in tick_circuit.items():
+                is_meas = symbol.startswith('measure')
+
+                # The frames do not depend on the state, so the gates of the symbol are run on the state first.
+                results = state.run_gate(symbol, locations, **gate_params)
+
+                for location in locations:
+                    frames.bindings[symbol](frames, location, **gate_params)
+
+                    if is_meas:
+                        meas_keys.append((time, location))
+                        reference.append(1 if results.get(location) else 0)
+
+            if after is not None:
+                self._apply(frames, after)
+
+        self.meas_keys = meas_keys
+        self.reference = np.array(reference, dtype=np.uint8)
+
+        outcomes = frames.outcome_flips() ^ self.reference
+
+        return outcomes, frames
+
+    @staticmethod
+    def _pack_errors(times, shot_ids, ticks, after, qudits, opcodes):
+        """
+        Groups the Paulis of all the shots by tick and converts them to frame updates.
+
+        Returns: Dictionary of time => (update before the tick, update after the tick), where an update is a tuple of the
+            qudit, word, bit mask, and opcode of each Pauli (or None if there are none).
+
+        """
+
+        shot_ids = np.asarray(shot_ids, dtype=np.int64)
+        keys = 2 * np.asarray(ticks, dtype=np.int64) + np.asarray(after, dtype=np.int64)
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        qudits = np.asarray(qudits, dtype=np.int64)[order]
+        opcodes = np.asarray(opcodes, dtype=np.uint8)[order]
+        words = shot_ids[order] // 64
+        bits = np.uint64(1) << (shot_ids[order] % 64).astype(np.uint64)
+
+        bounds = np.searchsorted(keys, np.arange(2 * len(times) + 1)).tolist()
+
+        errors = {}
+        for tick, time in enumerate(times):
+            updates = []
+            for key in (2 * tick, 2 * tick + 1):
+                start, stop = bounds[key], bounds[key + 1]
+                updates.append((qudits[start:stop], words[start:stop], bits[start:stop], opcodes[start:stop])
+                               if stop > start else None)
+
+            errors[time] = tuple(updates)
+
+        return errors
+
+    @staticmethod
+    def _apply(frames, update):
+        """
+        Multiplies the Paulis of an update into the frames of their shots.
+        """
+
+        qudits, words, bits, opcodes = update
+
+        for frame, mask in ((frames.x, 1), (frames.z, 2)):
+            has = (opcodes & mask).astype(bool)
+            np.bitwise_xor.at(frame, (qudits[has], words[has]), bits[has])
+
+    def shot_output(self, outcomes, shot):
+        """
+        Returns the outcomes of one shot in the format ``Standard.run`` records them.
+
+        Args:
+            outcomes (np.ndarray): Outcomes returned by ``run``.
+            shot (int): Index of the shot.
+
+        Returns: StdOutput
+
+        """
+
+        output = StdOutput()
+
+        for (time, location), result in zip(self.meas_keys, outcomes[shot]):
+            if result:
+                output.record({location: 1}, time)
+
+        return output
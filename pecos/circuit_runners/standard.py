@@ -21,6 +21,8 @@ import os
 import random
 import numpy as np
 from ..misc.std_ouput import StdOutput
+from ..misc.random_streams import shot_rng, using_rng
+from ..error_gens.fault_array import FaultArray
 
 
 class Standard(object):
@@ -43,8 +45,23 @@ class Standard(object):
         np.random.seed(self.seed)
         random.seed(self.seed)
 
+    def shot_rng(self, shot):
+        """
+        Returns the random number generator of a shot, derived from ``seed`` and the index of the shot (see
+        ``pecos.misc.random_streams``). Passing it to ``run`` makes the shot reproducible no matter which other shots
+        are run, or in which process.
+
+        Args:
+            shot (int): Index of the shot.
+
+        Returns: np.random.Generator
+
+        """
+
+        return shot_rng(self.seed, shot)
+
     @staticmethod
-    def run(state, circuit, error_gen=None, error_params=None, error_circuits=None, output=None):
+    def run(state, circuit, error_gen=None, error_params=None, error_circuits=None, output=None, rng=None):
         """
 
         Args:
@@ -52,13 +69,19 @@ class Standard(object):
             circuit:
             error_gen:
             error_params:
-            error_circuits:
+            error_circuits: ``ErrorCircuits`` or a ``FaultArray`` of errors to apply instead of generating them.
             output:
+            rng (np.random.Generator): If given, the error generator and the random measurement outcomes of ``state``
+                draw from it instead of from the global state of ``np.random``.
 
         Returns:
 
         """
 
+        if rng is not None:
+            with using_rng(rng, state, error_gen):
+                return Standard.run(state, circuit, error_gen, error_params, error_circuits, output)
+
         if output is None:
             output = StdOutput()
 
@@ -69,6 +92,9 @@ class Standard(object):
         # Initialize errors...
         # --------------------
 
+        if isinstance(error_circuits, FaultArray) and error_gen is None:
+            return Standard._run_fault_array(state, circuit, error_circuits, output)
+
         if error_gen is None:  # No errors
 
             generate_errors = False
@@ -82,12 +108,12 @@ class Standard(object):
 
         # run through the circuits...
         # ---------------------------
-        for tick_circuit, time, params in circuit.iter_ticks():
+        for tick_circuit, time, params, error_free in tape(circuit):
 
             # ---------------
             # GENERATE ERRORS
             # ---------------
-            if params.get('error_free', False):
+            if error_free:
                 errors = {}
             else:
                 if generate_errors:
@@ -114,3 +140,59 @@ class Standard(object):
                 state.run_circuit(after_errors)
 
         return output, error_circuits
+
+    @staticmethod
+    def _run_fault_array(state, circuit, fault_array, output):
+        """
+        Runs a circuit with the errors of a ``FaultArray``. The faults are sorted by tick, so they are applied by
+        stepping through the ticks that have faults as the circuit is run.
+        """
+
+        fault_ticks = fault_array.ticks()
+        next_fault = next(fault_ticks, None)
+
+        for tick_circuit, time, params, error_free in tape(circuit):
+
+            if next_fault is None or next_fault[0] != time:
+                output.record(state.run_circuit(tick_circuit), time)
+                continue
+
+            _, before_errors, after_errors = next_fault
+            next_fault = next(fault_ticks, None)
+
+            if error_free:
+                before_errors = after_errors = ()
+
+            for symbol, qudits in before_errors:
+                state.run_gate(symbol, qudits)
+
+            output.record(state.run_circuit(tick_circuit), time)
+
+            for symbol, qudits in after_errors:
+                state.run_gate(symbol, qudits)
+
+        if next_fault is not None:
+            raise Exception('The FaultArray has faults at time %s, which is not a tick of the circuit (or is out of '
+                            'order).' % str(next_fault[0]))
+
+        return output, fault_array
+
+
+def tape(circuit):
+    """
+    Returns the ticks of a circuit as (tick circuit, time, params, error free) tuples.
+
+    Circuits that cache their ticks (see ``LogicalCircuit.tape``) are not walked again.
+
+    Args:
+        circuit: A ``QuantumCircuit``, ``LogicalCircuit``, or other object with an ``iter_ticks`` method.
+
+    Returns: Iterable of tuples
+
+    """
+
+    if hasattr(circuit, 'tape'):
+        return circuit.tape()
+
+    return ((tick_circuit, time, params, params.get('error_free', False))
+            for tick_circuit, time, params in circuit.iter_ticks())
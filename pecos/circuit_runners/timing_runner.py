@@ -17,7 +17,7 @@
 #  =========================================================================  #
 
 from time import perf_counter as default_timer
-from .standard import Standard
+from .standard import Standard, tape
 
 
 class TimingRunner(Standard):
@@ -35,6 +35,7 @@ class TimingRunner(Standard):
         super().__init__(seed)
 
         self.total_time = 0.0
+        self.last_time = 0.0
         self.num_gates = 0
 
         if timer is None:
@@ -50,8 +51,38 @@ class TimingRunner(Standard):
 
         """
         self.total_time = 0.0
+        self.last_time = 0.0
         self.num_gates = 0
 
+    def run(self, state, circuit, error_gen=None, error_params=None, error_circuits=None, output=None, rng=None):
+        """
+        Runs a circuit as ``Standard.run`` does. The time taken is stored in ``last_time`` and added to
+        ``total_time``, and the number of gate locations of the circuit is added to ``num_gates``.
+
+        Args:
+            state:
+            circuit:
+            error_gen:
+            error_params:
+            error_circuits:
+            output:
+            rng:
+
+        Returns:
+
+        """
+
+        ti = self.timer()
+        result = super().run(state, circuit, error_gen, error_params, error_circuits, output, rng)
+        self.last_time = self.timer() - ti
+        self.total_time += self.last_time
+
+        for tick_circuit, _, _, _ in tape(circuit):
+            for _, locations, _ in tick_circuit.items():
+                self.num_gates += len(locations)
+
+        return result
+
     def run_gates(self, state, gates, removed_locations=None):
         """
         Directly apply a collection of quantum gates to a state.
@@ -17,4 +17,5 @@
 #  =========================================================================  #
 
 from .quantum_circuit import QuantumCircuit
-from .logical_circuit import LogicalCircuit
+from .logical_circuit import LogicalCircuit, Tape, TapeTick
+from .compact_circuit import CompactCircuit
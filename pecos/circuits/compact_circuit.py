@@ -0,0 +1,317 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+"""
+Contains the class ``CompactCircuit``, an array-based form of ``QuantumCircuit``.
+"""
+
+import numpy as np
+from .quantum_circuit import QuantumCircuit
+
+
+class CompactCircuit:
+    """
+    A read-only form of ``QuantumCircuit`` that stores the gates as a struct of NumPy arrays.
+
+    Each tick is a run of gate groups. A group is a gate symbol and parameters acting on locations that are all qudit ids
+    (arity 0) or all tuples of the same length (the arity). The qudits of all the locations are stored in one flat array:
+
+    - ``symbols`` and ``params`` are the tables of the distinct gate symbols and parameter dictionaries;
+    - ``opcodes[g]`` and ``param_ids[g]`` index these tables for group ``g``;
+    - ``arities[g]`` is the arity of the locations of group ``g``;
+    - ``qudit_offsets[g]:qudit_offsets[g + 1]`` is the slice of ``qudit_ids`` holding the qudits of group ``g``;
+    - ``tick_offsets[t]:tick_offsets[t + 1]`` are the groups of tick ``t``.
+
+    The ticks are iterated over in the same way as those of a ``QuantumCircuit`` (see ``items`` and ``iter_ticks``), so
+    it can be given to simulators, circuit runners, and error generators in its place. The locations are returned as
+    lists instead of sets.
+
+    """
+
+    def __init__(self, symbols, params, opcodes, param_ids, arities, qudit_offsets, qudit_ids, tick_offsets, qudits=None,
+                 **metadata):
+        """
+
+        Args:
+            symbols (list of str): Gate symbols.
+            params (list of dict): Gate parameters.
+            opcodes: Index of the symbol of each group.
+            param_ids: Index of the parameters of each group.
+            arities: Arity of the locations of each group.
+            qudit_offsets: Offsets of the qudits of each group into ``qudit_ids``.
+            qudit_ids: Qudits of all the locations.
+            tick_offsets: Offsets of the groups of each tick.
+            qudits (set): Qudits of the circuit (those in ``qudit_ids`` if None).
+            **metadata: Quantum circuit parameters.
+        """
+
+        self.symbols = list(symbols)
+        self.params = list(params)
+        self.opcodes = np.asarray(opcodes, dtype=np.int32)
+        self.param_ids = np.asarray(param_ids, dtype=np.int32)
+        self.arities = np.asarray(arities, dtype=np.int8)
+        self.qudit_offsets = np.asarray(qudit_offsets, dtype=np.int64)
+        self.qudit_ids = _smallest_int_array(qudit_ids)
+        self.tick_offsets = np.asarray(tick_offsets, dtype=np.int64)
+        self.metadata = metadata
+
+        if qudits is None:
+            qudits = set(self.qudit_ids.tolist())
+        self.qudits = set(qudits)
+
+        self._idle_qudits = {}
+
+    @classmethod
+    def from_circuit(cls, quantum_circuit):
+        """
+        Converts a ``QuantumCircuit``.
+
+        Args:
+            quantum_circuit (QuantumCircuit): The circuit to convert. Its qudit ids must be integers.
+
+        Returns: CompactCircuit
+
+        """
+
+        symbols, symbol_ids = [], {}
+        params = []
+        opcodes, param_ids, arities, qudit_offsets, tick_offsets = [], [], [], [0], [0]
+        qudit_ids = []
+
+        for tick in range(len(quantum_circuit)):
+            for symbol, locations, gate_params in quantum_circuit.items(tick=tick):
+
+                opcode = symbol_ids.get(symbol)
+                if opcode is None:
+                    opcode = symbol_ids[symbol] = len(symbols)
+                    symbols.append(symbol)
+
+                # The parameters are interned by equality as they may not be hashable.
+                for param_id, other in enumerate(params):
+                    if other == gate_params:
+                        break
+                else:
+                    param_id = len(params)
+                    params.append(dict(gate_params))
+
+                # split the locations by arity
+                by_arity = {}
+                for location in locations:
+                    if isinstance(location, tuple):
+                        by_arity.setdefault(len(location), []).extend(location)
+                    else:
+                        by_arity.setdefault(0, []).append(location)
+
+                for arity, ids in by_arity.items():
+                    opcodes.append(opcode)
+                    param_ids.append(param_id)
+                    arities.append(arity)
+                    qudit_ids.extend(ids)
+                    qudit_offsets.append(len(qudit_ids))
+
+            tick_offsets.append(len(opcodes))
+
+        return cls(symbols, params, opcodes, param_ids, arities, qudit_offsets, qudit_ids, tick_offsets,
+                   qudits=quantum_circuit.qudits, **quantum_circuit.metadata)
+
+    def to_circuit(self):
+        """
+        Converts back to a ``QuantumCircuit``.
+
+        Returns: QuantumCircuit
+
+        """
+
+        quantum_circuit = QuantumCircuit(len(self), **self.metadata)
+
+        for tick in range(len(self)):
+            for symbol, locations, params in self.items(tick=tick):
+                quantum_circuit.update(symbol, set(locations), tick=tick, **params)
+
+        quantum_circuit.qudits.update(self.qudits)
+
+        return quantum_circuit
+
+    def items(self, tick=None):
+        """
+        An iterator through all the gates of the circuit (or of tick ``tick``).
+
+        Yields: Tuples of gate symbol, list of locations, and parameters.
+
+        """
+
+        if tick is None:
+            for tick_index in range(len(self)):
+                yield from self._tick_items(tick_index)
+
+        else:
+            yield from self._tick_items(tick)
+
+    def _tick_items(self, tick):
+        """
+        Yields the gates of a tick. The arrays are converted to lists once per tick and not once per gate.
+        """
+
+        start, stop = self.tick_offsets[tick], self.tick_offsets[tick + 1]
+
+        if start == stop:
+            return
+
+        offsets = self.qudit_offsets[start:stop + 1].tolist()
+        base = offsets[0]
+        ids = self.qudit_ids[base:offsets[-1]].tolist()
+
+        symbols, params = self.symbols, self.params
+
+        for opcode, param_id, arity, first, last in zip(self.opcodes[start:stop].tolist(),
+                                                        self.param_ids[start:stop].tolist(),
+                                                        self.arities[start:stop].tolist(), offsets, offsets[1:]):
+
+            locations = ids[first - base:last - base]
+
+            if arity:
+                locations = list(zip(*[iter(locations)] * arity))
+
+            yield symbols[opcode], locations, params[param_id]
+
+    def iter_ticks(self):
+        """
+        An iterator over the ticks in the same form as ``QuantumCircuit.iter_ticks``.
+        """
+
+        for tick in range(len(self)):
+            yield CompactTick(self, tick), tick, self.metadata
+
+    @property
+    def active_qudits(self):
+        """
+        Returns the active qudits of each tick.
+        """
+
+        return _ActiveQudits(self)
+
+    def idle_qudits(self, tick):
+        """
+        Returns the qudits of the circuit that are not acted on during a tick. The result is computed once per tick.
+        """
+
+        idle = self._idle_qudits.get(tick)
+
+        if idle is None:
+            idle = self._idle_qudits[tick] = frozenset(self.qudits - self[tick].active_qudits)
+
+        return idle
+
+    @property
+    def num_gates(self):
+        """
+        Number of gate locations in the circuit.
+        """
+
+        arities = np.maximum(self.arities, 1).astype(np.int64)
+        return int(np.sum(np.diff(self.qudit_offsets) // arities))
+
+    @property
+    def nbytes(self):
+        """
+        Number of bytes used by the arrays.
+        """
+
+        return sum(array.nbytes for array in (self.opcodes, self.param_ids, self.arities, self.qudit_offsets,
+                                              self.qudit_ids, self.tick_offsets))
+
+    def __getitem__(self, tick):
+        if tick < 0:
+            tick += len(self)
+
+        if not 0 <= tick < len(self):
+            raise IndexError('Tick index out of range.')
+
+        return CompactTick(self, tick)
+
+    def __len__(self):
+        return len(self.tick_offsets) - 1
+
+    def __iter__(self):
+        return self.items()
+
+    def __str__(self):
+        return "CompactCircuit(ticks=%s, gates=%s)" % (len(self), self.num_gates)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class CompactTick:
+    """
+    A view of one tick of a ``CompactCircuit``, used in place of the ``ParamGateCollection`` of a ``QuantumCircuit``.
+    """
+
+    def __init__(self, circuit, tick):
+        self.circuit = circuit
+        self.tick = tick
+        self.metadata = circuit.metadata
+
+    def items(self, tick=None):
+        return self.circuit.items(tick=self.tick)
+
+    @property
+    def active_qudits(self):
+        circuit = self.circuit
+        start = circuit.qudit_offsets[circuit.tick_offsets[self.tick]]
+        stop = circuit.qudit_offsets[circuit.tick_offsets[self.tick + 1]]
+
+        return set(circuit.qudit_ids[start:stop].tolist())
+
+    def __str__(self):
+        tick_list = []
+        for symbol, locations, params in self.items():
+            if len(params) == 0:
+                tick_list.append("'%s': %s" % (symbol, locations))
+            else:
+                tick_list.append("'%s': loc: %s - params=%s" % (symbol, locations, params))
+
+        return "Tick({%s})" % ', '.join(tick_list)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class _ActiveQudits:
+    """
+    Sequence of the active qudits of the ticks of a ``CompactCircuit`` that are only computed when requested.
+    """
+
+    def __init__(self, circuit):
+        self.circuit = circuit
+
+    def __getitem__(self, tick):
+        return self.circuit[tick].active_qudits
+
+    def __len__(self):
+        return len(self.circuit)
+
+
+def _smallest_int_array(values):
+    """
+    Returns the values as an int32 array if they fit and as an int64 array otherwise.
+    """
+
+    values = np.asarray(values, dtype=np.int64)
+
+    if values.size and (values.min() < np.iinfo(np.int32).min or values.max() > np.iinfo(np.int32).max):
+        return values
+
+    return values.astype(np.int32)
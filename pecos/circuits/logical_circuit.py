@@ -19,8 +19,11 @@
 Provides class to represent a logical circuit.
 """
 
+from collections import namedtuple
 from .quantum_circuit import QuantumCircuit
 
+TapeTick = namedtuple('TapeTick', 'tick_circuit, time, params, error_free')
+
 
 class LogicalCircuit(QuantumCircuit):
     """
@@ -38,6 +41,7 @@ class LogicalCircuit(QuantumCircuit):
             self.qudit_set = None
 
         self.suppress_warning = suppress_warning
+        self._tape = None
 
         super().__init__(**params)
 
@@ -47,7 +51,8 @@ class LogicalCircuit(QuantumCircuit):
         Args:
             logical_gate:
             gate_locations:
-            **params:
+            **params: The parameter ``repeat`` (int) gives the number of times the instructions of the gate are run in a
+                row. The gate is only stored once.
 
         Returns:
 
@@ -96,19 +101,62 @@ class LogicalCircuit(QuantumCircuit):
         raise NotImplementedError('!!!')
 
     def iter_ticks(self):
-        """An iterator for looping over the various quantum circuits comprising this data structure."""
+        """An iterator for looping over the various quantum circuits comprising this data structure.
 
-        for logical_tick in range(len(self)):
-            for logical_gate, _, _ in self.items(tick=logical_tick):
-                for instr_index, instr_circuit in enumerate(logical_gate.circuits):
-                    params = {'logical_circuit_params': self.metadata, 'gate': logical_gate, }
-                    params.update(instr_circuit.metadata)
+        The instructions of a gate appended with ``repeat=n`` are iterated over ``n`` times. The instructions of the
+        ``r``-th repetition are numbered as if the instructions of the gate were listed ``n`` times, so that each tick
+        has a distinct time.
+        """
+
+        for logical_tick, body, repeat in self._bodies():
+            num_instr = len(body)
+
+            for rep in range(repeat):
+                for instr_index, instr_circuit, params in body:
+                    instr_index += rep * num_instr
 
                     for tick in range(len(instr_circuit)):
                         tick_gates = instr_circuit[tick]
                         time = (logical_tick, instr_index, tick)
                         yield tick_gates, time, params
 
+    def _bodies(self):
+        """
+        Yields the logical tick, (instruction index, instruction circuit, params) of each instruction, and number of
+        repetitions of each logical gate.
+        """
+
+        for logical_tick in range(len(self)):
+            for logical_gate, _, gate_params in self.items(tick=logical_tick):
+                body = []
+                for instr_index, instr_circuit in enumerate(logical_gate.circuits):
+                    params = {'logical_circuit_params': self.metadata, 'gate': logical_gate, }
+                    params.update(instr_circuit.metadata)
+                    body.append((instr_index, instr_circuit, params))
+
+                yield logical_tick, body, gate_params.get('repeat', 1)
+
+    def tape(self):
+        """
+        Returns the ticks of ``iter_ticks`` as a ``Tape`` that is computed once and reused until the logical circuit is
+        changed.
+
+        Each element is a ``TapeTick`` of the tick circuit, time, and params given by ``iter_ticks`` and whether the tick
+        is error free. Note that changes made to the logical gates after they are added are not detected.
+
+        Returns: Tape
+
+        """
+
+        if self._tape is None:
+            self._tape = Tape(self)
+
+        return self._tape
+
+    def _changed(self):
+        super()._changed()
+        self._tape = None
+
     def __iter__(self):
 
         for element in self._ticks:
@@ -142,3 +190,57 @@ class LogicalCircuit(QuantumCircuit):
             tick_circuit = self[logical_tick]
             # (logical_tick, instr_index, tick)
             return tick_circuit
+
+
+class Tape:
+    """
+    The ticks of a ``LogicalCircuit`` as ``TapeTick`` elements.
+
+    The ticks of one repetition of each logical gate are stored, so the memory used does not depend on the number of
+    repetitions (see the parameter ``repeat`` of ``LogicalCircuit.append``).
+    """
+
+    def __init__(self, logical_circuit):
+
+        # (logical tick, ticks of one repetition, number of repetitions, number of instructions)
+        self.segments = []
+
+        for logical_tick, body, repeat in logical_circuit._bodies():
+            ticks = []
+            for instr_index, instr_circuit, params in body:
+                error_free = params.get('error_free', False)
+
+                for tick in range(len(instr_circuit)):
+                    ticks.append(TapeTick(instr_circuit[tick], (logical_tick, instr_index, tick), params, error_free))
+
+            self.segments.append((logical_tick, ticks, repeat, len(body)))
+
+    def __iter__(self):
+
+        for logical_tick, ticks, repeat, num_instr in self.segments:
+
+            yield from ticks
+
+            for rep in range(1, repeat):
+                offset = rep * num_instr
+                for tick_circuit, (_, instr_index, tick), params, error_free in ticks:
+                    yield TapeTick(tick_circuit, (logical_tick, instr_index + offset, tick), params, error_free)
+
+    def __len__(self):
+        return sum(len(ticks) * repeat for _, ticks, repeat, _ in self.segments)
+
+    def __getitem__(self, index):
+
+        if index < 0:
+            index += len(self)
+
+        for logical_tick, ticks, repeat, num_instr in self.segments:
+            if index < len(ticks) * repeat:
+                rep, index = divmod(index, len(ticks))
+                tick_circuit, (_, instr_index, tick), params, error_free = ticks[index]
+
+                return TapeTick(tick_circuit, (logical_tick, instr_index + rep * num_instr, tick), params, error_free)
+
+            index -= len(ticks) * repeat
+
+        raise IndexError('Tape index out of range.')
@@ -44,12 +44,17 @@ class QuantumCircuit(MutableSequence):
             This gate dictionary is assumed to be a collection of gates that act in parallel on the qudits.
             self.active_qudits(list): If `check_overlap` == True then ``active_qudits`` will be tracked; otherwise,
             ``active_qudits`` will not be tracked.
+            self.version(int): Incremented whenever the circuit or one of its ticks is changed, so that caches built
+            from the circuit can tell if they are out of date.
         """
         self._gates_class = ParamGateCollection
         self._ticks_class = list
         self._ticks = self._ticks_class()
         self.metadata = metadata
         self.qudits = set()
+        self._active_qudits = None  # Cached list of the active qudits of each tick.
+        self._idle_qudits = {}  # Cached tick => qudits not acted on during the tick.
+        self.version = 0  # Incremented whenever the circuit is changed (see ``_changed``).
         # TODO: If all the gates on a qudit are discarded... then the qudit will not be removed from this set... fix
 
         if 'tracked_qudits' in metadata:
@@ -73,11 +78,41 @@ class QuantumCircuit(MutableSequence):
                 active.update(gates.active_qudits)
 
         else:
-            active = []
-            for gates in self._ticks:
-                active.append(gates.active_qudits)
+            if self._active_qudits is None:
+                self._active_qudits = [gates.active_qudits for gates in self._ticks]
+            active = self._active_qudits
         return active
 
+    def idle_qudits(self, tick):
+        """
+        Returns the qudits of the circuit that are not acted on during a tick.
+
+        The result is computed once per tick and reused until the circuit is changed.
+
+        Args:
+            tick(int): Tick index.
+
+        Returns: frozenset
+
+        """
+
+        idle = self._idle_qudits.get(tick)
+
+        if idle is None:
+            idle = self._idle_qudits[tick] = frozenset(self.qudits - self._ticks[tick].active_qudits)
+
+        return idle
+
+    def _changed(self):
+        """
+        Clears the cached information about the ticks and increments ``version``. Called whenever the circuit or one of
+        its ticks is changed.
+        """
+
+        self._active_qudits = None
+        self._idle_qudits = {}
+        self.version += 1
+
     def append(self, symbol, locations=None, **params):
         """Adds a new gate=>gate_locations (set) pair to the end of ``self.gates``.
 
@@ -97,6 +132,7 @@ class QuantumCircuit(MutableSequence):
         gates = self._gates_class(self, symbol, locations, **params)
 
         self._ticks.append(gates)
+        self._changed()
 
     def update(self, symbol, locations=None, tick=-1, emptyappend=False, **params):
         """Updates that last group of parallel gates to include the gate acting on the set of qudits.
@@ -114,6 +150,7 @@ class QuantumCircuit(MutableSequence):
             self.add_ticks(1)
 
         self._ticks[tick].add(symbol, locations, **params)
+        self._changed()
 
     def discard(self, locations, tick=-1):
         """Discards ``locations`` for tick ``tick``.
@@ -127,6 +164,7 @@ class QuantumCircuit(MutableSequence):
         """
 
         self._ticks[tick].discard(locations)
+        self._changed()
 
     def add_ticks(self, num_ticks):
         """
@@ -187,6 +225,7 @@ class QuantumCircuit(MutableSequence):
         gate_dict, params = item
         gates = self._gates_class(self, gate_dict, **params)
         self._ticks.insert(tick, gates)
+        self._changed()
 
     def _circuit_setup(self, circuit_setup):
 
@@ -215,6 +254,7 @@ class QuantumCircuit(MutableSequence):
 
         gate_dict, params = item
         self._ticks[tick] = self._gates_class(self, gate_dict, **params)
+        self._changed()
 
     def __len__(self):
         """Used to return number of ticks when len() is used on an instance of this class.
@@ -235,6 +275,7 @@ class QuantumCircuit(MutableSequence):
 
         """
         self._ticks[tick] = self._gates_class(self)
+        self._changed()
 
     def __str__(self):
         """String returned when a string representation is requested. This occurs during printing.
@@ -335,6 +376,8 @@ class ParamGateCollection:
                 else:
                     self.symbols[gate_symbol].append(self.Gate(gate_symbol, params, gate_locations))
 
+        self.circuit._changed()
+
         return self
 
     def discard(self, locations):
@@ -377,6 +420,8 @@ class ParamGateCollection:
             else:
                 self.active_qudits.discard(location)
 
+        self.circuit._changed()
+
         return self
 
     def _verify_qudits(self, gate_dict):
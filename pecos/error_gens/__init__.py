@@ -22,3 +22,6 @@ from .xerror_gen import XGen
 from .zerror_gen import ZGen
 from .xzerror_gen import XZGen
 from .gatewise_gen import GatewiseGen
+from .fault_table import FaultTable, FaultList
+from .fault_array import FaultArray
+from .pauli_channel_gen import PauliChannelGen
@@ -0,0 +1,346 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Contains the class ``FaultArray``, which stores the errors of a shot as one sorted array instead of as ``QuantumCircuits``
+for each tick.
+"""
+
+import json
+import struct
+import numpy as np
+from .class_errors_circuit import ErrorCircuits
+from ..circuits import QuantumCircuit
+
+# The opcodes of the Paulis are their (x, z) bits: opcode = x + 2 * z.
+PAULI_SYMBOLS = ('I', 'X', 'Z', 'Y')
+
+# Serialized format: magic bytes, format kind, version, and the length of a JSON header with the times and symbols,
+# followed by the header and the records of the faults.
+_MAGIC = b'PECOS'
+_KIND = b'R'
+_VERSION = 1
+_HEADER = struct.Struct('<5scBI')
+
+
+class FaultArray:
+    """
+    The errors of a shot as a sorted array of one-qudit faults.
+
+    Each fault is a record (tick, after, opcode, qudit): ``times[tick]`` is the time of the tick, ``after`` tells whether
+    the error is applied after (or before) the gates of the tick, and ``symbols[opcode]`` is the gate applied to
+    ``qudit``. The first four symbols are the Paulis, with the opcode given by their (x, z) bits (see
+    ``PAULI_SYMBOLS``). The faults are sorted by tick, after, opcode, and qudit, and no qudit has more than one fault for
+    the same tick and side.
+
+    Circuit runners apply a ``FaultArray`` directly when it is passed as ``error_circuits`` (see ``Standard.run``), and
+    ``error_circuits`` converts it to the ``ErrorCircuits`` an error generator would have generated.
+
+    A ``FaultArray`` is an error realization that can be sampled once and replayed on any number of states, circuits
+    with the same ticks (such as the preparation of different logical basis-states), and decoders. It is not changed by
+    being run, only keeps the ticks that have faults, and can be compared, hashed (for example, to cache the results of
+    expensive shots), pickled, and serialized with ``to_bytes``.
+
+    Attributes:
+        faults (np.ndarray): Read-only structured array of the faults with the fields of ``dtype``.
+        times (tuple): Time of each tick that has faults, in the order the ticks are run.
+        symbols (tuple): Gate symbol of each opcode.
+    """
+
+    dtype = np.dtype([('tick', '<i4'), ('after', '?'), ('opcode', 'u1'), ('qudit', '<i8')])
+
+    def __init__(self, times, ticks, after, opcodes, qudits, symbols=PAULI_SYMBOLS):
+        """
+
+        Args:
+            times (list): Time of each tick, in the order the ticks are run.
+            ticks: Index into ``times`` of each fault.
+            after: Whether each fault is after the tick.
+            opcodes: Index into ``symbols`` of each fault.
+            qudits: Qudit of each fault.
+            symbols: Gate symbol of each opcode.
+        """
+
+        faults = np.empty(len(ticks), dtype=self.dtype)
+        faults['tick'] = ticks
+        faults['after'] = after
+        faults['opcode'] = opcodes
+        faults['qudit'] = qudits
+
+        # Only the ticks with faults are kept, so equal errors give equal arrays.
+        used = np.unique(faults['tick'])
+        faults['tick'] = np.searchsorted(used, faults['tick'])
+        times = [times[tick] for tick in used.tolist()]
+
+        self._set(np.sort(faults, order=['tick', 'after', 'opcode', 'qudit']), times, symbols)
+
+    def _set(self, faults, times, symbols):
+
+        faults.flags.writeable = False
+
+        self.faults = faults
+        self.times = tuple(times)
+        self.symbols = tuple(symbols)
+        self._hash = None
+
+    @classmethod
+    def from_paulis(cls, times, ticks, after, qudits, opcodes):
+        """
+        Creates a ``FaultArray`` of Pauli errors. Paulis on the same qudit at the same tick and side are multiplied
+        together and identities are dropped.
+
+        Args:
+            times (list): Time of each tick, in the order the ticks are run.
+            ticks: Index into ``times`` of each Pauli.
+            after: Whether each Pauli is after the tick.
+            qudits: Qudit of each Pauli.
+            opcodes: (x, z) bits of each Pauli (see ``PAULI_SYMBOLS``).
+
+        Returns: FaultArray
+
+        """
+
+        ticks = np.asarray(ticks, dtype=np.int64)
+        after = np.asarray(after, dtype=bool)
+        qudits = np.asarray(qudits, dtype=np.int64)
+        opcodes = np.asarray(opcodes, dtype=np.uint8)
+
+        if len(ticks):
+            order = np.lexsort((qudits, after, ticks))
+            ticks, after, qudits, opcodes = ticks[order], after[order], qudits[order], opcodes[order]
+
+            starts = np.flatnonzero(np.concatenate([[True], (ticks[1:] != ticks[:-1]) | (after[1:] != after[:-1]) |
+                                                    (qudits[1:] != qudits[:-1])]))
+            opcodes = np.bitwise_xor.reduceat(opcodes, starts)
+            keep = opcodes != 0
+
+            ticks, after, qudits, opcodes = ticks[starts][keep], after[starts][keep], qudits[starts][keep], opcodes[keep]
+
+        return cls(times, ticks, after, opcodes, qudits)
+
+    @classmethod
+    def from_error_circuits(cls, error_circuits, times=None):
+        """
+        Converts ``ErrorCircuits`` to a ``FaultArray``.
+
+        Only errors that are gates without parameters acting on one qudit can be converted, and no gate locations may be
+        replaced.
+
+        Args:
+            error_circuits (ErrorCircuits): Errors, such as those returned by ``Standard.run``.
+            times (list): Times of the ticks in the order they are run. If None, the times of ``error_circuits`` are
+                used in their order.
+
+        Returns: FaultArray
+
+        """
+
+        if times is None:
+            times = list(error_circuits)
+        tick_ids = {time: tick for tick, time in enumerate(times)}
+
+        symbols = list(PAULI_SYMBOLS)
+        opcode_ids = {symbol: opcode for opcode, symbol in enumerate(symbols)}
+
+        ticks, after, opcodes, qudits = [], [], [], []
+
+        for time, errors in error_circuits.items():
+
+            if errors.get('replaced'):
+                raise Exception('Replaced gate locations can not be stored in a FaultArray.')
+
+            for is_after, when in ((False, 'before'), (True, 'after')):
+                error_circuit = errors.get(when)
+
+                if not error_circuit:
+                    continue
+
+                if len(error_circuit) > 1:
+                    raise Exception('Error circuits with more than one tick can not be stored in a FaultArray.')
+
+                for symbol, locations, params in error_circuit.items():
+
+                    if params:
+                        raise Exception('Errors with parameters can not be stored in a FaultArray.')
+
+                    opcode = opcode_ids.get(symbol)
+                    if opcode is None:
+                        opcode = opcode_ids[symbol] = len(symbols)
+                        symbols.append(symbol)
+
+                    for location in locations:
+                        if isinstance(location, tuple):
+                            raise Exception('Only errors that act on one qudit can be stored in a FaultArray.')
+
+                        ticks.append(tick_ids[time])
+                        after.append(is_after)
+                        opcodes.append(opcode)
+                        qudits.append(location)
+
+        return cls(times, ticks, after, opcodes, qudits, symbols)
+
+    def __len__(self):
+        return len(self.faults)
+
+    def __eq__(self, other):
+
+        if not isinstance(other, FaultArray):
+            return NotImplemented
+
+        return (self.times == other.times and self.symbols == other.symbols and
+                np.array_equal(self.faults, other.faults))
+
+    def __hash__(self):
+
+        if self._hash is None:
+            self._hash = hash((self.times, self.symbols, self.faults.tobytes()))
+
+        return self._hash
+
+    def __repr__(self):
+        return 'FaultArray(%s faults in %s ticks)' % (len(self.faults), len(self.times))
+
+    def to_bytes(self):
+        """
+        Serializes the faults.
+
+        Times must be integers or (nested) tuples of integers, as those of ``QuantumCircuits`` and ``LogicalCircuits``
+        are.
+
+        Returns: bytes
+
+        """
+
+        header = json.dumps({'times': self.times, 'symbols': self.symbols}).encode('utf-8')
+
+        return b''.join([_HEADER.pack(_MAGIC, _KIND, _VERSION, len(header)), header, self.faults.tobytes()])
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a ``FaultArray`` from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized faults.
+
+        Returns: FaultArray
+
+        """
+
+        fault_array = cls.__new__(cls)
+        fault_array.__setstate__(data)
+
+        return fault_array
+
+    def __getstate__(self):
+        return self.to_bytes()
+
+    def __setstate__(self, data):
+
+        if len(data) < _HEADER.size:
+            raise Exception('Data is too short to be a serialized FaultArray.')
+
+        magic, kind, version, header_size = _HEADER.unpack_from(data)
+
+        if magic != _MAGIC or kind != _KIND:
+            raise Exception('Data is not a serialized FaultArray.')
+
+        if version != _VERSION:
+            raise Exception('Unsupported serialization version: %s' % version)
+
+        offset = _HEADER.size + header_size
+        header = json.loads(bytes(data[_HEADER.size:offset]).decode('utf-8'))
+
+        if (len(data) - offset) % self.dtype.itemsize:
+            raise Exception('Serialized FaultArray has the wrong size.')
+
+        faults = np.frombuffer(data, dtype=self.dtype, offset=offset).copy()
+
+        self._set(faults, [_as_time(time) for time in header['times']], header['symbols'])
+
+    def ticks(self):
+        """
+        Yields the errors of each tick that has faults.
+
+        Yields: Tuples (time, before, after), where ``before`` and ``after`` are lists of (symbol, set of qudits).
+
+        """
+
+        faults = self.faults
+
+        if not len(faults):
+            return
+
+        tick_ids = faults['tick']
+        after = faults['after']
+        opcodes = faults['opcode']
+
+        # Boundaries of the runs of faults with the same tick, side, and opcode.
+        changes = np.flatnonzero((tick_ids[1:] != tick_ids[:-1]) | (after[1:] != after[:-1]) |
+                                 (opcodes[1:] != opcodes[:-1])) + 1
+        starts = np.concatenate([[0], changes]).tolist()
+        stops = np.concatenate([changes, [len(faults)]]).tolist()
+
+        qudits = faults['qudit'].tolist()
+        tick_ids = tick_ids.tolist()
+        after = after.tolist()
+        opcodes = opcodes.tolist()
+
+        tick = tick_ids[0]
+        errors = ([], [])
+        for start, stop in zip(starts, stops):
+
+            if tick_ids[start] != tick:
+                yield self.times[tick], errors[0], errors[1]
+                tick = tick_ids[start]
+                errors = ([], [])
+
+            errors[after[start]].append((self.symbols[opcodes[start]], set(qudits[start:stop])))
+
+        yield self.times[tick], errors[0], errors[1]
+
+    def error_circuits(self):
+        """
+        Converts the faults to ``ErrorCircuits``.
+
+        Returns: ErrorCircuits
+
+        """
+
+        error_circuits = ErrorCircuits()
+
+        for time, before_errors, after_errors in self.ticks():
+            circuits = []
+            for errors in (before_errors, after_errors):
+                circuit = QuantumCircuit()
+                for symbol, qudits in errors:
+                    circuit.update(symbol, qudits, emptyappend=True)
+                circuits.append(circuit)
+
+            error_circuits.add_circuits(time, circuits[0], circuits[1])
+
+        return error_circuits
+
+
+def _as_time(time):
+    """
+    Converts a time read from JSON back to a time (JSON stores tuples as lists).
+    """
+
+    if isinstance(time, list):
+        return tuple(_as_time(t) for t in time)
+
+    return time
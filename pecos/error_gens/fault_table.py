@@ -0,0 +1,405 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Contains the class ``FaultTable``, which lists every possible fault of a circuit so that the faults of a whole shot can
+be sampled at once.
+"""
+
+import numpy as np
+from .class_errors_circuit import ErrorCircuits
+from .fault_array import FaultArray
+from ..circuits import QuantumCircuit
+
+
+class FaultTable:
+    """
+    Table of the fault channels of a circuit under an error generator.
+
+    A channel is one gate location at one tick at which, with probability ``probs[c]``, one of a set of equally likely
+    Pauli faults occurs (see ``ParentErrorGen.tick_fault_channels``). Instead of going through the circuit tick by tick
+    and location by location, the faults of a whole shot are sampled with a few vectorized calls. This is much faster
+    when the probability of a fault is low, since almost no location has a fault.
+
+    Attributes:
+        times (list): Time of each tick that has channels.
+        tick_ids (np.ndarray): Index into ``times`` of each channel.
+        after (np.ndarray): Whether the fault of each channel occurs after (True) or before (False) the tick.
+        probs (np.ndarray): Probability of a fault for each channel.
+        locations (list): Gate location of each channel.
+        option_sets (list): Distinct lists of faults (tuples of Pauli symbols, one per qudit of the location).
+        option_set_ids (np.ndarray): Index into ``option_sets`` of each channel.
+        num_options (np.ndarray): Number of faults of each channel.
+    """
+
+    def __init__(self, error_gen, circuit, error_params):
+        """
+
+        Args:
+            error_gen: Error generator (see ``ParentErrorGen.tick_fault_channels``).
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+        """
+
+        self.times = []
+        self.locations = []
+        self.option_sets = []
+
+        tick_ids, after, probs, option_set_ids = [], [], [], []
+        set_ids = {}
+
+        error_gen.start(circuit, error_params)
+
+        for tick_circuit, time, params in circuit.iter_ticks():
+
+            if params.get('error_free', False):
+                continue
+
+            channels = error_gen.tick_fault_channels(tick_circuit, time, **params)
+
+            if not channels:
+                continue
+
+            tick_id = len(self.times)
+            self.times.append(time)
+
+            for location, is_after, prob, options in channels:
+
+                key = tuple(options)
+                set_id = set_ids.get(key)
+                if set_id is None:
+                    set_id = set_ids[key] = len(self.option_sets)
+                    self.option_sets.append(list(options))
+
+                tick_ids.append(tick_id)
+                after.append(is_after)
+                probs.append(prob)
+                option_set_ids.append(set_id)
+                self.locations.append(location)
+
+        self.tick_ids = np.array(tick_ids, dtype=np.int64)
+        self.after = np.array(after, dtype=bool)
+        self.probs = np.array(probs, dtype=float)
+        self.option_set_ids = np.array(option_set_ids, dtype=np.int64)
+        self.num_options = np.array([len(options) for options in self.option_sets], dtype=np.int64)[
+            self.option_set_ids] if self.option_sets else np.zeros(0, dtype=np.int64)
+
+        # Set by ``paulis`` on its first call.
+        self._qudits = None
+        self._opcodes = None
+
+    def __len__(self):
+        return len(self.probs)
+
+    def sample(self, method='bernoulli', rng=None):
+        """
+        Samples the faults of one shot.
+
+        Args:
+            method (str): 'bernoulli' draws a random number for each channel. 'geometric' draws the gaps between the
+                channels with faults, so the cost is proportional to the number of faults instead of the number of
+                channels, which is much faster at low error rates. Both give the same distribution of faults.
+            rng (np.random.Generator): Random number generator (the global state of ``np.random`` if None).
+
+        Returns: FaultList
+
+        """
+
+        return self.sample_shots(1, method=method, rng=rng)[0]
+
+    def sample_shots(self, shots, method='bernoulli', chunk_size=None, rng=None):
+        """
+        Samples the faults of several shots, drawing the random numbers of many shots at once.
+
+        Args:
+            shots (int): Number of shots.
+            method (str): 'bernoulli' or 'geometric' (see ``sample``).
+            chunk_size (int): Number of shots drawn at once (chosen to limit memory if None).
+            rng (np.random.Generator): Random number generator (the global state of ``np.random`` if None).
+
+        Returns: list of FaultList
+
+        """
+
+        shot_ids, channels, choices = self.draw(shots, method=method, chunk_size=chunk_size, rng=rng)
+        bounds = np.searchsorted(shot_ids, np.arange(shots + 1))
+
+        return [FaultList(self, channels[bounds[shot]:bounds[shot + 1]], choices[bounds[shot]:bounds[shot + 1]])
+                for shot in range(shots)]
+
+    def draw(self, shots, method='bernoulli', chunk_size=None, rng=None):
+        """
+        Samples the faults of several shots as flat arrays (see ``sample_shots``).
+
+        Args:
+            shots (int): Number of shots.
+            method (str): 'bernoulli' or 'geometric' (see ``sample``).
+            chunk_size (int): Number of shots drawn at once (chosen to limit memory if None).
+            rng (np.random.Generator): Random number generator (the global state of ``np.random`` if None).
+
+        Returns: Tuple of the shot, channel, and chosen fault of each fault, sorted by shot and then by channel.
+
+        """
+
+        if rng is None:
+            rng = np.random
+
+        num_channels = len(self.probs)
+
+        if method == 'bernoulli':
+            fire = self._bernoulli_positions
+        elif method == 'geometric':
+            fire = self._geometric_positions
+        else:
+            raise Exception('Sampling method "%s" is not known.' % method)
+
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 22) // max(1, num_channels))
+
+        shot_ids, channels, choices = [], [], []
+        for start in range(0, shots, chunk_size):
+            num = min(chunk_size, shots - start)
+
+            # The faults are found as positions in the channels of all the shots placed one after the other.
+            chunk_shots, chunk_channels = np.divmod(fire(num, rng), max(1, num_channels))
+
+            shot_ids.append(chunk_shots + start)
+            channels.append(chunk_channels)
+            choices.append(self.choose(chunk_channels, rng))
+
+        if not shot_ids:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        return np.concatenate(shot_ids), np.concatenate(channels), np.concatenate(choices)
+
+    def _bernoulli_positions(self, shots, rng):
+        """
+        Decides for each channel of each shot whether it has a fault.
+        """
+
+        return np.flatnonzero(rng.random((shots, len(self.probs))) < self.probs)
+
+    def _geometric_positions(self, shots, rng):
+        """
+        Finds the channels with faults by drawing the gaps between them.
+
+        The gaps between the faults of a sequence of channels that each have a fault with probability ``rate`` are
+        geometrically distributed. The largest probability below one is used as ``rate`` and a channel found this way
+        is then kept with probability ``probs[c] / rate``. Channels with a probability of one always have a fault.
+        """
+
+        num_channels = len(self.probs)
+        total = shots * num_channels
+
+        certain = self.probs >= 1.0
+        uncertain = self.probs[~certain]
+        rate = uncertain.max() if len(uncertain) else 0.0
+
+        found = []
+
+        if rate > 0.0:
+            last = -1
+            while True:
+                expected = (total - last - 1) * rate
+                gaps = rng.geometric(rate, int(expected + 5.0 * np.sqrt(expected) + 16))
+                positions = last + np.cumsum(gaps)
+
+                if positions[-1] >= total:
+                    found.append(positions[positions < total])
+                    break
+
+                found.append(positions)
+                last = positions[-1]
+
+            positions = np.concatenate(found)
+            channels = positions % num_channels
+
+            keep = ~certain[channels]
+            if np.any(uncertain != rate):
+                keep &= rng.random(len(channels)) * rate < self.probs[channels]
+
+            found = [positions[keep]]
+
+        if np.any(certain):
+            found.append((np.arange(shots)[:, None] * num_channels + np.flatnonzero(certain)).ravel())
+
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+
+        return np.sort(np.concatenate(found))
+
+    def choose(self, channels, rng=None):
+        """
+        Chooses which of its faults occurs for each of the channels.
+
+        Args:
+            channels (np.ndarray): Channel indices.
+            rng (np.random.Generator): Random number generator (the global state of ``np.random`` if None).
+
+        Returns: np.ndarray of the index of the fault of each channel.
+
+        """
+
+        if rng is None:
+            rng = np.random
+
+        return (rng.random(len(channels)) * self.num_options[channels]).astype(np.int64)
+
+    def paulis(self, channels, choices):
+        """
+        Splits faults into their one-qudit Paulis.
+
+        Args:
+            channels (np.ndarray): Channel of each fault.
+            choices (np.ndarray): The chosen fault of each channel.
+
+        Returns: Tuple of the fault (index into ``channels``), tick (index into ``times``), whether it is after the tick,
+            qudit, and opcode (x + 2 * z, see ``FaultArray``) of each non-identity Pauli. The Paulis are in the order of
+            the faults.
+
+        """
+
+        if self._qudits is None:
+            self._pauli_tables()
+
+        channels = np.asarray(channels, dtype=np.int64)
+        choices = np.asarray(choices, dtype=np.int64)
+
+        opcodes = self._opcodes[self.option_set_ids[channels], choices]
+        faults, positions = np.nonzero(opcodes)
+
+        channels = channels[faults]
+
+        return (faults, self.tick_ids[channels], self.after[channels], self._qudits[channels, positions],
+                opcodes[faults, positions])
+
+    def _pauli_tables(self):
+        """
+        Creates the (channel, position) => qudit and (option set, fault, position) => opcode arrays used by ``paulis``.
+        """
+
+        locations = [location if isinstance(location, tuple) else (location, ) for location in self.locations]
+        width = max([len(location) for location in locations] + [1])
+
+        self._qudits = np.full((len(locations), width), -1, dtype=np.int64)
+        for channel, location in enumerate(locations):
+            self._qudits[channel, :len(location)] = location
+
+        num_options = max([len(options) for options in self.option_sets] + [1])
+
+        # Identities (and the padding) have opcode 0.
+        self._opcodes = np.zeros((len(self.option_sets), num_options, width), dtype=np.uint8)
+        for set_id, options in enumerate(self.option_sets):
+            for choice, symbols in enumerate(options):
+                for position, symbol in enumerate(symbols):
+                    if symbol != 'I':
+                        self._opcodes[set_id, choice, position] = _OPCODES[symbol]
+
+    def fault(self, channel, choice):
+        """
+        Returns the time, whether it is after the tick, location, and Pauli symbols of a fault.
+        """
+
+        return (self.times[self.tick_ids[channel]], bool(self.after[channel]), self.locations[channel],
+                self.option_sets[self.option_set_ids[channel]][choice])
+
+
+class FaultList:
+    """
+    The faults of one shot, given as the channels of a ``FaultTable`` in which a fault occurred and the index of the
+    fault chosen for each.
+    """
+
+    def __init__(self, table, channels, choices):
+        """
+
+        Args:
+            table (FaultTable): The table the faults were sampled from.
+            channels (np.ndarray): Sorted indices of the channels with a fault.
+            choices (np.ndarray): The fault of each channel.
+        """
+
+        self.table = table
+        self.channels = np.asarray(channels, dtype=np.int64)
+        self.choices = np.asarray(choices, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __iter__(self):
+        """
+        Yields the time, whether it is after the tick, location, and Pauli symbols of each fault.
+        """
+
+        for channel, choice in zip(self.channels.tolist(), self.choices.tolist()):
+            yield self.table.fault(channel, choice)
+
+    def error_circuits(self):
+        """
+        Converts the faults to the ``ErrorCircuits`` an error generator would have generated, so that they can be
+        applied with ``Standard.run(..., error_circuits=...)``.
+
+        Faults on the same qudit at the same time (and before or after the tick) are multiplied together.
+
+        Returns: ErrorCircuits
+
+        """
+
+        # time => when => qudit => (x, z)
+        paulis = {}
+
+        for time, after, location, symbols in self:
+            qudits = location if isinstance(location, tuple) else (location, )
+            frame = paulis.setdefault(time, {}).setdefault(after, {})
+
+            for qudit, symbol in zip(qudits, symbols):
+                if symbol == 'I':
+                    continue
+
+                x, z = frame.get(qudit, (False, False))
+                frame[qudit] = (x ^ (symbol != 'Z'), z ^ (symbol != 'X'))
+
+        error_circuits = ErrorCircuits()
+
+        for time, frames in paulis.items():
+            circuits = {}
+            for after, frame in frames.items():
+                circuit = QuantumCircuit()
+                for qudit, (x, z) in frame.items():
+                    if x or z:
+                        circuit.update(_SYMBOLS[x, z], {qudit}, emptyappend=True)
+                circuits[after] = circuit
+
+            error_circuits.add_circuits(time, circuits.get(False), circuits.get(True))
+
+        return error_circuits
+
+    def fault_array(self):
+        """
+        Converts the faults to a ``FaultArray``, which circuit runners can apply without creating circuits for each
+        tick. Faults on the same qudit at the same time (and before or after the tick) are multiplied together.
+
+        Returns: FaultArray
+
+        """
+
+        _, ticks, after, qudits, opcodes = self.table.paulis(self.channels, self.choices)
+
+        return FaultArray.from_paulis(self.table.times, ticks, after, qudits, opcodes)
+
+
+_SYMBOLS = {(True, False): 'X', (True, True): 'Y', (False, True): 'Z'}
+_OPCODES = {'X': 1, 'Z': 2, 'Y': 3}
@@ -123,7 +123,7 @@ class GatewiseGen(ParentErrorGen):
         # -----------
         if 'idle' in self.gen.error_func_dict:
 
-            inactive_qudits = circuit.qudits - circuit.active_qudits[tick_index]
+            inactive_qudits = circuit.idle_qudits(tick_index)
 
             if tick_index == 0 and 'data' in self.gen.error_func_dict:
                 data_qudit_set = params['data_qudit_set']
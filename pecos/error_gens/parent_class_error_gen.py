@@ -21,6 +21,8 @@ Simple error generator meant to demonstrate a basic error generator that produce
 """
 import numpy as np
 from .class_errors_circuit import ErrorCircuits
+from .fault_table import FaultTable
+from .fault_array import FaultArray
 
 
 class ParentErrorGen(object):
@@ -28,6 +30,10 @@ class ParentErrorGen(object):
     A simple error generator for the depolarizing model.
 
     This error generator does not allow much modification of the error model.
+
+    Attributes:
+        rng (Optional[np.random.Generator]): If set, random numbers are drawn from it instead of from the global state
+            of ``np.random`` (see ``pecos.misc.random_streams``).
     """
 
     def __init__(self):
@@ -39,6 +45,10 @@ class ParentErrorGen(object):
         self.error_params = None
         self.circuit = None
         self.generator_class = Generator
+        self.rng = None
+
+        # (circuit, circuit version, error params, FaultTable) of the last call of ``generate_fault_array(s)``
+        self._cached_table = None
 
     def start(self, circuit, error_params):
         """
@@ -68,6 +78,151 @@ class ParentErrorGen(object):
 
         return {}
 
+    def fault_table(self, circuit, error_params):
+        """
+        Lists all the faults this error generator can generate for a circuit, so that the faults of whole shots can be
+        sampled at once (see ``FaultTable``).
+
+        Args:
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+
+        Returns: FaultTable
+
+        """
+
+        return FaultTable(self, circuit, error_params)
+
+    def generate_fault_array(self, circuit, error_params):
+        """
+        Generates the errors of a whole shot as a ``FaultArray`` instead of as ``QuantumCircuits`` for each tick. The
+        result can be passed to ``Standard.run`` as ``error_circuits``.
+
+        The faults are sampled from the ``fault_table`` of the circuit, which is created on the first call and reused
+        while the same circuit and error parameters are given. The table is created again if the circuit was changed in
+        between, which is detected from ``QuantumCircuit.version``.
+
+        Args:
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+
+        Returns: FaultArray
+
+        """
+
+        return self.generate_fault_arrays(circuit, error_params, 1)[0]
+
+    def generate_fault_arrays(self, circuit, error_params, shots):
+        """
+        Generates the errors of many shots at once (see ``generate_fault_array``). The faults of the shots are drawn
+        together, and each ``FaultArray`` can be replayed on any number of states, decoders, or circuits with the same
+        ticks.
+
+        Args:
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+            shots (int): Number of shots.
+
+        Returns: list of FaultArray
+
+        """
+
+        times, shot_ids, ticks, after, qudits, opcodes = self.generate_pauli_faults(circuit, error_params, shots)
+        bounds = np.searchsorted(shot_ids, np.arange(shots + 1)).tolist()
+
+        return [FaultArray.from_paulis(times, ticks[start:stop], after[start:stop], qudits[start:stop],
+                                       opcodes[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def generate_pauli_faults(self, circuit, error_params, shots):
+        """
+        Generates the errors of many shots as flat arrays of one-qudit Paulis, which is what ``generate_fault_arrays``
+        and ``FrameSampler`` are built on. Paulis on the same qudit at the same time are not multiplied together.
+
+        The faults are sampled from the ``fault_table`` of the circuit with the geometric method (see
+        ``FaultTable.sample``).
+
+        Args:
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+            shots (int): Number of shots.
+
+        Returns: Tuple of the times of the ticks and the shot, tick (index into the times), whether it is after the
+            tick, qudit, and opcode (x + 2 * z, see ``FaultArray``) of each Pauli, sorted by shot.
+
+        Raises: Exception if some errors are given by custom error functions (see ``Generator.unlisted_gates``).
+
+        """
+
+        unlisted = self.gen.unlisted_gates()
+        if unlisted:
+            raise Exception('%s can not sample the faults of many shots at once since the errors of %s are given by '
+                            'custom error functions. Only errors given by ErrorStaticSymbol, ErrorSet, or '
+                            'ErrorSetMultiQuditGate (the str and iterable ``error_func`` of ``set_gate_error``) are '
+                            'supported. Run the shots one at a time with ``Standard.run`` instead.'
+                            % (type(self).__name__, ', '.join(unlisted)))
+
+        table = self._table(circuit, error_params)
+
+        shot_ids, channels, choices = table.draw(shots, method='geometric', rng=self.rng)
+        faults, ticks, after, qudits, opcodes = table.paulis(channels, choices)
+
+        return table.times, shot_ids[faults], ticks, after, qudits, opcodes
+
+    def _table(self, circuit, error_params):
+        """
+        Returns the ``FaultTable`` of a circuit, which is reused while the same unchanged circuit and error parameters are
+        given.
+        """
+
+        # Circuits without a version, such as ``CompactCircuit``, can not be changed.
+        version = getattr(circuit, 'version', None)
+        cached = self._cached_table
+        if cached is None or cached[0] is not circuit or cached[1] != version or cached[2] != error_params:
+            table = self.fault_table(circuit, error_params)
+            cached = self._cached_table = (circuit, version, dict(error_params), table)
+
+        return cached[3]
+
+    def tick_fault_channels(self, tick_circuit, time, **params):
+        """
+        Returns the distributions of the errors that ``generate_tick_errors`` would generate for a tick instead of
+        sampling them. ``start`` must be called first.
+
+        The gates ``generate_tick_errors`` creates errors for are recorded (see ``Generator.create_errors``) and
+        converted by ``Generator.error_channel``.
+
+        Args:
+            tick_circuit:
+            time:
+            **params:
+
+        Returns: List of (location, after, probability, options) tuples, one per gate location that can have an error.
+            One of the ``options`` (tuples of Pauli symbols, one per qudit of the location) occurs with ``probability``
+            and each is equally likely. ``after`` tells if the error occurs after or before the tick.
+
+        """
+
+        gen = self.gen
+
+        gen.recorded = []
+        try:
+            self.generate_tick_errors(tick_circuit, time, **params)
+            recorded = gen.recorded
+        finally:
+            gen.recorded = None
+
+        channels = []
+        for gate_symbol, locations in recorded:
+            channel = gen.error_channel(self, gate_symbol)
+
+            if channel is not None:
+                after, probability, options = channel
+                for location in locations:
+                    channels.append((location, after, probability, options))
+
+        return channels
+
 
 class Generator:
     """
@@ -80,6 +235,9 @@ class Generator:
         self.error_func_dict = {}
         self.default_error_tuple = (False, 'p')
 
+        # If a list, ``create_errors`` records the gates instead of generating errors (see ``tick_fault_channels``).
+        self.recorded = None
+
     def set_gate_group(self, group_symbol, gate_set):
         """
 
@@ -203,6 +361,10 @@ class Generator:
 
         """
 
+        if self.recorded is not None:
+            self.recorded.append((gate_symbol, locations))
+            return set([])
+
         error_func, error_param = self.error_func_dict.get(gate_symbol, self.default_error_tuple)
 
         if error_func is True:  # Default error
@@ -215,6 +377,12 @@ class Generator:
 
         p = err_gen.error_params[error_param]
 
+        # Error functions are only given the random number generator if one is set, so that error functions that do not
+        # take it keep working.
+        rng = err_gen.rng
+        if rng is not None:
+            kwargs['rng'] = rng
+
         if p is True:  # Error always occurs
 
             for loc in locations:
@@ -224,7 +392,8 @@ class Generator:
 
         else:
 
-            rand_nums = np.random.random(len(locations))  # Create len(locations) number of random float between 0 and 1.
+            # Create len(locations) number of random float between 0 and 1.
+            rand_nums = (np.random if rng is None else rng).random(len(locations))
             rand_nums = rand_nums <= p  # Bolean evaluation of random number <= p
 
             # TODO: Think about using the numpy function vectorize...
@@ -237,6 +406,81 @@ class Generator:
 
             return error_locations
 
+    def error_channel(self, err_gen, gate_symbol):
+        """
+        Returns the distribution of the errors ``create_errors`` generates for each location of a gate.
+
+        Only errors set with ``ErrorStaticSymbol``, ``ErrorSet``, and ``ErrorSetMultiQuditGate`` (and so the str and
+        iterable ``error_func`` of ``set_gate_error``) can be described this way.
+
+        Args:
+            err_gen: The error generator.
+            gate_symbol: The gate symbol that is being evaluated for errors.
+
+        Returns: None if there are no errors and otherwise a tuple (after, probability, options), where ``options`` is
+            a list of equally likely tuples of Pauli symbols (one symbol per qudit of a location).
+
+        """
+
+        error_func, error_param = self.error_func_dict.get(gate_symbol, self.default_error_tuple)
+
+        if error_func is True:  # Default error
+            error_func = self.default_error_tuple[0]
+
+        if error_func is False:  # No errors
+            return None
+
+        p = err_gen.error_params[error_param]
+
+        if p is True:
+            p = 1.0
+        elif not p:
+            return None
+
+        if not self._listable(error_func):
+            raise Exception('Can not find the error distribution of gate "%s". Only errors given by ErrorStaticSymbol, '
+                            'ErrorSet, or ErrorSetMultiQuditGate are supported.' % gate_symbol)
+
+        error_class = error_func.__self__
+        after = error_class.after
+
+        if isinstance(error_class, self.ErrorStaticSymbol):
+            options = [(error_class.data, )]
+        else:
+            options = []
+            for error_symbols in error_class.data:
+                if isinstance(error_symbols, (tuple, np.ndarray)):
+                    options.append(tuple(str(sym) for sym in error_symbols))
+                else:
+                    options.append((str(error_symbols), ))
+
+        return after, float(p), options
+
+    def unlisted_gates(self):
+        """
+        Returns the gate symbols whose errors are given by custom error functions, which ``error_channel`` can not
+        describe. A custom default error is returned as ``'default'``.
+
+        Returns: Sorted list of gate symbols.
+
+        """
+
+        error_funcs = [(symbol, value[0]) for symbol, value in self.error_func_dict.items() if value is not False]
+        error_funcs.append(('default', self.default_error_tuple[0]))
+
+        return sorted(symbol for symbol, error_func in error_funcs if not self._listable(error_func))
+
+    def _listable(self, error_func):
+        """
+        Returns whether ``error_channel`` can describe the errors of an error function.
+        """
+
+        if error_func is True or error_func is False:
+            return True
+
+        return isinstance(getattr(error_func, '__self__', None),
+                          (self.ErrorStaticSymbol, self.ErrorSet, self.ErrorSetMultiQuditGate))
+
     class ErrorStaticSymbol:
         """
         Class used to create a callable that just returns a symbol.
@@ -245,16 +489,19 @@ class Generator:
         def __init__(self, symbol, after=True):
             self.data = symbol
 
+            # Whether ``error_func`` adds the error after the gate (read by ``Generator.error_channel``).
+            self.after = after
+
             if after:
                 self.error_func = self.error_func_after
             else:
                 self.error_func = self.error_func_before
 
-        def error_func_after(self, after, before, replace, location, error_params):
+        def error_func_after(self, after, before, replace, location, error_params, rng=None):
 
             after.update(self.data, {location}, emptyappend=True)
 
-        def error_func_before(self, after, before, replace, location, error_params):
+        def error_func_before(self, after, before, replace, location, error_params, rng=None):
 
             before.update(self.data, {location}, emptyappend=True)
 
@@ -267,18 +514,20 @@ class Generator:
 
             self.data = np.array(list(error_set))
 
+            self.after = after
+
             if after:
                 self.error_func = self.error_func_after
             else:
                 self.error_func = self.error_func_before
 
-        def error_func_after(self, after, before, replace, location, error_params):
+        def error_func_after(self, after, before, replace, location, error_params, rng=None):
 
-            after.update(np.random.choice(self.data), {location}, emptyappend=True)
+            after.update((np.random if rng is None else rng).choice(self.data), {location}, emptyappend=True)
 
-        def error_func_before(self, after, before, replace, location, error_params):
+        def error_func_before(self, after, before, replace, location, error_params, rng=None):
 
-            before.update(np.random.choice(self.data), {location}, emptyappend=True)
+            before.update((np.random if rng is None else rng).choice(self.data), {location}, emptyappend=True)
 
     class ErrorSetMultiQuditGate:
         """
@@ -293,17 +542,19 @@ class Generator:
                 error_set[0] = (error_set[0],)
                 self.data = np.array(list(error_set))
 
+            self.after = after
+
             if after:
                 self.error_func = self.error_func_after
             else:
                 self.error_func = self.error_func_before
 
-        def error_func_after(self, after, before, replace, location, error_params):
+        def error_func_after(self, after, before, replace, location, error_params, rng=None):
 
             # error_symbols = np.random.choice(self.data)
 
             # Choose an error symbol or tuple of symbols:
-            indx = np.random.choice(len(self.data))
+            indx = (np.random if rng is None else rng).choice(len(self.data))
             error_symbols = self.data[indx]
 
             if isinstance(error_symbols, (tuple, np.ndarray)) and len(error_symbols) > 1:
@@ -322,10 +573,10 @@ class Generator:
             else:
                 raise Exception("Only tuples and strings are currently accepted")
 
-        def error_func_before(self, after, before, replace, location, error_params):
+        def error_func_before(self, after, before, replace, location, error_params, rng=None):
 
             # error_symbols = np.random.choice(self.data)
-            indx = np.random.choice(len(self.data))
+            indx = (np.random if rng is None else rng).choice(len(self.data))
             error_symbols = self.data[indx]
 
             if isinstance(error_symbols, np.ndarray) and len(error_symbols) > 1:
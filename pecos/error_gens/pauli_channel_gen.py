@@ -0,0 +1,401 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Error generator for general Pauli channels, where each Pauli error of a gate can have its own probability.
+"""
+
+import numpy as np
+from .class_errors_circuit import ErrorCircuits
+from ..circuits.quantum_circuit import QuantumCircuit
+from .parent_class_error_gen import ParentErrorGen
+
+
+def alias_table(probs):
+    """
+    Creates the Walker alias table of a discrete distribution, with which an outcome is sampled from a single uniform
+    random number: ``u * n`` selects a column ``i`` and the outcome is ``i`` if the fractional part of ``u * n`` is less
+    than ``accept[i]`` and ``alias[i]`` otherwise.
+
+    Args:
+        probs: Probabilities of the ``n`` outcomes (summing to one).
+
+    Returns: Tuple of the arrays ``accept`` and ``alias``.
+
+    """
+
+    probs = np.asarray(probs, dtype=float)
+    n = len(probs)
+
+    scaled = probs * n / probs.sum()
+    accept = np.ones(n)
+    alias = np.arange(n)
+
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+
+    while small and large:
+        i = small.pop()
+        j = large.pop()
+
+        accept[i] = scaled[i]
+        alias[i] = j
+
+        scaled[j] += scaled[i] - 1.0
+        if scaled[j] < 1.0:
+            small.append(j)
+        else:
+            large.append(j)
+
+    # Whatever is left has a probability of one up to rounding errors.
+
+    return accept, alias
+
+
+class PauliChannelGen(ParentErrorGen):
+    """
+    An error generator for Pauli channels with an arbitrary probability for each Pauli error.
+
+    A channel is given for each gate symbol as the probabilities of the 3 one-qubit Paulis (X, Y, Z) or the 15
+    non-identity two-qubit Paulis (in the order of ``two_qubit_paulis``), either as a sequence or as a dict from Pauli to
+    probability. The symbols 'idle' and 'data' give the channels of the idle qudits of each tick and of the data qudits
+    at the start of a logical gate (as for the 'code_capacity' model of ``DepolarGen``).
+
+    When the errors of a tick are generated, the outcomes (no error or one of the Paulis) of all the gate locations with
+    channels are drawn at once with Walker alias tables, which need one random number per location.
+
+    Attributes:
+        channels (dict): Gate symbol => (probabilities, error parameter, after).
+    """
+
+    one_qubit_paulis = [('X', ), ('Y', ), ('Z', )]
+
+    two_qubit_paulis = [
+        ('I', 'X'), ('I', 'Y'), ('I', 'Z'),
+        ('X', 'I'), ('X', 'X'), ('X', 'Y'), ('X', 'Z'),
+        ('Y', 'I'), ('Y', 'X'), ('Y', 'Y'), ('Y', 'Z'),
+        ('Z', 'I'), ('Z', 'X'), ('Z', 'Y'), ('Z', 'Z')]
+
+    def __init__(self, channels=None, has_idle_errors=True):
+        """
+
+        Args:
+            channels (dict): Gate symbol => probabilities (see ``set_channel``).
+            has_idle_errors (bool): Whether the 'idle' channel, if given, is applied.
+        """
+
+        super().__init__()
+
+        self.has_idle_errors = has_idle_errors
+        self.channels = {}
+
+        # Set by ``start``.
+        self._key = None
+        self._tables = {}
+        self._accept = None
+        self._alias = None
+        self._after = None
+        self._opcodes = None
+
+        if channels is not None:
+            for symbol, probs in channels.items():
+                self.set_channel(symbol, probs)
+
+    def set_channel(self, symbol, probs, error_param=None, after=None):
+        """
+        Sets the Pauli channel of a gate symbol.
+
+        Args:
+            symbol (str): Gate symbol, or 'idle' or 'data'.
+            probs: The probability of each Pauli error: a sequence of 3 (X, Y, Z) or 15 (see ``two_qubit_paulis``)
+                probabilities, or a dict from Pauli symbols or tuples of them to probabilities (Paulis that are missing
+                have a probability of zero).
+            error_param (str): If given, ``probs`` are relative weights and the probability of each error is
+                ``error_params[error_param]`` times its share of the total weight.
+            after (bool): Whether errors occur after the gate. By default, errors occur before measurements and after
+                other gates.
+
+        """
+
+        probs = self._as_vector(probs)
+
+        if np.any(probs < 0.0):
+            raise Exception('The probabilities of gate "%s" can not be negative.' % symbol)
+
+        if error_param is None and probs.sum() > 1.0 + 1e-12:
+            raise Exception('The probabilities of gate "%s" sum to more than one.' % symbol)
+
+        if error_param is not None and probs.sum() == 0.0:
+            raise Exception('The weights of gate "%s" can not all be zero.' % symbol)
+
+        if after is None:
+            after = not symbol.startswith('measure')
+
+        self.channels[symbol] = (probs, error_param, after)
+        self._key = None
+
+    def _as_vector(self, probs):
+        """
+        Converts the probabilities of a channel to an array in the order of ``one_qubit_paulis`` or
+        ``two_qubit_paulis``.
+        """
+
+        if isinstance(probs, dict):
+            keys = [key if isinstance(key, tuple) else (key, ) for key in probs]
+            paulis = self.two_qubit_paulis if len(keys[0]) == 2 else self.one_qubit_paulis
+
+            vector = np.zeros(len(paulis))
+            for key, prob in zip(keys, probs.values()):
+                if key not in paulis:
+                    raise Exception('"%s" is not one of the Paulis %s.' % (key, paulis))
+                vector[paulis.index(key)] = prob
+
+            return vector
+
+        vector = np.array(probs, dtype=float)
+
+        if vector.shape not in [(3, ), (15, )]:
+            raise Exception('A Pauli channel needs 3 (one-qubit) or 15 (two-qubit) probabilities.')
+
+        return vector
+
+    def start(self, circuit, error_params):
+        """
+        Start up at the beginning of a circuit simulation. The alias tables of the channels are built for
+        ``error_params``.
+
+        Args:
+            circuit:
+            error_params:
+
+        Returns:
+
+        """
+
+        self.error_circuits = ErrorCircuits()
+        self.circuit = circuit
+        self.error_params = error_params
+
+        # The tables are only built again if the error parameters they depend on have changed.
+        key = tuple(error_params[error_param] for _, error_param, _ in self.channels.values() if error_param is not None)
+        if key != self._key:
+            self._build_tables(error_params)
+            self._key = key
+
+        return self.error_circuits
+
+    def _build_tables(self, error_params):
+        """
+        Builds the alias tables of the channels.
+        """
+
+        # The tables of all the channels are stored one after the other in flat arrays. Column 0 of a table is the
+        # outcome without an error and column k > 0 is its (k - 1)th Pauli, whose opcodes (one per qudit, see
+        # ``FaultArray``) are stored in ``_opcodes``.
+        self._tables = {}
+        accepts, aliases, after_flags, opcodes = [], [], [], []
+        offset = 0
+
+        for symbol, (probs, error_param, after) in self.channels.items():
+
+            if error_param is not None:
+                probs = error_params[error_param] * probs / probs.sum()
+
+            if not np.any(probs > 0.0):
+                continue
+
+            paulis = self.one_qubit_paulis if len(probs) == 3 else self.two_qubit_paulis
+
+            accept, alias = alias_table(np.concatenate([[max(0.0, 1.0 - probs.sum())], probs]))
+            accepts.append(accept)
+            aliases.append(alias)
+            after_flags.extend([after] * len(accept))
+            opcodes.append((0, 0))
+            opcodes.extend(tuple(_OPCODES.get(sym, 0) for sym in pauli) + (0, ) * (2 - len(pauli)) for pauli in paulis)
+
+            self._tables[symbol] = (offset, len(accept))
+            offset += len(accept)
+
+        self._accept = np.concatenate(accepts) if accepts else np.zeros(0)
+        self._alias = np.concatenate(aliases) if aliases else np.zeros(0, dtype=np.int64)
+        self._after = np.array(after_flags, dtype=bool)
+        self._opcodes = np.array(opcodes, dtype=np.uint8).reshape(-1, 2)
+
+    def generate_tick_errors(self, tick_circuit, time, **params):
+        """
+        Returns before errors, after errors, and replaced locations for the given key (args).
+
+        Returns:
+
+        """
+
+        groups = self._tick_groups(tick_circuit, time, params)
+
+        before = QuantumCircuit()
+        after = QuantumCircuit()
+
+        if groups:
+            # when => qudit => (x, z). Errors on the same qudit (such as data and idle errors) are multiplied together.
+            frames = ({}, {})
+
+            _, _, after_flags, qudits, opcodes = self._draw([(0, table, locations) for table, locations in groups])
+
+            for is_after, qudit, opcode in zip(after_flags.tolist(), qudits.tolist(), opcodes.tolist()):
+                frame = frames[is_after]
+                x, z = frame.get(qudit, (False, False))
+                frame[qudit] = (x ^ bool(opcode & 1), z ^ bool(opcode & 2))
+
+            for frame, errors in zip(frames, (before, after)):
+                for qudit, (x, z) in frame.items():
+                    if x or z:
+                        errors.update(_SYMBOLS[x, z], {qudit}, emptyappend=True)
+
+        self.error_circuits.add_circuits(time, before, after)
+
+        return self.error_circuits
+
+    def generate_pauli_faults(self, circuit, error_params, shots):
+        """
+        Generates the errors of many shots as flat arrays of one-qudit Paulis (see
+        ``ParentErrorGen.generate_pauli_faults``). The gate locations of the whole circuit are collected once and the
+        outcomes of all of them for all the shots are drawn together.
+
+        Args:
+            circuit: A ``QuantumCircuit`` or ``LogicalCircuit``.
+            error_params (dict): Parameters for the error generator.
+            shots (int): Number of shots.
+
+        Returns: Tuple of the times of the ticks and the shot, tick, whether it is after the tick, qudit, and opcode of
+            each Pauli, sorted by shot.
+
+        """
+
+        self.start(circuit, error_params)
+
+        times = []
+        groups = []
+        for tick_circuit, time, params in circuit.iter_ticks():
+
+            if params.get('error_free', False):
+                continue
+
+            tick_groups = self._tick_groups(tick_circuit, time, params)
+            if tick_groups:
+                groups.extend((len(times), table, locations) for table, locations in tick_groups)
+                times.append(time)
+
+        return (times, ) + self._draw(groups, shots)
+
+    def _tick_groups(self, tick_circuit, time, params):
+        """
+        Returns (table, locations) of each group of gate locations of a tick that have a channel.
+        """
+
+        if isinstance(time, tuple):
+            tick_index = time[-1]
+        else:
+            tick_index = time
+
+        circuit = tick_circuit.circuit
+        tables = self._tables
+
+        groups = []
+
+        if 'data' in tables and tick_index == 0 and params.get('data_qudit_set'):
+            groups.append((tables['data'], params['data_qudit_set']))
+
+        for symbol, locations, _ in circuit.items(tick=tick_index):
+            table = tables.get(symbol)
+            if table is not None and locations:
+                if isinstance(next(iter(locations)), tuple) != (table[1] == 16):
+                    raise Exception('The channel of gate "%s" does not match the number of qudits it acts on.' % symbol)
+                groups.append((table, locations))
+
+        if self.has_idle_errors and 'idle' in tables:
+            idle_qudits = circuit.idle_qudits(tick_index)
+            if idle_qudits:
+                groups.append((tables['idle'], idle_qudits))
+
+        return groups
+
+    def _draw(self, groups, shots=1, chunk_size=None):
+        """
+        Draws the outcomes of all the locations of ``groups`` for each shot.
+
+        Args:
+            groups: Tuples of (tag, table, locations), where the tag (an int, such as the index of a tick) is returned
+                with the errors of the locations.
+            shots (int): Number of shots.
+            chunk_size (int): Number of shots drawn at once (chosen to limit memory if None).
+
+        Returns: Tuple of arrays of the shot, tag, whether it is after the tick, qudit, and opcode of each non-identity
+            Pauli of the errors, sorted by shot.
+
+        """
+
+        rng = np.random if self.rng is None else self.rng
+
+        counts = [len(locs) for _, _, locs in groups]
+        tags = np.repeat(np.array([tag for tag, _, _ in groups], dtype=np.int64), counts)
+        offsets = np.repeat(np.array([offset for _, (offset, _), _ in groups], dtype=np.int64), counts)
+        sizes = np.repeat(np.array([size for _, (_, size), _ in groups], dtype=np.int64), counts)
+
+        # The qudits of each location, padded with -1 for one-qudit locations.
+        qudits = np.full((len(tags), 2), -1, dtype=np.int64)
+        start = 0
+        for (_, (_, size), locs), count in zip(groups, counts):
+            width = 2 if size == 16 else 1
+            qudits[start:start + count, :width] = np.array(list(locs), dtype=np.int64).reshape(count, width)
+            start += count
+
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 22) // max(1, len(tags)))
+
+        shot_ids, locations, columns = [], [], []
+        for first in range(0, shots, chunk_size):
+            num = min(chunk_size, shots - first)
+
+            u = rng.random((num, len(tags))) * sizes
+            column = u.astype(np.int64)
+            flat = offsets + column
+            outcomes = np.where(u - column < self._accept[flat], column, self._alias[flat])
+
+            chunk_shots, chunk_locations = np.nonzero(outcomes)
+            shot_ids.append(chunk_shots + first)
+            locations.append(chunk_locations)
+            columns.append(offsets[chunk_locations] + outcomes[chunk_shots, chunk_locations])
+
+        shot_ids = np.concatenate(shot_ids) if shot_ids else np.zeros(0, dtype=np.int64)
+        locations = np.concatenate(locations) if locations else np.zeros(0, dtype=np.int64)
+        columns = np.concatenate(columns) if columns else np.zeros(0, dtype=np.int64)
+
+        opcodes = self._opcodes[columns]
+        faults, positions = np.nonzero(opcodes)
+        locations = locations[faults]
+
+        return (shot_ids[faults], tags[locations], self._after[columns[faults]], qudits[locations, positions],
+                opcodes[faults, positions])
+
+    def tick_fault_channels(self, tick_circuit, time, **params):
+        """
+        Not supported, since the Pauli errors of a channel are not equally likely (see ``FaultTable``).
+        """
+
+        raise Exception('PauliChannelGen can not be converted to a FaultTable since its errors are not equally likely.')
+
+
+_SYMBOLS = {(True, False): 'X', (True, True): 'Y', (False, True): 'Z'}
+_OPCODES = {'X': 1, 'Z': 2, 'Y': 3}
@@ -183,7 +183,7 @@ class XZGen(ParentErrorGen):
         # idle errors
         # -----------
         if self.has_idle_errors:
-            inactive_qudits = circuit.qudits - circuit.active_qudits[tick_index]
+            inactive_qudits = circuit.idle_qudits(tick_index)
             self.gen.create_errors(self, 'idle', inactive_qudits, after, before, replace)
 
         self.error_circuits.add_circuits(time, before, after)
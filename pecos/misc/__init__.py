@@ -18,3 +18,4 @@
 
 from .threshold_curve import threshold_fit
 from . import commute
+from .random_streams import shot_rng, shot_rngs, shot_seed_sequence
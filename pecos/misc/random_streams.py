@@ -0,0 +1,107 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Functions for creating the random number generators of individual shots.
+
+By default, PECOS draws random numbers from the global state of ``np.random``, so results depend on the order in which
+shots are simulated. Instead, each shot can be given its own ``numpy.random.Generator``, derived from a seed and the
+index of the shot with ``numpy.random.SeedSequence``. The stream of a shot then does not depend on which other shots are
+simulated, or where, so a simulation split among any number of workers gives the same results as one run serially.
+"""
+
+from contextlib import contextmanager
+import numpy as np
+
+
+def shot_seed_sequence(seed, shot):
+    """
+    Returns the ``SeedSequence`` of a shot. It is the same as ``np.random.SeedSequence(seed).spawn(shot + 1)[shot]``.
+
+    Args:
+        seed (int): Seed of the whole simulation.
+        shot (int): Index of the shot.
+
+    Returns: np.random.SeedSequence
+
+    """
+
+    return np.random.SeedSequence(seed, spawn_key=(shot, ))
+
+
+def shot_rng(seed, shot):
+    """
+    Returns the random number generator of a shot.
+
+    Args:
+        seed (int): Seed of the whole simulation.
+        shot (int): Index of the shot.
+
+    Returns: np.random.Generator
+
+    """
+
+    return np.random.Generator(np.random.PCG64(shot_seed_sequence(seed, shot)))
+
+
+def shot_rngs(seed, start, stop):
+    """
+    Returns the random number generators of the shots ``start`` to ``stop - 1``, such as the shots one worker simulates.
+    """
+
+    return [shot_rng(seed, shot) for shot in range(start, stop)]
+
+
+@contextmanager
+def using_rng(rng, *objects):
+    """
+    Context manager that sets the ``rng`` attribute of objects, such as a simulator and an error generator, to ``rng``
+    and restores their previous generators on exit. Nothing is changed if ``rng`` is None, and objects that are None are
+    skipped.
+
+    Args:
+        rng (Optional[np.random.Generator]): The random number generator to use.
+        *objects: Objects with an ``rng`` attribute.
+
+    """
+
+    if rng is None:
+        objects = []
+    else:
+        objects = [obj for obj in objects if obj is not None]
+
+    previous = [obj.rng for obj in objects]
+
+    for obj in objects:
+        obj.rng = rng
+
+    try:
+        yield
+
+    finally:
+        for obj, old_rng in zip(objects, previous):
+            obj.rng = old_rng
+
+
+def random_bit(rng=None):
+    """
+    Returns a uniformly random bit drawn from ``rng``, or from the global state of ``np.random`` if ``rng`` is None.
+    """
+
+    if rng is None:
+        return np.random.randint(2)
+
+    return int(rng.integers(2))
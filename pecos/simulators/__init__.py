@@ -18,9 +18,16 @@
 
 from ._parent_sim_classes import Simulator
 from . import sim_class_types
+from ._logical_op import LogicalOp  # Logical operators compiled for repeated sign checks
+from ._gate_profiler import GateProfiler  # Opt-in per gate symbol profiling of simulators
 
 from ._sparsesim import SparseSim as pySparseSim  # Python sparse stabilizer sim
 from ._paulifaultprop import PauliFaultProp  # Pauli fault propagation sim
+from ._paulifaultprop import PauliFrameProp  # Batched Pauli-frame propagation sim
+from ._packedtableausim import PackedTableauSim  # Bit-packed tableau stabilizer sim
+from ._bitsetsim import BitSetSim  # Python-int bitset stabilizer sim
+from ._graphsim import GraphSim  # Graph-state stabilizer sim
+from ._statevecsim import StateVecSim  # NumPy state-vector sim
 
 # C++ version of SparseStabSim wrapper
 try:
@@ -0,0 +1,99 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from . import cmd_one_qubit as q1
+from . import cmd_two_qubit as q2
+from . import cmd_init as qinit
+from . import cmd_meas as qmeas
+
+gate_dict = {
+    # Initialization
+    # ==============
+    'init |0>': qinit.init_zero,
+    'init |1>': qinit.init_one,
+    'init |+>': qinit.init_plus,
+    'init |->': qinit.init_minus,
+    'init |+i>': qinit.init_plusi,
+    'init |-i>': qinit.init_minusi,
+
+    # circuit element symbol to function
+
+    # one-qubit operations
+    # ====================
+
+    # Paulis    # x->, z->
+    'I': q1.I,  # +x+z == R(U, 0)
+    'X': q1.X,  # +x-z == R(X, pi)
+    'Y': q1.Y,  # -x-z == R(Y, pi)
+    'Z': q1.Z,  # -x+z == R(Z, pi)
+
+    # Square root of Paulis
+    'Q': q1.Q,    # +x-y == R(X, pi/2)
+    'Qd': q1.Qd,  # +x+y == R(X, -pi/2)
+    'R': q1.R,    # -z+x == R(Y, pi/2)
+    'Rd': q1.Rd,  # +z-x == R(Y, -pi/2)
+    'S': q1.S,    # +y+z == R(Z, pi/2)
+    'Sd': q1.Sd,  # -y+z == R(Z, -pi/2)
+
+    # Hadamard-like
+    'H': q1.H,
+
+    'H1': q1.H,
+    'H2': q1.H2,
+    'H3': q1.H3,
+    'H4': q1.H4,
+    'H5': q1.H5,
+    'H6': q1.H6,
+
+    'H+z+x': q1.H,
+    'H-z-x': q1.H2,
+    'H+y-z': q1.H3,
+    'H-y-z': q1.H4,
+    'H-x+y': q1.H5,
+    'H-x-y': q1.H6,
+
+    # Face rotations
+    'F1': q1.F1,    # +y+x
+    'F1d': q1.F1d,  # +z+y
+    'F2': q1.F2,    # -z+y
+    'F2d': q1.F2d,  # -y-x
+    'F3': q1.F3,    # +y-x
+    'F3d': q1.F3d,  # -z-y
+    'F4': q1.F4,    # +z-y
+    'F4d': q1.F4d,  # -y+x
+
+    # two-qubit operations
+    # ====================
+    'CNOT': q2.CNOT,
+    'CZ': q2.CZ,
+    'CY': q2.CY,
+    'SWAP': q2.SWAP,
+    'G': q2.G2,
+    'G2': q2.G2,
+    'II': q2.II,
+
+    # Mølmer–Sørensen gates
+    'SqrtXX': q2.SqrtXX,  # \equiv e^{+i (\pi /4)} * e^{-i (\pi /4) XX } == R(XX, pi/2)
+    'MS': q2.SqrtXX,
+    'MSXX': q2.SqrtXX,
+
+    # Measurements
+    # ============
+    'measure X': qmeas.meas_x,
+    'measure Y': qmeas.meas_y,
+    'measure Z': qmeas.meas_z,
+    'force output': qmeas.force_output,
+}
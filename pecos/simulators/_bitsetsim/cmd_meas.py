@@ -0,0 +1,279 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Measurements for ``BitSetSim``.
+"""
+
+from ...misc.random_streams import random_bit
+from .helper import to_list, popcount
+from .cmd_one_qubit import H, H5
+
+
+def meas_x(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the X basis.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether state should be collapsed.
+
+    Returns: int
+
+    """
+
+    H(state, qubit)
+
+    meas_outcome = meas_z(state, qubit, forced_outcome, collapse)
+
+    H(state, qubit)
+
+    return meas_outcome
+
+
+def meas_y(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the Y basis.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether to collapse the state if measurement is not already determined.
+
+    Returns: int
+
+    """
+
+    H5(state, qubit)
+
+    meas_outcome = meas_z(state, qubit, forced_outcome, collapse)
+
+    H5(state, qubit)
+
+    return meas_outcome
+
+
+def meas_z(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the Z basis.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether to collapse the state if measurement is not already determined.
+
+    Returns: int
+
+    """
+
+    stabs = state.stabs
+
+    # Generators with an X or W on the qubit anti-commute with the measurement.
+    anticom_stabs = stabs.col_x[qubit]
+    anticom_destabs = state.destabs.col_x[qubit]
+
+    if not anticom_stabs:  # No anti-commuting stabilizer => determined sign
+
+        # Z_qubit is the product of the stabilizers whose destabilizers anti-commute with it.
+        num_minuses = popcount(anticom_destabs & stabs.signs_minus)
+        num_is = popcount(anticom_destabs & stabs.signs_i)
+
+        # Sign correction due ZX -> -XZ (none if Z_qubit is itself a generator, as after measuring it)
+        if anticom_destabs & (anticom_destabs - 1):
+            stabs.sync_rows()
+            row_x = stabs.row_x
+            row_z = stabs.row_z
+            cumulative_x = 0
+            for i in to_list(anticom_destabs):
+                num_minuses += popcount(row_z[i] & cumulative_x)
+                cumulative_x ^= row_x[i]
+
+        if num_is % 4:  # Can only be 0 or 2
+            num_minuses += 1
+
+        return num_minuses % 2
+
+    if not collapse:
+        return _choose_outcome(state, forced_outcome)
+
+    return nondeterministic_meas(state, qubit, anticom_stabs, anticom_destabs, forced_outcome)
+
+
+def nondeterministic_meas(state,
+                          qubit: int,
+                          anticom_stabs: int,
+                          anticom_destabs: int,
+                          forced_outcome: int) -> int:
+    """
+    Collapses the state for a Z measurement whose outcome is not determined.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        anticom_stabs (int): Mask of the stabilizers that anti-commute with the measurement.
+        anticom_destabs (int): Mask of the destabilizers that anti-commute with the measurement.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+
+    stabs = state.stabs
+    destabs = state.destabs
+
+    # The updates below keep the rows and columns in sync themselves.
+    stabs.sync_rows()
+    destabs.sync_rows()
+
+    stabs_row_x = stabs.row_x
+    stabs_row_z = stabs.row_z
+    destabs_row_x = destabs.row_x
+    destabs_row_z = destabs.row_z
+
+    # Replace the lowest weight anti-commuting stabilizer.
+    if anticom_stabs & (anticom_stabs - 1):
+        removed_id = min(to_list(anticom_stabs), key=lambda i: popcount(stabs_row_x[i]) + popcount(stabs_row_z[i]))
+    else:
+        removed_id = anticom_stabs.bit_length() - 1
+    removed_bit = 1 << removed_id
+
+    removed_row_x = stabs_row_x[removed_id]
+    removed_row_z = stabs_row_z[removed_id]
+
+    anticom_stabs ^= removed_bit
+    anticom_destabs &= ~removed_bit
+
+    # -----------------------------------------------
+    # Signs
+    # -----------------------------------------------
+    if stabs.signs_minus & removed_bit:
+        stabs.signs_minus ^= anticom_stabs
+
+    if stabs.signs_i & removed_bit:
+        stabs.signs_i ^= removed_bit
+
+        # i * i = -1 and 1 * i = i
+        stabs.signs_minus ^= stabs.signs_i & anticom_stabs
+        stabs.signs_i ^= anticom_stabs
+
+    # -----------------------------------------------
+    # Multiply anti-commuting stabs with removed stab.
+    # -----------------------------------------------
+    for i in to_list(anticom_stabs):
+
+        # ZX -> -XZ sign correction
+        if popcount(removed_row_z & stabs_row_x[i]) % 2:
+            stabs.signs_minus ^= 1 << i
+
+        stabs_row_x[i] ^= removed_row_x
+        stabs_row_z[i] ^= removed_row_z
+
+    for q in to_list(removed_row_x):
+        stabs.col_x[q] ^= anticom_stabs | removed_bit
+
+    for q in to_list(removed_row_z):
+        stabs.col_z[q] ^= anticom_stabs | removed_bit
+
+    # -----------------------------------------------
+    # Replace the removed stabilizer with the measured stabilizer.
+    # -----------------------------------------------
+    stabs.col_z[qubit] |= removed_bit
+    stabs_row_x[removed_id] = 0
+    stabs_row_z[removed_id] = 1 << int(qubit)
+
+    # -----------------------------------------------
+    # Multiply all other anti-commuting destabilizers by the new destabilizer (the removed stabilizer).
+    # -----------------------------------------------
+    for q in to_list(destabs_row_x[removed_id]):
+        destabs.col_x[q] ^= removed_bit
+
+    for q in to_list(destabs_row_z[removed_id]):
+        destabs.col_z[q] ^= removed_bit
+
+    for q in to_list(removed_row_x):
+        destabs.col_x[q] ^= anticom_destabs | removed_bit
+
+    for q in to_list(removed_row_z):
+        destabs.col_z[q] ^= anticom_destabs | removed_bit
+
+    for i in to_list(anticom_destabs):
+        destabs_row_x[i] ^= removed_row_x
+        destabs_row_z[i] ^= removed_row_z
+
+    destabs_row_x[removed_id] = removed_row_x
+    destabs_row_z[removed_id] = removed_row_z
+
+    # -----------------------------------------------
+    # Outcome
+    # -----------------------------------------------
+    meas_outcome = _choose_outcome(state, forced_outcome)
+
+    # Use the outcome as the sign of the new stabilizer
+    if meas_outcome:
+        stabs.signs_minus |= removed_bit
+    else:
+        stabs.signs_minus &= ~removed_bit
+
+    return meas_outcome
+
+
+def _choose_outcome(state, forced_outcome: int) -> int:
+    """
+    Returns the forced outcome or a uniformly random one (drawn from ``state.rng`` if it is set).
+    """
+
+    if forced_outcome == 0 or forced_outcome == 1:
+        return forced_outcome
+    elif forced_outcome is None or forced_outcome == -1:
+        return random_bit(state.rng)
+    else:
+        raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
+
+
+def force_output(state,
+                 qubit: int,
+                 forced_output: int = -1) -> int:
+    """
+    Outputs value.
+
+    Used for error generators to generate outputs when replacing measurements.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_output (int): Integer that will be outputted.
+
+    Returns: int
+
+    """
+    return forced_output
@@ -0,0 +1,383 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+One-qubit Cliffords for ``BitSetSim``.
+
+Each gate is specified by how it conjugates X and Z (the same "+z+x" notation used in the bindings). This is compiled
+once into the map of the qubit's (x, z) bits and the powers of i that generators with an X, Z, or W = XZ on the qubit
+pick up, which is then applied to the qubit's columns, which are single ``int`` bitmasks. The rows are synced later (see
+``Gens.sync_rows``).
+"""
+
+from typing import Tuple
+from .helper import add_phase
+
+# Pauli => (power of i, x bit, z bit) with Y = iW = iXZ
+_PAULIS = {'X': (0, 1, 0), 'Y': (1, 1, 1), 'Z': (0, 0, 1)}
+
+
+def compile_clifford(image_x: str, image_z: str) -> Tuple[int, ...]:
+    """
+    Compiles a one-qubit Clifford given the images of X and Z (e.g., '+Z', '-Y').
+
+    The power of i a generator picks up is a function of its (x, z) bits on the qubit. Each bit of it is written as
+    a x + b z + c xz (mod 2), so that the generators it is set for are a single expression of the qubit's columns.
+
+    Returns: Tuple of (x <- x, x <- z, z <- x, z <- z, a, b, c of bit 0 of the power of i, a, b, c of bit 1).
+
+    """
+
+    phase_x, xx, zx = _PAULIS[image_x[1].upper()]
+    phase_z, xz, zz = _PAULIS[image_z[1].upper()]
+
+    phase_x += 2 * (image_x[0] == '-')
+    phase_z += 2 * (image_z[0] == '-')
+
+    # W = XZ -> C(X) C(Z) = X^xx Z^zx X^xz Z^zz, where moving Z^zx past X^xz picks up (-1)^(zx xz)
+    phase_w = phase_x + phase_z + 2 * zx * xz
+
+    rule = [xx, xz, zx, zz]
+    for bit in (1, 2):
+        a = phase_x & bit and 1
+        b = phase_z & bit and 1
+        rule.extend((a, b, a ^ b ^ (phase_w & bit and 1)))
+
+    return tuple(rule)
+
+
+def apply_clifford(state,
+                   qubit: int,
+                   rule: Tuple[int, ...]) -> None:
+    """
+    Applies a compiled one-qubit Clifford to the stabilizers and destabilizers.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        rule (Tuple[int, ...]): Output of ``compile_clifford``.
+
+    Returns: None
+
+    """
+
+    xx, xz, zx, zz, a_1, b_1, c_1, a_2, b_2, c_2 = rule
+
+    # Signs (only tracked for the stabilizers)
+    # ----------------------------------------
+    stabs = state.stabs
+    bits_x = stabs.col_x[qubit]
+    bits_z = stabs.col_z[qubit]
+
+    mask_1 = (bits_x if a_1 else 0) ^ (bits_z if b_1 else 0) ^ (bits_x & bits_z if c_1 else 0)
+    mask_2 = (bits_x if a_2 else 0) ^ (bits_z if b_2 else 0) ^ (bits_x & bits_z if c_2 else 0)
+
+    if mask_1:
+        add_phase(stabs, mask_1, mask_2)
+    elif mask_2:
+        stabs.signs_minus ^= mask_2
+
+    # Paulis
+    # ------
+    if xz == zx == 0:
+        return
+
+    for g in state.gens:
+        bits_x = g.col_x[qubit]
+        bits_z = g.col_z[qubit]
+
+        new_x = (bits_x if xx else 0) ^ (bits_z if xz else 0)
+        new_z = (bits_x if zx else 0) ^ (bits_z if zz else 0)
+
+        if new_x != bits_x:
+            g.stale_x.setdefault(qubit, bits_x)
+            g.col_x[qubit] = new_x
+
+        if new_z != bits_z:
+            g.stale_z.setdefault(qubit, bits_z)
+            g.col_z[qubit] = new_z
+
+
+# Paulis
+_X = compile_clifford('+X', '-Z')
+_Y = compile_clifford('-X', '-Z')
+_Z = compile_clifford('-X', '+Z')
+
+# Square root of Paulis
+_Q = compile_clifford('+X', '-Y')
+_QD = compile_clifford('+X', '+Y')
+_R = compile_clifford('-Z', '+X')
+_RD = compile_clifford('+Z', '-X')
+_S = compile_clifford('+Y', '+Z')
+_SD = compile_clifford('-Y', '+Z')
+
+# Hadamard-like
+_H = compile_clifford('+Z', '+X')
+_H2 = compile_clifford('-Z', '-X')
+_H3 = compile_clifford('+Y', '-Z')
+_H4 = compile_clifford('-Y', '-Z')
+_H5 = compile_clifford('-X', '+Y')
+_H6 = compile_clifford('-X', '-Y')
+
+# Face rotations
+_F1 = compile_clifford('+Y', '+X')
+_F1D = compile_clifford('+Z', '+Y')
+_F2 = compile_clifford('-Z', '+Y')
+_F2D = compile_clifford('-Y', '-X')
+_F3 = compile_clifford('+Y', '-X')
+_F3D = compile_clifford('-Z', '-Y')
+_F4 = compile_clifford('+Z', '-Y')
+_F4D = compile_clifford('-Y', '+X')
+
+
+def I(state, qubit: int) -> None:
+    """
+    Identity, which does nothing.
+
+    X -> X
+    Z -> Z
+    """
+    pass
+
+
+def X(state, qubit: int) -> None:
+    """
+    Pauli X.
+
+    X -> X
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _X)
+
+
+def Y(state, qubit: int) -> None:
+    """
+    Pauli Y.
+
+    X -> -X
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _Y)
+
+
+def Z(state, qubit: int) -> None:
+    """
+    Pauli Z.
+
+    X -> -X
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _Z)
+
+
+def Q(state, qubit: int) -> None:
+    """
+    Square root of X.
+
+    X -> X
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _Q)
+
+
+def Qd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of X.
+
+    X -> X
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _QD)
+
+
+def R(state, qubit: int) -> None:
+    """
+    Square root of Y.
+
+    X -> -Z
+    Z -> X
+    """
+    apply_clifford(state, qubit, _R)
+
+
+def Rd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of Y.
+
+    X -> Z
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _RD)
+
+
+def S(state, qubit: int) -> None:
+    """
+    Square root of Z.
+
+    X -> Y
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _S)
+
+
+def Sd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of Z.
+
+    X -> -Y
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _SD)
+
+
+def H(state, qubit: int) -> None:
+    """
+    Hadamard.
+
+    X -> Z
+    Z -> X
+    """
+    apply_clifford(state, qubit, _H)
+
+
+def H2(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -Z
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _H2)
+
+
+def H3(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> Y
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _H3)
+
+
+def H4(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -Y
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _H4)
+
+
+def H5(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -X
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _H5)
+
+
+def H6(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -X
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _H6)
+
+
+def F1(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Y
+    Z -> X
+    """
+    apply_clifford(state, qubit, _F1)
+
+
+def F1d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Z
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _F1D)
+
+
+def F2(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Z
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _F2)
+
+
+def F2d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Y
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _F2D)
+
+
+def F3(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Y
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _F3)
+
+
+def F3d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Z
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _F3D)
+
+
+def F4(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Z
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _F4)
+
+
+def F4d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Y
+    Z -> X
+    """
+    apply_clifford(state, qubit, _F4D)
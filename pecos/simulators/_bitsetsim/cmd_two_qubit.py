@@ -0,0 +1,212 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Two-qubit Cliffords for ``BitSetSim``.
+
+The generators are written as (-1)^minus i^i times products of X, Z, and W = XZ (see ``BitSetSim``), so the sign rules
+differ from those of CHP. The gates only update the columns and leave syncing the rows to ``Gens.sync_rows``.
+"""
+
+from typing import Tuple
+from .helper import add_phase, add_to_column
+from .cmd_one_qubit import H, S, Sd
+
+
+def CNOT(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CNOT gate to the generators.
+
+    XI -> XX
+    ZI -> ZI
+    IX -> IX
+    IZ -> ZZ
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): Control and target qubits.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    # ``add_to_column`` is inlined since this is the most common gate.
+    for g in state.gens:
+        # X2 += X1
+        col_x = g.col_x
+        mask = col_x[qubit1]
+        if mask:
+            g.stale_x.setdefault(qubit2, col_x[qubit2])
+            col_x[qubit2] ^= mask
+
+        # Z1 += Z2
+        col_z = g.col_z
+        mask = col_z[qubit2]
+        if mask:
+            g.stale_z.setdefault(qubit1, col_z[qubit1])
+            col_z[qubit1] ^= mask
+
+
+def CZ(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CZ gate to the generators.
+
+    XI -> XZ
+    ZI -> ZI
+    IX -> ZX
+    IZ -> IZ
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    # XX -> XZ ZX = -WW
+    stabs = state.stabs
+    stabs.signs_minus ^= stabs.col_x[qubit1] & stabs.col_x[qubit2]
+
+    for g in state.gens:
+        x1 = g.col_x[qubit1]
+        x2 = g.col_x[qubit2]
+
+        # Z1 += X2, Z2 += X1
+        add_to_column(g.col_z, g.stale_z, qubit1, x2)
+        add_to_column(g.col_z, g.stale_z, qubit2, x1)
+
+
+def CY(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a Controlled-Y gate.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): Control and target qubits.
+
+    Returns: None
+
+    """
+
+    _, qubit2 = qubits
+
+    S(state, qubit2)
+    CNOT(state, qubits)
+    Sd(state, qubit2)
+
+
+def SWAP(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a SWAP gate to the generators.
+
+    XI -> IX
+    ZI -> IZ
+    IX -> XI
+    IZ -> ZI
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    for g in state.gens:
+        for cols, stale in ((g.col_x, g.stale_x), (g.col_z, g.stale_z)):
+            # Only the generators that differ on the two qubits change.
+            diff = cols[qubit1] ^ cols[qubit2]
+            add_to_column(cols, stale, qubit1, diff)
+            add_to_column(cols, stale, qubit2, diff)
+
+
+def G2(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CZ.H(1).H(2).CZ to the generators.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    CZ(state, qubits)
+    H(state, qubit1)
+    H(state, qubit2)
+    CZ(state, qubits)
+
+
+def II(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Two qubit identity.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+    pass
+
+
+def SqrtXX(state,
+           qubits: Tuple[int, int]) -> None:
+    """
+    Applies a square root of XX rotation to the generators.
+
+    XI -> XI
+    ZI -> -iWX (-YX)
+    IX -> IX
+    IZ -> -iXW (-XY)
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    # Generators with an odd number of Zs on the two qubits pick up -i and an XX.
+    stabs = state.stabs
+    odd_zs = stabs.col_z[qubit1] ^ stabs.col_z[qubit2]
+    add_phase(stabs, odd_zs, odd_zs)
+
+    for g in state.gens:
+        odd_zs = g.col_z[qubit1] ^ g.col_z[qubit2]
+
+        add_to_column(g.col_x, g.stale_x, qubit1, odd_zs)
+        add_to_column(g.col_x, g.stale_x, qubit2, odd_zs)
@@ -0,0 +1,102 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Bit-level helpers for ``BitSetSim``.
+
+Bit ``i`` of a row is qubit ``i`` and bit ``i`` of a column (or of the sign masks) is generator ``i``.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+
+def to_mask(ids: Iterable[int]) -> int:
+    """
+    Returns the bitmask with the bits of ``ids`` set.
+    """
+
+    mask = 0
+    for i in ids:
+        mask |= 1 << int(i)
+
+    return mask
+
+
+def to_list(mask: int) -> List[int]:
+    """
+    Returns the indices of the set bits of ``mask`` in increasing order.
+    """
+
+    ids = []
+    while mask:
+        i = mask.bit_length() - 1
+        ids.append(i)
+        mask ^= 1 << i
+
+    ids.reverse()
+    return ids
+
+
+def add_to_column(cols: List[int], stale: Dict[int, int], qubit: int, mask: int) -> None:
+    """
+    Toggles the generators in ``mask`` in the column of ``qubit``, noting the old column in ``stale`` so that the rows
+    can be synced later (see ``Gens.sync_rows``).
+    """
+
+    if mask:
+        stale.setdefault(qubit, cols[qubit])
+        cols[qubit] ^= mask
+
+
+def to_set(mask: int) -> Set[int]:
+    """
+    Returns the set of the indices of the set bits of ``mask``.
+    """
+    return set(to_list(mask))
+
+
+def _popcount(mask: int) -> int:
+    """
+    Number of set bits of ``mask``.
+    """
+    return bin(mask).count('1')
+
+
+# ``int.bit_count`` was added in Python 3.10.
+popcount = getattr(int, 'bit_count', _popcount)
+
+
+def add_phase(gens, mask_1: int, mask_2: int) -> None:
+    """
+    Multiplies the signs of generators by powers of i.
+
+    The generators in ``mask_1`` (but not ``mask_2``) are multiplied by i, those in ``mask_2`` (but not ``mask_1``) by
+    -1, and those in both by -i.
+
+    Args:
+        gens (Gens): The generators.
+        mask_1 (int): Bit 0 of the power of i for each generator.
+        mask_2 (int): Bit 1 of the power of i for each generator.
+
+    Returns: None
+
+    """
+
+    # (-1)^minus i^i * i^k: i * i = -1 carries into the minus sign
+    carry = gens.signs_i & mask_1
+
+    gens.signs_i ^= mask_1
+    gens.signs_minus ^= mask_2 ^ carry
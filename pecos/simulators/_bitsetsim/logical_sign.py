@@ -0,0 +1,89 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Functions:
+
+find_logical_signs
+"""
+
+from typing import Union
+from ...circuits import QuantumCircuit
+from .._logical_op import LogicalOp
+from .helper import to_list, popcount, to_set
+
+
+def find_logical_signs(state,
+                       logical_circuit: Union[QuantumCircuit, LogicalOp]) -> int:
+    """
+    Find the sign of the logical operator.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        logical_circuit (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+            operator (or the operator compiled with ``LogicalOp``).
+
+    Returns: 0 if the logical operator stabilizes the state with a +1 sign and 1 if with a -1 sign.
+
+    """
+
+    logical_op = LogicalOp.compile(logical_circuit)
+    logical_x, logical_z = logical_op.bitmasks()
+
+    stabs = state.stabs
+    destabs = state.destabs
+
+    # Stabilizers whose destabilizers anti-commute with the logical operator build the logical operator.
+    build_stabs = 0
+
+    for q in to_list(logical_x):
+        build_stabs ^= destabs.col_z[q]
+
+    for q in to_list(logical_z):
+        build_stabs ^= destabs.col_x[q]
+
+    # Multiply the stabilizers together
+    num_minuses = popcount(build_stabs & stabs.signs_minus)
+    num_is = popcount(build_stabs & stabs.signs_i)
+
+    stabs.sync_rows()
+
+    test_x = 0
+    test_z = 0
+    for i in to_list(build_stabs):
+        # Sign correction due ZX -> -XZ
+        num_minuses += popcount(stabs.row_z[i] & test_x)
+
+        test_x ^= stabs.row_x[i]
+        test_z ^= stabs.row_z[i]
+
+    # Compare with logical operator
+    test_x ^= logical_x
+    test_z ^= logical_z
+
+    if test_x or test_z:
+        print(('Logical op: xs - %s and zs - %s' % (set(logical_op.xs), set(logical_op.zs))))
+        raise Exception('Failure due to not finding logical op! x... %s z... %s' %
+                        (str(to_set(test_x ^ logical_x)), str(to_set(test_z ^ logical_z))))
+
+    # Translate the Ws to Ys... W = -iY => For each Y add another -1 and +i.
+    phase = 2 * num_minuses + num_is + 3 * logical_op.num_ys
+
+    if phase % 2:
+        raise Exception('Logical operator has an imaginary sign... Not allowed if logical state is stabilized '
+                        'by logical op!')
+
+    return (phase % 4) // 2
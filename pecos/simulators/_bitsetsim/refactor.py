@@ -0,0 +1,177 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Functions:
+
+find_stab
+refactor
+"""
+
+from typing import Optional, Set, Tuple
+from .helper import to_list, popcount, to_mask, to_set
+
+
+def find_stab(state,
+              xs: Set[int],
+              zs: Set[int]) -> Tuple[bool, Set[int]]:
+    """
+    Find a stabilizer in the stabilizer group.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        xs (Set[int]): Qubits the stabilizer acts on with X or W.
+        zs (Set[int]): Qubits the stabilizer acts on with Z or W.
+
+    Returns: Whether the stabilizer is in the stabilizer group and the ids of the generators whose destabilizers
+        anti-commute with it (i.e., the generators whose product is the stabilizer if it was found).
+
+    """
+
+    found, antidestabs = _find_stab(state, to_mask(xs), to_mask(zs))
+
+    return found, to_set(antidestabs)
+
+
+def _find_stab(state,
+               xs: int,
+               zs: int) -> Tuple[bool, int]:
+
+    stabs = state.stabs
+    destabs = state.destabs
+
+    # Find the destabilizer generators that anticommute with the stabilizer indicated by xs and zs.
+    antidestabs = 0
+    for q in to_list(xs):
+        antidestabs ^= destabs.col_z[q]
+
+    for q in to_list(zs):
+        antidestabs ^= destabs.col_x[q]
+
+    # Now we will confirm that the supplied stabilizer is actually in the stabilizer group.
+    stabs.sync_rows()
+
+    confirm_xs = 0
+    confirm_zs = 0
+    for i in to_list(antidestabs):
+        confirm_xs ^= stabs.row_x[i]
+        confirm_zs ^= stabs.row_z[i]
+
+    found = confirm_xs == xs and confirm_zs == zs
+
+    return found, antidestabs
+
+
+def refactor(state,
+             xs: Set[int],
+             zs: Set[int],
+             choose: Optional[int] = None,
+             prefer: Optional[Set[int]] = None,
+             protected: Optional[Set[int]] = None) -> Tuple[bool, Optional[int]]:
+    """
+    Updates the generators so that a stabilizer in the stabilizer group becomes one of the stabilizer generators.
+
+    Args:
+        state (BitSetSim): Instance representing the stabilizer state.
+        xs (Set[int]): Qubits the stabilizer acts on with X or W.
+        zs (Set[int]): Qubits the stabilizer acts on with Z or W.
+        choose (None, int): Order of stabilizer ids to choose from.
+        prefer (None, set): Stabilizer ids that we should choose from.
+        protected (None, set): Stabilizer ids not to choose from.
+
+    Returns: Whether the stabilizer was found and the id of the generator that was replaced by it.
+
+    """
+
+    stabs = state.stabs
+    destabs = state.destabs
+
+    # Determine if the proposed stabilizer is in the stabilizer group
+    found, gens = _find_stab(state, to_mask(xs), to_mask(zs))
+
+    if not found:
+        return found, None
+
+    # The updates below keep the rows and columns in sync themselves.
+    destabs.sync_rows()
+
+    # Pick a stabilizer generator to become the requested stabilizer generator.
+    available = gens & ~to_mask(protected) if protected else gens
+
+    if not available:
+        raise Exception('Every generator that builds the stabilizer is protected.')
+
+    new_stab = None
+    if prefer is not None:
+        for i in prefer:
+            if available >> i & 1:
+                new_stab = i
+                break
+
+    if new_stab is None:
+        if choose is None:
+            new_stab = (available & -available).bit_length() - 1
+        else:
+            new_stab = to_list(available)[choose]
+
+    new_bit = 1 << new_stab
+    gens ^= new_bit
+
+    # Now for each stabilizer/destabilizer generator pair we need to do:
+    # stab_new -> stab_new * stab
+    # destab -> destab * destab_new
+
+    # Stab update
+    row_x = stabs.row_x[new_stab]
+    row_z = stabs.row_z[new_stab]
+
+    num_minuses = popcount(gens & stabs.signs_minus) + (stabs.signs_minus >> new_stab & 1)
+    num_is = popcount(gens & stabs.signs_i) + (stabs.signs_i >> new_stab & 1)
+
+    for i in to_list(gens):
+        # ZX -> -XZ sign correction
+        num_minuses += popcount(row_z & stabs.row_x[i])
+
+        row_x ^= stabs.row_x[i]
+        row_z ^= stabs.row_z[i]
+
+    for q in to_list(row_x ^ stabs.row_x[new_stab]):
+        stabs.col_x[q] ^= new_bit
+
+    for q in to_list(row_z ^ stabs.row_z[new_stab]):
+        stabs.col_z[q] ^= new_bit
+
+    stabs.row_x[new_stab] = row_x
+    stabs.row_z[new_stab] = row_z
+
+    # Sign update
+    phase = (2 * num_minuses + num_is) % 4
+
+    stabs.signs_minus = stabs.signs_minus & ~new_bit | (phase >> 1) << new_stab
+    stabs.signs_i = stabs.signs_i & ~new_bit | (phase & 1) << new_stab
+
+    # Destab update
+    for q in to_list(destabs.row_x[new_stab]):
+        destabs.col_x[q] ^= gens
+
+    for q in to_list(destabs.row_z[new_stab]):
+        destabs.col_z[q] ^= gens
+
+    for i in to_list(gens):
+        destabs.row_x[i] ^= destabs.row_x[new_stab]
+        destabs.row_z[i] ^= destabs.row_z[new_stab]
+
+    return found, new_stab
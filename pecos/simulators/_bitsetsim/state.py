@@ -0,0 +1,487 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+A stabilizer simulator that stores each row and column of the tableau as a Python ``int`` bitmask.
+
+The data structure is the same as that of ``SparseSim`` (stabilizers and destabilizers stored both row-wise and
+column-wise, with signs written as (-1)^minus i^i times a product of X, Z, and W = XZ), except that the sets of ids are
+replaced by bitmasks. Set operations on a row or column then become single integer operations, which is faster than
+hashing when the rows and columns are heavy, such as for surface code states or dense tableaus. When they have only one
+or two entries, hashing is just as fast, and the Python ``SparseSim`` is 10-30% faster.
+
+Gates only update the columns. Keeping the rows in sync means toggling one bit in the row of every generator in a
+changed column, which would make the cost of a gate grow with the weight of its columns again. So the gates only note
+the columns they change, and the rows are brought up to date (see ``Gens.sync_rows``) when they are read, which is
+mostly by measurements. All the changes to a column since then are applied to the rows at once, and changes that cancel
+out cost nothing.
+
+For the paper on CHP read: http://arxiv.org/abs/quant-ph/0406196
+"""
+
+from typing import Any, Union, Set, Tuple, List, Iterable
+from ...circuits import QuantumCircuit
+from ..sim_class_types import Stabilizer
+from .. import _serialization
+from .._logical_op import LogicalOp
+from . import bindings
+from .helper import to_list
+from .logical_sign import find_logical_signs
+from .refactor import refactor as refactor_generators
+from .refactor import find_stab as find_stabilizer
+
+
+class BitSetSim(Stabilizer):
+    """
+    Represents the stabilizer state.
+
+    Attributes:
+        num_qubits (int):
+        bindings (dict):
+        stabs (Gens):
+        destabs (Gens):
+        gens (Tuple[Gens, Gens]):
+    """
+
+    def __init__(self, num_qubits: int) -> None:
+        """
+        Initializes the stabilizer state.
+
+        Args:
+            num_qubits (int): Number of qubits being represented.
+
+        Returns:
+
+        """
+
+        super().__init__()
+
+        if not isinstance(num_qubits, int):
+            raise Exception('``num_qubits`` should be of type ``int.``')
+
+        self.num_qubits = num_qubits
+
+        self.bindings = bindings.gate_dict
+
+        # Represent a stabilizer state with ``num_qubits`` qubits.
+        self.stabs = Gens(num_qubits)
+        self.destabs = Gens(num_qubits)
+        self.gens = (self.stabs, self.destabs)
+
+        # Initialize all qubits in the zero state
+        self.stabs.init_all_z()
+        self.destabs.init_all_x()
+
+    def logical_sign(self,
+                     logical_op: Union[QuantumCircuit, LogicalOp]) -> int:
+        """
+        Returns the sign of a logical operator that is in the stabilizer group.
+
+        Args:
+            logical_op (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+                operator (or the operator compiled with ``LogicalOp``).
+
+        Returns: int
+
+        """
+        return find_logical_signs(self, logical_op)
+
+    def logical_signs(self,
+                      logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+        """
+        Returns the signs of several logical operators that are in the stabilizer group.
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): The logical operators.
+
+        Returns: List[int]
+
+        """
+        return [find_logical_signs(self, logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
+    def refactor(self,
+                 xs: Set[int],
+                 zs: Set[int],
+                 choose=None,
+                 prefer=None,
+                 protected=None):
+
+        return refactor_generators(self, xs, zs, choose, prefer, protected)
+
+    def find_stab(self,
+                  xs: Set[int],
+                  zs: Set[int]):
+
+        return find_stabilizer(self, xs, zs)
+
+    def run_direct(self,
+                   symbol: str,
+                   location: Set[Union[int, Tuple[int, ...]]],
+                   **gate_kwargs: Any):
+        self.bindings[symbol](self, location, **gate_kwargs)
+
+    def reset(self) -> None:
+        """
+        Returns the state to |0...0> in place. Since the rows and columns are ints, this only rebuilds two lists per
+        generator set.
+
+        Returns: None
+
+        """
+
+        self.stabs.init_all_z()
+        self.destabs.init_all_x()
+
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+
+        new = BitSetSim(self.num_qubits)
+        new.restore(self)
+
+        return new
+
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
+
+        Returns (BitSetSim): A copy of the state that is not modified by later gates.
+
+        """
+        return self.copy()
+
+    def restore(self, snapshot) -> None:
+        """
+        Overwrites the stabilizers and destabilizers with those of a snapshot. The snapshot is left untouched and can
+        be restored again.
+
+        Args:
+            snapshot (BitSetSim): State returned by ``snapshot`` (or any ``BitSetSim`` with the same number of qubits).
+
+        Returns: None
+
+        """
+
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        for gen, old_gen in zip(self.gens, snapshot.gens):
+            gen.copy_from(old_gen)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the tableau into a compact bit-packed format (see ``pecos.simulators._serialization``), which can
+        also be read by the other stabilizer simulators.
+
+        Returns: bytes
+
+        """
+
+        n = self.num_qubits
+
+        self.stabs.sync_rows()
+        self.destabs.sync_rows()
+
+        tableau = {}
+        for name, gen in (('stabs', self.stabs), ('destabs', self.destabs)):
+            tableau[name + '_x'] = _serialization.ints_to_bits(gen.row_x, n)
+            tableau[name + '_z'] = _serialization.ints_to_bits(gen.row_z, n)
+            tableau[name + '_minus'] = _serialization.ints_to_bits([gen.signs_minus], n)[0]
+            tableau[name + '_i'] = _serialization.ints_to_bits([gen.signs_i], n)[0]
+
+        return _serialization.tableau_to_bytes(n, tableau)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized tableau.
+
+        Returns (BitSetSim): The deserialized state.
+
+        """
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        state = cls(num_qubits)
+        state._load_tableau(tableau)
+
+        return state
+
+    def _load_tableau(self, tableau) -> None:
+
+        for name, gen in (('stabs', self.stabs), ('destabs', self.destabs)):
+            gen.signs_minus = _serialization.bits_to_ints(tableau[name + '_minus'])[0]
+            gen.signs_i = _serialization.bits_to_ints(tableau[name + '_i'])[0]
+
+            gen.row_x = _serialization.bits_to_ints(tableau[name + '_x'])
+            gen.row_z = _serialization.bits_to_ints(tableau[name + '_z'])
+
+            gen.col_x = rows_to_cols(gen.row_x, self.num_qubits)
+            gen.col_z = rows_to_cols(gen.row_z, self.num_qubits)
+
+            gen.stale_x = {}
+            gen.stale_z = {}
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, data: bytes) -> None:
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        self.__init__(num_qubits)
+        self._load_tableau(tableau)
+
+    def print_stabs(self,
+                    verbose: bool = True,
+                    print_y: bool = True,
+                    print_destabs: bool = False):
+
+        str_s = self.print_tableau(self.stabs, verbose=verbose, print_y=print_y)
+
+        if print_destabs:
+            if verbose:
+                print('-------------------------------')
+            str_d = self.print_tableau(self.destabs, verbose=verbose, print_signs=False, print_y=print_y)
+
+            return str_s, str_d
+
+        return str_s
+
+    @staticmethod
+    def print_tableau(gen,
+                      verbose: bool = True,
+                      print_signs: bool = True,
+                      print_y: bool = True) -> List[str]:
+        """
+        Prints out the generators.
+        """
+
+        col_str = gen.col_string(print_signs=print_signs, print_y=print_y)
+        row_str = gen.row_string(print_signs=print_signs, print_y=print_y)
+
+        if col_str != row_str:
+            raise Exception('Something bad happened! String representation of the row-wise vs column-wise '
+                            'stabilizers do not match!')
+
+        if verbose:
+            for line in col_str:
+                print(line)
+
+        return col_str
+
+
+def rows_to_cols(rows: List[int], num_qubits: int) -> List[int]:
+    """
+    Transposes the rows of generators into columns.
+    """
+
+    cols = [0] * num_qubits
+    for i, row in enumerate(rows):
+        gen_bit = 1 << i
+        for q in to_list(row):
+            cols[q] |= gen_bit
+
+    return cols
+
+
+class Gens(object):
+    """
+    This class is the data structure used for tracking stabilizer/destabilizer generators.
+
+    Attributes:
+        num_qubits (int): Number of qubits.
+        col_x (List[int]): For each qubit, the mask of the generators with an X or W on it.
+        col_z (List[int]): For each qubit, the mask of the generators with a Z or W on it.
+        row_x (List[int]): For each generator, the mask of the qubits with an X or W on them.
+        row_z (List[int]): For each generator, the mask of the qubits with a Z or W on them.
+        stale_x (Dict[int, int]): For each qubit whose X column changed since the rows were last synced, the column at
+            that time. Code that changes a column without updating the rows records it here.
+        stale_z (Dict[int, int]): Same for the Z columns.
+        signs_minus (int): Mask of the generators with a -1 sign.
+        signs_i (int): Mask of the generators with an i sign.
+    """
+
+    _sign_strs = ('  ', ' i', ' -', '-i')
+
+    def __init__(self, num_qubits: int) -> None:
+        """
+        :param num_qubits: Number of qubits to simulate.
+        """
+
+        self.num_qubits = num_qubits
+
+        self.col_x = [0] * num_qubits
+        self.col_z = [0] * num_qubits
+
+        self.row_x = [0] * num_qubits
+        self.row_z = [0] * num_qubits
+
+        self.stale_x = {}
+        self.stale_z = {}
+
+        self.signs_minus = 0
+        self.signs_i = 0
+
+    def sync_rows(self) -> None:
+        """
+        Brings the rows up to date with the columns that changed since they were last synced. This has to be called
+        before reading the rows.
+        """
+
+        for rows, cols, stale in ((self.row_x, self.col_x, self.stale_x), (self.row_z, self.col_z, self.stale_z)):
+            if stale:
+                # Toggle the qubit's bit in the rows of the generators whose entry in the column changed.
+                for q, old_col in stale.items():
+                    mask = cols[q] ^ old_col
+                    bit = 1 << int(q)
+                    while mask:
+                        i = mask.bit_length() - 1
+                        rows[i] ^= bit
+                        mask ^= 1 << i
+
+                stale.clear()
+
+    def copy_from(self, other) -> None:
+        """
+        Replaces the generators with copies of those in ``other``.
+
+        :param other: Gens instance to copy.
+        """
+
+        # ints are immutable so copying the lists is enough.
+        self.signs_minus = other.signs_minus
+        self.signs_i = other.signs_i
+
+        self.col_x = list(other.col_x)
+        self.col_z = list(other.col_z)
+
+        self.row_x = list(other.row_x)
+        self.row_z = list(other.row_z)
+
+        self.stale_x = dict(other.stale_x)
+        self.stale_z = dict(other.stale_z)
+
+    def init_all_z(self) -> None:
+        """
+        Used to initiate stabilizers to all Zs.
+        """
+
+        self.signs_minus = 0
+        self.signs_i = 0
+
+        self.col_x = [0] * self.num_qubits
+        self.col_z = [1 << i for i in range(self.num_qubits)]
+
+        self.row_x = [0] * self.num_qubits
+        self.row_z = [1 << i for i in range(self.num_qubits)]
+
+        self.stale_x = {}
+        self.stale_z = {}
+
+    def init_all_x(self) -> None:
+        """
+        Used to initiate destabilizers to all Xs.
+        """
+
+        self.signs_minus = 0
+        self.signs_i = 0
+
+        self.col_x = [1 << i for i in range(self.num_qubits)]
+        self.col_z = [0] * self.num_qubits
+
+        self.row_x = [1 << i for i in range(self.num_qubits)]
+        self.row_z = [0] * self.num_qubits
+
+        self.stale_x = {}
+        self.stale_z = {}
+
+    def _pauli_sign(self, i_gen: int, num_ys: int) -> str:
+
+        # Stored as (-1)^minus i^i W^k = (-1)^minus i^i (-i)^k Y^k
+        phase = 2 * (self.signs_minus >> i_gen & 1) + (self.signs_i >> i_gen & 1) + 3 * num_ys
+
+        return self._sign_strs[phase % 4]
+
+    def _string(self, letters: List[List[str]], print_signs: bool, print_y: bool) -> List[str]:
+
+        result = []
+        for i_gen, stab_letters in enumerate(letters):
+            num_ws = stab_letters.count('W')
+
+            if print_y:
+                stab_letters = ['Y' if letter == 'W' else letter for letter in stab_letters]
+
+            sign = self._pauli_sign(i_gen, num_ws if print_y else 0) if print_signs else '  '
+
+            result.append(sign + ''.join(stab_letters))
+
+        return result
+
+    @staticmethod
+    def _letter(x: int, z: int) -> str:
+        return 'IZXW'[2 * x + z]
+
+    def col_string(self,
+                   print_signs: bool = True,
+                   print_y: bool = False) -> List[str]:
+        """
+        Returns the string representation of each generator built from the column-wise representation.
+
+        Args:
+            print_signs (bool): Whether to print the signs of the generators.
+            print_y (bool): Whether to write Y instead of W.
+
+        Returns: List[str]
+
+        """
+
+        letters = [[self._letter(self.col_x[q] >> i_gen & 1, self.col_z[q] >> i_gen & 1)
+                    for q in range(self.num_qubits)] for i_gen in range(self.num_qubits)]
+
+        return self._string(letters, print_signs, print_y)
+
+    def row_string(self,
+                   print_signs: bool = True,
+                   print_y: bool = False) -> List[str]:
+        """
+        Returns the string representation of each generator built from the row-wise representation.
+
+        Args:
+            print_signs (bool): Whether to print the signs of the generators.
+            print_y (bool): Whether to write Y instead of W.
+
+        Returns: List[str]
+
+        """
+
+        self.sync_rows()
+
+        letters = [[self._letter(row_x >> q & 1, row_z >> q & 1) for q in range(self.num_qubits)]
+                   for row_x, row_z in zip(self.row_x, self.row_z)]
+
+        return self._string(letters, print_signs, print_y)
+
+    def print_tableau(self, verbose: bool = True) -> List[str]:
+        """
+        Prints out the generators.
+        """
+
+        return BitSetSim.print_tableau(self, verbose=verbose, print_y=False)
@@ -25,9 +25,15 @@ The setup file for the Cython wrapped C++ version of SparseSim.
 Notes:
     Use the following to compile from command line:
     python setup.py build_ext --inplace
+
+    The set container used by the C++ simulator can be chosen with the environment variable ``PECOS_SPARSESIM_SET``
+    ("hash", "sorted", "bitset", or "hybrid"). The default is "bitset", which is the fastest container on every family
+    of ``benchmark_sets.py``. A bitset takes one bit per qubit (or generator) whether or not it is set, so "hash" or
+    "sorted" may be preferable for very large, very sparse states.
 """
 # import numpy as np
 import os
+import sys
 import shutil
 from distutils.core import setup
 from distutils.extension import Extension
@@ -40,18 +46,32 @@ try:
 except FileNotFoundError:
     pass
 
+# Set container used for the rows, columns, and signs of the stabilizer tableau
+set_macros = {
+    'hash': [],
+    'sorted': [('SPARSESIM_SET_SORTED', None)],
+    'bitset': [('SPARSESIM_SET_BITSET', None)],
+    'hybrid': [('SPARSESIM_SET_HYBRID', None)],
+}
+
+set_type = os.environ.get('PECOS_SPARSESIM_SET', 'bitset')
+if set_type not in set_macros:
+    raise Exception('PECOS_SPARSESIM_SET must be one of: %s' % ', '.join(set_macros))
+
 # compiler_flags = ["-std=c++11", "-Wall", "-fPIC", "-O2", "-O3", "-c", ]
-compiler_flags = ["-std=c++11", "-W3", "-fPIC", "-O2", "-O3", "-c", ]
+# "-W3" is only understood by MSVC
+warning_flag = "-W3" if sys.platform == 'win32' else "-Wall"
+compiler_flags = ["-std=c++11", warning_flag, "-fPIC", "-O2", "-O3", "-c", ]
 
 ext_modules = [
     Extension('cysparsesim',
               sources=[
                   "src/cysparsesim.pyx",
                   "src/sparsesim.cpp",
-                  "src/logical_sign.py",
               ],
               language='c++',
               extra_compile_args=compiler_flags,
+              define_macros=set_macros[set_type],
               include_dirs=['./src'],
               # include_dirs=[np.get_include()],
               ),
@@ -21,9 +21,12 @@
 
 cimport src.cysparsesim_header as s
 from src.cysparsesim_header cimport int_num, bool
+from libcpp.vector cimport vector
+from cython.operator cimport dereference as deref, preincrement as inc
+import numpy as np
 
-# from .logical_sign import find_logical_signs
-from .src.logical_sign import find_logical_signs
+from .._logical_op import LogicalOp
+from .. import _serialization
 
 cdef dict bindings = {
 
@@ -89,6 +92,152 @@ cdef dict bindings = {
                 
             }
 
+# Gates that ``SparseSim.run_gates`` dispatches to the C++ ``State::run_gate``.
+cdef dict gate_ids = {
+
+    'init |0>': s.GATE_INIT_ZERO,
+    'init |1>': s.GATE_INIT_ONE,
+    'init |+>': s.GATE_INIT_PLUS,
+    'init |->': s.GATE_INIT_MINUS,
+    'init |+i>': s.GATE_INIT_PLUSI,
+    'init |-i>': s.GATE_INIT_MINUSI,
+
+    'I': s.GATE_I,
+    'X': s.GATE_X,
+    'Y': s.GATE_Y,
+    'Z': s.GATE_Z,
+
+    'Q': s.GATE_Q,
+    'Qd': s.GATE_QD,
+    'R': s.GATE_R,
+    'Rd': s.GATE_RD,
+    'S': s.GATE_S,
+    'Sd': s.GATE_SD,
+
+    'H': s.GATE_H,
+    'H1': s.GATE_H,
+    'H2': s.GATE_H2,
+    'H3': s.GATE_H3,
+    'H4': s.GATE_H4,
+    'H5': s.GATE_H5,
+    'H6': s.GATE_H6,
+
+    'H+z+x': s.GATE_H,
+    'H-z-x': s.GATE_H2,
+    'H+y-z': s.GATE_H3,
+    'H-y-z': s.GATE_H4,
+    'H-x+y': s.GATE_H5,
+    'H-x-y': s.GATE_H6,
+
+    'F1': s.GATE_F1,
+    'F2': s.GATE_F2,
+    'F3': s.GATE_F3,
+    'F4': s.GATE_F4,
+
+    'F1d': s.GATE_F1D,
+    'F2d': s.GATE_F2D,
+    'F3d': s.GATE_F3D,
+    'F4d': s.GATE_F4D,
+
+    'II': s.GATE_II,
+    'CNOT': s.GATE_CNOT,
+    'CZ': s.GATE_CZ,
+    'CY': s.GATE_CY,
+    'SWAP': s.GATE_SWAP,
+    'G': s.GATE_G2,
+
+    'SqrtXX': s.GATE_SQRTXX,
+    'MS': s.GATE_SQRTXX,
+    'MSXX': s.GATE_SQRTXX,
+
+    'measure X': s.GATE_MEASURE_X,
+    'measure Y': s.GATE_MEASURE_Y,
+    'measure Z': s.GATE_MEASURE_Z,
+
+            }
+
+cdef set batch_params = {'forced_outcome', 'collapse'}
+
+cdef set meas_symbols = {'measure X', 'measure Y', 'measure Z'}
+
+# Name of the set container ``sparsesim.h`` was built with ("hash", "sorted", "bitset", or "hybrid").
+int_set_type = s.SPARSESIM_SET_NAME.decode('ascii')
+
+
+def get_dense_threshold():
+    """
+    Returns the number of ids above which a set is stored as a bitset when built with the "hybrid" container.
+    """
+    return s.hybrid_dense_threshold
+
+
+def set_dense_threshold(size_t threshold):
+    """
+    Sets the number of ids above which a set is stored as a bitset when built with the "hybrid" container. Setting it
+    to 0 stores all sets as bitsets, while a very large value stores all sets as sorted vectors.
+    """
+    s.hybrid_dense_threshold = threshold
+
+
+cdef set _to_set(s.int_set& c_set):
+
+    cdef:
+        set result = set()
+        s.int_set.iterator it = c_set.begin()
+
+    while it != c_set.end():
+        result.add(deref(it))
+        inc(it)
+
+    return result
+
+
+cdef list _to_sets(s.int_set_vec& c_sets):
+    return [_to_set(c_sets[i]) for i in range(c_sets.size())]
+
+
+cdef list _sizes(s.int_set_vec& c_sets):
+    return [c_sets[i].size() for i in range(c_sets.size())]
+
+
+cdef dict _to_dict(s.Generators& gen):
+    return {
+        'col_x': _to_sets(gen.col_x),
+        'col_z': _to_sets(gen.col_z),
+        'row_x': _to_sets(gen.row_x),
+        'row_z': _to_sets(gen.row_z),
+    }
+
+
+cdef void _toggle(vector[unsigned char]& flags, s.int_set& c_set):
+
+    cdef s.int_set.iterator it = c_set.begin()
+
+    while it != c_set.end():
+        flags[deref(it)] ^= 1
+        inc(it)
+
+
+cdef void _from_set(s.int_set& c_set, values):
+
+    c_set.clear()
+
+    for value in values:
+        c_set.insert(value)
+
+
+cdef void _from_sets(s.int_set_vec& c_sets, sets):
+
+    cdef Py_ssize_t i
+
+    c_sets.clear()
+    c_sets.resize(len(sets))
+
+    for i, values in enumerate(sets):
+        for value in values:
+            c_sets[i].insert(value)
+
+
 cdef class SparseSim:
     
     cdef s.State* _c_state
@@ -97,6 +246,8 @@ cdef class SparseSim:
         int_num num_qubits
         int reserve_buckets
         dict bindings
+        object profiler
+        object rng
     
     def __cinit__(self, int_num num_qubits, int reserve_buckets=0):
         self._c_state = new s.State(num_qubits, reserve_buckets)
@@ -104,6 +255,8 @@ cdef class SparseSim:
         self.num_qubits = self._c_state.num_qubits
         self.reserve_buckets = self._c_state.reserve_buckets
         self.bindings = bindings
+        self.profiler = None
+        self.rng = None
 
     cdef void hadamard(self, int_num qubit):
         self._c_state.hadamard(qubit)
@@ -283,19 +436,245 @@ cdef class SparseSim:
         
     cdef void initminusi(self, const int_num qubit):
         self.initone(qubit)
-        self._c_state.H6(qubit)
+        self._c_state.H5(qubit)  # -Z -> -Y
         
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+
+        cdef SparseSim new = SparseSim(self.num_qubits, self.reserve_buckets)
+        new.restore(self)
+
+        return new
+
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
+
+        Returns (SparseSim): A copy of the state that is not modified by later gates.
+
+        """
+        return self.copy()
+
+    def restore(self, SparseSim snapshot):
+        """
+        Overwrites the stabilizers and destabilizers with those of a snapshot. The snapshot is left untouched and can
+        be restored again.
+
+        Args:
+            snapshot (SparseSim): State returned by ``snapshot`` (or any ``SparseSim`` with the same number of qubits).
+
+        Returns: None
+
+        """
+
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        # Bulk copies of the C++ containers.
+        self._c_state.stabs = snapshot._c_state.stabs
+        self._c_state.destabs = snapshot._c_state.destabs
+        self._c_state.signs_minus = snapshot._c_state.signs_minus
+        self._c_state.signs_i = snapshot._c_state.signs_i
+        self._c_state.touched = snapshot._c_state.touched
+        self._c_state.is_touched = snapshot._c_state.is_touched
+
+    def reset(self):
+        """
+        Returns the state to |0...0> in place.
+
+        The C++ state keeps track of the qubits that gates have acted on since it was last |0...0>, and only the rows and
+        columns of these qubits are reinitialized. If the generators were set directly (e.g., by ``from_bytes``), every
+        row and column is reinitialized, still without allocating new sets.
+
+        Returns: None
+
+        """
+        self._c_state.reset()
+
+    def to_bytes(self):
+        """
+        Serializes the tableau into a compact bit-packed format (see ``pecos.simulators._serialization``), which can
+        also be read by the other stabilizer simulators.
+
+        Returns: bytes
+
+        """
+
+        stabs = self.stabs
+        stabs['signs_minus'] = self.signs_minus
+        stabs['signs_i'] = self.signs_i
+
+        # The signs of the destabilizers are not tracked.
+        destabs = self.destabs
+        destabs['signs_minus'] = set()
+        destabs['signs_i'] = set()
+
+        return _serialization.tableau_to_bytes(self.num_qubits,
+                                               _serialization.gens_to_bits(self.num_qubits, stabs, destabs))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized tableau.
+
+        Returns (SparseSim): The deserialized state.
+
+        """
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        cdef SparseSim state = cls(num_qubits)
+        state._load_tableau(tableau)
+
+        return state
+
+    def _load_tableau(self, tableau):
+
+        stabs, destabs = _serialization.bits_to_gens(self.num_qubits, tableau)
+
+        self.set_stabs_destabs(stabs['row_x'], stabs['row_z'], destabs['row_x'], destabs['row_z'])
+
+        _from_set(self._c_state.signs_minus, stabs['signs_minus'])
+        _from_set(self._c_state.signs_i, stabs['signs_i'])
+
+    def __reduce__(self):
+        return SparseSim, (self.num_qubits, self.reserve_buckets), self.to_bytes()
+
+    def __setstate__(self, data):
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        if num_qubits != self.num_qubits:
+            raise Exception('Serialized state has %s qubits but the state has %s.' % (num_qubits, self.num_qubits))
+
+        self._load_tableau(tableau)
+
     def logical_sign(self, logical_op):
         """
+        Returns the sign of a logical operator that is in the stabilizer group.
 
         Args:
-            logical_op:
+            logical_op: Single tick circuit of X, Y, and Z gates giving the logical operator (or the operator compiled
+                with ``LogicalOp``).
 
-        Returns:
+        Returns: int
 
         """
-        return find_logical_signs(self, logical_op)
+        return self._logical_sign(LogicalOp.compile(logical_op))
+
+    def logical_signs(self, logical_ops):
+        """
+        Returns the signs of several logical operators that are in the stabilizer group.
+
+        Args:
+            logical_ops: Iterable of logical operators.
+
+        Returns: List[int]
+
+        """
+        return [self._logical_sign(logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
+    cdef int _logical_sign(self, logical_op) except -1:
+
+        cdef:
+            int_num n = self.num_qubits
+            int_num q, stab
+            vector[unsigned char] build_stabs, test_x, test_z
+            size_t logical_minus = logical_op.num_ys
+            size_t logical_i = logical_op.num_ys
+
+        build_stabs.resize(n, 0)
+        test_x.resize(n, 0)
+        test_z.resize(n, 0)
+
+        for q in logical_op.xs | logical_op.zs:
+            if q >= n:
+                raise Exception('Logical operator acts on qubit %s but the state only has %s qubits.' % (q, n))
+
+        # Stabilizers whose destabilizers anti-commute with the logical operator build the logical operator.
+        for q in logical_op.xs:
+            _toggle(build_stabs, self._c_state.destabs.col_z[q])
+
+        for q in logical_op.zs:
+            _toggle(build_stabs, self._c_state.destabs.col_x[q])
+
+        for stab in range(n):
+            if build_stabs[stab]:
+                _toggle(test_x, self._c_state.stabs.row_x[stab])
+                _toggle(test_z, self._c_state.stabs.row_z[stab])
+
+                logical_minus += self._c_state.signs_minus.count(stab)
+                logical_i += self._c_state.signs_i.count(stab)
+
+        # Compare with logical operator
+        for q in logical_op.xs:
+            test_x[q] ^= 1
+
+        for q in logical_op.zs:
+            test_z[q] ^= 1
+
+        for q in range(n):
+            if test_x[q] or test_z[q]:
+                print(('Logical op: xs - %s and zs - %s' % (set(logical_op.xs), set(logical_op.zs))))
+                raise Exception('Failure due to not finding logical op! x... %s z... %s' %
+                                ({i for i in range(n) if test_x[i]}, {i for i in range(n) if test_z[i]}))
+
+        # i^logical_i (-1)^logical_minus, where the Ws were translated to Ys (W = -iY)
+        if logical_i % 2:
+            raise Exception('Logical operator has an imaginary sign... Not allowed if logical state is stabilized '
+                            'by logical op!')
+
+        return (logical_minus + logical_i // 2) % 2
             
+    def run_gates(self, symbol, locations, int forced_outcome=-1, bool collapse=True):
+        """
+        Applies a gate to every location with the loop over locations done in C++.
+
+        Args:
+            symbol (str): Gate symbol. Must be one of the keys of ``gate_ids``.
+            locations: Sequence of qubit ids (one-qubit gates) or of qubit pairs (two-qubit gates). NumPy arrays of shape
+                (n, ) or (n, 2) are copied without iterating in Python.
+            forced_outcome (int): Outcome to force nondeterministic measurements to (-1 for a random outcome).
+            collapse (bool): Whether measurements collapse the state.
+
+        Returns (np.ndarray): For measurements, the outcome of each location (in the order given); otherwise, an empty
+        array.
+
+        """
+
+        cdef:
+            int gate
+            vector[int_num] qubits
+            const unsigned long long[:] qubit_array
+            Py_ssize_t i
+
+        try:
+            gate = gate_ids[symbol]
+        except KeyError:
+            raise Exception('Gate "%s" cannot be run by `run_gates`.' % symbol)
+
+        if isinstance(locations, np.ndarray):
+            qubit_array = np.ascontiguousarray(locations, dtype=np.uint64).ravel()
+            qubits.reserve(qubit_array.shape[0])
+            for i in range(qubit_array.shape[0]):
+                qubits.push_back(qubit_array[i])
+
+        elif gate >= s.GATE_II:
+            for location in locations:
+                qubits.push_back(location[0])
+                qubits.push_back(location[1])
+
+        else:
+            for location in locations:
+                qubits.push_back(location)
+
+        return np.array(self._c_state.run_gate(gate, qubits, forced_outcome, collapse), dtype=np.uint8)
+
     def run_gate(self, symbol, locations, **params):
         """
 
@@ -308,12 +687,38 @@ cdef class SparseSim:
 
         """
 
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
+
         output = {}
-        for location in locations:
-            results = self.bindings[symbol](self, location, **params)
 
-            if results:
-                output[location] = results
+        if self.rng is not None and symbol in meas_symbols and 'forced_outcome' not in params:
+            # Random outcomes are drawn from ``rng`` instead of the C++ generator by forcing each measurement to a bit
+            # drawn from it (forced outcomes only apply to nondeterministic measurements).
+            for location in locations:
+                results = self.bindings[symbol](self, location, forced_outcome=int(self.rng.integers(2)), **params)
+
+                if results:
+                    output[location] = results
+
+        elif symbol in gate_ids and batch_params.issuperset(params):
+
+            locations = list(locations)
+            results = self.run_gates(symbol, locations, **params)
+
+            if results.shape[0]:
+                output = {location: result for location, result in zip(locations, results.tolist()) if result}
+
+        else:
+            for location in locations:
+                results = self.bindings[symbol](self, location, **params)
+
+                if results:
+                    output[location] = results
+
+        if profiler is not None:
+            profiler.record_gate(symbol, len(locations), profiler.timer() - ti)
 
         return output
 
@@ -321,7 +726,8 @@ cdef class SparseSim:
         """
 
         Args:
-            circuit (QuantumCircuit): A circuit instance or object with an appropriate items() generator.
+            circuit (QuantumCircuit): A circuit instance or object with an appropriate items() generator (such as a
+                ``CompactCircuit``).
             removed_locations:
 
         Returns (list): If output is True then the circuit output is returned. Note that this output format may differ
@@ -332,31 +738,39 @@ cdef class SparseSim:
         # TODO: removed_locations doesn't make sense except if circuit is tick_circuit
         # because can't say not to do gates for particular ticks....
 
-        if removed_locations is None:
-            removed_locations = set([])
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
 
         results = {}
         for symbol, locations, params in circuit.items():
-            gate_results = self.run_gate(symbol, locations - removed_locations, **params)
+            # Locations are only copied if some of them are removed.
+            if removed_locations:
+                locations = set(locations) - removed_locations
+
+            gate_results = self.run_gate(symbol, locations, **params)
             results.update(gate_results)
 
+        if profiler is not None:
+            profiler.record_circuit(profiler.timer() - ti)
+
         return results
     
     @property
     def signs_minus(self):
-        return self._c_state.signs_minus
+        return _to_set(self._c_state.signs_minus)
     
     @property
     def signs_i(self):
-        return self._c_state.signs_i
+        return _to_set(self._c_state.signs_i)
     
     @property
     def stabs(self):
-        return self._c_state.stabs
+        return _to_dict(self._c_state.stabs)
     
     @property
     def destabs(self):
-        return self._c_state.destabs
+        return _to_dict(self._c_state.destabs)
         
     def _pauli_sign(self, gen, i_gen):
 
@@ -442,53 +856,18 @@ cdef class SparseSim:
         return result
     
     def get_largest_degree(self):
-        
-        cdef:
-            list size_stabs_col_x = []
-            list size_stabs_col_z = []
-            list size_destabs_col_x = []
-            list size_destabs_col_z = []
-            list size_stabs_row_x = []
-            list size_stabs_row_z = []
-            list size_destabs_row_x = []
-            list size_destabs_row_z = []
-            dict output_dict = {}
-        
-        for col in self._c_state.stabs.col_x:
-            size_stabs_col_x.append(len(col))
-            
-        for col in self._c_state.stabs.col_z:
-            size_stabs_col_z.append(len(col))
-            
-        for col in self._c_state.destabs.col_x:
-            size_destabs_col_x.append(len(col))
-            
-        for col in self._c_state.destabs.col_z:
-            size_destabs_col_z.append(len(col))
-            
-        for row in self._c_state.stabs.row_x:
-            size_stabs_row_x.append(len(row))
-            
-        for row in self._c_state.stabs.row_z:
-            size_stabs_row_z.append(len(row))
-            
-        for row in self._c_state.destabs.row_x:
-            size_destabs_row_x.append(len(row))
-            
-        for row in self._c_state.destabs.row_z:
-            size_destabs_row_z.append(len(row))
-            
+
         output_dict = {
-            'size_stabs_col_x': size_stabs_col_x,
-            'size_stabs_col_z': size_stabs_col_z,
-            'size_destabs_col_x': size_destabs_col_x,
-            'size_destabs_col_z': size_destabs_col_z,
-            'size_stabs_row_x': size_stabs_row_x,
-            'size_stabs_row_z': size_stabs_row_z,
-            'size_destabs_row_x': size_destabs_row_x,
-            'size_destabs_row_z': size_destabs_row_z,
-            'size_signs_minus': len(self._c_state.signs_minus),
-            'size_signs_i': len(self._c_state.signs_i),
+            'size_stabs_col_x': _sizes(self._c_state.stabs.col_x),
+            'size_stabs_col_z': _sizes(self._c_state.stabs.col_z),
+            'size_destabs_col_x': _sizes(self._c_state.destabs.col_x),
+            'size_destabs_col_z': _sizes(self._c_state.destabs.col_z),
+            'size_stabs_row_x': _sizes(self._c_state.stabs.row_x),
+            'size_stabs_row_z': _sizes(self._c_state.stabs.row_z),
+            'size_destabs_row_x': _sizes(self._c_state.destabs.row_x),
+            'size_destabs_row_z': _sizes(self._c_state.destabs.row_z),
+            'size_signs_minus': self._c_state.signs_minus.size(),
+            'size_signs_i': self._c_state.signs_i.size(),
                 }
         
         return output_dict
@@ -507,10 +886,10 @@ cdef class SparseSim:
         if len(destabs_row_z) != self.num_qubits:
             raise Exception('Size of `destabs_row_z` must equal `num_qubits`.')
         
-        self._c_state.stabs.row_x = stabs_row_x
-        self._c_state.stabs.row_z = stabs_row_z
-        self._c_state.destabs.row_x = destabs_row_x
-        self._c_state.destabs.row_z = destabs_row_z
+        _from_sets(self._c_state.stabs.row_x, stabs_row_x)
+        _from_sets(self._c_state.stabs.row_z, stabs_row_z)
+        _from_sets(self._c_state.destabs.row_x, destabs_row_x)
+        _from_sets(self._c_state.destabs.row_z, destabs_row_z)
         
         stabs_col_x = [set() for i in range(self.num_qubits)]
         stabs_col_z = [set() for i in range(self.num_qubits)]
@@ -537,10 +916,12 @@ cdef class SparseSim:
                 # destabs_row_z[q].add(s)
                 destabs_col_z[q].add(s)
                 
-        self._c_state.stabs.col_x = stabs_col_x
-        self._c_state.stabs.col_z = stabs_col_z
-        self._c_state.destabs.col_x = destabs_col_x
-        self._c_state.destabs.col_z = destabs_col_z
+        _from_sets(self._c_state.stabs.col_x, stabs_col_x)
+        _from_sets(self._c_state.stabs.col_z, stabs_col_z)
+        _from_sets(self._c_state.destabs.col_x, destabs_col_x)
+        _from_sets(self._c_state.destabs.col_z, destabs_col_z)
+
+        self._c_state.touch_all()
 
     def print_tableau(self, gen, verbose=True, print_signs=True):
         """
@@ -21,15 +21,40 @@
 
 from libcpp cimport bool
 from libcpp.vector cimport vector
-from libcpp.unordered_set cimport unordered_set
 
 cdef extern from "sparsesim.h":
     
     ctypedef unsigned long long int_num
-    ctypedef unordered_set[int_num] int_set
+    # The container is chosen at build time (see ``sparsesim.h``), so only the interface used here is declared.
+    cdef cppclass int_set:
+        cppclass iterator:
+            int_num operator*()
+            iterator operator++()
+            bint operator==(iterator)
+            bint operator!=(iterator)
+        int_set() except +
+        iterator begin()
+        iterator end()
+        size_t size()
+        size_t count(const int_num&)
+        void insert(const int_num&)
+        void clear()
+
     ctypedef vector[int_set] int_set_vec
     
     unsigned int random_outcome()
+
+    const char* SPARSESIM_SET_NAME
+    size_t hybrid_dense_threshold "HybridSet::dense_threshold"
+
+    cdef enum GateId:
+        GATE_I, GATE_X, GATE_Y, GATE_Z,
+        GATE_Q, GATE_QD, GATE_R, GATE_RD, GATE_S, GATE_SD,
+        GATE_H, GATE_H2, GATE_H3, GATE_H4, GATE_H5, GATE_H6,
+        GATE_F1, GATE_F2, GATE_F3, GATE_F4, GATE_F1D, GATE_F2D, GATE_F3D, GATE_F4D,
+        GATE_INIT_ZERO, GATE_INIT_ONE, GATE_INIT_PLUS, GATE_INIT_MINUS, GATE_INIT_PLUSI, GATE_INIT_MINUSI,
+        GATE_MEASURE_X, GATE_MEASURE_Y, GATE_MEASURE_Z,
+        GATE_II, GATE_CNOT, GATE_CZ, GATE_CY, GATE_SWAP, GATE_G2, GATE_SQRTXX
     
     struct Generators:
         int_set_vec col_x
@@ -45,8 +70,12 @@ cdef extern from "sparsesim.h":
         int reserve_buckets
         Generators stabs, destabs
         int_set signs_minus, signs_i
+        vector[int_num] touched
+        vector[unsigned char] is_touched
         
         # Methods
+        void reset()
+        void touch_all()
         void hadamard(const int_num &qubit)
         void bitflip(const int_num &qubit)  # X
         void phaseflip(const int_num& qubit)  # Z
@@ -73,3 +102,5 @@ cdef extern from "sparsesim.h":
         void cnot(const int_num& tqubit, const int_num& cqubit)
         void swap(const int_num& qubit1, const int_num& qubit2)
         unsigned int measure(const int_num& qubit, int forced_outcome, bool collapse)
+        vector[unsigned int] run_gate(const int& gate, const vector[int_num]& qubits, int forced_outcome,
+                                      bool collapse) except +
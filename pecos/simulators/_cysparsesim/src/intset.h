@@ -0,0 +1,313 @@
+//  =========================================================================  //
+//   Copyright 2018 The PECOS Developers
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//  =========================================================================  //
+
+// intset.h
+//
+// Integer set containers that can be used in place of unordered_set<int_num> for the rows, columns, and sign sets of
+// the sparse stabilizer simulator. They only provide the part of the unordered_set interface that sparsesim.cpp uses:
+// count, insert, erase, size, clear, swap, reserve/rehash, and iteration.
+//
+//     SortedVecSet: Sorted vector of ids. Good for the short rows and columns of LDPC-like codes.
+//     BitSet: One bit per id. Good for dense tableaus with a small number of qubits.
+//     HybridSet: Sorted vector that switches to a bitset once it holds more than ``HybridSet::dense_threshold`` ids
+//                (and back once it holds fewer than half of that).
+
+#ifndef INTSET_H
+#define INTSET_H
+
+#include <algorithm>
+#include <cstdint>
+#include <vector>
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#endif
+
+typedef unsigned long long int_num;
+
+
+// Index of the lowest set bit of a nonzero word.
+inline unsigned int lowest_bit(uint64_t bits) {
+#ifdef _MSC_VER
+    unsigned long index;
+    _BitScanForward64(&index, bits);
+    return (unsigned int) index;
+#else
+    return (unsigned int) __builtin_ctzll(bits);
+#endif
+}
+
+
+class SortedVecSet {
+    public:
+        typedef std::vector<int_num>::const_iterator iterator;
+        typedef iterator const_iterator;
+
+        iterator begin() const { return data.begin(); }
+        iterator end() const { return data.end(); }
+
+        size_t size() const { return data.size(); }
+        bool empty() const { return data.empty(); }
+
+        size_t count(const int_num& val) const {
+            return std::binary_search(data.begin(), data.end(), val);
+        }
+
+        void insert(const int_num& val) {
+            std::vector<int_num>::iterator it = std::lower_bound(data.begin(), data.end(), val);
+            if (it == data.end() || *it != val) {
+                data.insert(it, val);
+            }
+        }
+
+        size_t erase(const int_num& val) {
+            std::vector<int_num>::iterator it = std::lower_bound(data.begin(), data.end(), val);
+            if (it != data.end() && *it == val) {
+                data.erase(it);
+                return 1;
+            }
+            return 0;
+        }
+
+        void clear() { data.clear(); }
+        void swap(SortedVecSet& other) { data.swap(other.data); }
+        void reserve(size_t size) { data.reserve(size); }
+        void rehash(size_t size) { data.reserve(size); }
+
+    private:
+        std::vector<int_num> data;
+};
+
+
+// Iterates over the set bits of a vector of words.
+class BitIterator {
+    public:
+        BitIterator() : words(NULL), word(0), bits(0) {}
+
+        BitIterator(const std::vector<uint64_t>* words, size_t word)
+            : words(words), word(word), bits(0) {
+            if (word < words->size()) {
+                bits = (*words)[word];
+                advance();
+            }
+        }
+
+        int_num operator*() const {
+            return (int_num) (word * 64 + lowest_bit(bits));
+        }
+
+        BitIterator& operator++() {
+            bits &= bits - 1;
+            advance();
+            return *this;
+        }
+
+        bool operator==(const BitIterator& other) const { return word == other.word && bits == other.bits; }
+        bool operator!=(const BitIterator& other) const { return !(*this == other); }
+
+    private:
+        const std::vector<uint64_t>* words;
+        size_t word;
+        uint64_t bits;
+
+        void advance() {
+            while (bits == 0 && ++word < words->size()) {
+                bits = (*words)[word];
+            }
+            if (bits == 0) {
+                word = words->size();
+            }
+        }
+};
+
+
+class BitSet {
+    public:
+        typedef BitIterator iterator;
+        typedef iterator const_iterator;
+
+        BitSet() : num(0) {}
+
+        iterator begin() const { return BitIterator(&words, 0); }
+        iterator end() const { return BitIterator(&words, words.size()); }
+
+        size_t size() const { return num; }
+        bool empty() const { return num == 0; }
+
+        size_t count(const int_num& val) const {
+            size_t word = val >> 6;
+            return word < words.size() && ((words[word] >> (val & 63)) & 1);
+        }
+
+        void insert(const int_num& val) {
+            size_t word = val >> 6;
+            uint64_t mask = (uint64_t) 1 << (val & 63);
+            if (word >= words.size()) {
+                words.resize(word + 1, 0);
+            }
+            if (!(words[word] & mask)) {
+                words[word] |= mask;
+                num++;
+            }
+        }
+
+        size_t erase(const int_num& val) {
+            size_t word = val >> 6;
+            uint64_t mask = (uint64_t) 1 << (val & 63);
+            if (word < words.size() && (words[word] & mask)) {
+                words[word] &= ~mask;
+                num--;
+                return 1;
+            }
+            return 0;
+        }
+
+        void clear() {
+            std::fill(words.begin(), words.end(), 0);
+            num = 0;
+        }
+
+        void swap(BitSet& other) {
+            words.swap(other.words);
+            std::swap(num, other.num);
+        }
+
+        void reserve(size_t size) { words.reserve((size + 63) / 64); }
+        void rehash(size_t size) { words.resize(std::max(words.size(), (size + 63) / 64), 0); }
+
+    private:
+        std::vector<uint64_t> words;
+        size_t num;
+};
+
+
+// Iterates over either the sparse ids or the set bits of a ``HybridSet``.
+class HybridIterator {
+    public:
+        HybridIterator() : dense(false) {}
+
+        HybridIterator(std::vector<int_num>::const_iterator sparse_it, const BitIterator& dense_it, bool dense)
+            : sparse_it(sparse_it), dense_it(dense_it), dense(dense) {}
+
+        int_num operator*() const { return dense ? *dense_it : *sparse_it; }
+
+        HybridIterator& operator++() {
+            if (dense) {
+                ++dense_it;
+            } else {
+                ++sparse_it;
+            }
+            return *this;
+        }
+
+        bool operator==(const HybridIterator& other) const {
+            return dense ? dense_it == other.dense_it : sparse_it == other.sparse_it;
+        }
+        bool operator!=(const HybridIterator& other) const { return !(*this == other); }
+
+    private:
+        std::vector<int_num>::const_iterator sparse_it;
+        BitIterator dense_it;
+        bool dense;
+};
+
+
+class HybridSet {
+    public:
+        typedef HybridIterator iterator;
+        typedef iterator const_iterator;
+
+        // Number of ids above which sets are stored as bitsets. Can be changed at run time; 0 makes every non-empty
+        // set a bitset and a very large value makes every set a sorted vector.
+        static size_t dense_threshold;
+
+        HybridSet() : dense(false) {}
+
+        iterator begin() const {
+            return HybridIterator(sparse.begin(), bits.begin(), dense);
+        }
+
+        iterator end() const {
+            return HybridIterator(sparse.end(), bits.end(), dense);
+        }
+
+        size_t size() const { return dense ? bits.size() : sparse.size(); }
+        bool empty() const { return size() == 0; }
+
+        size_t count(const int_num& val) const {
+            return dense ? bits.count(val) : sparse.count(val);
+        }
+
+        void insert(const int_num& val) {
+            if (dense) {
+                bits.insert(val);
+            } else {
+                sparse.insert(val);
+                if (sparse.size() > dense_threshold) {
+                    to_dense();
+                }
+            }
+        }
+
+        size_t erase(const int_num& val) {
+            if (dense) {
+                size_t removed = bits.erase(val);
+                if (bits.size() < dense_threshold / 2) {
+                    to_sparse();
+                }
+                return removed;
+            }
+            return sparse.erase(val);
+        }
+
+        void clear() {
+            sparse.clear();
+            bits = BitSet();
+            dense = false;
+        }
+
+        void swap(HybridSet& other) {
+            sparse.swap(other.sparse);
+            bits.swap(other.bits);
+            std::swap(dense, other.dense);
+        }
+
+        void reserve(size_t size) { sparse.reserve(std::min(size, dense_threshold)); }
+        void rehash(size_t size) { reserve(size); }
+
+    private:
+        SortedVecSet sparse;
+        BitSet bits;
+        bool dense;
+
+        void to_dense() {
+            for (const int_num& val: sparse) {
+                bits.insert(val);
+            }
+            sparse = SortedVecSet();
+            dense = true;
+        }
+
+        void to_sparse() {
+            for (const int_num& val: bits) {
+                sparse.insert(val);
+            }
+            bits = BitSet();
+            dense = false;
+        }
+};
+
+#endif
@@ -18,6 +18,9 @@
 
 #include "sparsesim.h"
 
+// Size above which a HybridSet is stored as a bitset.
+size_t HybridSet::dense_threshold = 16;
+
 // Function to create random outcomes
 unsigned int random_outcome(void) {
   // return random() > RAND_MAX/2;:
@@ -84,6 +87,48 @@ void State::clear() {  // Allows state to reinitilize.
     //Inilialize signs columns
     signs_minus.clear();
     signs_i.clear();
+
+    touched.clear();
+    is_touched.assign(num_qubits, 0);
+}
+
+void State::reset() {
+    /*
+    Returns the state to |0...0> in place. A qubit that no gate has acted on since the state was last |0...0> still
+    has the rows (of the generators with its id) and columns of that state, so only the rows and columns of the
+    touched qubits are reinitialized.
+    */
+
+    for (const int_num& q: touched) {
+
+        stabs.col_x[q].clear();
+        stabs.row_x[q].clear();
+        stabs.col_z[q].clear();
+        stabs.col_z[q].insert(q);
+        stabs.row_z[q].clear();
+        stabs.row_z[q].insert(q);
+
+        destabs.col_z[q].clear();
+        destabs.row_z[q].clear();
+        destabs.col_x[q].clear();
+        destabs.col_x[q].insert(q);
+        destabs.row_x[q].clear();
+        destabs.row_x[q].insert(q);
+
+        is_touched[q] = 0;
+    }
+
+    touched.clear();
+
+    signs_minus.clear();
+    signs_i.clear();
+}
+
+void State::touch_all() {
+
+    for (int_num q = 0; q < num_qubits; q++) {
+        touch(q);
+    }
 }
 
 void State::hadamard(const int_num& qubit) {
@@ -93,6 +138,8 @@ void State::hadamard(const int_num& qubit) {
     W -> -W
     Y -> -Y
     */
+
+    touch(qubit);
     
     // X and Z -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -140,6 +187,7 @@ void hadamard_gen_mod(Generators& gen, const int_num& qubit) {
 }
 
 void State::bitflip(const int_num& qubit) {
+    touch(qubit);
     
     // Z -> -1
     for (const int_num& elem: stabs.col_z[qubit]) {
@@ -154,6 +202,7 @@ void State::bitflip(const int_num& qubit) {
 }
 
 void State::phaseflip(const int_num& qubit) {
+    touch(qubit);
     
     // X -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -168,6 +217,7 @@ void State::phaseflip(const int_num& qubit) {
 }
 
 void State::Y(const int_num& qubit) {
+    touch(qubit);
     
     // Z -> -1
     for (const int_num& elem: stabs.col_z[qubit]) {
@@ -197,6 +247,8 @@ void State::phaserot(const int_num& qubit) {
     W -> iX
     Y -> -X
     */
+
+    touch(qubit);
     
     // X -> i
     // signs_i ^= stabs.col_x[qubit]
@@ -252,6 +304,9 @@ void phaserot_gen_mod(Generators& gen, const int_num& qubit) {
 }
 
 void State::cnot(const int_num& tqubit, const int_num& cqubit) {
+    touch(tqubit);
+    touch(cqubit);
+
     cnot_gen_mod(stabs, tqubit, cqubit);
     cnot_gen_mod(destabs, tqubit, cqubit);
 }
@@ -286,6 +341,9 @@ void cnot_gen_mod(Generators& gen, const int_num& tqubit,
 
 
 void State::swap(const int_num& qubit1, const int_num& qubit2) {
+    touch(qubit1);
+    touch(qubit2);
+
     swap_gen_mod(stabs, qubit1, qubit2);
     swap_gen_mod(destabs, qubit1, qubit2);
 }
@@ -334,6 +392,7 @@ void swap_gen_mod(Generators& gen, const int_num& qubit1,
 }
 
 unsigned int State::measure(const int_num& qubit, int forced_outcome=-1, bool collapse=true) {
+    touch(qubit);
 
     if (stabs.col_x[qubit].size() == 0) {  // There are no anticommuting stabilizers
         return deterministic_measure(qubit);
@@ -656,6 +715,8 @@ void State::R(const int_num& qubit) {
     W -> W
     Y -> Y
     */
+
+    touch(qubit);
     
     // Change the sign appropriately
 
@@ -697,6 +758,8 @@ void State::Rd(const int_num& qubit) {
     W -> W
     Y -> Y
     */
+
+    touch(qubit);
     
     // Change the sign appropriately
 
@@ -727,6 +790,8 @@ void State::Sd(const int_num& qubit) {
     W -> -iX
     Y -> X
     */
+
+    touch(qubit);
     
     
 
@@ -773,6 +838,8 @@ void State::Q(const int_num& qubit) {
     W -> -iZ
     Y -> Z
     */
+
+    touch(qubit);
     
     
 
@@ -840,6 +907,8 @@ void State::Qd(const int_num& qubit) {
     W -> iZ
     Y -> -Z
     */
+
+    touch(qubit);
     
     
 
@@ -877,6 +946,8 @@ void State::H2(const int_num& qubit) {
     W -> -W
     Y -> -Y
     */
+
+    touch(qubit);
     
     // X or Z -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -915,6 +986,8 @@ void State::H3(const int_num& qubit) {
     W -> -iX
     Y -> X
     */
+
+    touch(qubit);
     
     for (const int_num& i: stabs.col_z[qubit]) {
         
@@ -959,6 +1032,8 @@ void State::H4(const int_num& qubit) {
     W -> iX
     Y -> -X
     */
+
+    touch(qubit);
     
     // X not Z -> -1
     // -------------------
@@ -1021,6 +1096,8 @@ void State::H5(const int_num& qubit) {
     W -> -iZ
     Y -> Z
     */
+
+    touch(qubit);
     
     for (const int_num& i: stabs.col_x[qubit]) {
         
@@ -1067,6 +1144,8 @@ void State::H6(const int_num& qubit) {
     W -> iZ
     Y -> -Z
     */
+
+    touch(qubit);
     
     // X not Z -> -1
     // -------------------
@@ -1132,6 +1211,8 @@ void State::F1(const int_num& qubit) {
     W -> -W
     Y -> -Y
     */
+
+    touch(qubit);
     
     // X and Z -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -1216,6 +1297,8 @@ void State::F2(const int_num& qubit) {
     W -> iX
     Y -> -X
     */
+
+    touch(qubit);
     
     // X not Z -> -1
     // -------------------
@@ -1302,6 +1385,8 @@ void State::F3(const int_num& qubit) {
     W -> iZ
     Y -> -Z
     */
+
+    touch(qubit);
     
     // Z not X -> -1
     // -------------------
@@ -1349,6 +1434,8 @@ void State::F4(const int_num& qubit) {
     W -> iX
     Y -> -X
     */
+
+    touch(qubit);
     
     // Z not X -> -1
     // -------------------
@@ -1398,6 +1485,8 @@ void State::F1d(const int_num& qubit) {
     W -> -iX
     Y -> X
     */
+
+    touch(qubit);
     
     // X and Z -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -1448,6 +1537,7 @@ void State::F2d(const int_num& qubit) {
     Y -> Z
     */
 
+    touch(qubit);
 
     
     // X or Z -> -1
@@ -1507,6 +1597,8 @@ void State::F3d(const int_num& qubit) {
     W -> -iX
     Y -> X
     */
+
+    touch(qubit);
     
     // X or Z -> -1
     for (const int_num& elem: stabs.col_x[qubit]) {
@@ -1567,6 +1659,8 @@ void State::F4d(const int_num& qubit) {
     W -> iZ
     Y -> -Z
     */
+
+    touch(qubit);
     
     // X not Z -> -1
     // -------------------
@@ -1606,3 +1700,139 @@ void State::F4d(const int_num& qubit) {
     F1_gen_mod(destabs, qubit);
     
 }
+
+
+vector<unsigned int> State::run_gate(const int& gate, const vector<int_num>& qubits, int forced_outcome=-1,
+                                     bool collapse=true) {
+    /*
+    Applies the gate ``gate`` (a ``GateId``) to each location in turn.
+
+    One-qubit gates take one entry of ``qubits`` per location, while two-qubit gates take consecutive pairs. For
+    measurements, the outcome of each location is returned (in order); otherwise, the returned vector is empty.
+    */
+
+    vector<unsigned int> results;
+
+    if (gate >= GATE_II) {
+
+        if (qubits.size() % 2) {
+            throw std::invalid_argument("Two-qubit gates require an even number of qubits.");
+        }
+
+        for (size_t i = 0; i < qubits.size(); i += 2) {
+            run_two_qubit(gate, qubits[i], qubits[i + 1]);
+        }
+
+    } else if (gate >= GATE_MEASURE_X) {
+
+        results.reserve(qubits.size());
+
+        for (const int_num& qubit: qubits) {
+
+            if (gate == GATE_MEASURE_X) {
+                hadamard(qubit);
+                results.push_back(measure(qubit, forced_outcome, collapse));
+                hadamard(qubit);
+            } else if (gate == GATE_MEASURE_Y) {
+                H5(qubit);
+                results.push_back(measure(qubit, forced_outcome, collapse));
+                H5(qubit);
+            } else {
+                results.push_back(measure(qubit, forced_outcome, collapse));
+            }
+        }
+
+    } else if (gate >= GATE_INIT_ZERO) {
+
+        const bool one = (gate == GATE_INIT_ONE) || (gate == GATE_INIT_MINUS) || (gate == GATE_INIT_MINUSI);
+
+        for (const int_num& qubit: qubits) {
+
+            if (measure(qubit, one, true) != (unsigned int) one) {
+                bitflip(qubit);
+            }
+
+            if ((gate == GATE_INIT_PLUS) || (gate == GATE_INIT_MINUS)) {
+                hadamard(qubit);
+            } else if ((gate == GATE_INIT_PLUSI) || (gate == GATE_INIT_MINUSI)) {
+                H5(qubit);  // Z -> Y
+            }
+        }
+
+    } else {
+
+        for (const int_num& qubit: qubits) {
+            run_one_qubit(gate, qubit);
+        }
+    }
+
+    return results;
+}
+
+void State::run_one_qubit(const int& gate, const int_num& qubit) {
+
+    switch (gate) {
+        case GATE_I: break;
+        case GATE_X: bitflip(qubit); break;
+        case GATE_Y: Y(qubit); break;
+        case GATE_Z: phaseflip(qubit); break;
+        case GATE_Q: Q(qubit); break;
+        case GATE_QD: Qd(qubit); break;
+        case GATE_R: R(qubit); break;
+        case GATE_RD: Rd(qubit); break;
+        case GATE_S: phaserot(qubit); break;
+        case GATE_SD: Sd(qubit); break;
+        case GATE_H: hadamard(qubit); break;
+        case GATE_H2: H2(qubit); break;
+        case GATE_H3: H3(qubit); break;
+        case GATE_H4: H4(qubit); break;
+        case GATE_H5: H5(qubit); break;
+        case GATE_H6: H6(qubit); break;
+        case GATE_F1: F1(qubit); break;
+        case GATE_F2: F2(qubit); break;
+        case GATE_F3: F3(qubit); break;
+        case GATE_F4: F4(qubit); break;
+        case GATE_F1D: F1d(qubit); break;
+        case GATE_F2D: F2d(qubit); break;
+        case GATE_F3D: F3d(qubit); break;
+        case GATE_F4D: F4d(qubit); break;
+        default: throw std::invalid_argument("Unknown one-qubit gate id.");
+    }
+}
+
+void State::run_two_qubit(const int& gate, const int_num& qubit1, const int_num& qubit2) {
+
+    switch (gate) {
+        case GATE_II: break;
+        case GATE_CNOT:
+            cnot(qubit1, qubit2);
+            break;
+        case GATE_CZ:
+            hadamard(qubit2);
+            cnot(qubit1, qubit2);
+            hadamard(qubit2);
+            break;
+        case GATE_CY:
+            phaserot(qubit2);
+            cnot(qubit1, qubit2);
+            Sd(qubit2);
+            break;
+        case GATE_SWAP:
+            swap(qubit1, qubit2);
+            break;
+        case GATE_G2:
+            hadamard(qubit1);
+            cnot(qubit2, qubit1);
+            cnot(qubit1, qubit2);
+            hadamard(qubit2);
+            break;
+        case GATE_SQRTXX:
+            Q(qubit1);  // Sqrt X
+            Q(qubit2);  // Sqrt X
+            Rd(qubit1);  // (Sqrt Y)^\dagger
+            cnot(qubit1, qubit2);  // CNOT
+            R(qubit1);  // Sqrt Y
+            break;
+        default: throw std::invalid_argument("Unknown two-qubit gate id.");
+    }
+}
@@ -21,6 +21,8 @@
 #include <cstdlib>
 #include <vector>
 #include <unordered_set>
+#include <stdexcept>
+#include "intset.h"
 
 
 using namespace std;
@@ -36,8 +38,25 @@ struct TrivialHash{
     }
 };
 
+// The container used for the rows, columns, and signs is chosen at build time (see setup.py):
+//     SPARSESIM_SET_SORTED: sorted vectors.
+//     SPARSESIM_SET_BITSET: bitsets.
+//     SPARSESIM_SET_HYBRID: sorted vectors that switch to bitsets when dense.
+//     otherwise: unordered_set.
+#if defined(SPARSESIM_SET_SORTED)
+typedef SortedVecSet int_set;
+#define SPARSESIM_SET_NAME "sorted"
+#elif defined(SPARSESIM_SET_BITSET)
+typedef BitSet int_set;
+#define SPARSESIM_SET_NAME "bitset"
+#elif defined(SPARSESIM_SET_HYBRID)
+typedef HybridSet int_set;
+#define SPARSESIM_SET_NAME "hybrid"
+#else
 //typedef unordered_set<int_num, TrivialHash, std::equal_to<unsigned long>> int_set;
 typedef unordered_set<int_num> int_set;
+#define SPARSESIM_SET_NAME "hash"
+#endif
 
 // typedef unordered_set<int_num> int_set;
 typedef vector<int_set> int_set_vec;
@@ -54,6 +73,21 @@ struct Generators {
 };
 
 
+// Gate ids understood by ``State::run_gate``.
+enum GateId {
+    // One-qubit gates
+    GATE_I, GATE_X, GATE_Y, GATE_Z,
+    GATE_Q, GATE_QD, GATE_R, GATE_RD, GATE_S, GATE_SD,
+    GATE_H, GATE_H2, GATE_H3, GATE_H4, GATE_H5, GATE_H6,
+    GATE_F1, GATE_F2, GATE_F3, GATE_F4, GATE_F1D, GATE_F2D, GATE_F3D, GATE_F4D,
+    // Initializations
+    GATE_INIT_ZERO, GATE_INIT_ONE, GATE_INIT_PLUS, GATE_INIT_MINUS, GATE_INIT_PLUSI, GATE_INIT_MINUSI,
+    // Measurements
+    GATE_MEASURE_X, GATE_MEASURE_Y, GATE_MEASURE_Z,
+    // Two-qubit gates (locations are given as consecutive pairs of qubits)
+    GATE_II, GATE_CNOT, GATE_CZ, GATE_CY, GATE_SWAP, GATE_G2, GATE_SQRTXX
+};
+
 class State {
     // ~State () {};
     public:
@@ -66,8 +100,18 @@ class State {
         const int reserve_buckets; // Wether to reserve buckets.
         Generators stabs, destabs;  // Stabilizers and destabilizer generator matrices.
         int_set signs_minus, signs_i;  // A column that stores minuses and is.
+        vector<int_num> touched;  // Qubits acted on since the state was last |0...0> (each listed once).
+        vector<unsigned char> is_touched;  // qubit id -> whether it is in ``touched``
         // Methods
         void clear();
+        void reset();  // Returns to |0...0> by reinitializing only the rows and columns of the touched qubits.
+        void touch_all();  // Marks every qubit as touched (e.g., after the generators are replaced).
+        inline void touch(const int_num& qubit) {
+            if (!is_touched[qubit]) {
+                is_touched[qubit] = 1;
+                touched.push_back(qubit);
+            }
+        }
         void hadamard(const int_num& qubit); // H
         void bitflip(const int_num& qubit); // X
         void phaseflip(const int_num& qubit); // Z
@@ -94,8 +138,12 @@ class State {
         void cnot(const int_num& tqubit, const int_num& cqubit);
         void swap(const int_num& qubit1, const int_num& qubit2);
         unsigned int measure(const int_num& qubit, int forced_outcome, bool collapse);
+        vector<unsigned int> run_gate(const int& gate, const vector<int_num>& qubits, int forced_outcome,
+                                      bool collapse);  // Applies a gate to every location.
         
     private:
+        void run_one_qubit(const int& gate, const int_num& qubit);
+        void run_two_qubit(const int& gate, const int_num& qubit1, const int_num& qubit2);
         unsigned int deterministic_measure(const int_num& qubit);
         unsigned int nondeterministic_measure(const int_num& qubit, int forced_outcome);
 };
@@ -0,0 +1,192 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Opt-in profiling of the gates applied by a simulator.
+
+A ``GateProfiler`` is attached to a simulator by setting its ``profiler`` attribute (see ``GateProfiler.attach``). While
+attached, every call of ``run_gate`` records the gate symbol, the number of locations, and the time taken, and every call
+of ``run_circuit`` records its time. Simulators without a profiler only pay for an ``is not None`` check per call.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from collections import defaultdict
+from time import perf_counter as default_timer
+import json
+import random
+import numpy as np
+
+
+class _GateStats:
+    """
+    Statistics of one gate symbol.
+    """
+
+    __slots__ = ('calls', 'locations', 'total_time', 'max_time', 'samples', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.locations = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples = []
+        self.histogram = defaultdict(int)
+
+
+class GateProfiler:
+    """
+    Records per gate symbol call counts, latencies, and histograms of the number of locations per call.
+
+    Latency percentiles are computed from a uniform sample (reservoir) of at most ``max_samples`` calls per symbol, so the
+    memory used does not grow with the length of a simulation.
+
+    Attributes:
+        timer (Callable[[], float]): Function returning the current time in seconds.
+        max_samples (int): Maximum number of latencies kept per symbol.
+        gates (Dict[str, _GateStats]): Statistics per gate symbol.
+        circuit_calls (int): Number of calls of ``run_circuit``.
+        circuit_time (float): Total time spent in ``run_circuit``.
+
+    """
+
+    percentiles = (50, 90, 99)
+
+    def __init__(self, timer: Optional[Callable[[], float]] = None, max_samples: int = 10000, seed: int = 0) -> None:
+
+        if timer is None:
+            timer = default_timer
+
+        self.timer = timer
+        self.max_samples = max_samples
+        self._rng = random.Random(seed)  # Separate from the generators used by the simulations.
+
+        self.gates = {}  # type: Dict[str, _GateStats]
+        self.circuit_calls = 0
+        self.circuit_time = 0.0
+
+    def attach(self, *states) -> 'GateProfiler':
+        """
+        Starts profiling the simulators ``states``.
+        """
+
+        for state in states:
+            state.profiler = self
+
+        return self
+
+    @staticmethod
+    def detach(*states) -> None:
+        """
+        Stops profiling the simulators ``states``.
+        """
+
+        for state in states:
+            state.profiler = None
+
+    def reset(self) -> None:
+        """
+        Clears the recorded statistics.
+        """
+
+        self.gates = {}
+        self.circuit_calls = 0
+        self.circuit_time = 0.0
+
+    def record_gate(self, symbol: str, num_locations: int, elapsed: float) -> None:
+        """
+        Records one call of ``run_gate``.
+        """
+
+        stats = self.gates.get(symbol)
+        if stats is None:
+            stats = self.gates[symbol] = _GateStats()
+
+        stats.calls += 1
+        stats.locations += num_locations
+        stats.total_time += elapsed
+        stats.histogram[num_locations] += 1
+
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+
+        # Reservoir sampling of the latencies
+        if len(stats.samples) < self.max_samples:
+            stats.samples.append(elapsed)
+        else:
+            i = self._rng.randrange(stats.calls)
+            if i < self.max_samples:
+                stats.samples[i] = elapsed
+
+    def record_circuit(self, elapsed: float) -> None:
+        """
+        Records one call of ``run_circuit``.
+        """
+
+        self.circuit_calls += 1
+        self.circuit_time += elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the statistics as a dictionary of built-in types.
+
+        Returns: Dictionary with the keys 'gates' (symbol => statistics) and 'circuits'.
+
+        """
+
+        gates = {}
+        for symbol, stats in self.gates.items():
+            percentiles = np.percentile(stats.samples, self.percentiles).tolist()
+
+            gates[symbol] = {
+                'calls': stats.calls,
+                'locations': stats.locations,
+                'total_time': stats.total_time,
+                'mean_time': stats.total_time / stats.calls,
+                'time_per_location': stats.total_time / stats.locations if stats.locations else 0.0,
+                'max_time': stats.max_time,
+                'percentiles': {str(p): t for p, t in zip(self.percentiles, percentiles)},
+                'locations_histogram': {str(n): c for n, c in sorted(stats.histogram.items())},
+            }
+
+        return {
+            'gates': gates,
+            'circuits': {'calls': self.circuit_calls, 'total_time': self.circuit_time},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Returns the statistics (see ``to_dict``) as a JSON string. Keyword arguments are passed to ``json.dumps``.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def summary(self) -> str:
+        """
+        Returns a table of the gate symbols ordered by the total time spent on them.
+        """
+
+        lines = ['%-12s %10s %12s %12s %12s %12s' % ('symbol', 'calls', 'locations', 'total (s)', 'mean (us)',
+                                                     'p99 (us)')]
+
+        data = self.to_dict()['gates']
+        for symbol, stats in sorted(data.items(), key=lambda item: -item[1]['total_time']):
+            lines.append('%-12s %10d %12d %12.6f %12.3f %12.3f' % (symbol, stats['calls'], stats['locations'],
+                                                                  stats['total_time'], 1e6 * stats['mean_time'],
+                                                                  1e6 * stats['percentiles']['99']))
+
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.summary()
@@ -0,0 +1,134 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Benchmark of ``GraphSim`` against the sparse stabilizer simulators
+==================================================================
+
+``GraphSim`` only wins on random sparse circuits. Times the simulators on random circuits (see
+``pecos.tools.random_circuit_speed``) and on surface code syndrome extraction.
+
+``GraphSim`` is faster than ``pySparseSim`` on the random circuits, about 2.3x at 1000 qubits and 2.6x at 3000 qubits.
+It is much slower on surface code syndrome extraction, and the gap grows quickly with the distance. The vertex degrees
+of the graph of a code state grow with the distance (the maximum degree is about 100 at d=13 and 300 at d=21), and
+the CZs and measurements of a round cost time that grows with the degrees squared. Time of one round of
+``Surface4444`` syndrome extraction after an ideal initialization:
+
+    ========  ===========  =========  ===========
+    distance  pySparseSim  GraphSim   slowdown
+    ========  ===========  =========  ===========
+    5         0.7 ms       7.3 ms     10x
+    9         2.2 ms       0.14 s     60x
+    13        6.9 ms       0.74 s     110x
+    21        24 ms        12 s       520x
+    31        89 ms        103 s      1200x
+    ========  ===========  =========  ===========
+
+Notes:
+    Use the following to run from the command line:
+    python -m pecos.simulators._graphsim.benchmark
+"""
+
+import argparse
+from timeit import default_timer
+
+# family name -> (description, parameters)
+families = {
+    'random': ('Random circuits', {'num_qubits': 1000, 'depth': 5000, 'trials': 5}),
+    'random_large': ('Random circuits', {'num_qubits': 3000, 'depth': 3000, 'trials': 5}),
+    'surface': ('Surface4444 syndrome extraction', {'distance': 5, 'rounds': 10}),
+    'surface_large': ('Surface4444 syndrome extraction', {'distance': 11, 'rounds': 3}),
+    'surface_xl': ('Surface4444 syndrome extraction', {'distance': 21, 'rounds': 1}),
+}
+
+
+def simulators():
+    """
+    Returns a dictionary of name -> simulator class of the simulators compared.
+    """
+
+    from pecos import simulators
+
+    sims = {'pySparseSim': simulators.pySparseSim, 'GraphSim': simulators.GraphSim}
+
+    if hasattr(simulators, 'cySparseSim'):
+        sims['cySparseSim'] = simulators.cySparseSim
+
+    return sims
+
+
+def time_family(state_sim, family, params):
+    """
+    Returns the time spent running the circuits of a family (not including creating the states).
+    """
+
+    from pecos import circuits, qeccs, circuit_runners
+    from pecos.tools import random_circuit_speed
+
+    if family.startswith('random'):
+        times, _, _ = random_circuit_speed(state_sim, params['num_qubits'], params['depth'], trials=params['trials'])
+        return sum(times)
+
+    qecc = qeccs.Surface4444(distance=params['distance'])
+
+    logical_circ = circuits.LogicalCircuit(supress_warning=True)
+    logical_circ.append(qecc.gate('ideal init |0>'))
+    logical_circ.append(qecc.gate('I', num_syn_extract=params['rounds']))
+
+    runner = circuit_runners.Standard(seed=0)
+    state = state_sim(qecc.num_qudits)
+
+    ti = default_timer()
+    runner.run(state, logical_circ)
+
+    return default_timer() - ti
+
+
+def benchmark(families_to_run, verbose=True):
+    """
+    Times each simulator on each circuit family.
+
+    Returns: Dictionary of family -> {simulator name: time in seconds}.
+
+    """
+
+    results = {family: {} for family in families_to_run}
+
+    for family in families_to_run:
+        for name, state_sim in simulators().items():
+            results[family][name] = time_family(state_sim, family, families[family][1])
+
+            if verbose:
+                print('    %-14s %-12s %.4f s' % (family, name, results[family][name]))
+
+    return results
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark GraphSim against the sparse stabilizer sims.')
+    parser.add_argument('families', nargs='*', default=list(families), help='Circuit families to time.')
+    args = parser.parse_args()
+
+    results = benchmark(args.families)
+
+    print('\nSpeedup of GraphSim over pySparseSim per circuit family:')
+    for family, times in results.items():
+        print('    %-14s %.2fx (%s)' % (family, times['pySparseSim'] / times['GraphSim'], families[family][0]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from . import cmd_one_qubit as q1
+from . import cmd_two_qubit as q2
+from . import cmd_init as qinit
+from . import cmd_meas as qmeas
+from .cliffords import aliases
+
+gate_dict = {
+    # Initialization
+    # ==============
+    'init |0>': qinit.init_zero,
+    'init |1>': qinit.init_one,
+    'init |+>': qinit.init_plus,
+    'init |->': qinit.init_minus,
+    'init |+i>': qinit.init_plusi,
+    'init |-i>': qinit.init_minusi,
+
+    # one-qubit operations
+    # ====================
+
+    # Paulis, square root of Paulis, Hadamard-like, and face rotations
+    **q1.gates,
+    **{alias: q1.gates[symbol] for alias, symbol in aliases.items()},
+
+    # two-qubit operations
+    # ====================
+    'CNOT': q2.CNOT,
+    'CZ': q2.CZ,
+    'CY': q2.CY,
+    'SWAP': q2.SWAP,
+    'G': q2.G2,
+    'G2': q2.G2,
+    'II': q2.II,
+
+    # Mølmer–Sørensen gates
+    'SqrtXX': q2.SqrtXX,
+    'MS': q2.SqrtXX,
+    'MSXX': q2.SqrtXX,
+
+    # Measurements
+    # ============
+    'measure X': qmeas.meas_x,
+    'measure Y': qmeas.meas_y,
+    'measure Z': qmeas.meas_z,
+    'force output': qmeas.force_output,
+}
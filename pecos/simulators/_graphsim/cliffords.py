@@ -0,0 +1,138 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Tables of the 24 one-qubit Cliffords (up to a global phase) used as the vertex operators of ``GraphSim``.
+
+The Cliffords are referred to by their index in ``symbols``, which follows the order of
+``pecos.circuit_converters.fuse_cliffords.one_qubit_cliffords`` (so the identity is 0).
+"""
+
+from collections import deque
+from itertools import product
+import numpy as np
+from ...circuit_converters.fuse_cliffords import one_qubit_cliffords, aliases, multiplication_table, _image
+from .._statevecsim.gates_one_qubit import matrices
+
+symbols = list(one_qubit_cliffords)
+index = {symbol: i for i, symbol in enumerate(symbols)}
+index.update({alias: index[symbol] for alias, symbol in aliases.items()})
+
+I = index['I']
+
+# compose[first][second] is the index of applying ``first`` and then ``second`` (the operator second.first).
+compose = [[index[multiplication_table[first, second]] for second in symbols] for first in symbols]
+
+inverse = [compose[c].index(I) for c in range(len(symbols))]
+
+_paulis = 'XYZ'
+
+PAULI_X, PAULI_Y, PAULI_Z = 0, 1, 2
+
+
+def _conjugation_table():
+    """
+    Returns the table of c, p => (sign, pauli) such that C P C^dagger = (-1)^sign pauli, where p and pauli index 'XYZ'.
+    """
+
+    table = []
+    for symbol in symbols:
+        images = []
+        for pauli in _paulis:
+            image = _image(one_qubit_cliffords[symbol], '+' + pauli)
+            images.append((int(image[0] == '-'), _paulis.index(image[1])))
+
+        table.append(tuple(images))
+
+    return table
+
+
+conjugate = _conjugation_table()
+
+# Vertex operators that commute with CZ (diagonal up to a phase).
+z_commuting = frozenset(c for c in range(len(symbols)) if conjugate[c][PAULI_Z] == (0, PAULI_Z))
+
+# Vertex operator => 'Q' (sqrt(-iX)) or 'Sd' (sqrt(iZ)), the first gate applied in a shortest product of these two
+# gates equal to it (None for the identity). ``GraphSim`` strips these gates off with local complementations.
+first_factor = [None] * len(symbols)
+
+
+def _first_factors():
+
+    seen = {I}
+    queue = deque([I])
+
+    while queue:
+        c = queue.popleft()
+
+        for gate in ('Q', 'Sd'):
+            new = compose[c][index[gate]]
+
+            if new not in seen:
+                seen.add(new)
+                first_factor[new] = first_factor[c] or gate
+                queue.append(new)
+
+    if len(seen) != len(symbols):
+        raise Exception('sqrt(-iX) and sqrt(iZ) should generate all the one-qubit Cliffords.')
+
+
+_first_factors()
+
+
+def _cphase_table():
+    """
+    Returns the table of (edge, vop1, vop2) => (edge, vop1, vop2) giving the two-vertex graph state after applying a CZ.
+
+    The outputs are found by comparing the state vectors of all the two-vertex graph states. When a vertex operator
+    commutes with CZ, the new one is chosen to also commute with CZ, so that the table can be used when that vertex has
+    other neighbors (see ``GraphSim.cz``).
+    """
+
+    cz = np.diag([1, 1, 1, -1])
+    plus = np.full(4, 0.5)
+
+    keys = list(product((0, 1), range(len(symbols)), range(len(symbols))))
+
+    states = np.array([np.kron(matrices[symbols[c1]], matrices[symbols[c2]]) @ (cz @ plus if edge else plus)
+                       for edge, c1, c2 in keys])
+
+    # Overlaps of the states after the CZ with all the states (equal up to a phase if the overlap is 1).
+    overlaps = np.abs(states.conj() @ (states @ cz).T)
+
+    table = {}
+    for i, (edge, c1, c2) in enumerate(keys):
+        found = None
+
+        for j in np.nonzero(np.abs(overlaps[:, i] - 1) < 1e-9)[0]:
+            _, new_c1, new_c2 = keys[j]
+
+            if (c1 in z_commuting) > (new_c1 in z_commuting) or (c2 in z_commuting) > (new_c2 in z_commuting):
+                continue
+
+            found = keys[j]
+            break
+
+        if found is None:
+            raise Exception('No graph state found for CZ applied to %s.' % str((edge, c1, c2)))
+
+        table[edge, c1, c2] = found
+
+    return table
+
+
+# (edge, vop1, vop2) => (edge, vop1, vop2) after a CZ
+cphase_table = _cphase_table()
@@ -0,0 +1,130 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Initializations for ``GraphSim``. The qubit is measured in the Z basis, which leaves its vertex without neighbors, and
+its vertex operator is then replaced by the one that prepares the state from |+>.
+"""
+
+from .cliffords import compose, index
+from .cmd_meas import measure, PAULI_Z
+
+_XH = compose[index['H']][index['X']]
+
+
+def _prepare(state,
+             qubit: int,
+             vop: int,
+             forced_outcome: int) -> None:
+
+    measure(state, qubit, PAULI_Z, forced_outcome)
+    state.vops[qubit] = vop
+
+
+def init_zero(state,
+              qubit: int) -> None:
+    """
+    Initialize qubit in state |0>.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, index['H'], 0)
+
+
+def init_one(state,
+             qubit: int) -> None:
+    """
+    Initialize qubit in state |1>.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, _XH, 1)
+
+
+def init_plus(state,
+              qubit: int) -> None:
+    """
+    Initialize qubit in state |+>.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, index['I'], 0)
+
+
+def init_minus(state,
+               qubit: int) -> None:
+    """
+    Initialize qubit in state |->.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, index['Z'], 0)
+
+
+def init_plusi(state,
+               qubit: int) -> None:
+    """
+    Initialize qubit in state |+i>.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, index['S'], 0)
+
+
+def init_minusi(state,
+                qubit: int) -> None:
+    """
+    Initialize qubit in state |-i>.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    _prepare(state, qubit, index['Sd'], 0)
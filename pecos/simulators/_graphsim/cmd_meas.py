@@ -0,0 +1,170 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Measurements for ``GraphSim``.
+
+A measurement of the Pauli P on a qubit with vertex operator C measures the Pauli C^dagger P C on the graph state.
+Local complementations are used to turn it into a Z measurement (X -> Y by complementing a neighbor and Y -> Z by
+complementing the vertex), which removes the vertex from the graph. The only deterministic case is X on a vertex without
+neighbors.
+"""
+
+from ...misc.random_streams import random_bit
+from .cliffords import PAULI_X, PAULI_Y, PAULI_Z, compose, conjugate, index, inverse
+
+_H = index['H']
+_XH = compose[index['H']][index['X']]
+_Z = index['Z']
+
+
+def meas_x(state,
+           qubit: int,
+           forced_outcome: int = -1) -> int:
+    """
+    Measurement in the X basis.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+    return measure(state, qubit, PAULI_X, forced_outcome)
+
+
+def meas_y(state,
+           qubit: int,
+           forced_outcome: int = -1) -> int:
+    """
+    Measurement in the Y basis.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+    return measure(state, qubit, PAULI_Y, forced_outcome)
+
+
+def meas_z(state,
+           qubit: int,
+           forced_outcome: int = -1) -> int:
+    """
+    Measurement in the Z basis.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+    return measure(state, qubit, PAULI_Z, forced_outcome)
+
+
+def measure(state,
+            qubit: int,
+            pauli: int,
+            forced_outcome: int = -1) -> int:
+    """
+    Measures a Pauli on a qubit. Afterwards the qubit's vertex has no neighbors.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        pauli (int): Index of the Pauli in 'XYZ'.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+
+    adj = state.adj
+    vops = state.vops
+
+    sign, bare = conjugate[inverse[vops[qubit]]][pauli]
+
+    if bare == PAULI_X:
+        if not adj[qubit]:
+            # X stabilizes |+>
+            return sign
+
+        state.local_complement(state.min_degree_neighbor(qubit))
+        sign, bare = conjugate[inverse[vops[qubit]]][pauli]
+
+    if bare == PAULI_Y:
+        state.local_complement(qubit)
+        sign, bare = conjugate[inverse[vops[qubit]]][pauli]
+
+    meas_outcome = _choose_outcome(state, forced_outcome)
+
+    # Project the graph state onto Z = (-1)^outcome. CZ|1>|psi> = |1> Z|psi> for each neighbor.
+    outcome = meas_outcome ^ sign
+
+    for b in adj[qubit]:
+        adj[b].remove(qubit)
+        if outcome:
+            vops[b] = compose[_Z][vops[b]]
+
+    adj[qubit].clear()
+
+    # |0> = H|+> and |1> = XH|+>
+    vops[qubit] = compose[_XH if outcome else _H][vops[qubit]]
+
+    return meas_outcome
+
+
+def _choose_outcome(state, forced_outcome: int) -> int:
+    """
+    Returns the forced outcome or a uniformly random one (drawn from ``state.rng`` if it is set).
+    """
+
+    if forced_outcome == 0 or forced_outcome == 1:
+        return forced_outcome
+    elif forced_outcome is None or forced_outcome == -1:
+        return random_bit(state.rng)
+    else:
+        raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
+
+
+def force_output(state,
+                 qubit: int,
+                 forced_output: int = -1) -> int:
+    """
+    Outputs value.
+
+    Used for error generators to generate outputs when replacing measurements.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_output (int): Integer that will be outputted.
+
+    Returns: int
+
+    """
+    return forced_output
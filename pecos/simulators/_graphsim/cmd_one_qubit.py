@@ -0,0 +1,50 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+One-qubit gates for ``GraphSim``. A one-qubit Clifford only changes the vertex operator of the qubit.
+"""
+
+from .cliffords import compose, index, one_qubit_cliffords
+
+
+def make_gate(symbol: str):
+    """
+    Returns the function that applies the one-qubit Clifford ``symbol`` (see ``cliffords.symbols``).
+    """
+
+    gate_row = [row[index[symbol]] for row in compose]
+
+    def gate(state,
+             qubit: int) -> None:
+        vops = state.vops
+        vops[qubit] = gate_row[vops[qubit]]
+
+    gate.__name__ = symbol
+
+    return gate
+
+
+# Symbol => gate function
+gates = {symbol: make_gate(symbol) for symbol in one_qubit_cliffords}
+
+H = gates['H']
+H5 = gates['H5']
+S = gates['S']
+Sd = gates['Sd']
+Q = gates['Q']
+R = gates['R']
+Rd = gates['Rd']
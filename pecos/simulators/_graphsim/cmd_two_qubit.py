@@ -0,0 +1,181 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Two-qubit gates for ``GraphSim``, which are all applied using CZs and one-qubit gates.
+"""
+
+from typing import Tuple
+from .cmd_one_qubit import H, S, Sd, Q, R, Rd
+
+
+def II(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Two-qubit identity.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The qubits acted on.
+
+    Returns: None
+
+    """
+    pass
+
+
+def CZ(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a controlled-Z gate.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The qubits acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+    state.cz(qubit1, qubit2)
+
+
+def CNOT(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CNOT, which is H(2), CZ, and then H(2).
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The control and target qubits.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    H(state, qubit2)
+    state.cz(qubit1, qubit2)
+    H(state, qubit2)
+
+
+def CY(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a controlled-Y gate as S(2), CNOT, and then Sd(2) (as in the other stabilizer simulators).
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The control and target qubits.
+
+    Returns: None
+
+    """
+
+    _, qubit2 = qubits
+
+    S(state, qubit2)
+    CNOT(state, qubits)
+    Sd(state, qubit2)
+
+
+def SWAP(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a SWAP gate by exchanging the vertices of the two qubits.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The qubits acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+    adj = state.adj
+
+    edge = qubit2 in adj[qubit1]
+
+    neighbors1 = adj[qubit1] - {qubit2}
+    neighbors2 = adj[qubit2] - {qubit1}
+
+    for b in neighbors1:
+        adj[b].remove(qubit1)
+
+    for b in neighbors2:
+        adj[b].remove(qubit2)
+
+    for b in neighbors1:
+        adj[b].add(qubit2)
+
+    for b in neighbors2:
+        adj[b].add(qubit1)
+
+    if edge:
+        neighbors1.add(qubit1)
+        neighbors2.add(qubit2)
+
+    adj[qubit1], adj[qubit2] = neighbors2, neighbors1
+
+    vops = state.vops
+    vops[qubit1], vops[qubit2] = vops[qubit2], vops[qubit1]
+
+
+def G2(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies the gate CZ, H(1), H(2), and then CZ.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The qubits acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    state.cz(qubit1, qubit2)
+    H(state, qubit1)
+    H(state, qubit2)
+    state.cz(qubit1, qubit2)
+
+
+def SqrtXX(state,
+           qubits: Tuple[int, int]) -> None:
+    """
+    Applies a square root of XX rotation as Q(1), Q(2), Rd(1), CNOT, and then R(1) (as in the other stabilizer
+    simulators).
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The qubits acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    Q(state, qubit1)
+    Q(state, qubit2)
+    Rd(state, qubit1)
+    CNOT(state, qubits)
+    R(state, qubit1)
@@ -0,0 +1,94 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Functions:
+
+find_logical_signs
+"""
+
+from typing import Union
+from ...circuits import QuantumCircuit
+from .._logical_op import LogicalOp
+from .cliffords import PAULI_X, PAULI_Y, PAULI_Z, conjugate, inverse
+
+
+def find_logical_signs(state,
+                       logical_circuit: Union[QuantumCircuit, LogicalOp]) -> int:
+    """
+    Find the sign of the logical operator.
+
+    The operator is conjugated by the vertex operators to give an operator on the graph state, which is then compared
+    with the product of the graph state's generators X_v Z_{N(v)} that has the same X part.
+
+    Args:
+        state (GraphSim): Instance representing the stabilizer state.
+        logical_circuit (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+            operator (or the operator compiled with ``LogicalOp``).
+
+    Returns: 0 if the logical operator stabilizes the state with a +1 sign and 1 if with a -1 sign.
+
+    """
+
+    logical_op = LogicalOp.compile(logical_circuit)
+    logical_xs = logical_op.xs
+    logical_zs = logical_op.zs
+
+    vops = state.vops
+    adj = state.adj
+
+    # Operator on the graph state written as (-1)^num_minuses i^num_ys X^xs Z^zs
+    num_minuses = 0
+    num_ys = 0
+    xs = set()
+    zs = set()
+
+    for q in logical_xs | logical_zs:
+        if q in logical_xs:
+            pauli = PAULI_Y if q in logical_zs else PAULI_X
+        else:
+            pauli = PAULI_Z
+
+        sign, pauli = conjugate[inverse[vops[q]]][pauli]
+        num_minuses += sign
+
+        if pauli != PAULI_Z:
+            xs.add(q)
+        if pauli != PAULI_X:
+            zs.add(q)
+        if pauli == PAULI_Y:
+            num_ys += 1
+
+    # Multiply the generators together
+    test_zs = set()
+    for v in xs:
+        # Sign correction due ZX -> -XZ
+        if v in test_zs:
+            num_minuses += 1
+
+        test_zs ^= adj[v]
+
+    if test_zs != zs:
+        print(('Logical op: xs - %s and zs - %s' % (set(logical_op.xs), set(logical_op.zs))))
+        raise Exception('Failure due to not finding logical op! z... %s' % str(test_zs ^ zs))
+
+    phase = 2 * num_minuses + num_ys
+
+    if phase % 2:
+        raise Exception('Logical operator has an imaginary sign... Not allowed if logical state is stabilized '
+                        'by logical op!')
+
+    return (phase % 4) // 2
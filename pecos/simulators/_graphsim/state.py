@@ -0,0 +1,265 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+A stabilizer simulator that represents the state as a graph state with local Clifford vertex operators.
+
+The state is |G; C> = prod_v C_v |G>, where |G> is the graph state of the graph G and each C_v is one of the 24
+one-qubit Cliffords. One-qubit gates only change a vertex operator and so take constant time, while CZs and
+measurements take time that depends on the degrees of the vertices acted on. This is only efficient for random sparse
+circuits, which keep the graph sparse. The vertex degrees of code states, such as surface code states, grow with the
+distance, so syndrome extraction is much slower than with ``SparseSim`` (see ``benchmark.py``).
+
+For the paper on this representation read: https://arxiv.org/abs/quant-ph/0504117
+"""
+
+from typing import Any, Union, Tuple, List, Iterable
+from ...circuits import QuantumCircuit
+from ..sim_class_types import Stabilizer
+from .._logical_op import LogicalOp
+from . import bindings
+from .cliffords import I, compose, cphase_table, first_factor, index, z_commuting
+from .logical_sign import find_logical_signs
+
+_H = index['H']
+_QD = index['Qd']
+_S = index['S']
+
+
+class GraphSim(Stabilizer):
+    """
+    Represents the stabilizer state as a graph state with vertex operators.
+
+    Attributes:
+        num_qubits (int):
+        bindings (dict):
+        adj (List[Set[int]]): For each qubit, the set of its neighbors.
+        vops (List[int]): For each qubit, the index of its vertex operator (see ``cliffords.symbols``).
+    """
+
+    def __init__(self, num_qubits: int) -> None:
+        """
+        Initializes the stabilizer state.
+
+        Args:
+            num_qubits (int): Number of qubits being represented.
+
+        Returns:
+
+        """
+
+        super().__init__()
+
+        if not isinstance(num_qubits, int):
+            raise Exception('``num_qubits`` should be of type ``int.``')
+
+        self.num_qubits = num_qubits
+
+        self.bindings = bindings.gate_dict
+
+        # Initialize all qubits in the zero state: |0> = H|+> and the graph has no edges.
+        self.adj = [set() for _ in range(num_qubits)]
+        self.vops = [_H] * num_qubits
+
+    def local_complement(self, vertex: int) -> None:
+        """
+        Complements the subgraph of the neighbors of a vertex while keeping the state the same.
+
+        Since |tau_v(G)> = sqrt(-iX_v) prod_{b in N(v)} sqrt(iZ_b) |G>, the inverses of these gates are added to the
+        vertex operators.
+
+        Args:
+            vertex (int): The vertex.
+
+        Returns: None
+
+        """
+
+        adj = self.adj
+        vops = self.vops
+        neighbors = adj[vertex]
+
+        for b in neighbors:
+            # Toggles the edges between b and the other neighbors (b is not its own neighbor).
+            adj_b = adj[b]
+            adj_b ^= neighbors
+            adj_b.remove(b)
+
+            vops[b] = compose[_S][vops[b]]
+
+        vops[vertex] = compose[_QD][vops[vertex]]
+
+    def remove_vop(self, vertex: int, avoid: int) -> None:
+        """
+        Makes the vertex operator of a vertex with neighbors the identity using local complementations.
+
+        Args:
+            vertex (int): The vertex.
+            avoid (int): A neighbor whose neighborhood is only complemented if there are no other neighbors.
+
+        Returns: None
+
+        """
+
+        vops = self.vops
+
+        while vops[vertex] != I:
+
+            if first_factor[vops[vertex]] == 'Q':
+                self.local_complement(vertex)
+
+            else:
+                # The vertex operators of the neighbors of the complemented vertex lose a sqrt(iZ). Complementing
+                # costs the square of the degree, so the neighbor with the lowest degree is used.
+                neighbor = self.min_degree_neighbor(vertex, avoid)
+                self.local_complement(neighbor)
+
+    def min_degree_neighbor(self, vertex: int, avoid: int = None) -> int:
+        """
+        Returns the neighbor of a vertex with the lowest degree, preferring neighbors other than ``avoid``.
+        """
+
+        adj = self.adj
+        neighbors = adj[vertex]
+
+        if avoid in neighbors and len(neighbors) > 1:
+            neighbors = neighbors - {avoid}
+
+        return min(neighbors, key=lambda b: len(adj[b]))
+
+    def cz(self, qubit1: int, qubit2: int) -> None:
+        """
+        Applies a CZ.
+
+        Args:
+            qubit1 (int): First qubit.
+            qubit2 (int): Second qubit.
+
+        Returns: None
+
+        """
+
+        adj = self.adj
+        vops = self.vops
+
+        # Reduce the vertex operators of the vertices with other neighbors to ones that commute with CZ.
+        if len(adj[qubit1]) > (qubit2 in adj[qubit1]):
+            self.remove_vop(qubit1, qubit2)
+
+        if len(adj[qubit2]) > (qubit1 in adj[qubit2]):
+            self.remove_vop(qubit2, qubit1)
+
+        if len(adj[qubit1]) > (qubit2 in adj[qubit1]) and vops[qubit1] not in z_commuting:
+            self.remove_vop(qubit1, qubit2)
+
+        edge = qubit2 in adj[qubit1]
+        new_edge, vops[qubit1], vops[qubit2] = cphase_table[edge, vops[qubit1], vops[qubit2]]
+
+        if new_edge != edge:
+            self.toggle_edge(qubit1, qubit2)
+
+    def toggle_edge(self, qubit1: int, qubit2: int) -> None:
+
+        if qubit2 in self.adj[qubit1]:
+            self.adj[qubit1].remove(qubit2)
+            self.adj[qubit2].remove(qubit1)
+        else:
+            self.adj[qubit1].add(qubit2)
+            self.adj[qubit2].add(qubit1)
+
+    def logical_sign(self,
+                     logical_op: Union[QuantumCircuit, LogicalOp]) -> int:
+        """
+        Returns the sign of a logical operator that is in the stabilizer group.
+
+        Args:
+            logical_op (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+                operator (or the operator compiled with ``LogicalOp``).
+
+        Returns: int
+
+        """
+        return find_logical_signs(self, logical_op)
+
+    def logical_signs(self,
+                      logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+        """
+        Returns the signs of several logical operators that are in the stabilizer group.
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): The logical operators.
+
+        Returns: List[int]
+
+        """
+        return [find_logical_signs(self, logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
+    def run_direct(self,
+                   symbol: str,
+                   location: Union[int, Tuple[int, ...]],
+                   **gate_kwargs: Any):
+        return self.bindings[symbol](self, location, **gate_kwargs)
+
+    def reset(self) -> None:
+        """
+        Returns the state to |0...0> in place.
+
+        Returns: None
+
+        """
+
+        for neighbors in self.adj:
+            if neighbors:
+                neighbors.clear()
+
+        self.vops = [_H] * self.num_qubits
+
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+
+        new = GraphSim(self.num_qubits)
+        new.restore(self)
+
+        return new
+
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
+
+        Returns (GraphSim): A copy of the state that is not modified by later gates.
+
+        """
+        return self.copy()
+
+    def restore(self, snapshot) -> None:
+        """
+        Overwrites the graph and vertex operators with those of a snapshot. The snapshot is left untouched and can be
+        restored again.
+
+        Args:
+            snapshot (GraphSim): State returned by ``snapshot`` (or any ``GraphSim`` with the same number of qubits).
+
+        Returns: None
+
+        """
+
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        self.adj = [set(neighbors) for neighbors in snapshot.adj]
+        self.vops = list(snapshot.vops)
@@ -0,0 +1,125 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Logical operators compiled once for repeated sign checks.
+
+``logical_sign`` is typically called once per Monte Carlo run with the same operator. Compiling the operator with
+``LogicalOp`` moves the parsing of the operator's circuit out of that loop. The stabilizer and Pauli propagation
+simulators accept either a ``LogicalOp`` or the ``QuantumCircuit`` it was compiled from.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from ..circuits import QuantumCircuit
+
+
+class LogicalOp:
+    """
+    A Pauli logical operator given by a single tick circuit of X, Y, and Z gates.
+
+    Attributes:
+        circuit (QuantumCircuit): The circuit the operator was compiled from.
+        xs (frozenset): Qubits acted on by X or Y.
+        zs (frozenset): Qubits acted on by Z or Y.
+        num_ys (int): Number of qubits acted on by Y.
+        x_ids (np.ndarray): Sorted array of ``xs``.
+        z_ids (np.ndarray): Sorted array of ``zs``.
+
+    """
+
+    def __init__(self, logical_circuit: QuantumCircuit) -> None:
+
+        if len(logical_circuit) != 1:
+            raise Exception('Logical operators are expected to only have one tick.')
+
+        xs = set()
+        zs = set()
+
+        for symbol, gate_locations, _ in logical_circuit.items():
+
+            if symbol == 'X':
+                xs.update(gate_locations)
+            elif symbol == 'Z':
+                zs.update(gate_locations)
+            elif symbol == 'Y':
+                xs.update(gate_locations)
+                zs.update(gate_locations)
+            else:
+                raise Exception('Can not currently handle logical operator with operator "%s"!' % symbol)
+
+        self.circuit = logical_circuit
+        self.xs = frozenset(xs)
+        self.zs = frozenset(zs)
+        self.num_ys = len(self.xs & self.zs)
+
+        self.x_ids = np.array(sorted(xs), dtype=np.int64)
+        self.z_ids = np.array(sorted(zs), dtype=np.int64)
+
+        self._masks = {}  # type: Dict[int, Tuple[np.ndarray, np.ndarray]]
+        self._bitmasks = None  # type: Optional[Tuple[int, int]]
+
+    @classmethod
+    def compile(cls, logical_op: Union[QuantumCircuit, 'LogicalOp']) -> 'LogicalOp':
+        """
+        Returns ``logical_op`` if it is already compiled and compiles it otherwise.
+        """
+
+        if isinstance(logical_op, cls):
+            return logical_op
+
+        return cls(logical_op)
+
+    @classmethod
+    def compile_all(cls, logical_ops: Iterable[Union[QuantumCircuit, 'LogicalOp']]) -> List['LogicalOp']:
+        return [cls.compile(op) for op in logical_ops]
+
+    def masks(self, words: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bit-packed X and Z parts of the operator as rows of ``words`` ``uint64`` words (cached).
+        """
+
+        masks = self._masks.get(words)
+
+        if masks is None:
+            masks = (self._pack(self.x_ids, words), self._pack(self.z_ids, words))
+            self._masks[words] = masks
+
+        return masks
+
+    def bitmasks(self) -> Tuple[int, int]:
+        """
+        X and Z parts of the operator as ``int`` bitmasks, where bit ``q`` is qubit ``q`` (cached).
+        """
+
+        if self._bitmasks is None:
+            self._bitmasks = (sum(1 << int(q) for q in self.xs), sum(1 << int(q) for q in self.zs))
+
+        return self._bitmasks
+
+    @staticmethod
+    def _pack(ids: np.ndarray, words: int) -> np.ndarray:
+
+        if len(ids) and ids[-1] >= 64 * words:
+            raise Exception('Logical operator acts on qubit %s but only %s qubits are stored.' % (ids[-1], 64 * words))
+
+        row = np.zeros(words, dtype=np.uint64)
+        np.bitwise_or.at(row, ids // 64, np.left_shift(np.uint64(1), (ids % 64).astype(np.uint64)))
+
+        return row
+
+    def __repr__(self):
+        return '<LogicalOp xs=%s zs=%s>' % (sorted(self.xs), sorted(self.zs))
@@ -0,0 +1,129 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Initializations for ``PackedTableauSim``.
+
+Each initialization also accepts an array of distinct qubits, which are initialized together.
+"""
+
+import numpy as np
+from .cmd_meas import meas_z_all
+from .cmd_one_qubit import H, H2, H5, H6, X
+
+
+def init_zero(state,
+              qubit: int) -> None:
+    """
+    Initialize qubit in state |0>.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    # Measure in the Z basis. (If random outcome, force a 0 outcome).
+    # If outcome is 1 apply an X.
+    qubits = np.array(qubit, dtype=np.int64, ndmin=1)
+    X(state, qubits[meas_z_all(state, qubits, 0) == 1])
+
+
+def init_one(state,
+             qubit: int) -> None:
+    """
+    Initialize qubit in state |1>.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    qubits = np.array(qubit, dtype=np.int64, ndmin=1)
+    X(state, qubits[meas_z_all(state, qubits, 1) == 0])
+
+
+def init_plus(state,
+              qubit: int) -> None:
+    """
+    Initialize qubit in state |+>.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    init_zero(state, qubit)
+    H(state, qubit)
+
+
+def init_minus(state,
+               qubit: int) -> None:
+    """
+    Initialize qubit in state |->
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    init_zero(state, qubit)
+    H2(state, qubit)
+
+
+def init_plusi(state,
+               qubit: int) -> None:
+    """
+    Initialize qubit in state |+i>
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    init_zero(state, qubit)
+    H5(state, qubit)
+
+
+def init_minusi(state,
+                qubit: int) -> None:
+    """
+    Initialize qubit in state |-i>
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+
+    Returns: None
+
+    """
+
+    init_zero(state, qubit)
+    H6(state, qubit)
@@ -0,0 +1,326 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Measurements for ``PackedTableauSim``.
+
+The tableau stores the images of the Paulis under the inverse of the Clifford C that prepares the state from |0...0>, so
+measuring Z on a qubit is the same as measuring the row of the qubit's Z on |0...0>. The outcome is determined if the row
+has no X or Y, and is then the sign of the row.
+"""
+
+import numpy as np
+from ...misc.random_streams import random_bit
+from .helper import locate, bit_ids, ONE
+from .cmd_one_qubit import H, H5, compile_clifford
+
+# Conjugations of the columns of the tableau used to collapse the state.
+_COLUMN_S = compile_clifford('+Y', '+Z')
+_COLUMN_Z = compile_clifford('-X', '+Z')
+_COLUMN_H = compile_clifford('+Z', '+X')
+
+
+def meas_x(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the X basis.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether state should be collapsed.
+
+    Returns: int
+
+    """
+
+    H(state, qubit)
+
+    meas_outcome = meas_z(state, qubit, forced_outcome, collapse)
+
+    H(state, qubit)
+
+    return meas_outcome
+
+
+def meas_y(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the Y basis.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether to collapse the state if measurement is not already determined.
+
+    Returns: int
+
+    """
+
+    H5(state, qubit)
+
+    meas_outcome = meas_z(state, qubit, forced_outcome, collapse)
+
+    H5(state, qubit)
+
+    return meas_outcome
+
+
+def meas_z(state,
+           qubit: int,
+           forced_outcome: int = -1,
+           collapse: bool = True) -> int:
+    """
+    Measurement in the Z basis.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether to collapse the state if measurement is not already determined.
+
+    Returns: int
+
+    """
+
+    row = state.num_qubits + qubit
+
+    if not state.x_bits[row].any():  # No X or Y => determined sign
+        return int(state.signs[row])
+
+    if not collapse:
+        return _choose_outcome(state, forced_outcome)
+
+    return nondeterministic_meas(state, qubit, forced_outcome)
+
+
+def meas_z_all(state,
+               qubits: np.ndarray,
+               forced_outcome: int = -1,
+               collapse: bool = True) -> np.ndarray:
+    """
+    Measurements of several qubits in the Z basis.
+
+    The determined outcomes are read off together. Measurements that are not determined are then made one by one in the
+    order of ``qubits``, which is the order their random outcomes are drawn in.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (np.ndarray): Distinct qubits being measured.
+        forced_outcome (int):  Integer that will be outputted by the measurements that are non-deterministic. If equal
+            to -1, however, the outcomes will be uniformly chosen from {0, 1}.
+        collapse (bool): Whether to collapse the state if measurements are not already determined.
+
+    Returns (np.ndarray): The outcomes.
+
+    """
+
+    rows = np.asarray(qubits, dtype=np.int64) + state.num_qubits
+
+    outcomes = state.signs[rows].astype(np.int64)
+    random = np.flatnonzero(state.x_bits[rows].any(axis=1))
+
+    # Measuring a commuting Pauli leaves a determined outcome determined, so only these can be random.
+    for i in random.tolist():
+        outcomes[i] = meas_z(state, int(qubits[i]), forced_outcome, collapse)
+
+    return outcomes
+
+
+def meas_x_all(state,
+               qubits: np.ndarray,
+               forced_outcome: int = -1,
+               collapse: bool = True) -> np.ndarray:
+    """
+    Measurements of several qubits in the X basis (see ``meas_z_all``).
+    """
+
+    H(state, qubits)
+    outcomes = meas_z_all(state, qubits, forced_outcome, collapse)
+    H(state, qubits)
+
+    return outcomes
+
+
+def meas_y_all(state,
+               qubits: np.ndarray,
+               forced_outcome: int = -1,
+               collapse: bool = True) -> np.ndarray:
+    """
+    Measurements of several qubits in the Y basis (see ``meas_z_all``).
+    """
+
+    H5(state, qubits)
+    outcomes = meas_z_all(state, qubits, forced_outcome, collapse)
+    H5(state, qubits)
+
+    return outcomes
+
+
+def nondeterministic_meas(state,
+                          qubit: int,
+                          forced_outcome: int) -> int:
+    """
+    Collapses the state for a Z measurement whose outcome is not determined.
+
+    If C prepares the state and P is the row of the qubit's Z, the measurement collapses C|0...0> like measuring P
+    collapses |0...0>. Conjugating the rows by CNOTs from a qubit k where P has an X or Y (and an S if it is a Y), which
+    leave |0...0> unchanged, brings P to the form +-X_k Z_J. Measuring that on |0...0> leaves Z_k^a H_k |0...0>, so the
+    rows are then conjugated by Z_k^a and H_k, after which P is determined.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_outcome (int):  Integer that will be outputted by the measurement if the measurement is
+            non-deterministic. If equal to -1, however, the outcome will be uniformly chosen from {0, 1}.
+
+    Returns: int
+
+    """
+
+    row = state.num_qubits + qubit
+
+    pivot, *others = bit_ids(state.x_bits[row]).tolist()
+
+    for other in others:
+        _conjugate_cnot(state, pivot, other)
+
+    word, shift = locate(pivot)
+    if (int(state.z_bits[row, word]) >> int(shift)) & 1:
+        # S Y S^dag = -X
+        _conjugate_clifford(state, pivot, _COLUMN_S)
+
+    meas_outcome = _choose_outcome(state, forced_outcome)
+
+    if meas_outcome != state.signs[row]:
+        _conjugate_clifford(state, pivot, _COLUMN_Z)
+
+    _conjugate_clifford(state, pivot, _COLUMN_H)
+
+    return meas_outcome
+
+
+def _columns(state, qubit: int):
+    """
+    Returns the word index, shift, and the qubit's x and z bits of every row.
+    """
+
+    word, shift = locate(qubit)
+    bits_x = (state.x_bits[:, word] >> shift) & ONE
+    bits_z = (state.z_bits[:, word] >> shift) & ONE
+
+    return word, shift, bits_x, bits_z
+
+
+def _combine(from_x: int, from_z: int, bits_x, bits_z):
+    """
+    GF(2) combination of the x and z bit columns.
+    """
+
+    if from_x and from_z:
+        return bits_x ^ bits_z
+    elif from_x:
+        return bits_x
+    elif from_z:
+        return bits_z
+    return None
+
+
+def _conjugate_clifford(state,
+                        qubit: int,
+                        rule) -> None:
+    """
+    Conjugates every row by a one-qubit Clifford (compiled with ``compile_clifford``) acting on a column.
+    """
+
+    xx, xz, zx, zz, sign_x, sign_z, sign_xz = rule
+    word, shift, bits_x, bits_z = _columns(state, qubit)
+
+    flip = _combine(sign_x, sign_z, bits_x, bits_z)
+    if sign_xz:
+        both = bits_x & bits_z
+        flip = both if flip is None else flip ^ both
+
+    if flip is not None:
+        state.signs ^= flip.astype(np.uint8)
+
+    if (xx, xz, zx, zz) == (1, 0, 0, 1):
+        return
+
+    new_x = _combine(xx, xz, bits_x, bits_z)
+    new_z = _combine(zx, zz, bits_x, bits_z)
+
+    state.x_bits[:, word] ^= (bits_x ^ new_x) << shift
+    state.z_bits[:, word] ^= (bits_z ^ new_z) << shift
+
+
+def _conjugate_cnot(state,
+                    control: int,
+                    target: int) -> None:
+    """
+    Conjugates every row by a CNOT acting on two columns.
+    """
+
+    word1, shift1, x1, z1 = _columns(state, control)
+    word2, shift2, x2, z2 = _columns(state, target)
+
+    # sign += x1 z2 (x2 + z1 + 1)
+    state.signs ^= (x1 & z2 & (x2 ^ z1 ^ ONE)).astype(np.uint8)
+
+    # X2 += X1, Z1 += Z2
+    state.x_bits[:, word2] ^= x1 << shift2
+    state.z_bits[:, word1] ^= z2 << shift1
+
+
+def _choose_outcome(state, forced_outcome: int) -> int:
+    """
+    Returns the forced outcome or a uniformly random one (drawn from ``state.rng`` if it is set).
+    """
+
+    if forced_outcome == 0 or forced_outcome == 1:
+        return forced_outcome
+    elif forced_outcome is None or forced_outcome == -1:
+        return random_bit(state.rng)
+    else:
+        raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
+
+
+def force_output(state,
+                 qubit: int,
+                 forced_output: int = -1) -> int:
+    """
+    Outputs value.
+
+    Used for error generators to generate outputs when replacing measurements.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubit (int): Integer that indexes the qubit being acted on.
+        forced_output (int): Integer that will be outputted.
+
+    Returns: int
+
+    """
+    return forced_output
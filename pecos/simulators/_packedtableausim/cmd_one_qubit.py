@@ -0,0 +1,408 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+One-qubit Cliffords for ``PackedTableauSim``.
+
+Each gate is specified by how it conjugates X and Z (the same "+z+x" notation used in the bindings). Applying a gate U
+replaces the row of each Pauli P of the (inverse) tableau by the row of U^dag P U, which is a signed copy of the X, Z,
+or Y row of the qubit. This is compiled once into the source and sign of the new X and Z rows, which are then updated as
+whole rows, for every qubit a gate acts on at once.
+"""
+
+from typing import Tuple
+import numpy as np
+from .helper import product_phase
+
+_PAULI_BITS = {'X': (1, 0), 'Y': (1, 1), 'Z': (0, 1)}
+
+# Sources of the new rows: the X row, the Z row, or the Y (= iXZ) row of the qubit.
+_ROW_X, _ROW_Z, _ROW_Y = 0, 1, 2
+
+
+def _pauli_phase(x1: int, z1: int, x2: int, z2: int) -> int:
+    """
+    Power of i picked up when multiplying two single-qubit Hermitian Paulis (first * second).
+    """
+
+    if x1 and z1:  # Y
+        return z2 - x2
+    elif x1:  # X
+        return z2 * (2 * x2 - 1)
+    elif z1:  # Z
+        return x2 * (1 - 2 * z2)
+    return 0
+
+
+def compile_clifford(image_x: str, image_z: str) -> Tuple[int, ...]:
+    """
+    Compiles a one-qubit Clifford given the images of X and Z (e.g., '+Z', '-Y').
+
+    Returns: Tuple of (x <- x, x <- z, z <- x, z <- z, sign if X, sign if Z, extra sign if Y).
+
+    """
+
+    sign_x, (xx, zx) = int(image_x[0] == '-'), _PAULI_BITS[image_x[1].upper()]
+    sign_z, (xz, zz) = int(image_z[0] == '-'), _PAULI_BITS[image_z[1].upper()]
+
+    # Y = iXZ -> i C(X) C(Z)
+    phase = (1 + _pauli_phase(xx, zx, xz, zz)) % 4
+    if phase not in (0, 2):
+        raise Exception('Images %s and %s do not describe a Clifford.' % (image_x, image_z))
+
+    sign_y = sign_x ^ sign_z ^ (phase == 2)
+
+    return xx, xz, zx, zz, sign_x, sign_z, sign_x ^ sign_z ^ sign_y
+
+
+def compile_rows(image_x: str, image_z: str) -> Tuple[int, int, int, int]:
+    """
+    Compiles how a one-qubit Clifford, given the images of X and Z, updates the rows of a qubit.
+
+    Returns: Tuple of (source of the X row, sign, source of the Z row, sign).
+
+    """
+
+    xx, xz, zx, zz, sign_x, sign_z, sign_xz = compile_clifford(image_x, image_z)
+
+    # U P U^dag = s Q => U^dag Q U = s P
+    images = {
+        (xx, zx): (_ROW_X, sign_x),
+        (xz, zz): (_ROW_Z, sign_z),
+        (xx ^ xz, zx ^ zz): (_ROW_Y, sign_xz ^ sign_x ^ sign_z),
+    }
+
+    return images[(1, 0)] + images[(0, 1)]
+
+
+def apply_clifford(state,
+                   qubits,
+                   rule: Tuple[int, int, int, int]) -> None:
+    """
+    Applies a compiled one-qubit Clifford to the rows of the qubits.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Union[int, np.ndarray]): Qubit (or distinct qubits) being acted on.
+        rule (Tuple[int, int, int, int]): Output of ``compile_rows``.
+
+    Returns: None
+
+    """
+
+    source_x, sign_x, source_z, sign_z = rule
+
+    rows_x = np.array(qubits, dtype=np.int64, ndmin=1)
+    rows_z = rows_x + state.num_qubits
+
+    x_bits = state.x_bits
+    z_bits = state.z_bits
+    signs = state.signs
+
+    # Paulis only change signs.
+    if (source_x, source_z) == (_ROW_X, _ROW_Z):
+        if sign_x:
+            signs[rows_x] ^= 1
+        if sign_z:
+            signs[rows_z] ^= 1
+        return
+
+    rows = [(x_bits[rows_x], z_bits[rows_x], signs[rows_x]), (x_bits[rows_z], z_bits[rows_z], signs[rows_z])]
+
+    if _ROW_Y in (source_x, source_z):
+        (x1, z1, s1), (x2, z2, s2) = rows
+        phase = product_phase(x1, z1, s1, x2, z2, s2) + 1
+        rows.append((x1 ^ x2, z1 ^ z2, (phase >> 1) & 1))
+
+    for target, source, sign in ((rows_x, source_x, sign_x), (rows_z, source_z, sign_z)):
+        new_x, new_z, new_signs = rows[source]
+
+        x_bits[target] = new_x
+        z_bits[target] = new_z
+        signs[target] = new_signs ^ sign
+
+
+# Paulis
+_X = compile_rows('+X', '-Z')
+_Y = compile_rows('-X', '-Z')
+_Z = compile_rows('-X', '+Z')
+
+# Square root of Paulis
+_Q = compile_rows('+X', '-Y')
+_QD = compile_rows('+X', '+Y')
+_R = compile_rows('-Z', '+X')
+_RD = compile_rows('+Z', '-X')
+_S = compile_rows('+Y', '+Z')
+_SD = compile_rows('-Y', '+Z')
+
+# Hadamard-like
+_H = compile_rows('+Z', '+X')
+_H2 = compile_rows('-Z', '-X')
+_H3 = compile_rows('+Y', '-Z')
+_H4 = compile_rows('-Y', '-Z')
+_H5 = compile_rows('-X', '+Y')
+_H6 = compile_rows('-X', '-Y')
+
+# Face rotations
+_F1 = compile_rows('+Y', '+X')
+_F1D = compile_rows('+Z', '+Y')
+_F2 = compile_rows('-Z', '+Y')
+_F2D = compile_rows('-Y', '-X')
+_F3 = compile_rows('+Y', '-X')
+_F3D = compile_rows('-Z', '-Y')
+_F4 = compile_rows('+Z', '-Y')
+_F4D = compile_rows('-Y', '+X')
+
+
+def I(state, qubit: int) -> None:
+    """
+    Identity, which does nothing.
+
+    X -> X
+    Z -> Z
+    """
+    pass
+
+
+def X(state, qubit: int) -> None:
+    """
+    Pauli X.
+
+    X -> X
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _X)
+
+
+def Y(state, qubit: int) -> None:
+    """
+    Pauli Y.
+
+    X -> -X
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _Y)
+
+
+def Z(state, qubit: int) -> None:
+    """
+    Pauli Z.
+
+    X -> -X
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _Z)
+
+
+
+def Q(state, qubit: int) -> None:
+    """
+    Square root of X.
+
+    X -> X
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _Q)
+
+
+def Qd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of X.
+
+    X -> X
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _QD)
+
+
+def R(state, qubit: int) -> None:
+    """
+    Square root of Y.
+
+    X -> -Z
+    Z -> X
+    """
+    apply_clifford(state, qubit, _R)
+
+
+def Rd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of Y.
+
+    X -> Z
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _RD)
+
+
+def S(state, qubit: int) -> None:
+    """
+    Square root of Z.
+
+    X -> Y
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _S)
+
+
+def Sd(state, qubit: int) -> None:
+    """
+    Hermitian adjoint of the square root of Z.
+
+    X -> -Y
+    Z -> Z
+    """
+    apply_clifford(state, qubit, _SD)
+
+
+def H(state, qubit: int) -> None:
+    """
+    Hadamard.
+
+    X -> Z
+    Z -> X
+    """
+    apply_clifford(state, qubit, _H)
+
+
+def H2(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -Z
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _H2)
+
+
+def H3(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> Y
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _H3)
+
+
+def H4(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -Y
+    Z -> -Z
+    """
+    apply_clifford(state, qubit, _H4)
+
+
+def H5(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -X
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _H5)
+
+
+def H6(state, qubit: int) -> None:
+    """
+    Hadamard-like rotation.
+
+    X -> -X
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _H6)
+
+
+def F1(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Y
+    Z -> X
+    """
+    apply_clifford(state, qubit, _F1)
+
+
+def F1d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Z
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _F1D)
+
+
+def F2(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Z
+    Z -> Y
+    """
+    apply_clifford(state, qubit, _F2)
+
+
+def F2d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Y
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _F2D)
+
+
+def F3(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Y
+    Z -> -X
+    """
+    apply_clifford(state, qubit, _F3)
+
+
+def F3d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Z
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _F3D)
+
+
+def F4(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> Z
+    Z -> -Y
+    """
+    apply_clifford(state, qubit, _F4)
+
+
+def F4d(state, qubit: int) -> None:
+    """
+    Rotation about a face of the stabilizer octahedron.
+
+    X -> -Y
+    Z -> X
+    """
+    apply_clifford(state, qubit, _F4D)
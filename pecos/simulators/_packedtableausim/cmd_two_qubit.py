@@ -0,0 +1,216 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Two-qubit Cliffords for ``PackedTableauSim``.
+
+The gates update the rows of the (inverse) tableau by multiplying them together, for every pair of qubits a gate acts on
+at once.
+"""
+
+from typing import Tuple
+import numpy as np
+from .helper import product_phase
+from .cmd_one_qubit import H, Q, R, Rd, S, Sd
+
+
+def _rows(state, qubits) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the rows of the X's and Z's of the first and of the second qubits of the pairs.
+    """
+
+    pairs = np.array(qubits, dtype=np.int64, ndmin=2)
+    n = state.num_qubits
+
+    return pairs[:, 0], pairs[:, 1], pairs[:, 0] + n, pairs[:, 1] + n
+
+
+def _multiply(state,
+              targets: np.ndarray,
+              sources: np.ndarray) -> None:
+    """
+    Multiplies the rows ``targets`` by the rows ``sources``, which commute with them.
+    """
+
+    x_bits = state.x_bits
+    z_bits = state.z_bits
+    signs = state.signs
+
+    x1, z1, s1 = x_bits[targets], z_bits[targets], signs[targets]
+    x2, z2, s2 = x_bits[sources], z_bits[sources], signs[sources]
+
+    x_bits[targets] = x1 ^ x2
+    z_bits[targets] = z1 ^ z2
+    signs[targets] = product_phase(x1, z1, s1, x2, z2, s2) >> 1
+
+
+def CNOT(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CNOT gate to the generators.
+
+    XI -> XX
+    ZI -> ZI
+    IX -> IX
+    IZ -> ZZ
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): Control and target qubits (or an array of such pairs acting on distinct qubits).
+
+    Returns: None
+
+    """
+
+    x1, x2, z1, z2 = _rows(state, qubits)
+
+    # CNOT^dag XI CNOT = XX and CNOT^dag IZ CNOT = ZZ
+    _multiply(state, x1, x2)
+    _multiply(state, z2, z1)
+
+
+def CZ(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CZ gate to the generators.
+
+    XI -> XZ
+    ZI -> ZI
+    IX -> ZX
+    IZ -> IZ
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on (or an array of such pairs acting on distinct qubits).
+
+    Returns: None
+
+    """
+
+    x1, x2, z1, z2 = _rows(state, qubits)
+
+    _multiply(state, x1, z2)
+    _multiply(state, x2, z1)
+
+
+def CY(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a Controlled-Y gate.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): Control and target qubits.
+
+    Returns: None
+
+    """
+
+    _, qubit2 = qubits
+
+    S(state, qubit2)
+    CNOT(state, qubits)
+    Sd(state, qubit2)
+
+
+def SWAP(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies a SWAP gate to the generators.
+
+    XI -> IX
+    ZI -> IZ
+    IX -> XI
+    IZ -> ZI
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on (or an array of such pairs acting on distinct qubits).
+
+    Returns: None
+
+    """
+
+    x1, x2, z1, z2 = _rows(state, qubits)
+
+    rows1 = np.concatenate([x1, z1])
+    rows2 = np.concatenate([x2, z2])
+
+    for bits in (state.x_bits, state.z_bits, state.signs):
+        bits[rows1], bits[rows2] = bits[rows2], bits[rows1]
+
+
+def G2(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CZ.H(1).H(2).CZ to the generators.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    CZ(state, qubits)
+    H(state, qubit1)
+    H(state, qubit2)
+    CZ(state, qubits)
+
+
+def II(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Two qubit identity.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+    pass
+
+
+def SqrtXX(state,
+           qubits: Tuple[int, int]) -> None:
+    """
+    Applies a square root of XX rotation to the generators.
+
+    XI -> XI
+    ZI -> -YX
+    IX -> IX
+    IZ -> -XY
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        qubits (Tuple[int, int]): The two qubits being acted on.
+
+    Returns: None
+
+    """
+
+    qubit1, qubit2 = qubits
+
+    Q(state, qubit1)
+    Q(state, qubit2)
+    Rd(state, qubit1)
+    CNOT(state, qubits)
+    R(state, qubit1)
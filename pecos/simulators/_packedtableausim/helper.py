@@ -0,0 +1,231 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Bit-level helpers for the packed tableau.
+
+Rows of the tableau are Hermitian Paulis stored as ``uint64`` words over the qubits with Y = (x=1, z=1). A row is
+interpreted as (-1)^r i^{|x & z|} X^x Z^z, which is the convention used by CHP.
+"""
+
+from typing import Iterable, Tuple
+import numpy as np
+
+WORD_SIZE = 64
+ONE = np.uint64(1)
+
+# Masks of the SWAR popcount.
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0f0f0f0f0f0f0f0f)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def num_words(num_qubits: int) -> int:
+    """
+    Number of ``uint64`` words needed to store one row of ``num_qubits`` bits.
+    """
+    return max(1, (num_qubits + WORD_SIZE - 1) // WORD_SIZE)
+
+
+def locate(qubit: int) -> Tuple[int, np.uint64]:
+    """
+    Returns the word index and bit shift that store ``qubit`` in a packed row.
+    """
+    return qubit // WORD_SIZE, np.uint64(qubit % WORD_SIZE)
+
+
+def pack(qubits: Iterable[int], words: int) -> np.ndarray:
+    """
+    Packs a collection of qubit ids into a single row of words.
+    """
+
+    row = np.zeros(words, dtype=np.uint64)
+    for q in qubits:
+        word, shift = locate(q)
+        row[word] |= ONE << shift
+
+    return row
+
+
+def unpack(row: np.ndarray) -> set:
+    """
+    Returns the set of qubit ids whose bits are set in ``row``.
+    """
+    return set(bit_ids(row).tolist())
+
+
+def bit_ids(row: np.ndarray) -> np.ndarray:
+    """
+    Returns the sorted array of qubit ids whose bits are set in ``row``.
+    """
+
+    bits = np.unpackbits(np.ascontiguousarray(row).view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits along the last axis of an array of words.
+    """
+    return _sum_bytes(_byte_counts(words))
+
+
+def _byte_counts(words: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits of each byte of the words, by counting those of each pair and nibble in parallel (SWAR).
+    """
+
+    counts = words - ((words >> np.uint64(1)) & _M1)
+    counts = (counts & _M2) + ((counts >> np.uint64(2)) & _M2)
+
+    return (counts + (counts >> np.uint64(4))) & _M4
+
+
+def _sum_bytes(counts: np.ndarray) -> np.ndarray:
+    """
+    Sums the bytes of each word, which must add up to less than 256, and then the words along the last axis.
+    """
+    return ((counts * _H01) >> np.uint64(56)).sum(axis=-1, dtype=np.int64)
+
+
+def transpose(bits: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Transposes a (num_qubits, words) array of packed rows as a num_qubits x num_qubits bit matrix.
+    """
+
+    words = bits.shape[1]
+    unpacked = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), axis=1, count=num_qubits, bitorder='little')
+
+    result = np.zeros((num_qubits, 8 * words), dtype=np.uint8)
+    result[:, :(num_qubits + 7) // 8] = np.packbits(unpacked.T, axis=1, bitorder='little')
+
+    return result.view(np.uint64)
+
+
+def product_phase(x1: np.ndarray, z1: np.ndarray, s1: np.ndarray,
+                  x2: np.ndarray, z2: np.ndarray, s2: np.ndarray) -> np.ndarray:
+    """
+    Power of i (mod 4) of the products (first * second) of rows, relative to the Hermitian row with the XOR of their
+    bits. The arguments broadcast against each other.
+
+    Each qubit where the two Paulis anti-commute contributes i (as in XY = iZ) or -i (as in YX = -iZ), so only two
+    counts are needed: the number of anti-commuting qubits and the number that contribute -i.
+
+    Args:
+        x1 (np.ndarray): (..., words) array of the X bits of the first factors.
+        z1 (np.ndarray): Z bits of the first factors.
+        s1 (np.ndarray): Sign bits of the first factors.
+        x2 (np.ndarray): X bits of the second factors.
+        z2 (np.ndarray): Z bits of the second factors.
+        s2 (np.ndarray): Sign bits of the second factors.
+
+    Returns: Array of the phases.
+
+    """
+
+    x1z2 = x1 & z2
+    anticom = x1z2 ^ (z1 & x2)
+    minus = (x1 ^ x2 ^ z1 ^ z2 ^ x1z2) & anticom
+
+    # At most 8 + 2 * 8 per byte.
+    phase = _sum_bytes(_byte_counts(anticom) + (_byte_counts(minus) << ONE))
+    phase += 2 * (s1.astype(np.int64) + s2.astype(np.int64))
+
+    return phase % 4
+
+
+def row_product(x_rows: np.ndarray, z_rows: np.ndarray, signs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Multiplies the Pauli rows together (in order) in one pass.
+
+    Writing each row as (-1)^r i^{|x & z|} X^x Z^z, reordering the product into X^x Z^z form costs a -1 for every Z
+    that has to move past a later X. Those crossings are counted with a running XOR of the Z rows.
+
+    Args:
+        x_rows (np.ndarray): (k, words) array of X bits.
+        z_rows (np.ndarray): (k, words) array of Z bits.
+        signs (np.ndarray): Length k array of sign bits.
+
+    Returns: Tuple of the X row, Z row, and the power of i (mod 4) of the product relative to the Hermitian row with
+        these bits.
+
+    """
+
+    if len(x_rows) == 0:
+        words = x_rows.shape[1]
+        return np.zeros(words, dtype=np.uint64), np.zeros(words, dtype=np.uint64), 0
+
+    z_prefix = np.bitwise_xor.accumulate(z_rows, axis=0)
+    x_total = np.bitwise_xor.reduce(x_rows, axis=0)
+    z_total = z_prefix[-1]
+
+    crossings = int(popcount(z_prefix[:-1] & x_rows[1:]).sum())
+
+    phase = int(popcount(x_rows & z_rows).sum()) + 2 * crossings - int(popcount(x_total & z_total))
+    phase += 2 * int(signs.sum())
+
+    return x_total, z_total, phase % 4
+
+
+def invert_tableau(x_bits: np.ndarray, z_bits: np.ndarray, signs: np.ndarray,
+                   num_qubits: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Inverts the Clifford described by a tableau.
+
+    Rows ``0`` to ``num_qubits - 1`` of the tableau are the images of the X's of the qubits and rows ``num_qubits`` to
+    ``2 * num_qubits - 1`` the images of the Z's. The inverse is returned in the same layout.
+
+    A Pauli that anti-commutes with an image C(P) is mapped by the inverse to one that anti-commutes with P, so the bits
+    of the inverse are transposes of those of the tableau. Each of its signs is found by applying the tableau to the
+    unsigned row and reading off the sign of the single qubit Pauli that results.
+
+    Args:
+        x_bits (np.ndarray): (2 * num_qubits, words) array of X bits.
+        z_bits (np.ndarray): (2 * num_qubits, words) array of Z bits.
+        signs (np.ndarray): Sign bits of the rows.
+        num_qubits (int): Number of qubits.
+
+    Returns: Tuple of the X bits, Z bits, and signs of the inverse.
+
+    """
+
+    n = num_qubits
+    images_x = slice(0, n)
+    images_z = slice(n, 2 * n)
+
+    new_x = np.empty_like(x_bits)
+    new_z = np.empty_like(z_bits)
+
+    new_x[images_x] = transpose(z_bits[images_z], n)
+    new_z[images_x] = transpose(z_bits[images_x], n)
+    new_x[images_z] = transpose(x_bits[images_z], n)
+    new_z[images_z] = transpose(x_bits[images_x], n)
+
+    new_signs = np.zeros_like(signs)
+    for row, (row_x, row_z) in enumerate(zip(new_x, new_z)):
+
+        xs = bit_ids(row_x)
+        zs = bit_ids(row_z)
+        rows = np.concatenate([xs, zs + n])
+
+        # P = i^{|x & z|} X^x Z^z
+        _, _, phase = row_product(x_bits[rows], z_bits[rows], signs[rows])
+        phase += len(np.intersect1d(xs, zs))
+
+        new_signs[row] = (phase % 4) >> 1
+
+    return new_x, new_z, new_signs
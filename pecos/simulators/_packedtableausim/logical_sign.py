@@ -0,0 +1,85 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Functions:
+
+find_logical_signs
+find_all_logical_signs
+"""
+
+from typing import Iterable, List, Union
+import numpy as np
+from ...circuits import QuantumCircuit
+from .._logical_op import LogicalOp
+from .helper import unpack, row_product
+
+
+def find_logical_signs(state,
+                       logical_circuit: Union[QuantumCircuit, LogicalOp]) -> int:
+    """
+    Find the sign of the logical operator.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        logical_circuit (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+            operator (or the operator compiled with ``LogicalOp``).
+
+    Returns: 0 if the logical operator stabilizes the state with a +1 sign and 1 if with a -1 sign.
+
+    """
+    return find_all_logical_signs(state, [logical_circuit])[0]
+
+
+def find_all_logical_signs(state,
+                           logical_circuits: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+    """
+    Find the signs of several logical operators.
+
+    The product of the rows of the Paulis of a logical operator is its image under the inverse of the Clifford that
+    prepares the state from |0...0>. The operator stabilizes the state if this image is a product of Z's, and its sign
+    is then the sign of the image.
+
+    Args:
+        state (PackedTableauSim): Instance representing the stabilizer state.
+        logical_circuits (Iterable[Union[QuantumCircuit, LogicalOp]]): The logical operators.
+
+    Returns: List of the signs (see ``find_logical_signs``).
+
+    """
+
+    n = state.num_qubits
+
+    signs = []
+    for logical_op in LogicalOp.compile_all(logical_circuits):
+
+        # Y = iXZ, and the Paulis of different qubits commute, so the operator is i^{#Y} (prod X) (prod Z).
+        rows = np.concatenate([logical_op.x_ids, logical_op.z_ids + n])
+        test_x, test_z, phase = row_product(state.x_bits[rows], state.z_bits[rows], state.signs[rows])
+        phase = (phase + logical_op.num_ys) % 4
+
+        if test_x.any():
+            print(('Logical op: xs - %s and zs - %s' % (set(logical_op.xs), set(logical_op.zs))))
+            raise Exception('Failure due to not finding logical op! x... %s z... %s' %
+                            (str(unpack(test_x)), str(unpack(test_z))))
+
+        if phase % 2:
+            raise Exception('Logical operator has an imaginary sign... Not allowed if logical state is stabilized '
+                            'by logical op!')
+
+        signs.append(phase // 2)
+
+    return signs
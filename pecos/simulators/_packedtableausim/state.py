@@ -0,0 +1,464 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+A stabilizer simulator that stores a CHP-style tableau as bit-packed ``numpy.uint64`` arrays.
+
+Instead of the stabilizers and destabilizers, the tableau holds the images of each qubit's X and Z under the inverse of
+the Clifford that prepares the state from |0...0> (the representation used by Stim). A gate then replaces a few rows by
+products of rows, which act on whole words and are done for every location of a tick at once, and a Z measurement whose
+outcome is determined only reads the sign of a row. This makes the simulator faster than the Python ``SparseSim`` for
+QEC simulations of large codes, such as surface code syndrome extraction for d>=9, as well as for dense or highly
+entangled states, where the set-based ``SparseSim`` slows down.
+
+For the paper on CHP read: http://arxiv.org/abs/quant-ph/0406196
+
+For the paper on Stim read: https://arxiv.org/abs/2103.02202
+"""
+
+from typing import Any, Union, Set, Tuple, List, Iterable
+import numpy as np
+from ...circuits import QuantumCircuit
+from ..sim_class_types import Stabilizer
+from .. import _serialization
+from .._logical_op import LogicalOp
+from . import bindings
+from .helper import num_words, unpack, popcount, invert_tableau, ONE
+from .logical_sign import find_logical_signs, find_all_logical_signs
+
+
+class PackedTableauSim(Stabilizer):
+    """
+    Represents the stabilizer state.
+
+    If C is the Clifford that prepares the state from |0...0>, the stabilizers are the C Z_q C^dag and the
+    destabilizers the C X_q C^dag. The tableau stores the inverse images instead: rows ``0`` to ``num_qubits - 1`` are
+    the C^dag X_q C and rows ``num_qubits`` to ``2 * num_qubits - 1`` are the C^dag Z_q C.
+
+    Attributes:
+        num_qubits (int):
+        bindings (dict):
+        x_bits (np.ndarray): (2 * num_qubits, words) array of the X bits of the rows.
+        z_bits (np.ndarray): (2 * num_qubits, words) array of the Z bits of the rows.
+        signs (np.ndarray): Sign bits of the rows.
+        stabs (Gens):
+        destabs (Gens):
+        gens (Tuple[Gens, Gens]):
+    """
+
+    def __init__(self, num_qubits: int) -> None:
+        """
+        Initializes the stabilizer state.
+
+        Args:
+            num_qubits (int): Number of qubits being represented.
+
+        Returns:
+
+        """
+
+        super().__init__()
+
+        if not isinstance(num_qubits, int):
+            raise Exception('``num_qubits`` should be of type ``int.``')
+
+        self.num_qubits = num_qubits
+
+        self.bindings = bindings.gate_dict
+
+        words = num_words(num_qubits)
+        self.x_bits = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.z_bits = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.signs = np.zeros(2 * num_qubits, dtype=np.uint8)
+
+        # Initialize all qubits in the zero state
+        self.init_all_zero()
+
+        self.stabs = Gens(self, num_qubits)
+        self.destabs = Gens(self, 0)
+        self.gens = (self.stabs, self.destabs)
+
+    def init_all_zero(self) -> None:
+        """
+        Resets the tableau to stabilizers Z and destabilizers X on every qubit (C = I).
+        """
+
+        n = self.num_qubits
+
+        self.x_bits[:] = 0
+        self.z_bits[:] = 0
+        self.signs[:] = 0
+
+        for q in range(n):
+            word, bit = divmod(q, 64)
+            self.x_bits[q, word] = ONE << np.uint64(bit)
+            self.z_bits[n + q, word] = ONE << np.uint64(bit)
+
+    def logical_sign(self,
+                     logical_op: Union[QuantumCircuit, LogicalOp]) -> int:
+        """
+        Returns the sign of a logical operator that is in the stabilizer group.
+
+        Args:
+            logical_op (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+                operator (or the operator compiled with ``LogicalOp``).
+
+        Returns: int
+
+        """
+        return find_logical_signs(self, logical_op)
+
+    def logical_signs(self,
+                      logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+        """
+        Returns the signs of several logical operators that are in the stabilizer group.
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): The logical operators.
+
+        Returns: List[int]
+
+        """
+        return find_all_logical_signs(self, logical_ops)
+
+    def run_gate(self, symbol, locations, **params):
+        """
+        Applies a gate to all of its locations in a tick. Gates in ``bindings.tick_dict`` act on every location at
+        once, provided the locations act on distinct qubits; the others are applied one location at a time.
+
+        Args:
+            symbol (str): Gate symbol.
+            locations: Qubits (or tuples of qubits) acted on.
+            **params: Gate parameters, e.g., ``forced_outcome``.
+
+        Returns (dict): Location => nonzero measurement outcome.
+
+        """
+
+        tick_gate = bindings.tick_dict.get(symbol)
+
+        if tick_gate is None or not locations:
+            return super().run_gate(symbol, locations, **params)
+
+        locations = list(locations)
+        qubits = np.array(locations, dtype=np.int64)
+
+        if qubits.ndim > 1 and len(np.unique(qubits)) != qubits.size:
+            return super().run_gate(symbol, locations, **params)
+
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
+
+        output = {}
+        results = tick_gate(self, qubits, **params)
+
+        if results is not None:
+            output = {locations[i]: int(results[i]) for i in np.flatnonzero(results).tolist()}
+
+        if profiler is not None:
+            profiler.record_gate(symbol, len(locations), profiler.timer() - ti)
+
+        return output
+
+    def run_direct(self,
+                   symbol: str,
+                   location: Set[Union[int, Tuple[int, ...]]],
+                   **gate_kwargs: Any):
+        self.bindings[symbol](self, location, **gate_kwargs)
+
+    def reset(self) -> None:
+        """
+        Returns the state to |0...0> in place (see ``init_all_zero``).
+
+        Returns: None
+
+        """
+        self.init_all_zero()
+
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+
+        new = PackedTableauSim(self.num_qubits)
+        new.restore(self)
+
+        return new
+
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
+
+        Returns (PackedTableauSim): A copy of the state that is not modified by later gates.
+
+        """
+        return self.copy()
+
+    def restore(self, snapshot) -> None:
+        """
+        Overwrites the tableau with that of a snapshot. The arrays are copied in place, so the snapshot is left
+        untouched and can be restored again.
+
+        Args:
+            snapshot (PackedTableauSim): State returned by ``snapshot``.
+
+        Returns: None
+
+        """
+
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        np.copyto(self.x_bits, snapshot.x_bits)
+        np.copyto(self.z_bits, snapshot.z_bits)
+        np.copyto(self.signs, snapshot.signs)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the tableau into a compact bit-packed format (see ``pecos.simulators._serialization``), which can
+        also be read by the other stabilizer simulators.
+
+        Returns: bytes
+
+        """
+
+        n = self.num_qubits
+        row_bytes = _serialization.num_bytes(n)
+        x_bits, z_bits, signs = self.tableau()
+
+        x_bytes = x_bits.astype('<u8', copy=False).view(np.uint8)[:, :row_bytes]
+        z_bytes = z_bits.astype('<u8', copy=False).view(np.uint8)[:, :row_bytes]
+
+        # (-1)^r i^{|x & z|} X^x Z^z -> (-1)^minus i^i (X, Z, W = XZ)
+        phase = ((2 * signs.astype(np.int64) + popcount(x_bits & z_bits)) % 4).astype(np.uint8)
+
+        tableau = {}
+        for name, start in (('destabs', 0), ('stabs', n)):
+            rows = slice(start, start + n)
+            tableau[name + '_x'] = x_bytes[rows]
+            tableau[name + '_z'] = z_bytes[rows]
+            tableau[name + '_minus'] = np.packbits(phase[rows] >> 1, bitorder='little')
+            tableau[name + '_i'] = np.packbits(phase[rows] & 1, bitorder='little')
+
+        return _serialization.tableau_to_bytes(n, tableau)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized tableau.
+
+        Returns (PackedTableauSim): The deserialized state.
+
+        """
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        state = cls(num_qubits)
+        state._load_tableau(tableau)
+
+        return state
+
+    def tableau(self):
+        """
+        Returns the stabilizers and destabilizers of the state, which are found by inverting the stored tableau.
+
+        Returns: Tuple of the X bits, Z bits, and signs of the destabilizers (rows ``0`` to ``num_qubits - 1``) and the
+            stabilizers (rows ``num_qubits`` to ``2 * num_qubits - 1``).
+
+        """
+        return invert_tableau(self.x_bits, self.z_bits, self.signs, self.num_qubits)
+
+    def _load_tableau(self, tableau) -> None:
+
+        n = self.num_qubits
+        words = self.x_bits.shape[1]
+
+        x_bits = np.zeros_like(self.x_bits)
+        z_bits = np.zeros_like(self.z_bits)
+        signs = np.zeros_like(self.signs)
+
+        for name, start in (('destabs', 0), ('stabs', n)):
+            rows = slice(start, start + n)
+
+            for bits, key in ((x_bits, name + '_x'), (z_bits, name + '_z')):
+                padded = np.zeros((n, words * 8), dtype=np.uint8)
+                padded[:, :tableau[key].shape[1]] = tableau[key]
+                bits[rows] = padded.view('<u8')
+
+            minus = np.unpackbits(tableau[name + '_minus'], bitorder='little')[:n].astype(np.int64)
+            has_i = np.unpackbits(tableau[name + '_i'], bitorder='little')[:n].astype(np.int64)
+            num_ys = popcount(x_bits[rows] & z_bits[rows])
+
+            # (-1)^minus i^i (X, Z, W = XZ) -> (-1)^r i^{|x & z|} X^x Z^z
+            # The signs of the destabilizers do not matter (and are not tracked by the sparse simulators).
+            if name == 'stabs' and np.any((has_i - num_ys) % 2):
+                raise Exception('Serialized tableau contains generators that are not Hermitian.')
+
+            signs[rows] = ((2 * minus + has_i - num_ys) % 4) >> 1
+
+        self.x_bits[:], self.z_bits[:], self.signs[:] = invert_tableau(x_bits, z_bits, signs, n)
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, data: bytes) -> None:
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        self.__init__(num_qubits)
+        self._load_tableau(tableau)
+
+    def print_stabs(self,
+                    verbose: bool = True,
+                    print_y: bool = True,
+                    print_destabs: bool = False):
+
+        str_s = self.print_tableau(self.stabs, verbose=verbose, print_y=print_y)
+
+        if print_destabs:
+            if verbose:
+                print('-------------------------------')
+            str_d = self.print_tableau(self.destabs, verbose=verbose, print_signs=False, print_y=print_y)
+
+            return str_s, str_d
+
+        return str_s
+
+    @staticmethod
+    def print_tableau(gen,
+                      verbose: bool = True,
+                      print_signs: bool = True,
+                      print_y: bool = True) -> List[str]:
+        """
+        Prints out the generators.
+        """
+
+        result = gen.row_string(print_signs=print_signs, print_y=print_y)
+
+        if verbose:
+            for line in result:
+                print(line)
+
+        return result
+
+
+class Gens(object):
+    """
+    View of either the stabilizers or the destabilizers of a ``PackedTableauSim``, which are found from its tableau
+    when they are read.
+
+    Mirrors the string output of ``SparseSim``'s generators, where Y is written as W = XZ (Y = iW).
+    """
+
+    _sign_strs = ('  ', ' i', ' -', '-i')
+
+    def __init__(self, state: PackedTableauSim, offset: int) -> None:
+
+        self.state = state
+        self.num_qubits = state.num_qubits
+        self.offset = offset
+
+    def rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the X bits, Z bits, and signs of the generators.
+        """
+
+        rows = slice(self.offset, self.offset + self.num_qubits)
+        x_bits, z_bits, signs = self.state.tableau()
+
+        return x_bits[rows], z_bits[rows], signs[rows]
+
+    @property
+    def x_bits(self) -> np.ndarray:
+        return self.rows()[0]
+
+    @property
+    def z_bits(self) -> np.ndarray:
+        return self.rows()[1]
+
+    @property
+    def signs(self) -> np.ndarray:
+        return self.rows()[2]
+
+    @property
+    def row_x(self) -> List[Set[int]]:
+        return [unpack(row) for row in self.x_bits]
+
+    @property
+    def row_z(self) -> List[Set[int]]:
+        return [unpack(row) for row in self.z_bits]
+
+    def row_string(self,
+                   print_signs: bool = True,
+                   print_y: bool = False) -> List[str]:
+        """
+        Returns the string representation of each generator.
+
+        Args:
+            print_signs (bool): Whether to print the signs of the generators.
+            print_y (bool): Whether to write Y instead of W.
+
+        Returns: List[str]
+
+        """
+
+        result = []
+        x_bits, z_bits, signs = self.rows()
+        num_ys = popcount(x_bits & z_bits)
+
+        for i_gen, (row_x, row_z) in enumerate(zip(map(unpack, x_bits), map(unpack, z_bits))):
+
+            stab_letters = []
+            for qubit in range(self.num_qubits):
+
+                if qubit in row_x and qubit in row_z:
+                    stab_letters.append('Y' if print_y else 'W')
+                elif qubit in row_x:
+                    stab_letters.append('X')
+                elif qubit in row_z:
+                    stab_letters.append('Z')
+                else:
+                    stab_letters.append('I')
+
+            if print_signs:
+                # Stored as (-1)^r Y^k = (-1)^r i^k W^k
+                phase = 2 * int(signs[i_gen])
+                if not print_y:
+                    phase += int(num_ys[i_gen])
+                sign = self._sign_strs[phase % 4]
+            else:
+                sign = '  '
+
+            result.append(sign + ''.join(stab_letters))
+
+        return result
+
+    def print_tableau(self, verbose: bool = True) -> List[str]:
+        """
+        Prints out the generators.
+        """
+
+        result = self.row_string(print_signs=self.offset != 0)
+
+        if verbose:
+            for line in result:
+                print(line)
+
+        return result
@@ -20,8 +20,17 @@
 class Simulator(object):
     """
     A parent class to provide standard methods for simulators.
+
+    Attributes:
+        profiler (Optional[GateProfiler]): If set, ``run_gate`` and ``run_circuit`` report their timings to it.
+        rng (Optional[np.random.Generator]): If set, random measurement outcomes are drawn from it instead of from the
+            global state of ``np.random`` (see ``pecos.misc.random_streams``).
+
     """
 
+    profiler = None
+    rng = None
+
     def __init__(self):
         self.bindings = {}
 
@@ -37,6 +46,10 @@ class Simulator(object):
 
         """
 
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
+
         output = {}
         for location in locations:
             results = self.bindings[symbol](self, location, **params)
@@ -44,13 +57,17 @@ class Simulator(object):
             if results:
                 output[location] = results
 
+        if profiler is not None:
+            profiler.record_gate(symbol, len(locations), profiler.timer() - ti)
+
         return output
 
     def run_circuit(self, circuit, removed_locations=None):
         """
 
         Args:
-            circuit (QuantumCircuit): A circuit instance or object with an appropriate items() generator.
+            circuit (QuantumCircuit): A circuit instance or object with an appropriate items() generator (such as a
+                ``CompactCircuit``).
             removed_locations:
 
         Returns (list): If output is True then the circuit output is returned. Note that this output format may differ
@@ -61,12 +78,20 @@ class Simulator(object):
         # TODO: removed_locations doesn't make sense except if circuit is tick_circuit
         # because can't say not to do gates for particular ticks....
 
-        if removed_locations is None:
-            removed_locations = set([])
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
 
         results = {}
         for symbol, locations, params in circuit.items():
-            gate_results = self.run_gate(symbol, locations - removed_locations, **params)
+            # Locations are only copied if some of them are removed.
+            if removed_locations:
+                locations = set(locations) - removed_locations
+
+            gate_results = self.run_gate(symbol, locations, **params)
             results.update(gate_results)
 
+        if profiler is not None:
+            profiler.record_circuit(profiler.timer() - ti)
+
         return results
@@ -19,3 +19,4 @@
 from . import bindings
 
 from .state import PauliFaultProp
+from .frame_state import PauliFrameProp
@@ -0,0 +1,98 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Specifies the symbol and function for each gate of ``PauliFrameProp``.
+"""
+from . import frame_gates
+
+gate_dict = {
+    # Initialization
+    # ==============
+    'init |0>': frame_gates.init_z,
+    'init |1>': frame_gates.init_z,
+    'init |+>': frame_gates.init_x,
+    'init |->': frame_gates.init_x,
+    'init |+i>': frame_gates.init_y,
+    'init |-i>': frame_gates.init_y,
+
+    # One-qubit Cliffords
+    # ===================
+
+    # Paulis
+    'I': frame_gates.I,
+    'X': frame_gates.I,
+    'Y': frame_gates.I,
+    'Z': frame_gates.I,
+
+    # Square root of Paulis
+    'Q': frame_gates.Q,
+    'Qd': frame_gates.Q,
+    'R': frame_gates.H,
+    'Rd': frame_gates.H,
+    'S': frame_gates.S,
+    'Sd': frame_gates.S,
+
+    # Hadamard-like
+    'H': frame_gates.H,
+
+    'H1': frame_gates.H,
+    'H2': frame_gates.H,
+    'H3': frame_gates.S,
+    'H4': frame_gates.S,
+    'H5': frame_gates.Q,
+    'H6': frame_gates.Q,
+
+    'H+z+x': frame_gates.H,
+    'H-z-x': frame_gates.H,
+    'H+y-z': frame_gates.S,
+    'H-y-z': frame_gates.S,
+    'H-x+y': frame_gates.Q,
+    'H-x-y': frame_gates.Q,
+
+    # Face rotations
+    'F1': frame_gates.F,    # +y+x
+    'F1d': frame_gates.Fd,  # +z+y
+    'F2': frame_gates.Fd,   # -z+y
+    'F2d': frame_gates.F,   # -y-x
+    'F3': frame_gates.F,    # +y-x
+    'F3d': frame_gates.Fd,  # -z-y
+    'F4': frame_gates.Fd,   # +z-y
+    'F4d': frame_gates.F,   # -y+x
+
+    # Two-qubit operations
+    # ====================
+    'CNOT': frame_gates.CNOT,
+    'CZ': frame_gates.CZ,
+    'CY': frame_gates.CY,
+    'SWAP': frame_gates.SWAP,
+    'G': frame_gates.G2,
+    'G2': frame_gates.G2,
+    'II': frame_gates.II,
+
+    # Mølmer–Sørensen gates
+    'SqrtXX': frame_gates.SqrtXX,
+    'MS': frame_gates.SqrtXX,
+    'MSXX': frame_gates.SqrtXX,
+
+    # Measurements
+    # ============
+    'measure X': frame_gates.meas_x,
+    'measure Y': frame_gates.meas_y,
+    'measure Z': frame_gates.meas_z,
+
+    'force output': frame_gates.force_output,
+}
@@ -0,0 +1,432 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Gates for ``PauliFrameProp``.
+
+Each qubit has a row of X bits and a row of Z bits, where bit ``s`` belongs to shot ``s``. Since signs are not tracked,
+a Clifford only needs to update the rows according to how it maps X and Z (up to a sign), which is done for all shots
+with a few word-wise XORs.
+"""
+
+from typing import Any, Tuple
+
+
+# Initialization
+# ==============
+
+def init_z(state,
+           qubit: int) -> None:
+    """
+    Initializes the qubit in a Z eigenstate (|0> or |1>).
+
+    The frame is cleared and then, since Z stabilizes the new state, given a random Z component.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    state.x[qubit] = 0
+    state.z[qubit] = state.random_row()
+
+
+def init_x(state,
+           qubit: int) -> None:
+    """
+    Initializes the qubit in an X eigenstate (|+> or |->).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    state.x[qubit] = state.random_row()
+    state.z[qubit] = 0
+
+
+def init_y(state,
+           qubit: int) -> None:
+    """
+    Initializes the qubit in a Y eigenstate (|+i> or |-i>).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    rand = state.random_row()
+    state.x[qubit] = rand
+    state.z[qubit] = rand
+
+
+# One-qubit Cliffords
+# ===================
+
+def I(state,
+      qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-X and Z -> +/-Z (the Paulis). These do not change the frames.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+    pass
+
+
+def H(state,
+      qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-Z and Z -> +/-X (H, H2, R, Rd).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    x = state.x[qubit].copy()
+    state.x[qubit] = state.z[qubit]
+    state.z[qubit] = x
+
+
+def S(state,
+      qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-Y and Z -> +/-Z (S, Sd, H3, H4).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    state.z[qubit] ^= state.x[qubit]
+
+
+def Q(state,
+      qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-X and Z -> +/-Y (Q, Qd, H5, H6).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    state.x[qubit] ^= state.z[qubit]
+
+
+def F(state,
+      qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-Y and Z -> +/-X (F1, F2d, F3, F4d).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    x = state.x[qubit].copy()
+    state.x[qubit] ^= state.z[qubit]
+    state.z[qubit] = x
+
+
+def Fd(state,
+       qubit: int) -> None:
+    """
+    Cliffords that map X -> +/-Z and Z -> +/-Y (F1d, F2, F3d, F4).
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+
+    Returns: None
+
+    """
+
+    z = state.z[qubit].copy()
+    state.z[qubit] ^= state.x[qubit]
+    state.x[qubit] = z
+
+
+# Two-qubit Cliffords
+# ===================
+
+def CNOT(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies the controlled-X gate.
+
+    XI -> XX
+    ZI -> ZI
+    IX -> IX
+    IZ -> ZZ
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The control and target qubits.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    state.x[q2] ^= state.x[q1]
+    state.z[q1] ^= state.z[q2]
+
+
+def CZ(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies the controlled-Z gate.
+
+    XI -> XZ
+    ZI -> ZI
+    IX -> ZX
+    IZ -> IZ
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The two qubits being operated on.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    state.z[q1] ^= state.x[q2]
+    state.z[q2] ^= state.x[q1]
+
+
+def CY(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies the controlled-Y gate.
+
+    XI -> XY
+    ZI -> ZI
+    IX -> ZX
+    IZ -> ZZ
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The control and target qubits.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    S(state, q2)
+    CNOT(state, qubits)
+    S(state, q2)
+
+
+def SWAP(state,
+         qubits: Tuple[int, int]) -> None:
+    """
+    Applies the SWAP gate.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The two qubits being operated on.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    state.x[[q1, q2]] = state.x[[q2, q1]]
+    state.z[[q1, q2]] = state.z[[q2, q1]]
+
+
+def G2(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Applies a CZ.H(1).H(2).CZ.
+
+    XI -> IX
+    ZI -> XZ
+    IX -> XI
+    IZ -> ZX
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The two qubits being operated on.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    CZ(state, qubits)
+    H(state, q1)
+    H(state, q2)
+    CZ(state, qubits)
+
+
+def II(state,
+       qubits: Tuple[int, int]) -> None:
+    """
+    Two-qubit identity.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The two qubits being operated on.
+
+    Returns: None
+
+    """
+    pass
+
+
+def SqrtXX(state,
+           qubits: Tuple[int, int]) -> None:
+    """
+    Applies a square root of XX rotation.
+
+    XI -> XI
+    ZI -> -YX
+    IX -> IX
+    IZ -> -XY
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubits (Tuple[int, int]): The two qubits being operated on.
+
+    Returns: None
+
+    """
+
+    q1, q2 = qubits
+
+    odd_zs = state.z[q1] ^ state.z[q2]
+    state.x[q1] ^= odd_zs
+    state.x[q2] ^= odd_zs
+
+
+# Measurements
+# ============
+
+def meas_z(state,
+           qubit: int,
+           **params: Any) -> None:
+    """
+    Measurement in the Z basis.
+
+    The X component of the frames flip the outcomes, which are appended to ``state.meas_record``. Afterwards, Z
+    stabilizes the qubit, so the frame is given a random Z component.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+        **params: Ignored.
+
+    Returns: None
+
+    """
+
+    state.meas_record.append(state.x[qubit].copy())
+    state.z[qubit] ^= state.random_row()
+
+
+def meas_x(state,
+           qubit: int,
+           **params: Any) -> None:
+    """
+    Measurement in the X basis.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+        **params: Ignored.
+
+    Returns: None
+
+    """
+
+    state.meas_record.append(state.z[qubit].copy())
+    state.x[qubit] ^= state.random_row()
+
+
+def meas_y(state,
+           qubit: int,
+           **params: Any) -> None:
+    """
+    Measurement in the Y basis.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+        **params: Ignored.
+
+    Returns: None
+
+    """
+
+    state.meas_record.append(state.x[qubit] ^ state.z[qubit])
+
+    rand = state.random_row()
+    state.x[qubit] ^= rand
+    state.z[qubit] ^= rand
+
+
+def force_output(state,
+                 qubit: int,
+                 forced_output: int = -1) -> int:
+    """
+    Outputs value.
+
+    Used for error generators to generate outputs when replacing measurements.
+
+    Args:
+        state (PauliFrameProp): The class representing the Pauli frames.
+        qubit (int): An integer indexing the qubit being operated on.
+        forced_output (int): Integer that will be outputted.
+
+    Returns: int
+
+    """
+    return forced_output
@@ -0,0 +1,242 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from typing import Iterable, Optional, Set, Tuple, Union
+import numpy as np
+from ..sim_class_types import PauliPropagation
+from .._logical_op import LogicalOp
+from . import frame_bindings
+from ...circuits import QuantumCircuit
+from ...circuits.quantum_circuit import ParamGateCollection
+
+
+class PauliFrameProp(PauliPropagation):
+    r"""
+    A batched version of ``PauliFaultProp`` that evolves the Pauli frames of many shots at once.
+
+    The frames are stored as bit-packed arrays: ``x[q]`` and ``z[q]`` are rows of ``uint64`` words where bit ``s`` says
+    whether shot ``s`` has an X (or Z) on qubit ``q``. Measurement flips (relative to a noiseless reference run) are
+    appended to ``meas_record``.
+
+    Attributes:
+        num_qubits (int): Number of qubits.
+        shots (int): Number of shots (frames) being propagated.
+        x (np.ndarray): (num_qubits, words) array of X bits.
+        z (np.ndarray): (num_qubits, words) array of Z bits.
+        meas_record (List[np.ndarray]): Packed measurement flips, one row per measurement.
+        randomize (bool): Whether frames are given random stabilizer components on initializations and measurements.
+        bindings (Dict[str, Callable]):
+
+    """
+
+    def __init__(self, num_qubits: int, shots: int, randomize: bool = True) -> None:
+        """
+
+        Args:
+            num_qubits (int): Number of qubits.
+            shots (int): Number of shots.
+            randomize (bool): Whether to randomize the frames with stabilizers of the reference state. This is needed
+                for measurements that are random in the reference run to also be random across the shots.
+
+        Returns: None
+
+        """
+
+        super().__init__()
+
+        self.num_qubits = num_qubits
+        self.shots = shots
+        self.randomize = randomize
+        self.words = max(1, (shots + 63) // 64)
+
+        self.x = np.zeros((num_qubits, self.words), dtype=np.uint64)
+        self.z = np.zeros((num_qubits, self.words), dtype=np.uint64)
+        self.meas_record = []
+
+        self.bindings = frame_bindings.gate_dict
+
+    def random_row(self) -> np.ndarray:
+        """
+        Returns a row of uniformly random bits (or of zeros if ``randomize`` is False).
+        """
+
+        if self.randomize:
+            rng = np.random if self.rng is None else self.rng
+            return np.frombuffer(rng.bytes(8 * self.words), dtype=np.uint64)
+        else:
+            return np.zeros(self.words, dtype=np.uint64)
+
+    def shot_mask(self, shots: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Returns a row with the bits of ``shots`` set (all shots if None).
+        """
+
+        if shots is None:
+            bits = np.ones(self.shots, dtype=np.uint8)
+        else:
+            bits = np.zeros(self.shots, dtype=np.uint8)
+            bits[list(shots)] = 1
+
+        return self.pack(bits)
+
+    def pack(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Packs the last axis of an array of 0/1 values (one per shot) into words.
+        """
+
+        bits = np.asarray(bits, dtype=np.uint8)
+        padding = [(0, 0)] * (bits.ndim - 1) + [(0, 64 * self.words - bits.shape[-1])]
+        packed = np.packbits(np.pad(bits, padding), axis=-1, bitorder='little')
+
+        return np.ascontiguousarray(packed).view(np.uint64)
+
+    def unpack(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Unpacks rows of words into an array of 0/1 values with the shots as the last axis.
+        """
+
+        rows = np.ascontiguousarray(rows, dtype=np.uint64)
+        bits = np.unpackbits(rows.view(np.uint8), axis=-1, bitorder='little')
+
+        return bits[..., :self.shots]
+
+    def seed_stabilizers(self, state) -> None:
+        """
+        Randomizes the frames with the stabilizers of a reference state.
+
+        Each stabilizer generator is added to each frame with probability 1/2. This does not change the physical state
+        of any shot but makes measurements that are random in the reference state random across the shots.
+
+        Args:
+            state: A stabilizer simulator such as ``SparseSim``.
+
+        Returns: None
+
+        """
+
+        if not self.randomize:
+            return
+
+        stabs = state.stabs
+
+        if isinstance(stabs, dict):  # cySparseSim
+            rows_x, rows_z = stabs['row_x'], stabs['row_z']
+        else:
+            rows_x, rows_z = stabs.row_x, stabs.row_z
+
+        for row_x, row_z in zip(rows_x, rows_z):
+            rand = self.random_row()
+
+            for q in row_x:
+                self.x[q] ^= rand
+
+            for q in row_z:
+                self.z[q] ^= rand
+
+    def logical_sign(self, logical_op: Union[QuantumCircuit, LogicalOp]) -> np.ndarray:
+        """
+        Determines for each shot whether the frame anticommutes with the logical operator (sign == 1) or not (sign ==
+        0).
+
+        Args:
+            logical_op (Union[QuantumCircuit, LogicalOp]): Quantum circuit representing a logical operator (or the
+                operator compiled with ``LogicalOp``).
+
+        Returns: np.ndarray - array of signs, one for each shot.
+
+        """
+        return self.logical_signs([logical_op])[0]
+
+    def logical_signs(self, logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> np.ndarray:
+        """
+        Signs of several logical operators for each shot (see ``logical_sign``).
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): Logical operators.
+
+        Returns: np.ndarray - (number of operators, shots) array of signs.
+
+        """
+
+        logical_ops = LogicalOp.compile_all(logical_ops)
+        parity = np.zeros((len(logical_ops), self.words), dtype=np.uint64)
+
+        for i, logical_op in enumerate(logical_ops):
+            # X anticommutes with Z and Z with X (Y is in both ``x_ids`` and ``z_ids``)
+            parity[i] = np.bitwise_xor.reduce(self.z[logical_op.x_ids], axis=0)
+            parity[i] ^= np.bitwise_xor.reduce(self.x[logical_op.z_ids], axis=0)
+
+        return self.unpack(parity)
+
+    def outcome_flips(self) -> np.ndarray:
+        """
+        Returns the recorded measurement flips as a (shots, measurements) array of 0/1 values.
+        """
+
+        if not self.meas_record:
+            return np.zeros((self.shots, 0), dtype=np.uint8)
+
+        return self.unpack(np.array(self.meas_record)).T
+
+    def run_circuit(self,
+                    circuit: ParamGateCollection,
+                    removed_locations: Union[Set[int], Set[Tuple[int, ...]], None] = None) -> dict:
+        """
+        Applies a quantum circuit to the frames of every shot. Faults and recoveries are added to every frame.
+
+        Args:
+            circuit (ParamGateCollection): A class representing a circuit.
+            removed_locations (Union[Set[int], Set[Tuple[int, ...]], None]): A set of qudit locations that correspond to
+                ideal gates that should be removed.
+
+        Returns: dict
+
+        """
+
+        circuit_type = circuit.metadata.get('circuit_type')
+
+        if circuit_type == 'faults' or circuit_type == 'recovery':
+            self.add_faults(circuit)
+            return {}
+        else:
+            return super().run_circuit(circuit, removed_locations)
+
+    def add_faults(self,
+                   circuit: Union[QuantumCircuit, ParamGateCollection],
+                   shots: Optional[Iterable[int]] = None) -> None:
+        """
+        Adds Pauli faults to the frames of some of the shots.
+
+        Args:
+            circuit (Union[QuantumCircuit, ParamGateCollection]): A quantum circuit representing Pauli faults.
+            shots (Optional[Iterable[int]]): The shots the faults are added to. If None, the faults are added to all of
+                the shots.
+
+        Returns: None
+
+        """
+
+        mask = self.shot_mask(shots)
+
+        for symbol, locations, params in circuit.items():
+            if symbol in ['X', 'Y', 'Z'] and not params:
+                for q in locations:
+                    if symbol != 'Z':
+                        self.x[q] ^= mask
+                    if symbol != 'X':
+                        self.z[q] ^= mask
+            else:
+                raise Exception('Can only handle Pauli errors.')
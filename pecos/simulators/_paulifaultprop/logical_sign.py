@@ -1,35 +1,24 @@
+from typing import Union
 from ...circuits import QuantumCircuit
+from .._logical_op import LogicalOp
 
 
 def find_logical_signs(state,
-                       logical_circuit: QuantumCircuit) -> int:
+                       logical_circuit: Union[QuantumCircuit, LogicalOp]) -> int:
     """
     Find the sign of the logical operator.
 
     Args:
         state:
-        logical_circuit:
+        logical_circuit: Logical operator as a single tick circuit or as a compiled ``LogicalOp``.
 
     Returns:
 
     """
-    if len(logical_circuit) != 1:
-        raise Exception('Logical operators are expected to only have one tick.')
-
-    logical_xs = set([])
-    logical_zs = set([])
-
-    for symbol, gate_locations, _ in logical_circuit.items():
-
-        if symbol == 'X':
-            logical_xs.update(gate_locations)
-        elif symbol == 'Z':
-            logical_zs.update(gate_locations)
-        elif symbol == 'Y':
-            logical_xs.update(gate_locations)
-            logical_zs.update(gate_locations)
-        else:
-            raise Exception('Can not currently handle logical operator with operator "%s"!' % symbol)
+
+    logical_op = LogicalOp.compile(logical_circuit)
+    logical_xs = logical_op.xs
+    logical_zs = logical_op.zs
 
     anticom = len(state.faults['X'] & logical_zs)
     anticom += len(state.faults['Y'] & logical_zs)
@@ -16,8 +16,10 @@
 #   limitations under the License.
 #  =========================================================================  #
 
-from typing import Set, Tuple, Union
+from typing import Iterable, List, Set, Tuple, Union
 from ..sim_class_types import PauliPropagation
+from .. import _serialization
+from .._logical_op import LogicalOp
 from . import bindings
 from .logical_sign import find_logical_signs
 from ...circuits import QuantumCircuit
@@ -60,19 +62,32 @@ class PauliFaultProp(PauliPropagation):
 
         self.bindings = bindings.gate_dict
 
-    def logical_sign(self, logical_op: QuantumCircuit) -> int:
+    def logical_sign(self, logical_op: Union[QuantumCircuit, LogicalOp]) -> int:
         """
         Find the sign of a logical operator, which is equivalent to determining if the faults communute (sign == 0) or
         anticommute (sign == 1) with the logical operator.
 
         Args:
-            logical_op (QuantumCircuit): Quantum circuit representing a logical operator.
+            logical_op (Union[QuantumCircuit, LogicalOp]): Quantum circuit representing a logical operator (or the
+                operator compiled with ``LogicalOp``).
 
         Returns: int - sign.
 
         """
         return find_logical_signs(self, logical_op)
 
+    def logical_signs(self, logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+        """
+        Signs of several logical operators (see ``logical_sign``).
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): Logical operators.
+
+        Returns: List[int] - signs.
+
+        """
+        return [find_logical_signs(self, logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
     def run_circuit(self,
                     circuit: ParamGateCollection,
                     removed_locations: Union[Set[int], Set[Tuple[int, ...]], None] = None,
@@ -135,5 +150,54 @@ class PauliFaultProp(PauliPropagation):
             else:
                 raise Exception('Can only handle Pauli errors.')
 
+    def reset(self) -> None:
+        """
+        Removes all the faults in place.
+
+        Returns: None
+
+        """
+
+        for faults in self.faults.values():
+            faults.clear()
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the faults as packed X and Z bits (see ``pecos.simulators._serialization``).
+
+        Returns: bytes
+
+        """
+        return _serialization.faults_to_bytes(self.num_qubits, self.faults)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized faults.
+
+        Returns (PauliFaultProp): The deserialized state.
+
+        """
+
+        num_qubits, faults = _serialization.faults_from_bytes(data)
+
+        state = cls(num_qubits)
+        state.faults = faults
+
+        return state
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, data: bytes) -> None:
+
+        num_qubits, faults = _serialization.faults_from_bytes(data)
+
+        self.__init__(num_qubits)
+        self.faults = faults
+
     def __str__(self):
         return '{\'X\': %s, \'Y\': %s, \'Z\': %s}' % (self.faults['X'], self.faults['Y'], self.faults['Z'])
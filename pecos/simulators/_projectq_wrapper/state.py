@@ -22,7 +22,9 @@ A simple wrapper for the ProjectQ simulator.
 Compatibility checked for: ProjectQ version 0.3.6
 """
 
+import numpy as np
 from ..sim_class_types import StateVector
+from .. import _serialization
 from ...circuits import QuantumCircuit
 from projectq import MainEngine
 from projectq.ops import All, Measure
@@ -68,6 +70,59 @@ class ProjectQSim(StateVector):
         """
         return find_logical_signs(self, logical_op,)
 
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the state vector (see ``pecos.simulators._serialization``).
+
+        Returns: bytes
+
+        """
+
+        self.eng.flush()
+        mapping, wavefunction = self.eng.backend.cheat()
+
+        # Reorder the amplitudes from the simulator's internal qubit order to that of the register.
+        n = self.num_qubits
+        amplitudes = np.asarray(wavefunction, dtype=np.complex128).reshape((2, ) * n)
+        axes = [n - 1 - mapping[q.id] for q in reversed(self.qs)]
+        amplitudes = amplitudes.transpose(axes).reshape(-1)
+
+        return _serialization.state_vector_to_bytes(n, amplitudes)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized state vector.
+
+        Returns (ProjectQSim): The deserialized state.
+
+        """
+
+        num_qubits, amplitudes = _serialization.state_vector_from_bytes(data)
+
+        state = cls(num_qubits)
+        state._load_amplitudes(amplitudes)
+
+        return state
+
+    def _load_amplitudes(self, amplitudes):
+
+        self.eng.flush()
+        self.eng.backend.set_wavefunction(amplitudes.tolist(), self.qs)
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, data: bytes) -> None:
+
+        num_qubits, amplitudes = _serialization.state_vector_from_bytes(data)
+
+        self.__init__(num_qubits)
+        self._load_amplitudes(amplitudes)
+
     def add_gate(self,
                  symbol: str,
                  gate_obj,
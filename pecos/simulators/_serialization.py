@@ -0,0 +1,296 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Compact binary formats used by the simulators' ``to_bytes``/``from_bytes`` methods and for pickling.
+
+Every format starts with a header of the magic bytes ``b'PECOS'``, a one byte format kind, a one byte version, and the
+number of qubits as a little-endian ``uint64``. Bit arrays are packed with ``numpy.packbits(..., bitorder='little')``
+with each row padded to a whole number of bytes.
+
+Stabilizer tableaus (kind ``TABLEAU``) then store the X and Z bits of the stabilizers and destabilizers followed by the
+sign bits. Signs use the convention of ``SparseSim``: a generator is (-1)^minus * i^i times a product of X, Z, and W =
+XZ. Since the stabilizer simulators share this format, a state written by one can be read by another.
+
+Pauli faults (kind ``FAULTS``) store the X and Z bits of the fault (Y sets both), and state vectors (kind
+``STATE_VECTOR``) store the ``complex128`` amplitudes in little-endian order with qubit 0 as the least significant bit.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+import struct
+import numpy as np
+
+MAGIC = b'PECOS'
+VERSION = 1
+
+# Format kinds
+TABLEAU = b'T'
+FAULTS = b'F'
+STATE_VECTOR = b'V'
+
+TABLEAU_ROWS = ('stabs_x', 'stabs_z', 'destabs_x', 'destabs_z')
+TABLEAU_SIGNS = ('stabs_minus', 'stabs_i', 'destabs_minus', 'destabs_i')
+
+_HEADER = struct.Struct('<5scBQ')
+
+
+def num_bytes(num_qubits: int) -> int:
+    """
+    Number of bytes of a packed row of ``num_qubits`` bits.
+    """
+    return (num_qubits + 7) // 8
+
+
+def write_header(kind: bytes, num_qubits: int) -> bytes:
+    return _HEADER.pack(MAGIC, kind, VERSION, num_qubits)
+
+
+def read_header(data: bytes, kind: bytes) -> Tuple[int, int]:
+    """
+    Checks the header of ``data``.
+
+    Returns: Tuple of the number of qubits and the offset of the body.
+
+    """
+
+    if len(data) < _HEADER.size:
+        raise Exception('Data is too short to be a serialized state.')
+
+    magic, data_kind, version, num_qubits = _HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise Exception('Data is not a serialized PECOS state.')
+
+    if data_kind != kind:
+        raise Exception('Expected serialized data of kind %r but got %r.' % (kind, data_kind))
+
+    if version != VERSION:
+        raise Exception('Unsupported serialization version: %s' % version)
+
+    return num_qubits, _HEADER.size
+
+
+def sets_to_bits(rows: Iterable[Iterable[int]], num_qubits: int) -> np.ndarray:
+    """
+    Packs a sequence of sets of qubit ids into a (len(rows), num_bytes) array.
+    """
+
+    rows = [list(row) for row in rows]
+    dense = np.zeros((len(rows), num_bytes(num_qubits) * 8), dtype=np.uint8)
+
+    lengths = [len(row) for row in rows]
+    if sum(lengths):
+        dense[np.repeat(np.arange(len(rows)), lengths), np.concatenate(rows).astype(np.int64)] = 1
+
+    return np.packbits(dense, axis=-1, bitorder='little')
+
+
+def bits_to_sets(bits: np.ndarray, num_qubits: int) -> List[Set[int]]:
+    """
+    Inverse of ``sets_to_bits``.
+    """
+
+    if len(bits) == 0:
+        return []
+
+    dense = np.unpackbits(bits, axis=-1, bitorder='little')[:, :num_qubits]
+    rows, qubits = np.nonzero(dense)
+    splits = np.searchsorted(rows, np.arange(1, len(bits)))
+
+    return [set(row.tolist()) for row in np.split(qubits, splits)]
+
+
+def ids_to_bits(ids: Iterable[int], num_qubits: int) -> np.ndarray:
+    return sets_to_bits([ids], num_qubits)[0]
+
+
+def bits_to_ids(bits: np.ndarray, num_qubits: int) -> Set[int]:
+    return bits_to_sets(bits[np.newaxis], num_qubits)[0]
+
+
+def ints_to_bits(rows: Iterable[int], num_qubits: int) -> np.ndarray:
+    """
+    Packs rows given as ``int`` bitmasks (bit ``q`` is qubit ``q``) like ``sets_to_bits``.
+    """
+
+    rows = list(rows)
+    row_bytes = num_bytes(num_qubits)
+    data = b''.join(row.to_bytes(row_bytes, 'little') for row in rows)
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(rows), row_bytes)
+
+
+def bits_to_ints(bits: np.ndarray) -> List[int]:
+    """
+    Inverse of ``ints_to_bits``.
+    """
+    return [int.from_bytes(row.tobytes(), 'little') for row in np.atleast_2d(bits)]
+
+
+def tableau_to_bytes(num_qubits: int, tableau: Dict[str, np.ndarray]) -> bytes:
+    """
+    Serializes a tableau.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        tableau (Dict[str, np.ndarray]): The packed bits of each of ``TABLEAU_ROWS`` ((num_qubits, num_bytes) arrays)
+            and ``TABLEAU_SIGNS`` ((num_bytes, ) arrays).
+
+    Returns: bytes
+
+    """
+
+    parts = [write_header(TABLEAU, num_qubits)]
+
+    for name in TABLEAU_ROWS + TABLEAU_SIGNS:
+        parts.append(np.ascontiguousarray(tableau[name], dtype=np.uint8).tobytes())
+
+    return b''.join(parts)
+
+
+def tableau_from_bytes(data: bytes) -> Tuple[int, Dict[str, np.ndarray]]:
+    """
+    Inverse of ``tableau_to_bytes``.
+    """
+
+    num_qubits, offset = read_header(data, TABLEAU)
+    row_bytes = num_bytes(num_qubits)
+
+    if len(data) != offset + 4 * row_bytes * (num_qubits + 1):
+        raise Exception('Serialized tableau has the wrong size for %s qubits.' % num_qubits)
+
+    body = np.frombuffer(data, dtype=np.uint8, offset=offset)
+
+    tableau = {}
+    for name in TABLEAU_ROWS:
+        tableau[name] = body[:num_qubits * row_bytes].reshape(num_qubits, row_bytes)
+        body = body[num_qubits * row_bytes:]
+
+    for name in TABLEAU_SIGNS:
+        tableau[name] = body[:row_bytes]
+        body = body[row_bytes:]
+
+    return num_qubits, tableau
+
+
+def gens_to_bits(num_qubits: int,
+                 stabs: Dict[str, Iterable],
+                 destabs: Dict[str, Iterable]) -> Dict[str, np.ndarray]:
+    """
+    Packs the sparse (``SparseSim``-like) representation of a tableau for ``tableau_to_bytes``.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        stabs (Dict[str, Iterable]): 'row_x', 'row_z', 'signs_minus', and 'signs_i' of the stabilizers.
+        destabs (Dict[str, Iterable]): 'row_x', 'row_z', 'signs_minus', and 'signs_i' of the destabilizers.
+
+    Returns: Dict[str, np.ndarray]
+
+    """
+
+    tableau = {}
+    for name, gen in (('stabs', stabs), ('destabs', destabs)):
+        tableau[name + '_x'] = sets_to_bits(gen['row_x'], num_qubits)
+        tableau[name + '_z'] = sets_to_bits(gen['row_z'], num_qubits)
+        tableau[name + '_minus'] = ids_to_bits(gen['signs_minus'], num_qubits)
+        tableau[name + '_i'] = ids_to_bits(gen['signs_i'], num_qubits)
+
+    return tableau
+
+
+def bits_to_gens(num_qubits: int, tableau: Dict[str, np.ndarray]) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """
+    Inverse of ``gens_to_bits``.
+    """
+
+    gens = []
+    for name in ('stabs', 'destabs'):
+        gens.append({
+            'row_x': bits_to_sets(tableau[name + '_x'], num_qubits),
+            'row_z': bits_to_sets(tableau[name + '_z'], num_qubits),
+            'signs_minus': bits_to_ids(tableau[name + '_minus'], num_qubits),
+            'signs_i': bits_to_ids(tableau[name + '_i'], num_qubits),
+        })
+
+    return gens[0], gens[1]
+
+
+def rows_to_cols(rows: List[Set[int]], num_qubits: int) -> List[Set[int]]:
+    """
+    Transposes the row-wise sparse representation of a set of generators into the column-wise one.
+    """
+
+    cols = [set() for _ in range(num_qubits)]
+    for i, row in enumerate(rows):
+        for q in row:
+            cols[q].add(i)
+
+    return cols
+
+
+def faults_to_bytes(num_qubits: int, faults: Dict[str, Set[int]]) -> bytes:
+    """
+    Serializes a Pauli fault given as a dictionary of 'X', 'Y', and 'Z' to sets of qubit ids.
+    """
+
+    x_bits = ids_to_bits(faults['X'] | faults['Y'], num_qubits)
+    z_bits = ids_to_bits(faults['Z'] | faults['Y'], num_qubits)
+
+    return write_header(FAULTS, num_qubits) + x_bits.tobytes() + z_bits.tobytes()
+
+
+def faults_from_bytes(data: bytes) -> Tuple[int, Dict[str, Set[int]]]:
+    """
+    Inverse of ``faults_to_bytes``.
+    """
+
+    num_qubits, offset = read_header(data, FAULTS)
+    row_bytes = num_bytes(num_qubits)
+
+    if len(data) != offset + 2 * row_bytes:
+        raise Exception('Serialized faults have the wrong size for %s qubits.' % num_qubits)
+
+    body = np.frombuffer(data, dtype=np.uint8, offset=offset)
+    x_ids = bits_to_ids(body[:row_bytes], num_qubits)
+    z_ids = bits_to_ids(body[row_bytes:], num_qubits)
+
+    return num_qubits, {'X': x_ids - z_ids, 'Y': x_ids & z_ids, 'Z': z_ids - x_ids}
+
+
+def state_vector_to_bytes(num_qubits: int, amplitudes: np.ndarray) -> bytes:
+    """
+    Serializes the 2^num_qubits amplitudes of a state vector (qubit 0 is the least significant bit of the index).
+    """
+
+    amplitudes = np.ascontiguousarray(amplitudes, dtype='<c16').reshape(-1)
+
+    if len(amplitudes) != 2 ** num_qubits:
+        raise Exception('Expected %s amplitudes but got %s.' % (2 ** num_qubits, len(amplitudes)))
+
+    return write_header(STATE_VECTOR, num_qubits) + amplitudes.tobytes()
+
+
+def state_vector_from_bytes(data: bytes) -> Tuple[int, np.ndarray]:
+    """
+    Inverse of ``state_vector_to_bytes``.
+    """
+
+    num_qubits, offset = read_header(data, STATE_VECTOR)
+
+    if len(data) != offset + 16 * 2 ** num_qubits:
+        raise Exception('Serialized state vector has the wrong size for %s qubits.' % num_qubits)
+
+    return num_qubits, np.frombuffer(data, dtype='<c16', offset=offset).astype(np.complex128)
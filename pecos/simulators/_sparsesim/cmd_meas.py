@@ -17,7 +17,7 @@
 #  =========================================================================  #
 
 from typing import Set, Optional
-import numpy as np
+from ...misc.random_streams import random_bit
 from .state import SparseSim
 from .cmd_one_qubit import H, H5
 
@@ -133,14 +133,12 @@ def meas_z(state: SparseSim,
             return nondeterministic_meas(state, qubit, anticom_stabs_col, anticom_destabs_col, forced_outcome)
 
         else:
-            if forced_outcome is not None:
-
-                if forced_outcome == 0 or forced_outcome == 1:
-                    meas_outcome = forced_outcome
-                else:
-                    raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
+            if forced_outcome == 0 or forced_outcome == 1:
+                meas_outcome = forced_outcome
+            elif forced_outcome is None or forced_outcome == -1:
+                meas_outcome = random_bit(state.rng)
             else:
-                meas_outcome = np.random.randint(2)
+                raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
 
     return meas_outcome
 
@@ -300,14 +298,12 @@ def nondeterministic_meas(state: SparseSim,
     # Measurements
     # ---------------------------------------------------------------------
 
-    if forced_outcome is not None:
-
-        if forced_outcome == 0 or forced_outcome == 1:
-            meas_outcome = forced_outcome
-        else:
-            raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
+    if forced_outcome == 0 or forced_outcome == 1:
+        meas_outcome = forced_outcome
+    elif forced_outcome is None or forced_outcome == -1:
+        meas_outcome = random_bit(state.rng)
     else:
-        meas_outcome = np.random.randint(2)
+        raise Exception('forced_outcome can only be 0 or 1 and not %s' % forced_outcome)
 
     # Use the random outcome as the sign of the replaced stabilizer
     if meas_outcome:
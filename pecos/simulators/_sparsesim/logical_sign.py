@@ -22,65 +22,38 @@ Functions:
 find_logical_signs
 logical_flip
 """
-from typing import Optional
+from typing import Union
 from ...circuits import QuantumCircuit
+from .._logical_op import LogicalOp
 
 
 def find_logical_signs(state,
-                       logical_circuit: QuantumCircuit,
-                       delogical_circuit: Optional[QuantumCircuit] = None
+                       logical_circuit: Union[QuantumCircuit, LogicalOp],
+                       delogical_circuit: Union[QuantumCircuit, LogicalOp, None] = None
                        ) -> int:
     """
     Find the sign of the logical operator.
 
     Args:
         state:
-        logical_circuit:
+        logical_circuit: Logical operator as a single tick circuit or as a compiled ``LogicalOp``.
 
     Returns:
 
     """
 
-    if len(logical_circuit) != 1:
-        raise Exception('Logical operators are expected to only have one tick.')
+    logical_op = LogicalOp.compile(logical_circuit)
+    logical_xs = logical_op.xs
+    logical_zs = logical_op.zs
 
     stabs = state.stabs
     destabs = state.destabs
 
-    logical_xs = set([])
-    logical_zs = set([])
-
-    for symbol, gate_locations, _ in logical_circuit.items():
-
-        if symbol == 'X':
-            logical_xs.update(gate_locations)
-        elif symbol == 'Z':
-            logical_zs.update(gate_locations)
-        elif symbol == 'Y':
-            logical_xs.update(gate_locations)
-            logical_zs.update(gate_locations)
-        else:
-            raise Exception('Can not currently handle logical operator with operator "%s"!' % symbol)
-
     if delogical_circuit:  # Check the relationship between logical operator and delogical operator.
 
-        if len(delogical_circuit) != 1:
-            raise Exception('Delogical operators are expected to only have one tick.')
-
-        delogical_xs = set([])
-        delogical_zs = set([])
-        
-        for symbol, gate_locations, _ in delogical_circuit.items():
-
-            if symbol == 'X':
-                delogical_xs.update(gate_locations)
-            elif symbol == 'Z':
-                delogical_zs.update(gate_locations)
-            elif symbol == 'Y':
-                delogical_xs.update(gate_locations)
-                delogical_zs.update(gate_locations)
-            else:
-                raise Exception('Can not currently handle logical operator with operator "%s"!' % symbol)
+        delogical_op = LogicalOp.compile(delogical_circuit)
+        delogical_xs = delogical_op.xs
+        delogical_zs = delogical_op.zs
 
         # Make sure the logical and delogical anti-commute
 
@@ -144,8 +117,7 @@ def find_logical_signs(state,
     logical_i = len(build_stabs & stabs.signs_i)
 
     # Translate the Ws to Ys... W = -i(iW) = -iY => For each Y add another -1 and +i.
-    logical_ws = logical_xs & logical_zs
-    num_ys = len(logical_ws)
+    num_ys = logical_op.num_ys
 
     logical_minus += num_ys
     logical_i += num_ys
@@ -41,9 +41,11 @@ Date        Author  Comment
 05/24/2017  CRA     Simplified string outputs. Added the method ``gate`` to ``State`` to give an 
 
 """
-from typing import Any, Union, Set, Tuple, List, Optional
+from typing import Any, Union, Set, Tuple, List, Optional, Iterable
 from ...circuits import QuantumCircuit
 from ..sim_class_types import Stabilizer
+from .. import _serialization
+from .._logical_op import LogicalOp
 from . import bindings
 from .logical_sign import find_logical_signs
 from .refactor import refactor as refactor_generators
@@ -92,14 +94,17 @@ class SparseSim(Stabilizer):
         self.stabs.init_all_z()
         self.destabs.init_all_x()
 
+        # Locations of the gates applied since the state was last |0...0> (None if the changes are not known).
+        self._touched = set()
+
     def logical_sign(self,
-                     logical_op: QuantumCircuit,
+                     logical_op: Union[QuantumCircuit, LogicalOp],
                      # delogical_op: Optional[QuantumCircuit] = None
                      ) -> int:
         """
 
         Args:
-            logical_op:
+            logical_op: Logical operator as a single tick circuit or as a compiled ``LogicalOp``.
 
         Returns:
 
@@ -108,6 +113,18 @@ class SparseSim(Stabilizer):
                                   # delogical_op
                                   )
 
+    def logical_signs(self, logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List[int]:
+        """
+        Signs of several logical operators (e.g., those of a code with multiple logical qubits).
+
+        Args:
+            logical_ops: Logical operators as single tick circuits or compiled ``LogicalOp``s.
+
+        Returns: List of the signs.
+
+        """
+        return [find_logical_signs(self, logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
     def refactor(self,
                  xs: Set[int],
                  zs: Set[int],
@@ -115,6 +132,8 @@ class SparseSim(Stabilizer):
                  prefer=None,
                  protected=None):
 
+        self._touched = None
+
         return refactor_generators(self, xs, zs, choose, prefer, protected)
 
     def find_stab(self,
@@ -123,42 +142,152 @@ class SparseSim(Stabilizer):
 
         return find_stabilizer(self, xs, zs)
 
+    def run_gate(self,
+                 symbol: str,
+                 locations: Set[Union[int, Tuple[int, ...]]],
+                 **params: Any):
+
+        if self._touched is not None:
+            self._touched.update(locations)
+
+        return super().run_gate(symbol, locations, **params)
+
     def run_direct(self,
                    symbol: str,
                    location: Set[Union[int, Tuple[int, ...]]],
                    **gate_kwargs: Any):
+
+        if self._touched is not None:
+            self._touched.add(location)
+
         self.bindings[symbol](self, location, **gate_kwargs)
 
+    def reset(self) -> None:
+        """
+        Returns the state to |0...0> in place.
+
+        Qubits that no gate has acted on since the state was last |0...0> still have the rows and columns of that
+        state, so only the rows and columns of the qubits acted on through ``run_gate``, ``run_circuit``, and
+        ``run_direct`` are reinitialized. If the generators were changed in another way (e.g., by ``refactor`` or
+        ``from_bytes``), every row and column is reinitialized, still without allocating new sets.
+
+        Returns: None
+
+        """
+
+        touched = self._touched
+
+        if touched is None:
+            qubits = range(self.num_qubits)
+        else:
+            qubits = set()
+            for location in touched:
+                if isinstance(location, tuple):
+                    qubits.update(location)
+                else:
+                    qubits.add(location)
+
+        self.stabs.reset_z(qubits)
+        self.destabs.reset_x(qubits)
+
+        self._touched = set()
+
     def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
 
         new = SparseSim(self.num_qubits)
+        new.restore(self)
 
-        old_stabs = self.stabs
-        old_destabs = self.destabs
+        return new
 
-        new_gens = (new.stabs, new.destabs)
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
 
-        for i, gen in enumerate([old_stabs, old_destabs]):
+        Returns (SparseSim): A copy of the state that is not modified by later gates.
 
-            new_gen = new_gens[i]
+        """
+        return self.copy()
 
-            new_gen.signs_minus = set()
-            new_gen.signs_i = set()
+    def restore(self, snapshot) -> None:
+        """
+        Overwrites the stabilizers and destabilizers with those of a snapshot. The snapshot is left untouched and can
+        be restored again.
 
-            new_gen.signs_minus.update(gen.signs_minus)
-            new_gen.signs_i.update(gen.signs_i)
+        Args:
+            snapshot (SparseSim): State returned by ``snapshot`` (or any ``SparseSim`` with the same number of qubits).
 
-            for j in range(self.num_qubits):
+        Returns: None
 
-                new_gen.row_x[j] = set()
-                new_gen.row_z[j] = set()
-                new_gen.col_x[j] = set()
-                new_gen.col_z[j] = set()
+        """
 
-                new_gen.row_x[j].update(gen.row_x[j])
-                new_gen.row_z[j].update(gen.row_z[j])
-                new_gen.col_x[j].update(gen.col_x[j])
-                new_gen.col_z[j].update(gen.col_z[j])
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        for gen, old_gen in zip(self.gens, snapshot.gens):
+            gen.copy_from(old_gen)
+
+        self._touched = None if snapshot._touched is None else set(snapshot._touched)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the tableau into a compact bit-packed format (see ``pecos.simulators._serialization``), which can
+        also be read by the other stabilizer simulators.
+
+        Returns: bytes
+
+        """
+
+        gens = [{'row_x': gen.row_x, 'row_z': gen.row_z, 'signs_minus': gen.signs_minus, 'signs_i': gen.signs_i}
+                for gen in self.gens]
+
+        return _serialization.tableau_to_bytes(self.num_qubits,
+                                               _serialization.gens_to_bits(self.num_qubits, *gens))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized tableau.
+
+        Returns (SparseSim): The deserialized state.
+
+        """
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        state = cls(num_qubits)
+        state._load_tableau(tableau)
+
+        return state
+
+    def _load_tableau(self, tableau) -> None:
+
+        for gen, sparse_gen in zip(self.gens, _serialization.bits_to_gens(self.num_qubits, tableau)):
+            gen.signs_minus = sparse_gen['signs_minus']
+            gen.signs_i = sparse_gen['signs_i']
+
+            gen.row_x = sparse_gen['row_x']
+            gen.row_z = sparse_gen['row_z']
+
+            gen.col_x = _serialization.rows_to_cols(gen.row_x, self.num_qubits)
+            gen.col_z = _serialization.rows_to_cols(gen.row_z, self.num_qubits)
+
+        self._touched = None
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, data: bytes) -> None:
+
+        num_qubits, tableau = _serialization.tableau_from_bytes(data)
+
+        self.__init__(num_qubits)
+        self._load_tableau(tableau)
 
     @staticmethod
     def _pauli_sign(gen,
@@ -440,6 +569,22 @@ class Gens(object):
         self.signs_minus = set()
         self.signs_i = set()
 
+    def copy_from(self, other) -> None:
+        """
+        Replaces the generators with copies of those in ``other``.
+
+        :param other: Gens instance to copy.
+        """
+
+        self.signs_minus = set(other.signs_minus)
+        self.signs_i = set(other.signs_i)
+
+        self.col_x = [set(s) for s in other.col_x]
+        self.col_z = [set(s) for s in other.col_z]
+
+        self.row_x = [set(s) for s in other.row_x]
+        self.row_z = [set(s) for s in other.row_z]
+
     def init_all_z(self) -> None:
         """
         Used to initiate stabilizers to all Zs.
@@ -457,6 +602,50 @@ class Gens(object):
         self.row_x = [set() for _ in range(self.num_qubits)]
         self.row_z = [{i} for i in range(self.num_qubits)]
 
+    def reset_z(self, qubits: Iterable[int]) -> None:
+        """
+        Sets the rows and columns of ``qubits`` back to those of ``init_all_z`` (clearing the sets in place) and clears
+        the signs. The other rows and columns are expected to already be those of ``init_all_z``.
+
+        :param qubits: Ids of the rows and columns to reinitialize.
+        """
+
+        self.signs_minus.clear()
+        self.signs_i.clear()
+
+        col_x, col_z, row_x, row_z = self.col_x, self.col_z, self.row_x, self.row_z
+
+        for q in qubits:
+            col_x[q].clear()
+            row_x[q].clear()
+
+            col_z[q].clear()
+            col_z[q].add(q)
+            row_z[q].clear()
+            row_z[q].add(q)
+
+    def reset_x(self, qubits: Iterable[int]) -> None:
+        """
+        Sets the rows and columns of ``qubits`` back to those of ``init_all_x`` (clearing the sets in place) and clears
+        the signs. The other rows and columns are expected to already be those of ``init_all_x``.
+
+        :param qubits: Ids of the rows and columns to reinitialize.
+        """
+
+        self.signs_minus.clear()
+        self.signs_i.clear()
+
+        col_x, col_z, row_x, row_z = self.col_x, self.col_z, self.row_x, self.row_z
+
+        for q in qubits:
+            col_z[q].clear()
+            row_z[q].clear()
+
+            col_x[q].clear()
+            col_x[q].add(q)
+            row_x[q].clear()
+            row_x[q].add(q)
+
     def init_all_x(self) -> None:
         """
         Used to initiate destabilizers to all Xs.
@@ -0,0 +1,72 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from . import gates_one_qubit as q1
+from . import gates_two_qubit as q2
+from . import gates_init as qinit
+from . import gates_meas as qmeas
+
+gate_dict = {
+    # Initialization
+    # ==============
+    'init |0>': qinit.init_zero,
+    'init |1>': qinit.init_one,
+    'init |+>': qinit.init_plus,
+    'init |->': qinit.init_minus,
+    'init |+i>': qinit.init_plusi,
+    'init |-i>': qinit.init_minusi,
+
+    # one-qubit operations
+    # ====================
+
+    # Paulis, square root of Paulis, Hadamard-like, and face rotations
+    **{symbol: q1.make_gate(symbol) for symbol in q1.matrices},
+
+    'H1': q1.make_gate('H'),
+    'H+z+x': q1.make_gate('H'),
+    'H-z-x': q1.make_gate('H2'),
+    'H+y-z': q1.make_gate('H3'),
+    'H-y-z': q1.make_gate('H4'),
+    'H-x+y': q1.make_gate('H5'),
+    'H-x-y': q1.make_gate('H6'),
+
+    # Rotations (take an angle arg)
+    'RX': q1.RX,
+    'RY': q1.RY,
+    'RZ': q1.RZ,
+
+    # two-qubit operations
+    # ====================
+    **{symbol: q2.make_gate(symbol) for symbol in q2.matrices},
+
+    'G': q2.make_gate('G2'),
+
+    # Mølmer–Sørensen gates
+    'MS': q2.make_gate('SqrtXX'),
+    'MSXX': q2.make_gate('SqrtXX'),
+
+    # Rotations (take an angle arg)
+    'RXX': q2.RXX,
+    'RYY': q2.RYY,
+    'RZZ': q2.RZZ,
+
+    # Measurements
+    # ============
+    'measure X': qmeas.meas_x,
+    'measure Y': qmeas.meas_y,
+    'measure Z': qmeas.meas_z,
+    'force output': qmeas.force_output,
+}
@@ -0,0 +1,60 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Initializations of ``StateVecSim``. A qubit is measured in the Z basis, flipped to |0> in the shots with outcome 1, and
+then rotated to the requested state.
+"""
+
+from .helper import measure_z, apply_matrix
+from .gates_one_qubit import compiled
+
+
+def init_zero(state, qubit: int) -> None:
+    """
+    Initialize qubit in state |0>.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit initialized.
+
+    Returns: None
+
+    """
+
+    # Random outcomes are forced to 0 so that only the shots already in |1> are flipped.
+    outcomes = measure_z(state, qubit, forced_outcome=0)
+
+    if outcomes.any():
+        apply_matrix(state, (qubit, ), compiled['X'], outcomes.nonzero()[0])
+
+
+def _init(symbol):
+
+    rows = compiled[symbol]
+
+    def init(state, qubit: int) -> None:
+        init_zero(state, qubit)
+        apply_matrix(state, (qubit, ), rows)
+
+    return init
+
+
+init_one = _init('X')  # Z -> -Z
+init_plus = _init('H')  # Z -> X
+init_minus = _init('H2')  # Z -> -X
+init_plusi = _init('H5')  # Z -> Y
+init_minusi = _init('H6')  # Z -> -Y
@@ -0,0 +1,109 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Measurements of ``StateVecSim``.
+
+The outcome of a measurement is an ``int`` if the state has a single shot and an array with the outcome of each shot
+otherwise.
+"""
+
+from typing import Optional
+from .helper import measure_z, apply_matrix
+from .gates_one_qubit import compiled
+
+
+def force_output(state, qubit, forced_output=-1):
+    """
+    Outputs value.
+
+    Used for error generators to generate outputs when replacing measurements.
+
+    Args:
+        state:
+        qubit:
+        forced_output:
+
+    Returns:
+
+    """
+    return forced_output
+
+
+def _output(state, outcomes):
+
+    if state.shots == 1:
+        return int(outcomes[0])
+
+    return outcomes
+
+
+def meas_z(state, qubit: int, forced_outcome: Optional[int] = -1):
+    """
+    Measurement in the Z-basis.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit measured.
+        forced_outcome (Optional[int]): Outcome (0 or 1) of the shots where the outcome is random. If -1 or None, the
+            outcomes are random.
+
+    Returns: The outcome(s).
+
+    """
+    return _output(state, measure_z(state, qubit, forced_outcome))
+
+
+def meas_x(state, qubit: int, forced_outcome: Optional[int] = -1):
+    """
+    Measurement in the X-basis.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit measured.
+        forced_outcome (Optional[int]): Outcome (0 or 1) of the shots where the outcome is random. If -1 or None, the
+            outcomes are random.
+
+    Returns: The outcome(s).
+
+    """
+
+    apply_matrix(state, (qubit, ), compiled['H'])
+    outcomes = measure_z(state, qubit, forced_outcome)
+    apply_matrix(state, (qubit, ), compiled['H'])
+
+    return _output(state, outcomes)
+
+
+def meas_y(state, qubit: int, forced_outcome: Optional[int] = -1):
+    """
+    Measurement in the Y-basis.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit measured.
+        forced_outcome (Optional[int]): Outcome (0 or 1) of the shots where the outcome is random. If -1 or None, the
+            outcomes are random.
+
+    Returns: The outcome(s).
+
+    """
+
+    apply_matrix(state, (qubit, ), compiled['H5'])
+    outcomes = measure_z(state, qubit, forced_outcome)
+    apply_matrix(state, (qubit, ), compiled['H5'])
+
+    return _output(state, outcomes)
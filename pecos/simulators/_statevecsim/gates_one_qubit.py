@@ -0,0 +1,150 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+One-qubit gates of ``StateVecSim``.
+
+The Cliffords are given (up to a global phase) by the same images of X and Z as in the stabilizer simulators.
+"""
+
+from typing import Optional, Iterable
+import numpy as np
+from .helper import compile_matrix, apply_matrix
+
+_r = 1.0 / np.sqrt(2.0)
+
+# Symbol => matrix
+matrices = {
+    # Paulis    # x->, z->
+    'I': np.array([[1, 0], [0, 1]]),  # +x+z
+    'X': np.array([[0, 1], [1, 0]]),  # +x-z
+    'Y': np.array([[0, -1j], [1j, 0]]),  # -x-z
+    'Z': np.array([[1, 0], [0, -1]]),  # -x+z
+
+    # Square root of Paulis
+    'Q': _r * np.array([[1, -1j], [-1j, 1]]),  # +x-y
+    'Qd': _r * np.array([[1, 1j], [1j, 1]]),  # +x+y
+    'R': _r * np.array([[1, -1], [1, 1]]),  # -z+x
+    'Rd': _r * np.array([[1, 1], [-1, 1]]),  # +z-x
+    'S': np.array([[1, 0], [0, 1j]]),  # +y+z
+    'Sd': np.array([[1, 0], [0, -1j]]),  # -y+z
+
+    # Hadamard-like
+    'H': _r * np.array([[1, 1], [1, -1]]),  # +z+x
+    'H2': _r * np.array([[1, -1], [-1, -1]]),  # -z-x
+    'H3': np.array([[0, 1], [1j, 0]]),  # +y-z
+    'H4': np.array([[0, 1], [-1j, 0]]),  # -y-z
+    'H5': _r * np.array([[1, -1j], [1j, -1]]),  # -x+y
+    'H6': _r * np.array([[1, 1j], [-1j, -1]]),  # -x-y
+
+    # Face rotations
+    'F1': _r * np.array([[1, -1j], [1, 1j]]),  # +y+x
+    'F1d': _r * np.array([[1, 1], [1j, -1j]]),  # +z+y
+    'F2': _r * np.array([[1, -1], [1j, 1j]]),  # -z+y
+    'F2d': _r * np.array([[1, -1j], [-1, -1j]]),  # -y-x
+    'F3': _r * np.array([[1, 1j], [-1, 1j]]),  # +y-x
+    'F3d': _r * np.array([[1, -1], [-1j, -1j]]),  # -z-y
+    'F4': _r * np.array([[1, 1], [-1j, 1j]]),  # +z-y
+    'F4d': _r * np.array([[1, 1j], [1, -1j]]),  # -y+x
+
+    # Non-Clifford
+    'T': np.array([[1, 0], [0, np.exp(0.25j * np.pi)]]),  # fourth root of Z
+    'Td': np.array([[1, 0], [0, np.exp(-0.25j * np.pi)]]),  # fourth root of Z dagger
+}
+
+# Symbol => matrix compiled for ``apply_matrix``
+compiled = {symbol: compile_matrix(matrix) for symbol, matrix in matrices.items()}
+
+
+def make_gate(symbol: str):
+    """
+    Returns the function that applies the gate ``symbol`` of ``matrices`` to a qubit.
+    """
+
+    rows = compiled[symbol]
+
+    def gate(state,
+             qubit: int,
+             shots: Optional[Iterable[int]] = None) -> None:
+        apply_matrix(state, (qubit, ), rows, shots)
+
+    gate.__name__ = symbol
+    gate.rows = rows
+    gate.matrix = matrices[symbol]
+
+    return gate
+
+
+def RX(state,
+       qubit: int,
+       angle: float = None,
+       shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle X / 2) about X.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+
+    c, s = np.cos(angle / 2), np.sin(angle / 2)
+    apply_matrix(state, (qubit, ), compile_matrix([[c, -1j * s], [-1j * s, c]]), shots)
+
+
+def RY(state,
+       qubit: int,
+       angle: float = None,
+       shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle Y / 2) about Y.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+
+    c, s = np.cos(angle / 2), np.sin(angle / 2)
+    apply_matrix(state, (qubit, ), compile_matrix([[c, -s], [s, c]]), shots)
+
+
+def RZ(state,
+       qubit: int,
+       angle: float = None,
+       shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle Z / 2) about Z.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+
+    apply_matrix(state, (qubit, ), compile_matrix([[np.exp(-0.5j * angle), 0], [0, np.exp(0.5j * angle)]]), shots)
@@ -0,0 +1,141 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Two-qubit gates of ``StateVecSim``.
+
+The first qubit of a location is the most significant bit of the row and column indices of the matrices (e.g., the
+control of CNOT).
+"""
+
+from typing import Optional, Iterable, Tuple
+import numpy as np
+from . import gates_one_qubit
+from .helper import compile_matrix, apply_matrix
+
+_one = gates_one_qubit.matrices
+_xx = np.kron(_one['X'], _one['X'])
+_yy = np.kron(_one['Y'], _one['Y'])
+_zz = np.kron(_one['Z'], _one['Z'])
+
+
+def _first(matrix):
+    return np.kron(matrix, _one['I'])
+
+
+def _second(matrix):
+    return np.kron(_one['I'], matrix)
+
+
+# Symbol => matrix
+matrices = {
+    'II': np.eye(4),
+    'CNOT': np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]),
+    'CZ': np.diag([1, 1, 1, -1]),
+    'SWAP': np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]),
+}
+
+# S(2), CNOT, and then Sd(2) as in the stabilizer simulators
+matrices['CY'] = _second(_one['Sd']) @ matrices['CNOT'] @ _second(_one['S'])
+
+# CZ.H(1).H(2).CZ
+matrices['G2'] = matrices['CZ'] @ np.kron(_one['H'], _one['H']) @ matrices['CZ']
+
+# Q(1), Q(2), Rd(1), CNOT, and then R(1) as in the stabilizer simulators (equal to exp(-i pi XX / 4) up to a phase).
+matrices['SqrtXX'] = (_first(_one['R']) @ matrices['CNOT'] @ _first(_one['Rd']) @ _second(_one['Q']) @
+                      _first(_one['Q']))
+
+# Symbol => matrix compiled for ``apply_matrix``
+compiled = {symbol: compile_matrix(matrix) for symbol, matrix in matrices.items()}
+
+
+def make_gate(symbol: str):
+    """
+    Returns the function that applies the gate ``symbol`` of ``matrices`` to a pair of qubits.
+    """
+
+    rows = compiled[symbol]
+
+    def gate(state,
+             qubits: Tuple[int, int],
+             shots: Optional[Iterable[int]] = None) -> None:
+        apply_matrix(state, qubits, rows, shots)
+
+    gate.__name__ = symbol
+    gate.rows = rows
+
+    return gate
+
+
+def _rotation(pauli_pauli, angle):
+    return compile_matrix(np.cos(angle / 2) * np.eye(4) - 1j * np.sin(angle / 2) * pauli_pauli)
+
+
+def RXX(state,
+        qubits: Tuple[int, int],
+        angle: float = None,
+        shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle XX / 2).
+
+    Args:
+        state (StateVecSim): The state.
+        qubits (Tuple[int, int]): The qubits acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+    apply_matrix(state, qubits, _rotation(_xx, angle), shots)
+
+
+def RYY(state,
+        qubits: Tuple[int, int],
+        angle: float = None,
+        shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle YY / 2).
+
+    Args:
+        state (StateVecSim): The state.
+        qubits (Tuple[int, int]): The qubits acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+    apply_matrix(state, qubits, _rotation(_yy, angle), shots)
+
+
+def RZZ(state,
+        qubits: Tuple[int, int],
+        angle: float = None,
+        shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Rotation exp(-i angle ZZ / 2).
+
+    Args:
+        state (StateVecSim): The state.
+        qubits (Tuple[int, int]): The qubits acted on.
+        angle (float): The rotation angle.
+        shots (Optional[Iterable[int]]): Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+    apply_matrix(state, qubits, _rotation(_zz, angle), shots)
@@ -0,0 +1,221 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Kernels that apply gates to the amplitudes of ``StateVecSim``.
+
+A gate on ``k`` qubits splits the amplitude tensor into ``2^k`` blocks, which are strided views with the bits of the
+gate's qubits fixed. The gate's matrix then only combines whole blocks, so each gate is a few vectorized operations on
+every shot at once, and the amplitudes are never transposed or copied into a new array.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+import numpy as np
+
+# Tolerance below which a probability is treated as zero.
+EPS = 1e-12
+
+
+def compile_matrix(matrix) -> Tuple[Tuple[Tuple[int, complex], ...], ...]:
+    """
+    Compiles the matrix of a gate into the nonzero entries of each of its rows, as used by ``apply_matrix``.
+
+    Args:
+        matrix: A 2^k by 2^k unitary, where the first qubit of the gate is the most significant bit of the row index.
+
+    Returns: Tuple of rows, each a tuple of (column, value) pairs.
+
+    """
+
+    matrix = np.asarray(matrix, dtype=np.complex128)
+
+    return tuple(tuple((col, complex(value)) for col, value in enumerate(row) if abs(value) > EPS) for row in matrix)
+
+
+@lru_cache(maxsize=4096)
+def block_indices(num_qubits: int, qubits: Tuple[int, ...]) -> Tuple[tuple, ...]:
+    """
+    Indices of the blocks of the amplitude tensor of a gate acting on ``qubits`` (in the order of the gate's basis).
+
+    The amplitude tensor has the shape (shots, 2, ..., 2), where axis ``num_qubits - q`` is the bit of qubit ``q``.
+    """
+
+    blocks = []
+    for k in range(2 ** len(qubits)):
+        index = [slice(None)] * (num_qubits + 1)
+
+        for j, qubit in enumerate(qubits):
+            index[num_qubits - qubit] = (k >> (len(qubits) - 1 - j)) & 1
+
+        blocks.append(tuple(index))
+
+    return tuple(blocks)
+
+
+def apply_matrix(state,
+                 qubits: Sequence[int],
+                 rows: Tuple[Tuple[Tuple[int, complex], ...], ...],
+                 shots: Optional[Iterable[int]] = None) -> None:
+    """
+    Applies a gate, compiled with ``compile_matrix``, to the amplitudes of a state in place.
+
+    Args:
+        state (StateVecSim): The state.
+        qubits: The qubits the gate acts on.
+        rows: The compiled matrix of the gate.
+        shots: Shots to apply the gate to (all shots if None).
+
+    Returns: None
+
+    """
+
+    qubits = tuple(int(q) for q in qubits)
+
+    if len(set(qubits)) != len(qubits):
+        raise Exception('Gate acts on the qubits %s more than once.' % str(qubits))
+
+    if shots is None:
+        _apply_blocks(state.tensor, block_indices(state.num_qubits, qubits), rows)
+
+    else:
+        shots = np.asarray(list(shots) if not isinstance(shots, np.ndarray) else shots, dtype=np.int64)
+        tensor = state.tensor[shots]
+        _apply_blocks(tensor, block_indices(state.num_qubits, qubits), rows)
+        state.tensor[shots] = tensor
+
+
+def apply_one_qubit_matrix(state, qubits: Iterable[int], matrix: np.ndarray) -> None:
+    """
+    Applies the same one-qubit matrix to each of several qubits of every shot, e.g., the locations of a tick.
+
+    A diagonal matrix is applied by a single multiplication with the product of its diagonals over the axes of the
+    qubits. Otherwise, the matrix is contracted with the axis of each qubit by ``np.tensordot`` before the result is
+    copied back into the amplitudes once. Either way, the cost is O(k 2^n) for k qubits.
+
+    Args:
+        state (StateVecSim): The state.
+        qubits: Distinct qubits acted on.
+        matrix (np.ndarray): 2 by 2 unitary.
+
+    Returns: None
+
+    """
+
+    num_qubits = state.num_qubits
+    axes = [num_qubits - int(q) for q in qubits]
+    matrix = np.asarray(matrix, dtype=np.complex128)
+
+    if matrix[0, 1] == 0 and matrix[1, 0] == 0:
+        factor = np.ones((1, ) * (num_qubits + 1), dtype=np.complex128)
+
+        for axis in axes:
+            shape = [1] * (num_qubits + 1)
+            shape[axis] = 2
+            factor = factor * np.diag(matrix).reshape(shape)
+
+        state.tensor *= factor
+        return
+
+    tensor = state.tensor
+    for axis in axes:
+        # tensordot puts the new axis of the qubit first.
+        tensor = np.moveaxis(np.tensordot(matrix, tensor, axes=([1], [axis])), 0, axis)
+
+    np.copyto(state.tensor, tensor)
+
+
+def _apply_blocks(tensor: np.ndarray, indices: Tuple[tuple, ...], rows) -> None:
+
+    blocks = [tensor[index] for index in indices]
+
+    # Rows that leave their block unchanged.
+    unchanged = {i for i, row in enumerate(rows) if len(row) == 1 and row[0][0] == i and row[0][1] == 1}
+
+    if all(len(row) == 1 and row[0][0] == i for i, row in enumerate(rows)):
+        # Diagonal gates only rescale blocks.
+        for i, ((_, value), ) in enumerate(rows):
+            if i not in unchanged:
+                blocks[i] *= value
+        return
+
+    # Blocks that are read before they are overwritten are copied first.
+    old = {col: blocks[col].copy() for i, row in enumerate(rows) if i not in unchanged for col, _ in row}
+
+    for i, row in enumerate(rows):
+
+        if i in unchanged:
+            continue
+
+        block = blocks[i]
+
+        if not row:
+            block[...] = 0
+            continue
+
+        (col, value), rest = row[0], row[1:]
+
+        if value == 1:
+            block[...] = old[col]
+        else:
+            np.multiply(old[col], value, out=block)
+
+        for col, value in rest:
+            block += value * old[col]
+
+
+def measure_z(state, qubit: int, forced_outcome: Optional[int] = -1) -> np.ndarray:
+    """
+    Measures a qubit in the Z basis, projecting each shot onto its outcome.
+
+    As for the stabilizer simulators, ``forced_outcome`` only decides the outcomes of shots where both outcomes are
+    possible.
+
+    Args:
+        state (StateVecSim): The state.
+        qubit (int): The qubit to measure.
+        forced_outcome (Optional[int]): 0 or 1 to force the outcome, or -1 (or None) for a random outcome.
+
+    Returns (np.ndarray): The outcome of each shot.
+
+    """
+
+    block0, block1 = (state.tensor[index] for index in block_indices(state.num_qubits, (int(qubit), )))
+    shape = (state.shots, ) + (1, ) * (block1.ndim - 1)
+    axes = tuple(range(1, block1.ndim))
+
+    prob1 = np.sum(block1.real ** 2 + block1.imag ** 2, axis=axes)
+    prob1 = np.clip(prob1, 0.0, 1.0)
+
+    if forced_outcome == 0 or forced_outcome == 1:
+        outcomes = np.full(state.shots, forced_outcome, dtype=np.uint8)
+    elif forced_outcome is None or forced_outcome == -1:
+        rng = np.random if state.rng is None else state.rng
+        outcomes = (rng.random(state.shots) < prob1).astype(np.uint8)
+    else:
+        raise Exception('forced_outcome was not 0, 1, or -1')
+
+    # Deterministic outcomes can not be forced.
+    outcomes[prob1 < EPS] = 0
+    outcomes[prob1 > 1 - EPS] = 1
+
+    prob = np.where(outcomes, prob1, 1.0 - prob1)
+    norm = 1.0 / np.sqrt(prob)
+
+    block0 *= np.where(outcomes, 0.0, norm).reshape(shape)
+    block1 *= np.where(outcomes, norm, 0.0).reshape(shape)
+
+    return outcomes
@@ -0,0 +1,89 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from typing import Union
+import numpy as np
+from .._logical_op import LogicalOp
+from ...circuits import QuantumCircuit
+
+# Tolerance of the deviation of the expectation value from +1 or -1.
+TOL = 1e-6
+
+
+def pauli_expectation(state, logical_op: LogicalOp) -> np.ndarray:
+    """
+    Expectation value of a Pauli operator in each shot.
+
+    Args:
+        state (StateVecSim): The state.
+        logical_op (LogicalOp): The operator.
+
+    Returns (np.ndarray): Real expectation value of each shot.
+
+    """
+
+    n = state.num_qubits
+
+    for q in logical_op.xs | logical_op.zs:
+        if q >= n:
+            raise Exception('Logical operator acts on qubit %s but the state only has %s qubits.' % (q, n))
+
+    tensor = state.tensor
+    image = tensor
+
+    # Y = iXZ
+    if logical_op.zs:
+        image = tensor.copy()
+
+        for q in logical_op.zs:
+            index = [slice(None)] * (n + 1)
+            index[n - q] = 1
+            image[tuple(index)] *= -1
+
+    if logical_op.xs:
+        image = np.flip(image, axis=tuple(n - q for q in logical_op.xs))
+
+    axes = tuple(range(1, n + 1))
+    expectation = (1j ** logical_op.num_ys) * np.sum(tensor.conj() * image, axis=axes)
+
+    return expectation.real
+
+
+def find_logical_signs(state, logical_op: Union[QuantumCircuit, LogicalOp]):
+    """
+    Finds the sign of a logical operator that stabilizes the state.
+
+    Args:
+        state (StateVecSim): The state.
+        logical_op: Single tick circuit of X, Y, and Z gates giving the logical operator (or the operator compiled with
+            ``LogicalOp``).
+
+    Returns: 0 (for +1) or 1 (for -1) as an ``int`` if the state has a single shot and as an array of the sign of each
+    shot otherwise.
+
+    """
+
+    expectation = pauli_expectation(state, LogicalOp.compile(logical_op))
+
+    if np.any(np.abs(np.abs(expectation) - 1.0) > TOL):
+        raise Exception('Logical operator does not stabilize the state (expectation values: %s).' % expectation)
+
+    signs = (expectation < 0).astype(np.uint8)
+
+    if state.shots == 1:
+        return int(signs[0])
+
+    return signs
@@ -0,0 +1,269 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+A state-vector simulator written with NumPy.
+"""
+
+from typing import Any, Iterable, List, Optional, Set, Tuple, Union
+import numpy as np
+from ..sim_class_types import StateVector
+from .. import _serialization
+from .._logical_op import LogicalOp
+from ...circuits import QuantumCircuit
+from . import bindings
+from .helper import apply_matrix, apply_one_qubit_matrix
+from .logical_sign import find_logical_signs
+
+
+class StateVecSim(StateVector):
+    """
+    A state-vector simulator that can simulate several independent shots of the same circuit at once.
+
+    The amplitudes of all the shots are stored in one array, where the shots are the leading axis, so that each gate is
+    applied to every shot by the same few vectorized operations (see ``helper.apply_matrix``). Gates accept the
+    keyword ``shots`` to only act on some of the shots (e.g., to add the errors of those shots), and measurements
+    return an array with the outcome of each shot when there is more than one shot.
+
+    Attributes:
+        num_qubits (int): Number of qubits.
+        shots (int): Number of shots.
+        amplitudes (np.ndarray): (shots, 2^num_qubits) array of amplitudes, where qubit 0 is the least significant bit
+            of the index.
+        tensor (np.ndarray): View of ``amplitudes`` with the shape (shots, 2, ..., 2), where axis ``num_qubits - q`` is
+            the bit of qubit ``q``.
+        bindings (Dict[str, Callable]):
+
+    """
+
+    def __init__(self, num_qubits: int, shots: int = 1) -> None:
+        """
+        Initializes every shot in the state |0...0>.
+
+        Args:
+            num_qubits (int): Number of qubits being represented.
+            shots (int): Number of shots.
+
+        Returns: None
+
+        """
+
+        if not isinstance(num_qubits, int):
+            raise Exception('``num_qubits`` should be of type ``int.``')
+
+        if shots < 1:
+            raise Exception('``shots`` should be at least 1.')
+
+        super().__init__()
+
+        self.bindings = bindings.gate_dict
+        self.num_qubits = num_qubits
+        self.shots = shots
+
+        self.amplitudes = np.zeros((shots, 2 ** num_qubits), dtype=np.complex128)
+        self.tensor = self.amplitudes.reshape((shots, ) + (2, ) * num_qubits)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Returns every shot to the state |0...0> in place.
+
+        Returns: None
+
+        """
+
+        self.amplitudes[:] = 0
+        self.amplitudes[:, 0] = 1
+
+    def run_gate(self,
+                 symbol: str,
+                 locations: Set[Union[int, Tuple[int, ...]]],
+                 **params: Any):
+        """
+        Applies a gate to each location.
+
+        The one-qubit gates given by a fixed matrix are applied to all the locations at once by
+        ``helper.apply_one_qubit_matrix``, and the other gates given by a fixed matrix are applied to each location by
+        ``helper.apply_matrix``. The remaining gates go through ``bindings``.
+
+        Args:
+            symbol (str): Gate symbol.
+            locations: Qubits (or tuples of qubits) acted on.
+            **params: Gate parameters, e.g., ``angle``, ``forced_outcome``, or ``shots``.
+
+        Returns (dict): Location => nonzero measurement outcome(s).
+
+        """
+
+        profiler = self.profiler
+        if profiler is not None:
+            ti = profiler.timer()
+
+        output = {}
+
+        # The gates given by a fixed matrix carry it as ``rows`` (see ``gates_one_qubit.make_gate``), and the one-qubit
+        # ones also as ``matrix``.
+        gate = self.bindings.get(symbol)
+        rows = getattr(gate, 'rows', None)
+        matrix = getattr(gate, 'matrix', None)
+
+        if matrix is not None and not params and len(locations) > 1:
+            apply_one_qubit_matrix(self, locations, matrix)
+
+        elif rows is not None and (not params or params.keys() == {'shots'}):
+            shots = params.get('shots')
+
+            for location in locations:
+                apply_matrix(self, location if isinstance(location, tuple) else (location, ), rows, shots)
+
+        else:
+            for location in locations:
+                results = self.bindings[symbol](self, location, **params)
+
+                if results is not None and np.any(results):
+                    output[location] = results
+
+        if profiler is not None:
+            profiler.record_gate(symbol, len(locations), profiler.timer() - ti)
+
+        return output
+
+    def run_direct(self,
+                   symbol: str,
+                   location: Union[int, Tuple[int, ...]],
+                   **gate_kwargs: Any):
+        return self.bindings[symbol](self, location, **gate_kwargs)
+
+    def logical_sign(self, logical_op: Union[QuantumCircuit, LogicalOp]):
+        """
+        Returns the sign (0 for +1 and 1 for -1) of a logical operator that stabilizes the state.
+
+        Args:
+            logical_op (Union[QuantumCircuit, LogicalOp]): Single tick circuit of X, Y, and Z gates giving the logical
+                operator (or the operator compiled with ``LogicalOp``).
+
+        Returns: An ``int`` if there is a single shot and an array of the sign of each shot otherwise.
+
+        """
+        return find_logical_signs(self, logical_op)
+
+    def logical_signs(self, logical_ops: Iterable[Union[QuantumCircuit, LogicalOp]]) -> List:
+        """
+        Returns the signs of several logical operators (see ``logical_sign``).
+
+        Args:
+            logical_ops (Iterable[Union[QuantumCircuit, LogicalOp]]): The logical operators.
+
+        Returns: List of signs.
+
+        """
+        return [find_logical_signs(self, logical_op) for logical_op in LogicalOp.compile_all(logical_ops)]
+
+    def probabilities(self) -> np.ndarray:
+        """
+        Returns the (shots, 2^num_qubits) array of the probabilities of the computational basis states.
+        """
+        return self.amplitudes.real ** 2 + self.amplitudes.imag ** 2
+
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+
+        new = StateVecSim(self.num_qubits, self.shots)
+        new.restore(self)
+
+        return new
+
+    def snapshot(self):
+        """
+        Captures the current state so that it can later be recovered with ``restore``.
+
+        Returns (StateVecSim): A copy of the state that is not modified by later gates.
+
+        """
+        return self.copy()
+
+    def restore(self, snapshot) -> None:
+        """
+        Overwrites the amplitudes with those of a snapshot. The snapshot is left untouched and can be restored again.
+
+        A snapshot with a single shot can be restored into a state with several shots, which sets every shot to the
+        snapshot.
+
+        Args:
+            snapshot (StateVecSim): State returned by ``snapshot``.
+
+        Returns: None
+
+        """
+
+        if snapshot.num_qubits != self.num_qubits:
+            raise Exception('Snapshot has %s qubits but the state has %s.' % (snapshot.num_qubits, self.num_qubits))
+
+        if snapshot.shots != self.shots and snapshot.shots != 1:
+            raise Exception('Snapshot has %s shots but the state has %s.' % (snapshot.shots, self.shots))
+
+        np.copyto(self.amplitudes, snapshot.amplitudes)
+
+    def to_bytes(self, shot: Optional[int] = None) -> bytes:
+        """
+        Serializes the state vector of a shot (see ``pecos.simulators._serialization``).
+
+        Args:
+            shot (Optional[int]): The shot to serialize. May be omitted if there is only one shot.
+
+        Returns: bytes
+
+        """
+
+        if shot is None:
+            if self.shots != 1:
+                raise Exception('The state has %s shots, so the shot to serialize must be given.' % self.shots)
+            shot = 0
+
+        return _serialization.state_vector_to_bytes(self.num_qubits, self.amplitudes[shot])
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Creates a single shot state from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): Serialized state vector.
+
+        Returns (StateVecSim): The deserialized state.
+
+        """
+
+        num_qubits, amplitudes = _serialization.state_vector_from_bytes(data)
+
+        state = cls(num_qubits)
+        state.amplitudes[0] = amplitudes
+
+        return state
+
+    def __getstate__(self) -> List[bytes]:
+        return [self.to_bytes(shot) for shot in range(self.shots)]
+
+    def __setstate__(self, data: List[bytes]) -> None:
+
+        num_qubits, _ = _serialization.state_vector_from_bytes(data[0])
+
+        self.__init__(num_qubits, len(data))
+
+        for shot, shot_data in enumerate(data):
+            self.amplitudes[shot] = _serialization.state_vector_from_bytes(shot_data)[1]
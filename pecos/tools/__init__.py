@@ -16,7 +16,7 @@
 #   limitations under the License.
 #  =========================================================================  #
 
-from .threshold_tools import threshold_code_capacity
+from .threshold_tools import threshold_code_capacity, ideal_state_preparer
 from .threshold_tools import codecapacity_logical_rate, codecapacity_logical_rate2, \
     codecapacity_logical_rate3
 from . import pseudo_threshold_tools
@@ -25,3 +25,4 @@ from . import fault_tolerance_checks
 from ._stabilizer_verification import VerifyStabilizers
 from ._tool_collection import fault_tolerance_check
 from .pseudo_threshold_tools import plot as plot_pseudo
+from .subset_sampling import SubsetSampler, codecapacity_subset_sampler
@@ -21,7 +21,7 @@ import numpy as np
 from .. import circuits
 from ..circuits import QuantumCircuit
 from ..circuit_runners import Standard
-from ..simulators import pySparseSim
+from ..simulators import pySparseSim, LogicalOp
 
 
 def fault_tolerance_check(QECC, decoder):
@@ -48,7 +48,7 @@ def fault_tolerance_check(QECC, decoder):
     syn_extract.append(QECC.gate('I', num_syn_extract=1))
 
     logical_ops = QECC.instruction('instr_syn_extract').final_logical_ops
-    logical_z = logical_ops[0]['Z']
+    logical_z = LogicalOp(logical_ops[0]['Z'])  # Compiled once since it is checked for every error
     # logical_x = logical_ops[0]['X']
 
     num_qudits = QECC.num_qudits
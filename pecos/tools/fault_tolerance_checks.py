@@ -121,6 +121,10 @@ def t_errors_check(qecc, logical_gate=None, syn_extract=None, decoder=None, t_we
     if decoder is None:
         decoder = MWPM2D(qecc)
 
+    # The states are reset in place for each combination of errors.
+    state_zero = pySparseSim(qecc.num_qudits)
+    state_plus = pySparseSim(qecc.num_qudits)
+
     for qubit_comb in powerset(qudit_set):
 
         if len(qubit_comb) > t_weight:
@@ -140,10 +144,8 @@ def t_errors_check(qecc, logical_gate=None, syn_extract=None, decoder=None, t_we
                 # print(e, q)
                 error_circ.update(e, {q})
 
-            state_zero = pySparseSim(qecc.num_qudits)
-            state_plus = pySparseSim(qecc.num_qudits)
-            # state_zero = circ_sim.init(qecc.num_qudits)
-            # state_plus = circ_sim.init(qecc.num_qudits)
+            state_zero.reset()
+            state_plus.reset()
 
             circ_sim.run(state_zero, initzero)
             circ_sim.run(state_plus, initplus)
@@ -263,6 +265,10 @@ def fault_check(qecc, logical_gate=None, decoder=None, t_weight=None, error_set=
     if decoder is None:
         decoder = MWPM2D(qecc)
 
+    # The states are reset in place for each combination of errors.
+    state_zero = pySparseSim(qecc.num_qudits)
+    state_plus = pySparseSim(qecc.num_qudits)
+
     for qubit_comb in powerset(qudit_set):
 
         if len(qubit_comb) > t_weight:
@@ -282,10 +288,8 @@ def fault_check(qecc, logical_gate=None, decoder=None, t_weight=None, error_set=
                 # print(e, q)
                 error_circ.update(e, {q})
 
-            state_zero = pySparseSim(qecc.num_qudits)
-            state_plus = pySparseSim(qecc.num_qudits)
-            # state_zero = circ_sim.init(qecc.num_qudits)
-            # state_plus = circ_sim.init(qecc.num_qudits)
+            state_zero.reset()
+            state_plus.reset()
 
             circ_sim.run(state_zero, initzero)
             circ_sim.run(state_plus, initplus)
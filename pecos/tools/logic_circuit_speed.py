@@ -34,7 +34,7 @@ def random_circuit_speed(state_sim, num_qubits, circuit_depth, trials=10000, gat
         state = pySparseSim(num_qubits)
         # state = circ_sim.init(num_qubits, state_sim)
         meas = circ_sim.run(state, qc)
-        times.append(circ_sim.total_time)
+        times.append(circ_sim.last_time)
         measurements.append(meas)
 
     return times, measurements
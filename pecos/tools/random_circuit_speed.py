@@ -19,10 +19,25 @@
 import numpy as np
 from ..circuits import QuantumCircuit
 from ..circuit_runners import TimingRunner
-from ..simulators import pySparseSim
 
 
 def random_circuit_speed(state_sim, num_qubits, circuit_depth, trials=10000, gates=None, seed_start=0, converter=None):
+    """
+    Times a simulator on random circuits.
+
+    Args:
+        state_sim: Simulator class, which is called with the number of qubits to create the state of each trial.
+        num_qubits (int): Number of qubits.
+        circuit_depth (int): Number of gates in each circuit.
+        trials (int): Number of circuits.
+        gates (Optional[List[str]]): Gate symbols to choose from (see ``generate_circuits``).
+        seed_start (int): Seed of the first circuit.
+        converter: Optional function applied to each circuit before it is run.
+
+    Returns: Tuple of the time spent running the gates of each circuit, the measurement results of each circuit, and
+        the circuits.
+
+    """
 
     circuits = generate_circuits(num_qubits, circuit_depth, trials, gates, seed_start)
 
@@ -35,8 +50,7 @@ def random_circuit_speed(state_sim, num_qubits, circuit_depth, trials=10000, gat
         if converter is not None:
             qc = converter(qc)
 
-        # state = circ_sim.init(num_qubits, state_sim)
-        state = pySparseSim(num_qubits)
+        state = state_sim(num_qubits)
         circ_sim.reset_time()
         meas = circ_sim.run(state, qc)
         times.append(circ_sim.total_time)
@@ -46,6 +60,30 @@ def random_circuit_speed(state_sim, num_qubits, circuit_depth, trials=10000, gat
 
 
 def generate_circuits(num_qubits, circuit_depth, trials=100000, gates=None, seed_start=0, iterate=False):
+    """
+    Generates random circuits with one gate per tick. Measurements are forced to give 0 if their outcome is random.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        circuit_depth (int): Number of gates in each circuit.
+        trials (int): Number of circuits.
+        gates (Optional[List[str]]): Gate symbols to choose from.
+        seed_start (int): Seed of the first circuit (each circuit is generated from its own seed).
+        iterate (bool): Whether to return a generator of the circuits instead of a list.
+
+    Returns: List (or generator) of ``QuantumCircuit``s.
+
+    """
+
+    circuits = _iter_circuits(num_qubits, circuit_depth, trials, gates, seed_start)
+
+    if iterate:
+        return circuits
+
+    return list(circuits)
+
+
+def _iter_circuits(num_qubits, circuit_depth, trials, gates, seed_start):
 
     if gates is None:
 
@@ -57,8 +95,6 @@ def generate_circuits(num_qubits, circuit_depth, trials=100000, gates=None, seed
                  'measure X', 'measure Y', 'measure Z',
                  'init |+>', 'init |->', 'init |+i>', 'init |-i>', 'init |0>', 'init |1>', ]
 
-    circuits = []
-
     for seed in range(seed_start, seed_start+trials):
 
         np.random.seed(seed)
@@ -75,20 +111,14 @@ def generate_circuits(num_qubits, circuit_depth, trials=100000, gates=None, seed
                 q = (int(q[0]), int(q[1]))
 
             else:
-                q = int(get_qubits(num_qubits, 1))
+                q = int(get_qubits(num_qubits, 1)[0])
 
                 if element in {'measure Z', 'measure X', 'measure Y'}:
-                    params = {'gate_kwargs': {'forced_outcome': 0}}
+                    params = {'forced_outcome': 0}
 
             qc.append(element, {q}, **params)
 
-        if iterate:
-            yield qc
-        else:
-            circuits.append(qc)
-
-    if not iterate:
-        return circuits
+        yield qc
 
 
 def get_qubits(num_qubits, size):
@@ -0,0 +1,341 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+"""
+Subset sampling of logical error rates.
+
+At physical error rates well below threshold, almost every Monte Carlo run has too few faults to cause a logical failure,
+so plain Monte Carlo needs a huge number of runs to see any. Subset sampling instead estimates, for each weight w (number
+of faults), the probability f(w) that w faults lead to a logical failure. The logical error rate of any physical error
+rate is then a binomially weighted sum of these probabilities.
+"""
+
+from itertools import combinations, product
+from math import comb
+import numpy as np
+from scipy.stats import binom
+from .. import circuit_runners, circuits
+from ..error_gens import FaultList
+from ..simulators import pySparseSim, LogicalOp
+from .threshold_tools import ideal_state_preparer
+
+
+class SubsetSampler:
+    """
+    Estimates the logical error rate of a circuit as a function of the probability of a fault by sampling the fault
+    configurations of each weight separately.
+
+    The fault channels of the circuit come from a ``FaultTable``, and each channel is assumed to have the same
+    probability ``p`` of a fault. For ``N`` channels, the number of faults of a run is then binomially distributed, and
+    all subsets of ``w`` channels are equally likely to be the ones with a fault. The fault of each of these channels is
+    chosen uniformly from its options, so a configuration (a subset together with the fault chosen for each of its
+    channels) is only as likely as the other configurations of its subset; channels with more options make each of
+    their configurations less likely. So, if ``f(w)`` is the probability that a weight-``w`` configuration causes a
+    logical failure::
+
+        p_L(p) = sum_w C(N, w) p^w (1 - p)^(N - w) f(w)
+
+    Each ``f(w)`` is estimated once, either exactly, by averaging over the subsets the fraction of each subset's
+    configurations that fail if there are few subsets, or by sampling subsets and faults uniformly. ``p_L`` can then be
+    evaluated for any ``p``. Weights above the largest one run are not simulated; their probability bounds the error of
+    leaving them out (see ``uncertainty``).
+
+    Attributes:
+        table (FaultTable): The fault channels of the circuit.
+        channels (np.ndarray): The channels of ``table`` that can have a fault.
+        trial: Function that simulates a ``FaultList`` and returns whether it caused a logical failure.
+        runs (dict): weight => number of sampled configurations, or of subsets if the weight was enumerated.
+        failures (dict): weight => number of sampled configurations that caused a logical failure, or the sum over the
+            subsets of the fraction of their configurations that did if the weight was enumerated.
+        exact (dict): weight => whether every configuration of the weight was simulated.
+    """
+
+    def __init__(self, table, trial):
+        """
+
+        Args:
+            table (FaultTable): The fault channels of the circuit.
+            trial: Function that takes a ``FaultList``, simulates the circuit with its faults, and returns whether they
+                caused a logical failure.
+        """
+
+        self.table = table
+        self.trial = trial
+        self.channels = np.flatnonzero(table.probs > 0.0)
+
+        probs = table.probs[self.channels]
+        if len(probs) and np.any(probs != probs[0]):
+            raise Exception('Subset sampling requires every fault channel to have the same probability.')
+
+        self.runs = {}
+        self.failures = {}
+        self.exact = {}
+
+    @property
+    def num_channels(self):
+        return len(self.channels)
+
+    def num_configurations(self, weight):
+        """
+        Returns the number of fault configurations of a weight.
+
+        This is the elementary symmetric polynomial of degree ``weight`` of the number of faults of each channel.
+        """
+
+        # counts[k] = number of configurations of weight k among the channels seen so far.
+        counts = [1] + [0] * weight
+        for num in self.table.num_options[self.channels].tolist():
+            for k in range(weight, 0, -1):
+                counts[k] += counts[k - 1] * num
+
+        return counts[weight]
+
+    def num_subsets(self, weight):
+        """
+        Returns the number of subsets of ``weight`` channels.
+        """
+
+        return comb(self.num_channels, weight)
+
+    def subsets(self, weight):
+        """
+        Yields every subset of ``weight`` channels as a tuple of channels.
+        """
+
+        return combinations(self.channels.tolist(), weight)
+
+    def subset_configurations(self, channels):
+        """
+        Yields every fault configuration of a subset of channels as a ``FaultList``.
+        """
+
+        num_options = self.table.num_options
+
+        for choices in product(*[range(num_options[c]) for c in channels]):
+            yield FaultList(self.table, channels, choices)
+
+    def configurations(self, weight):
+        """
+        Yields every fault configuration of a weight as a ``FaultList``.
+        """
+
+        for channels in self.subsets(weight):
+            yield from self.subset_configurations(channels)
+
+    def sample_configurations(self, weight, runs, rng=None):
+        """
+        Yields ``runs`` fault configurations of a weight, each chosen uniformly at random from ``rng`` (the global state of
+        ``np.random`` if None).
+        """
+
+        if rng is None:
+            rng = np.random
+
+        for _ in range(runs):
+            channels = np.sort(rng.choice(self.channels, weight, replace=False))
+            yield FaultList(self.table, channels, self.table.choose(channels, rng))
+
+    def run(self, max_weight, runs, rng=None):
+        """
+        Estimates the failure fractions of the weights from 0 to ``max_weight``.
+
+        Args:
+            max_weight (int): Largest weight simulated.
+            runs (int): Number of configurations simulated per weight. Weights that have no more subsets of channels
+                than this are enumerated instead.
+            rng (np.random.Generator): Random number generator of the sampled configurations (the global state of
+                ``np.random`` if None).
+
+        Returns: self
+
+        """
+
+        for weight in range(min(max_weight, self.num_channels) + 1):
+            self.run_weight(weight, runs, rng)
+
+        return self
+
+    def run_weight(self, weight, runs, rng=None):
+        """
+        Simulates configurations of one weight. Calling it again adds more samples, unless the weight was enumerated.
+
+        Args:
+            weight (int): Number of faults.
+            runs (int): Number of configurations to simulate.
+            rng (np.random.Generator): Random number generator of the sampled configurations (the global state of
+                ``np.random`` if None).
+
+        """
+
+        if self.exact.get(weight):
+            return
+
+        if weight > self.num_channels:
+            raise Exception('There are only %s fault channels.' % self.num_channels)
+
+        if weight not in self.runs and self.num_subsets(weight) <= runs:
+            # The configurations of a subset are weighted by 1/(number of configurations of the subset).
+            num_failures = 0.0
+            for channels in self.subsets(weight):
+                outcomes = [bool(self.trial(fault_list)) for fault_list in self.subset_configurations(channels)]
+                num_failures += sum(outcomes) / len(outcomes)
+
+            self.exact[weight] = True
+            self.runs[weight] = self.num_subsets(weight)
+            self.failures[weight] = num_failures
+            return
+
+        num_runs = 0
+        num_failures = 0
+        for fault_list in self.sample_configurations(weight, runs, rng):
+            num_runs += 1
+            num_failures += bool(self.trial(fault_list))
+
+        self.exact[weight] = False
+        self.runs[weight] = self.runs.get(weight, 0) + num_runs
+        self.failures[weight] = self.failures.get(weight, 0) + num_failures
+
+    @property
+    def max_weight(self):
+        """
+        Largest weight such that every weight up to it has been run (-1 if none).
+        """
+
+        weight = -1
+        while weight + 1 in self.runs:
+            weight += 1
+
+        return weight
+
+    def failure_rate(self, weight):
+        """
+        Returns the estimated probability that a configuration of a weight causes a logical failure.
+        """
+
+        return self.failures[weight] / self.runs[weight]
+
+    def _weight_probs(self, p):
+        """
+        Returns a (weights, probabilities) array with the probability of each weight that has been run at each ``p``.
+        """
+
+        weights = np.arange(self.max_weight + 1)
+        return binom.pmf(weights[:, None], self.num_channels, np.atleast_1d(p)[None, :])
+
+    def logical_rate(self, p):
+        """
+        Returns the logical error rate estimated from the weights that have been run.
+
+        Args:
+            p (float or array-like): Probability of a fault of each channel. For the error generators of PECOS, this is
+                the parameter ``p`` they were given.
+
+        Returns: float, or np.ndarray if ``p`` is an array.
+
+        """
+
+        rates = np.array([self.failure_rate(w) for w in range(self.max_weight + 1)])
+        logical_rates = rates @ self._weight_probs(p)
+
+        return logical_rates if np.ndim(p) else float(logical_rates[0])
+
+    def uncertainty(self, p):
+        """
+        Returns the uncertainties of ``logical_rate``.
+
+        Args:
+            p (float or array-like): Probability of a fault of each channel.
+
+        Returns: Tuple of the standard error due to sampling the weights that were not enumerated and the probability of
+            the weights that were not run (an upper bound on the error from leaving them out).
+
+        """
+
+        variances = np.array([0.0 if self.exact[w] else
+                              self.failure_rate(w) * (1.0 - self.failure_rate(w)) / self.runs[w]
+                              for w in range(self.max_weight + 1)])
+
+        std_error = np.sqrt(variances @ self._weight_probs(p) ** 2)
+        truncation = binom.sf(self.max_weight, self.num_channels, np.atleast_1d(p))
+
+        if np.ndim(p):
+            return std_error, truncation
+        return float(std_error[0]), float(truncation[0])
+
+
+def codecapacity_subset_sampler(qecc, error_gen, error_params, decoder, state_sim=None, circuit_runner=None,
+                                basis=None):
+    """
+    Creates a ``SubsetSampler`` for the same experiment as ``codecapacity_logical_rate``: an ideal logical basis-state
+    is prepared, a round of syndrome extraction is run with faults, and the decoder's recovery is applied before the
+    sign of the logical operator is checked.
+
+    Args:
+        qecc: A QECC that stores one logical qubit.
+        error_gen: Error generator, which determines the fault channels (see ``FaultTable``).
+        error_params (dict): Parameters for the error generator. Only which channels can have faults matters, not their
+            probability.
+        decoder: Decoder with a ``decode`` method.
+        state_sim: Simulator class (``pySparseSim`` if None).
+        circuit_runner: Circuit runner that accepts ``error_circuits`` (``Standard`` if None).
+        basis: 'zero' (or None) or 'plus'.
+
+    Returns: SubsetSampler
+
+    """
+
+    if state_sim is None:
+        state_sim = pySparseSim
+
+    if circuit_runner is None:
+        circuit_runner = circuit_runners.Standard()
+
+    if basis is None or basis == 'zero':
+        basis = '|0>'
+    elif basis == 'plus':
+        basis = '|+>'
+    else:
+        raise Exception('Basis must be "zero", "plus", "None"!')
+
+    syn_extract = circuits.LogicalCircuit(supress_warning=True)
+    syn_extract.append(qecc.gate('I', num_syn_extract=1))
+
+    init = circuits.LogicalCircuit(supress_warning=True)
+    gate = qecc.gate('ideal init %s' % basis)
+    init.append(gate)
+
+    logical_circ_dict = gate.final_instr().final_logical_ops
+    logical_ops_sym = gate.final_instr().logical_stabilizers
+
+    if len(logical_circ_dict) != 1:
+        raise Exception('This tool expects a code that stores one logical qubit.')
+
+    logical_circ = LogicalOp(logical_circ_dict[0][logical_ops_sym[0]])
+
+    prepare = ideal_state_preparer(state_sim, qecc.num_qudits, circuit_runner, init)
+
+    def trial(fault_list):
+        state, _ = prepare()
+
+        output, _ = circuit_runner.run(state, syn_extract, error_circuits=fault_list.error_circuits())
+
+        if output:
+            recovery = decoder.decode(output)
+            circuit_runner.run(state, recovery)
+
+        return state.logical_sign(logical_circ)
+
+    return SubsetSampler(error_gen.fault_table(syn_extract, error_params), trial)
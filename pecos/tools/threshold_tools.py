@@ -16,8 +16,9 @@
 #   limitations under the License.
 #  =========================================================================  #
 
+from time import perf_counter as default_timer
 import numpy as np
-from ..simulators import pySparseSim
+from ..simulators import pySparseSim, LogicalOp
 from .. import circuit_runners, circuits
 from ..qeccs import Surface4444
 from ..decoders import MWPM2D
@@ -26,7 +27,7 @@ from ..misc.threshold_curve import threshold_fit as default_fit, func as default
 
 
 def threshold_code_capacity(qecc_class, error_gen, decoder_class, ps, ds, runs, verbose=False, mode=1,
-                            threshold_fit=None, p0=None, func=None, circuit_runner=None, basis=None):
+                            threshold_fit=None, p0=None, func=None, circuit_runner=None, basis=None, state_sim=None):
     """
     Function that generates p_logical values given a list of physical errors (ps) and distance (ds).
     Args:
@@ -37,11 +38,13 @@ def threshold_code_capacity(qecc_class, error_gen, decoder_class, ps, ds, runs,
         qecc_class:
         decoder_class:
         verbose:
-        mode:
+        mode: 1 - run by run, 2 - logical rate from the average number of syndrome extractions until failure, 3 - all
+            runs sampled at once as Pauli frames. Modes 1 and 3 accept ``basis='both'``.
         threshold_fit:
         p0:
         func:
         circuit_runner:
+        state_sim: Stabilizer simulator class used to represent the state (defaults to ``pySparseSim``).
 
     Returns:
 
@@ -77,6 +80,8 @@ def threshold_code_capacity(qecc_class, error_gen, decoder_class, ps, ds, runs,
         determine_rate = codecapacity_logical_rate2
     elif mode == 2:
         determine_rate = codecapacity_logical_rate3
+    elif mode == 3:
+        determine_rate = codecapacity_logical_rate_frames
     else:
         raise Exception('Mode "%s" is not handled!' % mode)
 
@@ -97,7 +102,8 @@ def threshold_code_capacity(qecc_class, error_gen, decoder_class, ps, ds, runs,
         for p in ps:
 
             logical_error_rate, time = determine_rate(runs, qecc, d, error_gen, error_params={'p': p}, decoder=decoder,
-                                                      verbose=verbose, circuit_runner=circuit_runner, basis=basis)
+                                                      verbose=verbose, circuit_runner=circuit_runner, basis=basis,
+                                                      state_sim=state_sim)
             if verbose:
                 if time:
                     print('Runtime: %s s' % time)
@@ -116,7 +122,7 @@ def threshold_code_capacity(qecc_class, error_gen, decoder_class, ps, ds, runs,
 
 
 def threshold_code_capacity_calc(ps, ds, runs, error_gen=None, qecc_class=None, decoder_class=None, verbose=True,
-                                 mode=1, threshold_fit=None, p0=None, func=None, circuit_runner=None):
+                                 mode=1, threshold_fit=None, p0=None, func=None, circuit_runner=None, state_sim=None):
     """
     Function that generates p_logical values given a list of physical errors (ps) and distance (ds).
     Args:
@@ -132,6 +138,7 @@ def threshold_code_capacity_calc(ps, ds, runs, error_gen=None, qecc_class=None,
         p0:
         func:
         circuit_runner:
+        state_sim: Stabilizer simulator class used to represent the state (defaults to ``pySparseSim``).
 
     Returns:
 
@@ -184,7 +191,7 @@ def threshold_code_capacity_calc(ps, ds, runs, error_gen=None, qecc_class=None,
         for p in ps:
 
             logical_error_rate, time = determine_rate(runs, qecc, d, error_gen, error_params={'p': p}, decoder=decoder,
-                                                      verbose=verbose, circuit_runner=circuit_runner)
+                                                      verbose=verbose, circuit_runner=circuit_runner, state_sim=state_sim)
             if verbose:
                 if time:
                     print('Runtime: %s s' % time)
@@ -201,6 +208,56 @@ def threshold_code_capacity_calc(ps, ds, runs, error_gen=None, qecc_class=None,
     return {'plist': plist, 'dlist': dlist, 'plog': plog, 'opt': results[0], 'std': results[1]}
 
 
+def ideal_state_preparer(state_sim, num_qudits, circuit_runner, init_circuit):
+    """
+    Creates a function that returns a state prepared by ``init_circuit`` together with the simulation time spent
+    preparing it.
+
+    If the simulator supports ``snapshot``/``restore``, the initialization circuit is only simulated on the first call
+    and later calls restore the ideal state into the state instance from the previous call. Otherwise, if it supports
+    ``reset``, the state instance is reset in place and initialized again. Only simulators without either method are
+    created anew for each call.
+
+    Args:
+        state_sim: Simulator class.
+        num_qudits: Number of qudits the simulator should represent.
+        circuit_runner: Runner used to simulate ``init_circuit``.
+        init_circuit: The (ideal) initialization circuit.
+
+    Returns: Function with no arguments that returns the tuple (state, time).
+
+    """
+
+    cache = {}
+
+    def prepare():
+
+        state = cache.get('state')
+
+        if 'snapshot' in cache:
+            state.restore(cache['snapshot'])
+            return state, 0.0
+
+        if state is not None:
+            state.reset()
+        else:
+            state = state_sim(num_qudits)
+
+        circuit_runner.run(state, init_circuit)
+        init_time = getattr(circuit_runner, 'last_time', 0.0)
+
+        if hasattr(state, 'snapshot') and hasattr(state, 'restore'):
+            cache['snapshot'] = state.snapshot()
+            cache['state'] = state
+
+        elif hasattr(state, 'reset'):
+            cache['state'] = state
+
+        return state, init_time
+
+    return prepare
+
+
 def codecapacity_logical_rate(runs, qecc, distance, error_gen, error_params, decoder, seed=None, state_sim=None,
                               verbose=True, circuit_runner=None, basis=None):
     """
@@ -229,6 +286,9 @@ def codecapacity_logical_rate(runs, qecc, distance, error_gen, error_params, dec
     p = error_params['p']
     total_time = 0.0
 
+    if state_sim is None:
+        state_sim = pySparseSim
+
     # Circuit simulator
     if circuit_runner is None:
         circuit_runner = circuit_runners.TimingRunner(seed=seed)
@@ -261,24 +321,22 @@ def codecapacity_logical_rate(runs, qecc, distance, error_gen, error_params, dec
     if len(logical_circ_dict) != 1:
         raise Exception('This tool expects a code that stores one logical qubit.')
 
-    logical_circ = logical_circ_dict[0][logical_ops_sym[0]]
+    # Compiled once since the sign is checked every run
+    logical_circ = LogicalOp(logical_circ_dict[0][logical_ops_sym[0]])
+
+    # Prepares ideal logical |0> (only simulated once if the simulator supports snapshots)
+    prepare = ideal_state_preparer(state_sim, qecc.num_qudits, circuit_runner, initzero)
 
     num_failure = 0
 
     for _ in range(runs):
-        # State
-        state = pySparseSim(qecc.num_qudits)
-
         # Create ideal logical |0>
-        circuit_runner.run(state, initzero)
-        try:
-            total_time += circuit_runner.total_time
-        except AttributeError:
-            pass
+        state, init_time = prepare()
+        total_time += init_time
 
         output, _ = circuit_runner.run(state, syn_extract, error_gen=error_gen, error_params=error_params)
         try:
-            total_time += circuit_runner.total_time
+            total_time += circuit_runner.last_time
         except AttributeError:
             pass
 
@@ -338,6 +396,9 @@ def codecapacity_logical_rate2(runs, qecc, distance, error_gen, error_params, de
     p = error_params['p']
     total_time = 0.0
 
+    if state_sim is None:
+        state_sim = pySparseSim
+
     # Circuit simulator
     if circuit_runner is None:
         circuit_runner = circuit_runners.TimingRunner(seed=seed)
@@ -348,43 +409,36 @@ def codecapacity_logical_rate2(runs, qecc, distance, error_gen, error_params, de
 
     # init logical |0> circuit
     initzero = circuits.LogicalCircuit(supress_warning=True)
-    initzero.append(qecc.gate('ideal init |0>'))
+    gate_zero = qecc.gate('ideal init |0>')
+    initzero.append(gate_zero)
 
     # init logical |+> circuit
     initplus = circuits.LogicalCircuit(supress_warning=True)
-    initplus.append(qecc.gate('ideal init |+>'))
+    gate_plus = qecc.gate('ideal init |+>')
+    initplus.append(gate_plus)
+
+    logical_ops_zero = LogicalOp(gate_zero.final_instr().final_logical_ops[0]['Z'])
+    logical_ops_plus = LogicalOp(gate_plus.final_instr().final_logical_ops[0]['X'])
 
-    logical_ops_zero = qecc.instruction('instr_init_zero').logical_stabs[0]['Z']
-    logical_ops_plus = qecc.instruction('instr_init_plus').logical_stabs[0]['X']
+    # Prepares ideal logical |0> and |+> (only simulated once if the simulator supports snapshots)
+    prepare0 = ideal_state_preparer(state_sim, qecc.num_qudits, circuit_runner, initzero)
+    prepare1 = ideal_state_preparer(state_sim, qecc.num_qudits, circuit_runner, initplus)
 
     num_failure = 0
 
     for _ in range(runs):
-        # States
-        state0 = state_sim(qecc.num_qudits)
-        state1 = state_sim(qecc.num_qudits)
-
-        # state0 = circuit_runner.init(qecc.num_qudits, simulator=state_sim)
-        # state1 = circuit_runner.init(qecc.num_qudits, simulator=state_sim)
-
         # Create ideal logical |0>
-        circuit_runner.run(state0, initzero)
-        try:
-            total_time += circuit_runner.total_time
-        except AttributeError:
-            pass
+        state0, init_time = prepare0()
+        total_time += init_time
 
         # Create ideal logical |+>
-        circuit_runner.run(state1, initplus)
-        try:
-            total_time += circuit_runner.total_time
-        except AttributeError:
-            pass
+        state1, init_time = prepare1()
+        total_time += init_time
 
         output, error_circuits = circuit_runner.run(state0, syn_extract, error_gen=error_gen,
                                                     error_params=error_params)
         try:
-            total_time += circuit_runner.total_time
+            total_time += circuit_runner.last_time
         except AttributeError:
             pass
 
@@ -392,7 +446,7 @@ def codecapacity_logical_rate2(runs, qecc, distance, error_gen, error_params, de
 
         circuit_runner.run(state1, syn_extract, error_circuits=error_circuits)
         try:
-            total_time += circuit_runner.total_time
+            total_time += circuit_runner.last_time
         except AttributeError:
             pass
 
@@ -405,12 +459,12 @@ def codecapacity_logical_rate2(runs, qecc, distance, error_gen, error_params, de
 
             circuit_runner.run(state0, recovery)
             try:
-                total_time += circuit_runner.total_time
+                total_time += circuit_runner.last_time
             except AttributeError:
                 pass
             circuit_runner.run(state1, recovery)
             try:
-                total_time += circuit_runner.total_time
+                total_time += circuit_runner.last_time
             except AttributeError:
                 pass
 
@@ -470,10 +524,16 @@ def codecapacity_logical_rate3(runs, qecc, distance, error_gen, error_params, de
     p = error_params['p']
     total_time = 0.0
 
+    if state_sim is None:
+        state_sim = pySparseSim
+
     # Circuit simulator
     if circuit_runner is None:
         circuit_runner = circuit_runners.TimingRunner(seed=seed)
 
+    # Ideal initialization gate (only known if the init circuit is made here)
+    gate = None
+
     if init_circuit is None:
         # init circuit
         init_circuit = circuits.LogicalCircuit(supress_warning=True)
@@ -493,9 +553,7 @@ def codecapacity_logical_rate3(runs, qecc, distance, error_gen, error_params, de
         # logical_ops = qecc.instruction('instr_syn_extract').final_logical_ops[0]
         ## logical_ops = qecc.instruction('instr_init_zero').logical_stabs[0]
 
-        if init_circuit is None:
-
-            gate = qecc.gate('ideal init %s' % basis)
+        if gate is not None:
 
             # if len(gate.final_logical_stabs()) != 1:
             #    raise Exception('This tool expects a code that stores one logical qubit.')
@@ -516,34 +574,32 @@ def codecapacity_logical_rate3(runs, qecc, distance, error_gen, error_params, de
     else:
         logical_ops = init_logical_ops
 
+    # Compiled once since the sign is checked after every syndrome extraction
+    logical_ops = LogicalOp.compile(logical_ops)
+
     # Syndrome extraction
     syn_extract = circuits.LogicalCircuit(supress_warning=True)
     syn_extract.append(qecc.gate('I', num_syn_extract=1))
 
     # logical_ops = qecc.instruction('instr_syn_extract').final_logical_ops[0]
 
+    # Prepares the ideal logical state (only simulated once if the simulator supports snapshots)
+    prepare = ideal_state_preparer(state_sim, qecc.num_qudits, circuit_runner, init_circuit)
+
     run_durations = []
 
     for _ in range(runs):
 
-        # State
-        state = state_sim(qecc.num_qudits)
-
-        # state = circuit_runner.init(qecc.num_qudits, simulator=state_sim)
-
         # Create ideal logical |0>
-        circuit_runner.run(state, init_circuit)
-        try:
-            total_time += circuit_runner.total_time
-        except AttributeError:
-            pass
+        state, init_time = prepare()
+        total_time += init_time
 
-        for duration in range(max_syn_extract):
+        for duration in range(int(max_syn_extract)):
 
             # Run syndrome extraction
             output, _ = circuit_runner.run(state, syn_extract, error_gen=error_gen, error_params=error_params)
             try:
-                total_time += circuit_runner.total_time
+                total_time += circuit_runner.last_time
             except AttributeError:
                 pass
 
@@ -556,7 +612,7 @@ def codecapacity_logical_rate3(runs, qecc, distance, error_gen, error_params, de
                 # Apply recovery operation
                 circuit_runner.run(state, recovery)
                 try:
-                    total_time += circuit_runner.total_time
+                    total_time += circuit_runner.last_time
                 except AttributeError:
                     pass
 
@@ -588,3 +644,120 @@ def codecapacity_logical_rate3(runs, qecc, distance, error_gen, error_params, de
         print('\nplog/p = %s' % r)
 
     return logical_rate, total_time
+
+
+def codecapacity_logical_rate_frames(runs, qecc, distance, error_gen, error_params, decoder, seed=None, state_sim=None,
+                                     verbose=True, circuit_runner=None, basis=None):
+    """
+    A tool for determining the code-capacity logical-error rate for syndrome extraction.
+
+    This gives the same estimate as ``codecapacity_logical_rate``; however, the ideal logical state is only prepared
+    once and all the runs are simulated together as Pauli frames with ``circuit_runners.FrameSampler``. Decoding is done
+    once per distinct syndrome.
+
+    With ``basis='both'``, a run fails if either the logical Z or X operator is flipped, as for
+    ``codecapacity_logical_rate2``. The syndrome measurements of an ideal code state are deterministic, so the frames are
+    not randomized and the same frames (the errors times their recovery) are checked against the logical operators of
+    both bases.
+
+    Args:
+        runs: Number of runs to evaluate the logical error rate.
+        qecc:
+        distance:
+        error_gen:
+        error_params:
+        decoder:
+        seed:
+        state_sim:
+        verbose:
+        circuit_runner: Runner used for the ideal initialization.
+        basis: 'zero' (or None), 'plus', or 'both'.
+
+    Returns:
+
+    """
+
+    p = error_params['p']
+
+    if state_sim is None:
+        state_sim = pySparseSim
+
+    if circuit_runner is None:
+        circuit_runner = circuit_runners.Standard(seed=seed)
+
+    sampler = circuit_runners.FrameSampler(seed=seed)
+
+    # Syndrome extraction
+    syn_extract = circuits.LogicalCircuit(supress_warning=True)
+    syn_extract.append(qecc.gate('I', num_syn_extract=1))
+
+    # Choosing basis
+    if basis is None or basis == 'zero':
+        bases = ['|0>']
+    elif basis == 'plus':
+        bases = ['|+>']
+    elif basis == 'both':
+        bases = ['|0>', '|+>']
+    else:
+        raise Exception('Basis must be "zero", "plus", "both", "None"!')
+
+    # init circuit of the first basis and the logical operators checked
+    initzero = circuits.LogicalCircuit(supress_warning=True)
+    logical_circs = []
+
+    for basis in bases:
+        gate = qecc.gate('ideal init %s' % basis)
+
+        if not logical_circs:
+            initzero.append(gate)
+
+        logical_circ_dict = gate.final_instr().final_logical_ops
+        logical_ops_sym = gate.final_instr().logical_stabilizers
+
+        if len(logical_circ_dict) != 1:
+            raise Exception('This tool expects a code that stores one logical qubit.')
+
+        logical_circs.append(logical_circ_dict[0][logical_ops_sym[0]])
+
+    ti = default_timer()
+
+    # Create ideal logical state
+    state = state_sim(qecc.num_qudits)
+    circuit_runner.run(state, initzero)
+
+    outcomes, frames = sampler.run(state, syn_extract, shots=runs, error_gen=error_gen, error_params=error_params,
+                                   randomize=len(bases) == 1)
+
+    # Decode each distinct syndrome once.
+    _, first_shots, syndrome_ids = np.unique(outcomes, axis=0, return_index=True, return_inverse=True)
+    syndrome_ids = np.ravel(syndrome_ids)
+
+    for i, shot in enumerate(first_shots):
+
+        output = sampler.shot_output(outcomes, shot)
+
+        if output:
+
+            # Recovery operation
+            recovery = decoder.decode(output)
+
+            # Apply recovery operation
+            frames.add_faults(recovery, shots=np.flatnonzero(syndrome_ids == i))
+
+    # A run fails if any of the logical operators is flipped.
+    num_failure = int(np.any(frames.logical_signs(logical_circs), axis=0).sum())
+
+    total_time = default_timer() - ti
+
+    logical_rate = float(num_failure) / float(runs)
+
+    if verbose:
+        print('\ndistance = %s' % distance)
+        print('p = %s' % p)
+        print('runs = %s' % runs)
+
+        print('\nlogical error rate: %s' % logical_rate)
+        r = float(logical_rate)/float(p)
+        print('\nplog/p = %s' % r)
+
+    return logical_rate, total_time
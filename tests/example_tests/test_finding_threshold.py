@@ -14,6 +14,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from time import perf_counter
 import numpy as np
 import pecos as pc
 from pecos.misc.threshold_curve import func
@@ -48,3 +49,51 @@ def test_finding_threshold():
         pc.misc.threshold_fit(plist, dlist, plog, func, p0, maxfev=1000)
     except RuntimeError:
         pass
+
+
+def test_runtime_matches_wall_time():
+    """
+    The runtime returned by the threshold tools should be the sum of the times of the runs, which can not be more than
+    the wall-clock time.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=5)
+    depolar = pc.error_gens.DepolarGen(model_level='code_capacity')
+    mwpm2d = pc.decoders.MWPM2D(surface)
+
+    for tool in (pc.tools.codecapacity_logical_rate, pc.tools.codecapacity_logical_rate2,
+                 pc.tools.codecapacity_logical_rate3):
+        ti = perf_counter()
+        _, runtime = tool(50, surface, 5, depolar, error_params={'p': 0.1}, decoder=mwpm2d, verbose=False)
+        wall_time = perf_counter() - ti
+
+        assert 0.0 < runtime <= wall_time
+
+
+def test_frames_both_bases():
+    """
+    Sampling the runs as Pauli frames with ``basis='both'`` should estimate the same logical error rate as
+    ``codecapacity_logical_rate2`` and be accepted by ``threshold_code_capacity`` with ``mode=3``.
+    """
+
+    from pecos.tools.threshold_tools import codecapacity_logical_rate_frames
+
+    np.random.seed(4)
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    depolar = pc.error_gens.DepolarGen(model_level='code_capacity')
+    mwpm2d = pc.decoders.MWPM2D(surface)
+
+    frames_rate, _ = codecapacity_logical_rate_frames(4000, surface, 3, depolar, error_params={'p': 0.1},
+                                                      decoder=mwpm2d, basis='both', verbose=False)
+    zero_rate, _ = codecapacity_logical_rate_frames(4000, surface, 3, depolar, error_params={'p': 0.1},
+                                                    decoder=mwpm2d, basis='zero', verbose=False)
+    rate, _ = pc.tools.codecapacity_logical_rate2(1000, surface, 3, depolar, error_params={'p': 0.1}, decoder=mwpm2d,
+                                                  verbose=False)
+
+    assert frames_rate > zero_rate
+    assert abs(frames_rate - rate) < 5 * np.sqrt(rate * (1 - rate) / 1000)
+
+    results = pc.tools.threshold_code_capacity(pc.qeccs.Surface4444, depolar, pc.decoders.MWPM2D, ps=[0.1], ds=[3],
+                                               runs=100, mode=3, basis='both')
+    assert len(results['p_logical']) == 1
@@ -0,0 +1,134 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+from pecos.circuits import QuantumCircuit
+from pecos.simulators import pySparseSim, BitSetSim
+from pecos.simulators._bitsetsim import bindings
+
+one_qubit = ['I', 'X', 'Y', 'Z', 'Q', 'Qd', 'R', 'Rd', 'S', 'Sd', 'H', 'H2', 'H3', 'H4', 'H5', 'H6',
+             'F1', 'F1d', 'F2', 'F2d', 'F3', 'F3d', 'F4', 'F4d']
+two_qubit = ['CNOT', 'CZ', 'CY', 'SWAP', 'G', 'SqrtXX']
+measurements = ['measure X', 'measure Y', 'measure Z']
+
+
+def random_circuit(rng, num_qubits, depth):
+
+    gates = []
+    for _ in range(depth):
+        r = rng.rand()
+        if r < 0.4:
+            q1, q2 = rng.choice(num_qubits, 2, replace=False)
+            gates.append((two_qubit[rng.randint(len(two_qubit))], (int(q1), int(q2)), {}))
+        elif r < 0.5:
+            gates.append((measurements[rng.randint(3)], int(rng.randint(num_qubits)),
+                          {'forced_outcome': int(rng.randint(2))}))
+        else:
+            gates.append((one_qubit[rng.randint(len(one_qubit))], int(rng.randint(num_qubits)), {}))
+
+    return gates
+
+
+def test_bindings():
+    """
+    Test that all the gates of the sparse simulator are bound.
+    """
+
+    assert set(bindings.gate_dict) == set(pySparseSim(1).bindings)
+
+
+def test_matches_sparse_sim():
+    """
+    Test that the measurement outcomes and stabilizers agree with ``pySparseSim`` on random circuits.
+    """
+
+    rng = np.random.RandomState(0)
+
+    for _ in range(50):
+        num_qubits = int(rng.randint(2, 8))
+
+        state = BitSetSim(num_qubits)
+        sparse_state = pySparseSim(num_qubits)
+
+        for symbol, location, params in random_circuit(rng, num_qubits, 40):
+            assert state.run_gate(symbol, {location}, **params) == sparse_state.run_gate(symbol, {location}, **params)
+
+        for q in range(num_qubits):
+            basis = measurements[rng.randint(3)]
+            outcome = int(rng.randint(2))
+
+            assert (state.run_gate(basis, {q}, forced_outcome=outcome) ==
+                    sparse_state.run_gate(basis, {q}, forced_outcome=outcome))
+
+        assert state.stabs.print_tableau(verbose=False) == sparse_state.stabs.print_tableau(verbose=False)
+
+
+def test_find_stab_refactor():
+    """
+    Test making a stabilizer of the state one of its generators.
+    """
+
+    state = BitSetSim(3)
+    state.run_gate('H', {0})
+    state.run_gate('CNOT', {(0, 1)})
+    state.run_gate('CNOT', {(1, 2)})
+    state.run_gate('X', {2})
+
+    # -ZIZ is in the stabilizer group but is not a generator.
+    assert state.stabs.print_tableau(verbose=False) == ['  XXX', '  ZZI', ' -IZZ']
+    assert not state.find_stab({1}, {1})[0]
+
+    found, antidestabs = state.find_stab(set(), {0, 2})
+    assert found
+    assert antidestabs == {1, 2}
+
+    found, new_stab = state.refactor(set(), {0, 2}, prefer=[2])
+    assert found
+    assert new_stab == 2
+    assert state.stabs.print_tableau(verbose=False) == ['  XXX', '  ZZI', ' -ZIZ']
+    assert state.logical_sign(QuantumCircuit([{'Z': {0, 2}}])) == 1
+
+    # The destabilizers are updated to still pair up with the stabilizers.
+    assert state.print_tableau(state.destabs, verbose=False, print_signs=False) == ['  ZII', '  IXI', '  IIX']
+
+
+def test_lazy_rows():
+    """
+    Test that the rows left out of sync by the gates are synced when read, including after copying the state.
+    """
+
+    rng = np.random.RandomState(1)
+    num_qubits = 6
+
+    state = BitSetSim(num_qubits)
+    sparse_state = pySparseSim(num_qubits)
+
+    for symbol, location, params in random_circuit(rng, num_qubits, 60):
+        if not symbol.startswith('measure'):
+            state.run_gate(symbol, {location}, **params)
+            sparse_state.run_gate(symbol, {location}, **params)
+
+    assert state.stabs.stale_x or state.stabs.stale_z
+
+    copy = state.copy()
+    assert copy.to_bytes() == state.to_bytes() == sparse_state.to_bytes()
+
+    assert not state.stabs.stale_x and not state.stabs.stale_z
+
+    for sim in (state, copy):
+        assert sim.stabs.print_tableau(verbose=False) == sparse_state.stabs.print_tableau(verbose=False)
+        assert (sim.print_tableau(sim.destabs, verbose=False, print_signs=False) ==
+                sparse_state.print_tableau(sparse_state.destabs, verbose=False, print_signs=False))
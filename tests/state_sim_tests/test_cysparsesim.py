@@ -0,0 +1,91 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+import pytest
+
+cysparsesim = pytest.importorskip('pecos.simulators._cysparsesim')
+
+
+def test_run_gates_matches_bindings():
+    """
+    Test that the C++ loop of ``run_gates`` gives the same state as applying the bindings one location at a time.
+    """
+
+    state = cysparsesim.SparseSim(4)
+    state_ref = cysparsesim.SparseSim(4)
+
+    circuit = [
+        ('init |+>', [0, 2]),
+        ('F1', [1, 3]),
+        ('CNOT', [(0, 1), (2, 3)]),
+        ('SqrtXX', [(1, 2)]),
+        ('CZ', [(3, 0)]),
+        ('H5', [2]),
+    ]
+
+    for symbol, locations in circuit:
+        state.run_gates(symbol, locations)
+
+        for location in locations:
+            state_ref.bindings[symbol](state_ref, location)
+
+    assert state.stabs == state_ref.stabs
+    assert state.destabs == state_ref.destabs
+    assert state.signs_minus == state_ref.signs_minus
+    assert state.signs_i == state_ref.signs_i
+
+
+def test_run_gates_measure():
+    """
+    Test that measurement outcomes are returned as an array in the order of the locations.
+    """
+
+    state = cysparsesim.SparseSim(4)
+    state.run_gates('X', np.array([1, 3]))
+
+    results = state.run_gates('measure Z', np.array([3, 2, 1, 0]))
+    assert results.tolist() == [1, 0, 1, 0]
+
+    state.run_gates('H', [0])
+    assert state.run_gates('measure Z', [0], forced_outcome=1).tolist() == [1]
+
+    # ``run_gate`` keeps returning the dictionary of non-zero results.
+    assert state.run_gate('measure Z', {0, 1, 2}) == {0: 1, 1: 1}
+
+
+def test_set_container():
+    """
+    Test that the generators are converted to Python sets whatever container the extension was built with.
+    """
+
+    assert cysparsesim.cysparsesim.int_set_type in {'hash', 'sorted', 'bitset', 'hybrid'}
+
+    state = cysparsesim.SparseSim(3)
+    state.run_gates('H', [0])
+    state.run_gates('CNOT', [(0, 1), (0, 2)])
+    state.run_gates('S', [1])
+
+    assert state.stabs['row_x'] == [{0, 1, 2}, set(), set()]
+    assert state.stabs['row_z'] == [{1}, {0, 1}, {0, 2}]
+    assert state.stabs['col_z'] == [{1, 2}, {0, 1}, {2}]
+    assert state.signs_i == {0}
+    assert state.get_largest_degree()['size_stabs_row_x'] == [3, 0, 0]
+
+    new = cysparsesim.SparseSim(3)
+    new.set_stabs_destabs(state.stabs['row_x'], state.stabs['row_z'], state.destabs['row_x'], state.destabs['row_z'])
+    assert new.stabs == state.stabs
+    assert new.destabs == state.destabs
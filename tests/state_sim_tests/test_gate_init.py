@@ -14,9 +14,9 @@
 #   limitations under the License.
 #  =========================================================================  #
 
-from pecos.simulators import pySparseSim
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim
 
-states = [pySparseSim, ]
+states = [pySparseSim, PackedTableauSim, BitSetSim]
 
 
 def test_init_zero():
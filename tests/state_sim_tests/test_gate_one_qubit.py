@@ -18,9 +18,9 @@
 Test all one-qubit gates.
 """
 
-from pecos.simulators import pySparseSim
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim
 
-states = [pySparseSim, ]
+states = [pySparseSim, PackedTableauSim, BitSetSim]
 
 
 def gate_test(gate_symbol, stab_dict):
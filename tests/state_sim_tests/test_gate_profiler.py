@@ -0,0 +1,58 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import json
+from itertools import count
+from pecos.circuits import QuantumCircuit
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim, SparseSim, GateProfiler
+
+states = [pySparseSim, PackedTableauSim, BitSetSim, SparseSim]
+
+
+def test_profiler():
+
+    qc = QuantumCircuit()
+    qc.append({'H': {0, 1, 2}})
+    qc.append({'CNOT': {(0, 3), (1, 4)}, 'S': {2}})
+    qc.append({'H': {3}})
+    qc.append('measure Z', {0, 1, 2, 3, 4}, forced_outcome=0)
+
+    for State in states:
+
+        # Each call of the timer advances by one second.
+        ticks = count()
+        profiler = GateProfiler(timer=lambda: float(next(ticks)))
+
+        state = State(5)
+        assert state.profiler is None
+
+        profiler.attach(state)
+        for tick in range(len(qc)):
+            state.run_circuit(qc[tick])
+
+        data = json.loads(profiler.to_json())
+
+        assert data['circuits']['calls'] == 4
+        assert set(data['gates']) == {'H', 'CNOT', 'S', 'measure Z'}
+        assert data['gates']['H']['calls'] == 2
+        assert data['gates']['H']['locations'] == 4
+        assert data['gates']['H']['locations_histogram'] == {'1': 1, '3': 1}
+        assert data['gates']['H']['total_time'] == 2.0
+        assert data['gates']['CNOT']['percentiles']['50'] == 1.0
+
+        GateProfiler.detach(state)
+        state.run_gate('X', {0})
+        assert 'X' not in profiler.to_dict()['gates']
@@ -0,0 +1,147 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+from pecos.circuits import QuantumCircuit
+from pecos.simulators import pySparseSim, PackedTableauSim, GraphSim
+from pecos.simulators._graphsim import bindings
+
+one_qubit = ['I', 'X', 'Y', 'Z', 'Q', 'Qd', 'R', 'Rd', 'S', 'Sd', 'H', 'H2', 'H3', 'H4', 'H5', 'H6',
+             'F1', 'F1d', 'F2', 'F2d', 'F3', 'F3d', 'F4', 'F4d']
+two_qubit = ['CNOT', 'CZ', 'CY', 'SWAP', 'G', 'SqrtXX']
+measurements = ['measure X', 'measure Y', 'measure Z']
+inits = ['init |0>', 'init |1>', 'init |+>', 'init |->', 'init |+i>', 'init |-i>']
+
+
+def random_circuit(rng, num_qubits, depth):
+
+    gates = []
+    for _ in range(depth):
+        r = rng.rand()
+        if r < 0.4:
+            q1, q2 = rng.choice(num_qubits, 2, replace=False)
+            gates.append((two_qubit[rng.randint(len(two_qubit))], (int(q1), int(q2)), {}))
+        elif r < 0.5:
+            params = {'forced_outcome': int(rng.randint(2))} if rng.rand() < 0.5 else {}
+            gates.append((measurements[rng.randint(3)], int(rng.randint(num_qubits)), params))
+        elif r < 0.55:
+            gates.append((inits[rng.randint(len(inits))], int(rng.randint(num_qubits)), {}))
+        else:
+            gates.append((one_qubit[rng.randint(len(one_qubit))], int(rng.randint(num_qubits)), {}))
+
+    return gates
+
+
+def stabilizer_circuits(state):
+    """
+    Returns the stabilizer generators of a tableau simulator as single tick circuits.
+    """
+
+    circuits = []
+    for stab in state.stabs.print_tableau(verbose=False):
+        circuit = QuantumCircuit(1)
+        for q, pauli in enumerate(stab[2:]):
+            if pauli != 'I':
+                circuit.update({'Y' if pauli == 'W' else pauli: {q}})
+
+        circuits.append(circuit)
+
+    return circuits
+
+
+def test_bindings():
+    """
+    Test that all the gates of the sparse simulator are bound.
+    """
+
+    assert set(bindings.gate_dict) == set(pySparseSim(1).bindings)
+
+
+def test_matches_tableau_sim():
+    """
+    Test that the measurement outcomes (random ones drawn with the same seed) and the signs of the stabilizers agree
+    with ``PackedTableauSim`` on random circuits.
+    """
+
+    rng = np.random.RandomState(0)
+
+    for _ in range(50):
+        num_qubits = int(rng.randint(2, 12))
+
+        state = GraphSim(num_qubits)
+        tableau_state = PackedTableauSim(num_qubits)
+
+        for symbol, location, params in random_circuit(rng, num_qubits, 80):
+            seed = int(rng.randint(2 ** 31))
+
+            np.random.seed(seed)
+            results = state.run_gate(symbol, {location}, **params)
+
+            np.random.seed(seed)
+            assert results == tableau_state.run_gate(symbol, {location}, **params)
+
+        for q in range(num_qubits):
+            assert q not in state.adj[q]
+            assert all(q in state.adj[b] for b in state.adj[q])
+
+        for logical_op in stabilizer_circuits(tableau_state):
+            assert state.logical_sign(logical_op) == tableau_state.logical_sign(logical_op)
+
+
+def test_local_complement():
+    """
+    Test that local complementation changes the graph but not the state.
+    """
+
+    state = GraphSim(4)
+    state.run_gate('H', {0, 1, 2, 3})
+    state.run_gate('CZ', {(0, 1), (0, 2), (0, 3)})
+    state.run_gate('X', {2})
+
+    tableau_state = PackedTableauSim(4)
+    tableau_state.run_gate('H', {0, 1, 2, 3})
+    tableau_state.run_gate('CZ', {(0, 1), (0, 2), (0, 3)})
+    tableau_state.run_gate('X', {2})
+
+    state.local_complement(0)
+    assert state.adj == [{1, 2, 3}, {0, 2, 3}, {0, 1, 3}, {0, 1, 2}]
+
+    for logical_op in stabilizer_circuits(tableau_state):
+        assert state.logical_sign(logical_op) == tableau_state.logical_sign(logical_op)
+
+
+def test_snapshot_and_reset():
+    """
+    Test restoring a snapshot and resetting the state.
+    """
+
+    state = GraphSim(3)
+    state.run_gate('H', {0})
+    state.run_gate('CNOT', {(0, 1), })
+    state.run_gate('CNOT', {(1, 2), })
+
+    snap = state.snapshot()
+    state.run_gate('X', {0})
+    assert state.logical_sign(QuantumCircuit([{'X': {0, 1, 2}}])) == 0
+    assert state.logical_sign(QuantumCircuit([{'Z': {0, 1}}])) == 1
+
+    state.restore(snap)
+    assert state.logical_sign(QuantumCircuit([{'Z': {0, 1}}])) == 0
+
+    state.reset()
+    assert state.adj == [set(), set(), set()]
+    assert state.logical_signs([QuantumCircuit([{'Z': {q}}]) for q in range(3)]) == [0, 0, 0]
+
@@ -0,0 +1,91 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+from pecos import circuits, qeccs, circuit_runners
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim, SparseSim, PauliFaultProp, PauliFrameProp, LogicalOp
+
+states = [pySparseSim, PackedTableauSim, BitSetSim, SparseSim]
+
+
+def logical_zero(State, distance=3):
+
+    qecc = qeccs.Surface4444(distance=distance)
+
+    init = circuits.LogicalCircuit(supress_warning=True)
+    gate = qecc.gate('ideal init |0>')
+    init.append(gate)
+
+    state = State(qecc.num_qudits)
+    circuit_runners.Standard(seed=0).run(state, init)
+
+    return state, gate.final_instr().final_logical_ops[0]
+
+
+def test_compile():
+
+    logical_op = LogicalOp(circuits.QuantumCircuit([{'X': {0, 1}, 'Y': {2, }, 'Z': {3, }}]))
+
+    assert logical_op.xs == {0, 1, 2}
+    assert logical_op.zs == {2, 3}
+    assert logical_op.num_ys == 1
+    assert LogicalOp.compile(logical_op) is logical_op
+
+    mask_x, mask_z = logical_op.masks(2)
+    assert mask_x.tolist() == [7, 0]
+    assert mask_z.tolist() == [12, 0]
+
+
+def test_stabilizer_signs():
+    """
+    Test that compiled logical operators give the same signs as their circuits, individually and in batches.
+    """
+
+    for State in states:
+        state, logical_ops = logical_zero(State)
+        logical_z = LogicalOp(logical_ops['Z'])
+
+        assert state.logical_sign(logical_ops['Z']) == 0
+        assert state.logical_sign(logical_z) == 0
+
+        # Flip the logical qubit
+        for symbol, locations, _ in logical_ops['X'].items():
+            state.run_gate(symbol, locations)
+
+        assert state.logical_sign(logical_ops['Z']) == 1
+        assert state.logical_signs([logical_z, logical_ops['Z']]) == [1, 1]
+
+
+def test_propagation_signs():
+
+    _, logical_ops = logical_zero(pySparseSim)
+    logical_ops = LogicalOp.compile_all([logical_ops['X'], logical_ops['Z']])
+    qubit = min(logical_ops[0].xs & logical_ops[1].zs)
+
+    num_qubits = max(logical_ops[0].xs | logical_ops[1].zs) + 1
+
+    faults = PauliFaultProp(num_qubits)
+    faults.faults['X'].add(qubit)
+    assert faults.logical_signs(logical_ops) == [0, 1]
+
+    frames = PauliFrameProp(num_qubits, shots=70, randomize=False)
+    frames.x[qubit] = frames.shot_mask(range(0, 70, 2))
+    signs = frames.logical_signs(logical_ops)
+
+    assert signs.shape == (2, 70)
+    assert not signs[0].any()
+    assert np.array_equal(signs[1], np.arange(70) % 2 == 0)
+    assert np.array_equal(frames.logical_sign(logical_ops[1]), signs[1])
@@ -0,0 +1,81 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import pickle
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim, SparseSim, PauliFaultProp
+
+states = [pySparseSim, PackedTableauSim, BitSetSim, SparseSim]
+
+
+def prepare(State):
+
+    state = State(5)
+    state.run_gate('H', {0, 3})
+    state.run_gate('CNOT', {(0, 1), (3, 4)})
+    state.run_gate('S', {1, })
+    state.run_gate('CZ', {(1, 2), })
+    state.run_gate('Y', {4, })
+    state.run_gate('measure X', {2, }, forced_outcome=1)
+
+    return state
+
+
+def outcomes(state):
+    """
+    Forced measurements of every qubit in each basis (deterministic outcomes ignore the forced value).
+    """
+
+    results = []
+    for basis in ['measure X', 'measure Y', 'measure Z']:
+        new = state.copy()
+        results.append([new.run_gate(basis, {q, }, forced_outcome=0) for q in range(new.num_qubits)])
+
+    return results
+
+
+def test_pickle():
+    """
+    Test that pickled states are restored to the same state.
+    """
+
+    for State in states:
+        state = prepare(State)
+
+        new = pickle.loads(pickle.dumps(state))
+        assert new.to_bytes() == state.to_bytes()
+        assert outcomes(new) == outcomes(state)
+
+
+def test_from_bytes_across_simulators():
+    """
+    Test that a state serialized by one stabilizer simulator can be loaded by the others.
+    """
+
+    for State in states:
+        data = prepare(State).to_bytes()
+        expected = outcomes(State.from_bytes(data))
+
+        for OtherState in states:
+            assert outcomes(OtherState.from_bytes(data)) == expected
+
+
+def test_fault_serialization():
+
+    state = PauliFaultProp(10)
+    state.faults = {'X': {0, 9}, 'Y': {3, }, 'Z': {4, 8}}
+
+    assert PauliFaultProp.from_bytes(state.to_bytes()).faults == state.faults
+    assert pickle.loads(pickle.dumps(state)).faults == state.faults
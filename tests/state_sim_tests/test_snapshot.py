@@ -0,0 +1,135 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from pecos.circuits import QuantumCircuit
+from pecos.simulators import pySparseSim, PackedTableauSim, BitSetSim, SparseSim, PauliFaultProp
+
+states = [pySparseSim, PackedTableauSim, BitSetSim, SparseSim]
+
+
+def tableau(state):
+    """
+    String form of the stabilizers of a state (the Cython sim stores its generators as dicts).
+    """
+
+    if isinstance(state.stabs, dict):
+        return state.col_string(state.stabs)
+
+    return state.stabs.print_tableau(verbose=False)
+
+
+def bell_state(State):
+
+    state = State(3)
+    state.run_gate('init |0>', {0, 1, 2})
+    state.run_gate('H', {0, })
+    state.run_gate('CNOT', {(0, 1), })
+
+    return state
+
+
+def test_copy():
+    """
+    Test that copies are independent of the original.
+    """
+
+    for State in states:
+
+        state = bell_state(State)
+        rep = tableau(state)
+
+        new = state.copy()
+        assert tableau(new) == rep
+
+        new.run_gate('X', {2, })
+        assert tableau(state) == rep
+        assert tableau(new) != rep
+
+
+def test_snapshot_restore():
+    """
+    Test that a snapshot can be restored repeatedly.
+    """
+
+    for State in states:
+
+        state = bell_state(State)
+        rep = tableau(state)
+
+        snap = state.snapshot()
+
+        for _ in range(3):
+            state.run_gate('H', {2, })
+            state.run_gate('CNOT', {(1, 2), })
+            state.run_gate('measure Z', {0, 1, 2}, forced_outcome=1)
+            assert tableau(state) != rep
+
+            state.restore(snap)
+            assert tableau(state) == rep
+            assert tableau(snap) == rep
+
+
+def test_reset():
+    """
+    Test that reset returns a state to |0...0> after gates, restores, and deserialization.
+    """
+
+    def scramble(state):
+        state.run_gate('H', {0, 2})
+        state.run_gate('CNOT', {(0, 1), (2, 3)})
+        state.run_gate('S', {1, })
+        state.run_gate('measure X', {3, }, forced_outcome=1)
+        state.run_gate('CZ', {(1, 2), })
+
+    for State in states:
+
+        zero = tableau(State(4))
+
+        state = State(4)
+        for _ in range(2):
+            scramble(state)
+            assert tableau(state) != zero
+
+            state.reset()
+            assert tableau(state) == zero
+
+        # Gates after a reset act as they would on a new state.
+        new = State(4)
+        scramble(new)
+        scramble(state)
+        assert tableau(state) == tableau(new)
+
+        snap = new.snapshot()
+        state.reset()
+        state.restore(snap)
+        state.reset()
+        assert tableau(state) == zero
+
+        state = State.from_bytes(new.to_bytes())
+        state.reset()
+        assert tableau(state) == zero
+
+
+def test_fault_prop_reset():
+    """
+    Test that reset removes the faults of PauliFaultProp.
+    """
+
+    state = PauliFaultProp(4)
+    state.add_faults(QuantumCircuit([{'X': {0, 1}, 'Z': {2}, 'Y': {3}}]))
+    state.reset()
+
+    assert state.faults == {'X': set(), 'Y': set(), 'Z': set()}
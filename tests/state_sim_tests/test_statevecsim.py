@@ -0,0 +1,188 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import pickle
+import numpy as np
+from pecos.circuits import QuantumCircuit
+from pecos.circuit_converters.fuse_cliffords import one_qubit_cliffords
+from pecos.simulators import PackedTableauSim, StateVecSim, LogicalOp
+from pecos.simulators._statevecsim import gates_one_qubit
+
+two_qubit = ['CNOT', 'CZ', 'CY', 'SWAP', 'G', 'SqrtXX']
+measurements = ['measure X', 'measure Y', 'measure Z']
+
+paulis = {
+    'X': np.array([[0, 1], [1, 0]]),
+    'Y': np.array([[0, -1j], [1j, 0]]),
+    'Z': np.array([[1, 0], [0, -1]]),
+}
+
+
+def random_circuit(rng, num_qubits, depth):
+
+    gates = []
+    for _ in range(depth):
+        r = rng.rand()
+        if r < 0.4:
+            q1, q2 = rng.choice(num_qubits, 2, replace=False)
+            gates.append((two_qubit[rng.randint(len(two_qubit))], (int(q1), int(q2)), {}))
+        elif r < 0.5:
+            gates.append((measurements[rng.randint(3)], int(rng.randint(num_qubits)),
+                          {'forced_outcome': int(rng.randint(2))}))
+        else:
+            symbol = list(one_qubit_cliffords)[rng.randint(len(one_qubit_cliffords))]
+            gates.append((symbol, int(rng.randint(num_qubits)), {}))
+
+    return gates
+
+
+def test_one_qubit_cliffords():
+    """
+    Test that the matrix of each one-qubit Clifford conjugates X and Z as given by ``one_qubit_cliffords``.
+    """
+
+    for symbol, images in one_qubit_cliffords.items():
+        u = gates_one_qubit.matrices[symbol]
+
+        for pauli, image in zip('XZ', images):
+            sign = -1 if image[0] == '-' else 1
+            conjugated = u @ paulis[pauli] @ u.conj().T
+
+            # Equal up to the global phase of u.
+            assert np.allclose(conjugated, sign * paulis[image[1]])
+
+
+def test_matches_tableau_sim():
+    """
+    Test that the measurement outcomes and the signs of the stabilizers agree with ``PackedTableauSim`` on random
+    Clifford circuits.
+    """
+
+    rng = np.random.RandomState(0)
+
+    for _ in range(30):
+        num_qubits = int(rng.randint(2, 6))
+
+        state = StateVecSim(num_qubits)
+        tableau_state = PackedTableauSim(num_qubits)
+
+        for symbol, location, params in random_circuit(rng, num_qubits, 40):
+            assert state.run_gate(symbol, {location}, **params) == tableau_state.run_gate(symbol, {location},
+                                                                                          **params)
+
+        for stab in tableau_state.stabs.print_tableau(verbose=False):
+            logical_op = QuantumCircuit(1)
+            for q, pauli in enumerate(stab[2:]):
+                if pauli != 'I':
+                    logical_op.update({'Y' if pauli == 'W' else pauli: {q}})
+
+            assert state.logical_sign(logical_op) == tableau_state.logical_sign(logical_op)
+
+
+def test_batched_shots():
+    """
+    Test that gates act on every shot, or on the given shots, and that measurements are sampled for each shot.
+    """
+
+    np.random.seed(0)
+
+    state = StateVecSim(3, shots=1000)
+    state.run_gate('H', {0})
+    state.run_gate('CNOT', {(0, 1)})
+    state.run_gate('X', {2}, shots=[1, 5])
+
+    results = state.run_gate('measure Z', {0, 1, 2})
+
+    assert (results[0] == results[1]).all()
+    assert 300 < results[0].sum() < 700
+    assert list(np.nonzero(results[2])[0]) == [1, 5]
+
+    # The outcomes of the deterministic shots are not changed by forcing.
+    state.run_gate('H', {1})
+    x_results = state.run_gate('measure X', {1}, forced_outcome=0)
+    assert (x_results[1] == results[1]).all()
+
+    assert (state.logical_sign(QuantumCircuit([{'Z': {0}}])) == results[0]).all()
+
+
+def test_tick_of_one_qubit_gates():
+    """
+    Test that applying a one-qubit gate to all the locations of a tick at once matches applying it to each location.
+    """
+
+    rng = np.random.RandomState(0)
+    qubits = {0, 2, 3, 5}
+
+    for symbol in ['H', 'T', 'Q', 'Y']:
+        state = StateVecSim(6, shots=3)
+        state.amplitudes[:] = rng.randn(3, 2 ** 6) + 1j * rng.randn(3, 2 ** 6)
+        expected = state.copy()
+
+        state.run_gate(symbol, qubits)
+        for q in qubits:
+            expected.run_gate(symbol, {q})
+
+        assert np.allclose(state.amplitudes, expected.amplitudes)
+
+
+def test_rotations():
+    """
+    Test the non-Clifford gates.
+    """
+
+    state = StateVecSim(1)
+    state.run_gate('H', {0})
+    state.run_gate('T', {0})
+    state.run_gate('Td', {0})
+    assert state.logical_sign(QuantumCircuit([{'X': {0}}])) == 0
+
+    state.run_gate('RZ', {0}, angle=np.pi / 4)
+    state.run_gate('T', {0})
+    assert state.logical_sign(QuantumCircuit([{'Y': {0}}])) == 0
+
+    state = StateVecSim(2)
+    state.run_gate('RXX', {(0, 1)}, angle=np.pi / 3)
+    probs = state.probabilities()[0]
+    assert np.allclose(probs, [0.75, 0, 0, 0.25])
+
+
+def test_snapshot_and_serialization():
+    """
+    Test restoring snapshots and serializing the amplitudes.
+    """
+
+    state = StateVecSim(2, shots=3)
+    state.run_gate('H', {0})
+    state.run_gate('CNOT', {(0, 1)})
+    state.run_gate('S', {1}, shots=[2])
+
+    snap = state.snapshot()
+    state.run_gate('X', {0})
+    state.restore(snap)
+    assert np.allclose(state.amplitudes, snap.amplitudes)
+
+    new_state = pickle.loads(pickle.dumps(state))
+    assert new_state.shots == 3
+    assert np.allclose(new_state.amplitudes, state.amplitudes)
+
+    shot_state = StateVecSim.from_bytes(state.to_bytes(2))
+    assert np.allclose(shot_state.amplitudes[0], state.amplitudes[2])
+
+    logical_op = LogicalOp(QuantumCircuit([{'Z': {0, 1}}]))
+    assert list(state.logical_signs([logical_op])[0]) == [0, 0, 0]
+
+    state.reset()
+    assert np.allclose(state.probabilities()[:, 0], 1)
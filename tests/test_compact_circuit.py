@@ -0,0 +1,79 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+import pecos as pc
+from pecos.circuits import CompactCircuit, QuantumCircuit
+from pecos.circuit_runners import FrameSampler
+from pecos.simulators import PackedTableauSim
+
+
+def _gates(circuit):
+    """
+    The gates of each tick in a form that does not depend on the order of the locations.
+    """
+
+    return [sorted((symbol, sorted(params.items()), sorted(locations, key=str))
+                   for symbol, locations, params in circuit.items(tick=tick)) for tick in range(len(circuit))]
+
+
+def test_round_trip():
+
+    qc = QuantumCircuit(circuit_type='test')
+    qc.append({'init |0>': {0, 1, 2, 3}})
+    qc.append({'H': {0, 2}, 'X': {1}}, duration=2)
+    qc.append({})
+    qc.append({'CNOT': {(0, 1), (2, 3)}})
+    qc.append({'RZ': {0}}, angle=0.5)
+    qc.update({'RZ': {1}}, angle=0.25)
+    qc.update({'RZ': {2}}, angle=0.5)
+    qc.append({'measure Z': {0, 1, 2, 3}})
+
+    compact = CompactCircuit.from_circuit(qc)
+
+    assert len(compact) == len(qc)
+    assert compact.num_gates == 16
+    assert compact.symbols == ['init |0>', 'H', 'X', 'CNOT', 'RZ', 'measure Z']
+    assert compact.params == [{}, {'duration': 2}, {'angle': 0.5}, {'angle': 0.25}]
+    assert compact.active_qudits[3] == qc.active_qudits[3]
+    assert compact.qudits == qc.qudits
+
+    back = compact.to_circuit()
+
+    assert back.metadata == {'circuit_type': 'test'}
+    assert _gates(back) == _gates(qc)
+    assert _gates(compact) == _gates(qc)
+
+
+def test_runs_like_quantum_circuit():
+    """
+    Runners and error generators should give the same results for both forms of a circuit.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    qc = surface.instruction('instr_syn_extract').circuit
+    compact = CompactCircuit.from_circuit(qc)
+
+    depolar = pc.error_gens.DepolarGen(model_level='circuit')
+
+    outcomes = []
+    for circuit in (qc, compact):
+        sampler = FrameSampler(seed=4)
+        sampled, _ = sampler.run(PackedTableauSim(surface.num_qudits), circuit, shots=20, error_gen=depolar,
+                                 error_params={'p': 0.1})
+        outcomes.append(sampled)
+
+    assert np.array_equal(outcomes[0], outcomes[1])
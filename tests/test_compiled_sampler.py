@@ -0,0 +1,166 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+import pecos as pc
+from pecos.circuits import QuantumCircuit
+from pecos.circuit_runners import CompiledSampler, FrameSampler, Standard
+from pecos.error_gens import DepolarGen, GatewiseGen
+from pecos.simulators import SparseSim
+
+
+def test_detectors_match_standard():
+    """
+    The detector rates of a noisy surface code should agree with running the shots one by one with ``Standard``.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I', num_syn_extract=2))
+
+    depolar = DepolarGen(model_level='circuit')
+    params = {'p': 0.05}
+
+    np.random.seed(4)
+    sampler = CompiledSampler.compile(SparseSim(surface.num_qudits), logic, depolar, params)
+
+    # compare the outcome of each check between consecutive rounds
+    rounds = {}
+    for i, (_, location) in enumerate(sampler.meas_keys):
+        rounds.setdefault(location, []).append(i)
+    detectors = [(ids[0], ids[1]) for ids in rounds.values()]
+
+    compiled = sampler.sample(20000, detectors=detectors, rng=np.random.default_rng(5)).mean(axis=0)
+
+    shots = 3000
+    runner = Standard(seed=6)
+    standard = np.zeros(len(detectors))
+    for shot in range(shots):
+        output, _ = runner.run(SparseSim(surface.num_qudits), logic, error_gen=depolar, error_params=params,
+                               rng=runner.shot_rng(shot))
+        outcomes = [output.get(time, {}).get(location, 0) for time, location in sampler.meas_keys]
+        standard += [outcomes[i] ^ outcomes[j] for i, j in detectors]
+    standard /= shots
+
+    assert np.all(compiled > 0)
+    assert np.abs(compiled - standard).max() < 0.03
+
+
+def test_static_errors_match_standard():
+    """
+    Errors that always occur should flip the same measurements as when they are applied by ``Standard``.
+    """
+
+    qc = QuantumCircuit()
+    qc.append({'init |0>': {0, 1, 2}})
+    qc.append({'H': {2}})
+    qc.append({'CNOT': {(0, 1)}})
+    qc.append({'H': {2}})
+    qc.append({'measure Z': {0, 1, 2}})
+
+    errors = GatewiseGen()
+    errors.set_gate_error('H', 'X')
+    errors.set_gate_error('CNOT', [('Z', 'X')])
+
+    output, _ = Standard(seed=1).run(SparseSim(3), qc, error_gen=errors, error_params={'p': True})
+
+    sampler = CompiledSampler.compile(SparseSim(3), qc, errors, {'p': True})
+    outcomes = sampler.sample(10)
+
+    assert np.all(outcomes == [0, 1, 1])
+    assert sampler.shot_output(outcomes, 3) == output
+
+
+def test_matches_frame_sampler():
+    """
+    The detector statistics of a noisy surface code should agree with ``FrameSampler``.
+    """
+
+    np.random.seed(7)
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I', num_syn_extract=2))
+
+    depolar = DepolarGen(model_level='circuit')
+    params = {'p': 0.05}
+
+    sampler = CompiledSampler.compile(SparseSim(surface.num_qudits), logic, depolar, params)
+
+    # compare the flips of each check between consecutive rounds
+    rounds = {}
+    for i, (_, location) in enumerate(sampler.meas_keys):
+        rounds.setdefault(location, []).append(i)
+    detectors = [(ids[0], ids[1]) for ids in rounds.values()]
+
+    compiled = sampler.sample(20000, detectors=detectors).mean(axis=0)
+
+    frame_sampler = FrameSampler(seed=8)
+    outcomes, _ = frame_sampler.run(SparseSim(surface.num_qudits), logic, shots=4000, error_gen=depolar,
+                                    error_params=params)
+
+    assert frame_sampler.meas_keys == sampler.meas_keys
+
+    frames = np.array([outcomes[:, i] ^ outcomes[:, j] for i, j in detectors]).T.mean(axis=0)
+
+    assert np.all(compiled > 0)
+    assert np.abs(compiled - frames).max() < 0.04
+
+
+def test_noiseless_gives_reference():
+    np.random.seed(2)
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I'))
+    logical_ops = surface.instruction('instr_syn_extract').final_logical_ops[0]
+
+    sampler = CompiledSampler.compile(SparseSim(surface.num_qudits), logic, DepolarGen(model_level='circuit'),
+                                      {'p': 0.0}, logical_ops=[logical_ops['Z']])
+
+    outcomes, logicals = sampler.sample(50, separate_logicals=True)
+
+    # The X checks are random in the reference run, the Z checks are not
+    deterministic = outcomes.std(axis=0) == 0
+    assert np.any(deterministic)
+    assert np.all(outcomes[:, deterministic] == sampler.reference[deterministic])
+    assert not logicals.any()
+
+
+def test_rng_reproducible():
+    """
+    Shots drawn from a generator should not depend on the global state of ``np.random`` or on how they are chunked.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I'))
+
+    np.random.seed(1)
+    sampler = CompiledSampler.compile(SparseSim(surface.num_qudits), logic, DepolarGen(model_level='circuit'),
+                                      {'p': 0.05})
+
+    np.random.seed(2)
+    whole = sampler.sample(300, rng=np.random.default_rng(4))
+    np.random.seed(3)
+    chunked = sampler.sample(300, chunk_size=7, rng=np.random.default_rng(4))
+
+    assert np.array_equal(whole, chunked)
+    assert not np.array_equal(whole, sampler.sample(300, rng=np.random.default_rng(5)))
@@ -0,0 +1,196 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import pickle
+import numpy as np
+import pytest
+import pecos as pc
+from pecos.circuit_runners import Standard
+from pecos.error_gens import DepolarGen, PauliChannelGen, FaultArray, ErrorCircuits
+from pecos.simulators import pySparseSim
+
+
+def _logical_circuit():
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I', num_syn_extract=2))
+
+    return surface, logic
+
+
+def _as_sets(error_circuits):
+    """
+    Returns the errors as time => when => set of (symbol, qudit).
+    """
+
+    return {time: {when: {(symbol, q) for symbol, locations, _ in circuit.items() for q in locations}
+                   for when, circuit in errors.items()}
+            for time, errors in error_circuits.items()}
+
+
+def test_round_trip():
+    """
+    Converting generated errors to a FaultArray and back should not change them, and running the FaultArray should
+    give the same output as running the errors.
+    """
+
+    np.random.seed(4)
+
+    surface, logic = _logical_circuit()
+    runner = Standard(seed=4)
+    depolar = DepolarGen(model_level='circuit', has_idle_errors=True)
+    times = [time for _, time, _ in logic.iter_ticks()]
+
+    for _ in range(20):
+        output, error_circuits = runner.run(pySparseSim(surface.num_qudits), logic, error_gen=depolar,
+                                            error_params={'p': 0.02})
+
+        fault_array = FaultArray.from_error_circuits(error_circuits, times)
+        faults = fault_array.faults
+        assert np.all(np.diff(faults['tick']) >= 0)
+        assert _as_sets(fault_array.error_circuits()) == _as_sets(error_circuits)
+
+        output2, returned = runner.run(pySparseSim(surface.num_qudits), logic, error_circuits=fault_array)
+        assert returned is fault_array
+        assert output2 == output
+
+
+def test_fault_list_and_generators():
+    """
+    The FaultArray of a FaultList should match its ErrorCircuits, and the error generators should generate fault
+    arrays that can be run.
+    """
+
+    np.random.seed(8)
+
+    surface, logic = _logical_circuit()
+    depolar = DepolarGen(model_level='circuit', has_idle_errors=True)
+    table = depolar.fault_table(logic, {'p': 0.05})
+
+    for faults in table.sample_shots(20):
+        fault_array = faults.fault_array()
+        assert set(fault_array.times) <= set(table.times)
+        assert _as_sets(fault_array.error_circuits()) == _as_sets(faults.error_circuits())
+
+    channel_gen = PauliChannelGen({'CNOT': [0.002] * 15, 'measure Z': {'X': 0.02}, 'idle': {'Z': 0.01}})
+
+    counts = {}
+    for error_gen in (depolar, channel_gen):
+        for _ in range(5):
+            fault_array = error_gen.generate_fault_array(logic, {'p': 0.01})
+            Standard.run(pySparseSim(surface.num_qudits), logic, error_circuits=fault_array)
+
+    # The fault arrays of PauliChannelGen should have the same distribution as its errors for each tick.
+    shots = 300
+    for method in ('array', 'ticks'):
+        total = 0
+        for _ in range(shots):
+            if method == 'array':
+                total += len(channel_gen.generate_fault_array(logic, {}))
+            else:
+                _, error_circuits = Standard.run(pySparseSim(surface.num_qudits), logic, error_gen=channel_gen,
+                                                 error_params={})
+                total += sum(len(q) for errors in error_circuits.values() for circuit in errors.values()
+                             for _, q, _ in circuit.items())
+        counts[method] = total
+
+    assert abs(counts['array'] - counts['ticks']) < 5 * np.sqrt(counts['array'] + counts['ticks'])
+
+
+def test_unsupported():
+    """
+    Errors that are not one-qudit gates can not be stored, and faults at times that are not in the circuit are an error.
+    """
+
+    error_circuits = ErrorCircuits()
+    error_circuits.add_circuits(0, after_faults=pc.circuits.QuantumCircuit([{'CNOT': {(0, 1)}}]))
+
+    with pytest.raises(Exception):
+        FaultArray.from_error_circuits(error_circuits)
+
+    fault_array = FaultArray.from_paulis([5], [0, 0], [True, True], [1, 1], [1, 3])
+    assert len(fault_array) == 1 and fault_array.faults['opcode'][0] == 2
+
+    circuit = pc.circuits.QuantumCircuit([{'H': {0, 1}}])
+    with pytest.raises(Exception):
+        Standard.run(pySparseSim(2), circuit, error_circuits=fault_array)
+
+
+def test_realizations():
+    """
+    FaultArrays generated up front should be comparable, hashable, serializable, and give the same errors when replayed
+    on different logical basis-states.
+    """
+
+    np.random.seed(2)
+
+    surface, logic = _logical_circuit()
+    logic_plus = pc.circuits.LogicalCircuit()
+    logic_plus.append(surface.gate('ideal init |+>'))
+    logic_plus.append(surface.gate('I', num_syn_extract=2))
+
+    depolar = DepolarGen(model_level='circuit', has_idle_errors=True)
+    realizations = depolar.generate_fault_arrays(logic, {'p': 0.02}, 30)
+    assert len(realizations) == 30 and all(isinstance(r, FaultArray) for r in realizations)
+
+    # Number of shots with a non-trivial syndrome for each basis
+    syndromes = [0, 0]
+
+    for fault_array in realizations:
+        assert not fault_array.faults.flags.writeable
+
+        copy = FaultArray.from_bytes(fault_array.to_bytes())
+        assert copy == fault_array and hash(copy) == hash(fault_array)
+        assert pickle.loads(pickle.dumps(fault_array)) == fault_array
+        assert {fault_array: 1}[copy] == 1
+
+        # Replaying the realization on each basis should give the same output and final state as running its errors
+        # as ErrorCircuits.
+        for circuit in (logic, logic_plus):
+            results = []
+            for errors in (fault_array, fault_array.error_circuits()):
+                state = pySparseSim(surface.num_qudits)
+                output, _ = Standard.run(state, circuit, error_circuits=errors, rng=np.random.default_rng(6))
+                results.append((output, state.to_bytes()))
+
+            assert results[0] == results[1]
+            syndromes[circuit is logic] += bool(results[0][0])
+
+    assert syndromes[0] > 0 and syndromes[1] > 0
+
+    # Unused ticks are dropped, so equal errors give equal arrays.
+    assert FaultArray.from_paulis([0, 1], [1], [False], [3], [1]) == FaultArray.from_paulis([1], [0], [False], [3], [1])
+    assert FaultArray.from_paulis([0], [0], [False], [3], [1]) != FaultArray.from_paulis([0], [0], [False], [3], [2])
+
+    times = [((0, 1), 2)]
+    fault_array = FaultArray.from_paulis(times, [0], [True], [3], [3])
+    assert FaultArray.from_bytes(fault_array.to_bytes()).times == tuple(times)
+
+    with pytest.raises(Exception):
+        FaultArray.from_bytes(b'not a fault array')
+
+    # The batch of PauliChannelGen should have the same distribution as separately generated shots.
+    channel_gen = PauliChannelGen({'CNOT': [0.002] * 15, 'idle': {'Z': 0.01}})
+    batch = channel_gen.generate_fault_arrays(logic, {}, 300)
+    assert len(batch) == 300
+
+    counts = [sum(len(fault_array) for fault_array in batch),
+              sum(len(channel_gen.generate_fault_array(logic, {})) for _ in range(300))]
+    assert abs(counts[0] - counts[1]) < 5 * np.sqrt(sum(counts))
+
+    for fault_array in batch[:10]:
+        Standard.run(pySparseSim(surface.num_qudits), logic, error_circuits=fault_array)
@@ -0,0 +1,173 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from collections import Counter
+import numpy as np
+import pecos as pc
+from pecos.circuit_runners import Standard
+from pecos.error_gens import DepolarGen, GatewiseGen
+from pecos.simulators import pySparseSim
+
+
+def _error_counts(error_circuits, counts):
+    """
+    Counts each (time, before/after, Pauli, qudit) of a shot.
+    """
+
+    for time, errors in error_circuits.items():
+        for when in ('before', 'after'):
+            if when in errors:
+                for symbol, locations, _ in errors[when].items():
+                    for qudit in locations:
+                        counts[time, when, symbol, qudit] += 1
+
+
+def _logical_circuit(rounds=1):
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I', num_syn_extract=1), repeat=rounds)
+
+    return surface, logic
+
+
+def test_matches_generate_tick_errors():
+    """
+    The faults sampled from a fault table should have the same distribution as those of ``generate_tick_errors``.
+    """
+
+    np.random.seed(11)
+
+    _, logic = _logical_circuit()
+    depolar = DepolarGen(model_level='circuit', has_idle_errors=True)
+    params = {'p': 0.02}
+    shots = 3000
+
+    per_tick = Counter()
+    for _ in range(shots):
+        depolar.start(logic, params)
+        for tick_circuit, time, tick_params in logic.iter_ticks():
+            if not tick_params.get('error_free', False):
+                depolar.generate_tick_errors(tick_circuit, time, **tick_params)
+        _error_counts(depolar.error_circuits, per_tick)
+
+    table = depolar.fault_table(logic, params)
+    sampled = Counter()
+    for faults in table.sample_shots(shots):
+        _error_counts(faults.error_circuits(), sampled)
+
+    assert len(table) > 0
+
+    # Each kind of error occurs with probability of about 0.02 / 3 (or 0.02 / 15) per shot.
+    for key in set(per_tick) | set(sampled):
+        assert abs(per_tick[key] - sampled[key]) < 6 * np.sqrt(per_tick[key] + sampled[key] + 1)
+
+    assert abs(sum(per_tick.values()) - sum(sampled.values())) < 5 * np.sqrt(sum(per_tick.values()))
+
+
+def test_replay_with_standard():
+
+    surface, logic = _logical_circuit(rounds=2)
+
+    errors = GatewiseGen()
+    errors.set_gate_error('CNOT', [('X', 'Z')])
+    table = errors.fault_table(logic, {'p': True})
+
+    faults = table.sample()
+    assert len(faults) == len(table)
+
+    error_circuits = faults.error_circuits()
+    time, after, location, symbols = next(iter(faults))
+
+    assert after and symbols == ('X', 'Z')
+    assert set(location) <= error_circuits[time]['after'].active_qudits[0]
+
+    output, _ = Standard(seed=2).run(pySparseSim(surface.num_qudits), logic, error_circuits=error_circuits)
+
+    errors.start(logic, {'p': True})
+    generated, _ = Standard(seed=2).run(pySparseSim(surface.num_qudits), logic, error_gen=errors,
+                                        error_params={'p': True})
+
+    assert output == generated
+
+
+def test_geometric_sampling_is_bernoulli():
+    """
+    Geometric skip-sampling should give the same distribution of faults as deciding channel by channel: each channel
+    has a fault independently with its probability and the number of faults follows the Poisson binomial distribution.
+    """
+
+    from scipy import stats
+
+    np.random.seed(20)
+
+    qc = pc.circuits.QuantumCircuit()
+    qc.append({'H': {0, 1, 2, 3, 4, 5}})
+    qc.append({'CNOT': {(0, 1), (2, 3), (4, 5)}})
+    qc.append({'X': {0}, 'H': {1, 2, 3, 4, 5}})
+    qc.append({'CNOT': {(1, 2), (3, 4)}})
+
+    # Channels with different probabilities, including one that always has a fault.
+    errors = GatewiseGen()
+    errors.set_gate_error('H', {'X', 'Y', 'Z'}, error_param='p')
+    errors.set_gate_error('CNOT', [('X', 'I'), ('I', 'X'), ('Z', 'Z')], error_param='q')
+    errors.set_gate_error('X', 'Z', error_param='r')
+    table = errors.fault_table(qc, {'p': 0.03, 'q': 0.1, 'r': True})
+
+    probs = table.probs
+    shots = 20000
+
+    for method in ('bernoulli', 'geometric'):
+        fault_lists = table.sample_shots(shots, method=method)
+
+        # marginals of the channels
+        counts = np.bincount(np.concatenate([faults.channels for faults in fault_lists]), minlength=len(table))
+        assert np.all(np.abs(counts - shots * probs) <= 5 * np.sqrt(shots * probs * (1 - probs)) + 1e-9)
+
+        # distribution of the number of faults per shot
+        exact = np.array([1.0])
+        for prob in probs:
+            exact = np.convolve(exact, [1 - prob, prob])
+
+        observed = np.bincount([len(faults) for faults in fault_lists], minlength=len(exact))
+        bins = exact * shots >= 5
+        expected = exact[bins] / exact[bins].sum() * observed[bins].sum()
+
+        assert stats.chisquare(observed[bins], expected).pvalue > 1e-3
+
+        # The faults of each channel are equally likely.
+        choices = np.concatenate([faults.choices[faults.channels == 1] for faults in fault_lists])
+        assert stats.chisquare(np.bincount(choices, minlength=table.num_options[1])).pvalue > 1e-3
+
+
+def test_cached_table_follows_circuit_changes():
+    """
+    The fault table cached by the error generator should be created again when the circuit is changed.
+    """
+
+    qc = pc.circuits.QuantumCircuit()
+    qc.append({'X': {0}})
+
+    errors = GatewiseGen()
+    errors.set_gate_error('X', 'Z')
+
+    assert set(errors.generate_fault_array(qc, {'p': True}).faults['qudit']) == {0}
+
+    qc.append({'X': {1}})
+    assert set(errors.generate_fault_array(qc, {'p': True}).faults['qudit']) == {0, 1}
+
+    qc[1].add('X', {2})
+    assert set(errors.generate_fault_array(qc, {'p': True}).faults['qudit']) == {0, 1, 2}
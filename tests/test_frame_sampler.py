@@ -0,0 +1,175 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+import pytest
+from pecos.circuits import QuantumCircuit
+from pecos.circuit_runners import FrameSampler, Standard
+from pecos.error_gens import DepolarGen, GatewiseGen, PauliChannelGen
+from pecos.simulators import PackedTableauSim, PauliFaultProp, PauliFrameProp, pySparseSim
+
+
+def test_ghz_correlations():
+    """
+    Measurements that are random in the reference run should be random across the shots but stay correlated.
+    """
+
+    qc = QuantumCircuit()
+    qc.append({'init |0>': {0, 1, 2}})
+    qc.append({'H': {0}})
+    qc.append({'CNOT': {(0, 1)}})
+    qc.append({'CNOT': {(1, 2)}})
+    qc.append({'measure Z': {0, 1, 2}})
+
+    sampler = FrameSampler(seed=3)
+    outcomes, _ = sampler.run(PackedTableauSim(3), qc, shots=500)
+
+    assert outcomes.shape == (500, 3)
+    assert len(sampler.meas_keys) == 3
+    assert np.all(outcomes == outcomes[:, :1])
+    assert 0 < outcomes[:, 0].sum() < 500
+
+
+def test_rng_reproducible():
+    """
+    Shots sampled with a generator should not depend on the global state of ``np.random``, which is left untouched.
+    """
+
+    qc = QuantumCircuit()
+    qc.append({'init |0>': {0, 1, 2}})
+    qc.append({'H': {0}})
+    qc.append({'CNOT': {(0, 1)}})
+    qc.append({'CNOT': {(1, 2)}})
+    qc.append({'measure Z': {0, 1, 2}})
+
+    depolar = DepolarGen(model_level='circuit')
+
+    results = []
+    for seed in (1, 2):
+        np.random.seed(seed)
+        state = pySparseSim(3)
+        outcomes, _ = FrameSampler().run(state, qc, shots=200, error_gen=depolar, error_params={'p': 0.1},
+                                         rng=np.random.default_rng(9))
+        results.append(outcomes)
+
+        assert state.rng is None and depolar.rng is None
+
+    assert np.array_equal(results[0], results[1])
+    assert 0 < results[0].sum() < results[0].size
+
+
+def test_custom_error_funcs():
+    """
+    Generators whose errors are given by custom functions can not be sampled all at once and should be rejected before
+    the circuit is run, naming the generator and the gates.
+    """
+
+    def error_func(after, before, replace, location, error_params):
+        after.update('X', {location})
+
+    errors = GatewiseGen()
+    errors.set_gate_error('H', 'Z')
+    errors.set_gate_error('CNOT', error_func)
+
+    assert errors.gen.unlisted_gates() == ['CNOT']
+
+    qc = QuantumCircuit([{'H': {0}}, {'CNOT': {(0, 1)}}, {'measure Z': {0, 1}}])
+    state = pySparseSim(2)
+
+    with pytest.raises(Exception, match='GatewiseGen .* CNOT'):
+        FrameSampler().run(state, qc, shots=10, error_gen=errors, error_params={'p': 0.1},
+                           rng=np.random.default_rng(0))
+
+    assert state.rng is None and errors.rng is None
+    assert state.logical_sign(QuantumCircuit([{'Z': {0}}])) == 0
+
+
+def test_frames_match_fault_prop():
+    """
+    Propagating faults as frames should agree with PauliFaultProp shot by shot.
+    """
+
+    np.random.seed(5)
+
+    num_qubits = 5
+    shots = 70
+    gates = ['H', 'S', 'Q', 'R', 'F1', 'F2', 'H5', 'CNOT', 'CZ', 'CY', 'SWAP', 'G2', 'SqrtXX']
+
+    frames = PauliFrameProp(num_qubits, shots, randomize=False)
+    faults = [PauliFaultProp(num_qubits) for _ in range(shots)]
+
+    # Start each shot with a random Pauli on each qubit.
+    for shot, state in enumerate(faults):
+        fault = QuantumCircuit(1)
+        for q, symbol in enumerate(np.random.choice(['I', 'X', 'Y', 'Z'], num_qubits)):
+            if symbol != 'I':
+                fault.update(symbol, {q})
+
+        frames.add_faults(fault, shots=[shot])
+        state.add_faults(fault)
+
+    for _ in range(60):
+
+        symbol = np.random.choice(gates)
+        if symbol in ['CNOT', 'CZ', 'CY', 'SWAP', 'G2', 'SqrtXX']:
+            location = tuple(int(q) for q in np.random.choice(num_qubits, 2, replace=False))
+        else:
+            location = int(np.random.randint(num_qubits))
+
+        frames.run_gate(symbol, {location})
+        for state in faults:
+            state.run_gate(symbol, {location})
+
+    xs = frames.unpack(frames.x)
+    zs = frames.unpack(frames.z)
+
+    for shot, state in enumerate(faults):
+        assert set(np.flatnonzero(xs[:, shot])) == state.faults['X'] | state.faults['Y']
+        assert set(np.flatnonzero(zs[:, shot])) == state.faults['Z'] | state.faults['Y']
+
+
+def test_errors_match_standard():
+    """
+    The errors drawn for all the shots at once should flip the outcomes as often as the errors Standard generates.
+    """
+
+    np.random.seed(7)
+
+    qc = QuantumCircuit()
+    qc.append({'init |0>': {0, 1, 2}})
+    qc.append({'CNOT': {(0, 1)}})
+    qc.append({'measure Z': {0, 1, 2}})
+
+    # Errors that always occur
+    always = PauliChannelGen({'measure Z': {'X': 1.0}})
+    outcomes, _ = FrameSampler(seed=1).run(PackedTableauSim(3), qc, shots=100, error_gen=always, error_params={})
+    assert np.all(outcomes == 1)
+
+    depolar = DepolarGen(model_level='circuit')
+    shots = 2000
+
+    outcomes, _ = FrameSampler(seed=1).run(PackedTableauSim(3), qc, shots=shots, error_gen=depolar,
+                                           error_params={'p': 0.1})
+
+    standard = np.zeros(3)
+    for _ in range(shots):
+        output, _ = Standard.run(pySparseSim(3), qc, error_gen=depolar, error_params={'p': 0.1})
+        for results in output.values():
+            for q in results:
+                standard[q] += 1
+
+    rates = outcomes.mean(axis=0)
+    assert np.all(np.abs(rates - standard / shots) < 5 * np.sqrt(0.25 / shots))
@@ -0,0 +1,88 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import random
+from pecos.circuits import QuantumCircuit
+from pecos.circuit_converters import fuse_cliffords
+from pecos.circuit_converters.fuse_cliffords import one_qubit_cliffords, multiplication_table
+from pecos.circuit_runners import Standard
+from pecos.simulators import pySparseSim
+
+
+def test_multiplication_table():
+    """
+    Test that the table describes a group.
+    """
+
+    for symbol in one_qubit_cliffords:
+        assert multiplication_table['I', symbol] == symbol
+        assert multiplication_table[symbol, 'I'] == symbol
+
+        inverses = [other for other in one_qubit_cliffords if multiplication_table[symbol, other] == 'I']
+        assert len(inverses) == 1
+
+    assert multiplication_table['H', 'H'] == 'I'
+    assert multiplication_table['S', 'S'] == 'Z'
+    assert multiplication_table['S', 'Sd'] == 'I'
+
+
+def test_fuse_runs():
+
+    qc = QuantumCircuit()
+    qc.append({'H': {0, 1}, 'S': {2}})
+    qc.append({'S': {0, 1, 2}})
+    qc.append({'CNOT': {(1, 3)}, 'H': {0}})
+    qc.append({'S': {1}})
+    qc.append('measure Z', {0}, forced_outcome=0)
+
+    fused = fuse_cliffords(qc)
+
+    assert len(fused) == len(qc)
+    assert list(fused.items(tick=0)) == []
+    assert list(fused.items(tick=1)) == [('F1d', {1}, {}), ('Z', {2}, {})]
+    assert sorted(fused.items(tick=2)) == [('CNOT', {(1, 3)}, {}), ('Q', {0}, {})]
+    assert list(fused.items(tick=3)) == [('S', {1}, {})]
+    assert list(fused.items(tick=4)) == [('measure Z', {0}, {'forced_outcome': 0})]
+
+
+def test_fused_state():
+    """
+    Test that fusing does not change the state prepared by a random circuit.
+    """
+
+    rng = random.Random(0)
+    symbols = list(one_qubit_cliffords)
+
+    qc = QuantumCircuit()
+    for _ in range(40):
+        qubits = list(range(4))
+        rng.shuffle(qubits)
+
+        tick = {'CNOT': {(qubits.pop(), qubits.pop())}} if rng.random() < 0.3 else {}
+        for q in qubits:
+            tick.setdefault(rng.choice(symbols), set()).add(q)
+
+        qc.append(tick)
+
+    fused = fuse_cliffords(qc)
+    assert sum(len(locations) for _, locations, _ in fused.items()) < sum(len(locations) for _, locations, _ in qc.items())
+
+    state = pySparseSim(4)
+    fused_state = pySparseSim(4)
+    Standard(seed=0).run(state, qc)
+    Standard(seed=0).run(fused_state, fused)
+
+    assert state.stabs.print_tableau(verbose=False) == fused_state.stabs.print_tableau(verbose=False)
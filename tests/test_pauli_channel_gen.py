@@ -0,0 +1,136 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from collections import Counter
+import numpy as np
+from scipy.stats import chisquare
+import pecos as pc
+from pecos.circuit_runners import Standard
+from pecos.error_gens import PauliChannelGen
+from pecos.error_gens.pauli_channel_gen import alias_table
+from pecos.misc import shot_rng
+
+
+def _tick_errors(error_gen, circuit, error_params, shots):
+    """
+    Counts the Pauli (or pair of Paulis) applied to each location over many shots.
+    """
+
+    counts = Counter()
+    for _ in range(shots):
+        error_gen.start(circuit, error_params)
+        for tick_circuit, time, params in circuit.iter_ticks():
+            error_gen.generate_tick_errors(tick_circuit, time, **params)
+
+        for time, errors in error_gen.error_circuits.items():
+            for when, error_circuit in errors.items():
+                paulis = {}
+                for symbol, locations, _ in error_circuit.items():
+                    for qudit in locations:
+                        paulis[qudit] = symbol
+
+                for symbol, locations, _ in circuit.items(tick=time):
+                    for location in locations:
+                        qudits = location if isinstance(location, tuple) else (location, )
+                        key = tuple(paulis.get(q, 'I') for q in qudits)
+                        if set(key) != {'I'}:
+                            counts[symbol, when, key] += 1
+
+    return counts
+
+
+def test_alias_table():
+    """
+    The alias table should give each outcome its probability.
+    """
+
+    probs = np.array([0.5, 0.01, 0.3, 0.0, 0.19])
+    accept, alias = alias_table(probs)
+    n = len(probs)
+
+    implied = accept / n
+    for column in range(n):
+        implied[alias[column]] += (1.0 - accept[column]) / n
+
+    assert np.allclose(implied, probs)
+
+
+def test_channel_distributions():
+    """
+    The errors of each gate should follow its channel.
+    """
+
+    np.random.seed(2)
+
+    one_qubit = {'X': 0.05, 'Y': 0.01, 'Z': 0.2}
+    two_qubit = np.random.random(15)
+    two_qubit *= 0.3 / two_qubit.sum()
+
+    error_gen = PauliChannelGen({'H': one_qubit, 'measure Z': [0.1, 0.0, 0.0]})
+    error_gen.set_channel('CNOT', two_qubit, error_param='p')
+
+    circuit = pc.circuits.QuantumCircuit()
+    circuit.append('H', set(range(40)))
+    circuit.append('CNOT', {(2 * i, 2 * i + 1) for i in range(20)})
+    circuit.append('measure Z', set(range(40)))
+
+    shots = 500
+    counts = _tick_errors(error_gen, circuit, {'p': 0.3}, shots)
+
+    # A measurement only has X errors before it.
+    assert {key for key in counts if key[0] == 'measure Z'} == {('measure Z', 'before', ('X', ))}
+    assert abs(counts['measure Z', 'before', ('X', )] - 0.1 * 40 * shots) < 5 * np.sqrt(0.1 * 40 * shots)
+
+    observed = [counts['H', 'after', (p, )] for p in 'XYZ']
+    probs = np.array([0.05, 0.01, 0.2])
+    observed.append(40 * shots - sum(observed))
+    expected = 40 * shots * np.append(probs, 1 - probs.sum())
+    assert chisquare(observed, expected).pvalue > 1e-4
+
+    observed = [counts['CNOT', 'after', paulis] for paulis in PauliChannelGen.two_qubit_paulis]
+    observed.append(20 * shots - sum(observed))
+    expected = 20 * shots * np.append(two_qubit, 1 - two_qubit.sum())
+    assert chisquare(observed, expected).pvalue > 1e-4
+
+
+def test_runs_with_circuit_runner():
+    """
+    Idle and data errors should be generated for logical circuits, and shots given the same random number generator
+    should have the same errors.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+    logic.append(surface.gate('I', num_syn_extract=1))
+
+    error_gen = PauliChannelGen({'idle': {'Z': 1.0}, 'data': {'X': 1.0}})
+    runner = Standard(seed=1)
+
+    _, errors = runner.run(pc.simulators.SparseSim(surface.num_qudits), logic, error_gen=error_gen, error_params={})
+
+    # At the first tick, the data qudits are idle, so their data and idle errors are multiplied together.
+    first = errors[min(errors)]['after']
+    assert list(first.items()) == [('Y', set(surface.data_qudit_set), {})]
+
+    for time, error_dict in errors.items():
+        for symbol, locations, _ in error_dict['after'].items():
+            assert symbol == 'Z' or time == min(errors)
+
+    error_gen = PauliChannelGen({'CNOT': [0.01] * 15, 'measure Z': {'X': 0.05}})
+    results = [str(runner.run(pc.simulators.SparseSim(surface.num_qudits), logic, error_gen=error_gen,
+                              error_params={}, rng=shot_rng(9, shot))[1]) for shot in (0, 1, 0)]
+    assert results[0] == results[2]
@@ -93,3 +93,92 @@ def test_quantum_circuits():
 
     assert len(qc) == 2
     assert qc.active_qudits == [{0, 1}, {0, 1}]
+
+
+def test_logical_circuit_tape():
+
+    from pecos.qeccs import Surface4444
+    from pecos.circuits import LogicalCircuit
+
+    surface = Surface4444(distance=3)
+    logic = LogicalCircuit()
+    logic.append(surface.gate('ideal init |0>'))
+
+    tape = logic.tape()
+
+    assert logic.tape() is tape
+    assert [(tick.time, tick.error_free) for tick in tape] == [(time, params.get('error_free', False))
+                                                              for _, time, params in logic.iter_ticks()]
+    assert all(tick.error_free for tick in tape)
+
+    # The tape is recomputed after a change.
+    logic.append(surface.gate('I'))
+    new_tape = logic.tape()
+
+    assert new_tape is not tape
+    assert len(new_tape) == len(list(logic.iter_ticks())) > len(tape)
+    assert not new_tape[-1].error_free
+
+    logic[1] = ({surface.gate('I', num_syn_extract=2): frozenset([None])}, {})
+    assert logic.tape() is not new_tape
+    assert len(logic.tape()) == len(list(logic.iter_ticks()))
+
+
+def test_logical_circuit_repeat():
+
+    from pecos.qeccs import Surface4444
+    from pecos.circuits import LogicalCircuit
+
+    surface = Surface4444(distance=3)
+
+    listed = LogicalCircuit()
+    listed.append(surface.gate('ideal init |0>'))
+    listed.append(surface.gate('I', num_syn_extract=3))
+
+    repeated = LogicalCircuit()
+    repeated.append(surface.gate('ideal init |0>'))
+    repeated.append(surface.gate('I', num_syn_extract=1), repeat=3)
+
+    ticks = [(str(tick_circuit), time) for tick_circuit, time, _ in listed.iter_ticks()]
+
+    assert [(str(tick_circuit), time) for tick_circuit, time, _ in repeated.iter_ticks()] == ticks
+    assert [(str(tick.tick_circuit), tick.time) for tick in repeated.tape()] == ticks
+    assert [tick.time for tick in repeated.tape()] == [repeated.tape()[i].time for i in range(len(ticks))]
+
+    # The ticks of the repeated instructions are only stored once.
+    long = LogicalCircuit()
+    long.append(surface.gate('I', num_syn_extract=1), repeat=10**6)
+    tape = long.tape()
+
+    assert len(tape.segments[0][1]) == len(surface.instruction('instr_syn_extract').circuit)
+    assert len(tape) == 10**6 * len(tape.segments[0][1])
+    assert tape[-1].time == (0, 10**6 - 1, len(tape.segments[0][1]) - 1)
+
+
+def test_idle_qudits():
+
+    qc = QuantumCircuit()
+    qc.append({'X': {0}, 'Z': {2, 3}})
+    qc.append({'CNOT': {(0, 2), (1, 3)}})
+    qc.append('H', {2})
+
+    idle = qc.idle_qudits(2)
+
+    assert idle == {0, 1, 3}
+    assert qc.idle_qudits(2) is idle
+    assert qc.idle_qudits(1) == set()
+    assert qc.active_qudits is qc.active_qudits
+
+    # Changes to the circuit or its ticks clear the cache.
+    qc.update('X', {4}, tick=0)
+    assert qc.idle_qudits(2) == {0, 1, 3, 4}
+
+    qc[2].add('X', {0})
+    assert qc.idle_qudits(2) == {1, 3, 4}
+
+    qc.discard({2}, tick=2)
+    assert qc.idle_qudits(2) == {1, 2, 3, 4}
+    assert qc.active_qudits == [{0, 2, 3, 4}, {0, 1, 2, 3}, {0}]
+
+    qc.append('H', {5})
+    assert qc.idle_qudits(2) == {1, 2, 3, 4, 5}
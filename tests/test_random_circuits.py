@@ -16,6 +16,8 @@
 
 import numpy as np
 from pecos.simulators import SparseSim as state_sparse
+from pecos.simulators import PackedTableauSim, BitSetSim, GraphSim, pySparseSim
+from pecos.tools.random_circuit_speed import random_circuit_speed, generate_circuits
 
 
 def test_random_circuits():
@@ -54,10 +56,29 @@ def test_random_circuits():
         pass
 
     state_sims.append(state_sparse)
+    state_sims.append(PackedTableauSim)
+    state_sims.append(BitSetSim)
+    state_sims.append(GraphSim)
 
     assert run_circuit_test(state_sims, num_qubits=10, circuit_depth=50)
 
 
+def test_random_circuit_speed():
+    """
+    Test that ``random_circuit_speed`` runs the given simulator on the generated circuits.
+    """
+
+    circuits = generate_circuits(5, 20, trials=3)
+    assert len(circuits) == 3
+    assert len(list(generate_circuits(5, 20, trials=3, iterate=True))) == 3
+
+    times, measurements, _ = random_circuit_speed(GraphSim, 5, 20, trials=3)
+    _, sparse_measurements, _ = random_circuit_speed(pySparseSim, 5, 20, trials=3)
+
+    assert len(times) == 3
+    assert [output for output, _ in measurements] == [output for output, _ in sparse_measurements]
+
+
 def run_circuit_test(state_sims, num_qubits, circuit_depth, trials=1000, gates=None):
 
     if gates is None:
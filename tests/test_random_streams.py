@@ -0,0 +1,96 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+import numpy as np
+import pytest
+import pecos as pc
+from pecos.circuit_runners import Standard
+from pecos.error_gens import DepolarGen
+from pecos.misc import shot_rng
+from pecos.simulators import SparseSim, pySparseSim, BitSetSim, GraphSim, PackedTableauSim, StateVecSim
+
+
+def _run_shots(state_sim, logic, num_qudits, shots, seed):
+    """
+    Runs each shot with its own random number generator and returns the outputs and errors by shot.
+    """
+
+    runner = Standard(seed=seed)
+    depolar = DepolarGen(model_level='circuit')
+
+    results = {}
+    for shot in shots:
+        # The global state should not matter.
+        np.random.seed(shot + 1000)
+
+        state = state_sim(num_qudits)
+        output, errors = runner.run(state, logic, error_gen=depolar, error_params={'p': 0.05},
+                                    rng=runner.shot_rng(shot))
+
+        assert state.rng is None and depolar.rng is None
+        results[shot] = (dict(output), str(errors))
+
+    return results
+
+
+@pytest.mark.parametrize('state_sim', [SparseSim, pySparseSim, BitSetSim, GraphSim, PackedTableauSim])
+def test_shots_are_reproducible(state_sim):
+    """
+    A shot should give the same output however the shots are split among runs (or workers).
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit()
+    logic.append(surface.gate('ideal init |+>'))
+    logic.append(surface.gate('I', num_syn_extract=1))
+
+    serial = _run_shots(state_sim, logic, surface.num_qudits, range(8), seed=3)
+    split = _run_shots(state_sim, logic, surface.num_qudits, [7, 5, 3, 1], seed=3)
+    split.update(_run_shots(state_sim, logic, surface.num_qudits, [6, 4, 2, 0], seed=3))
+
+    assert serial == split
+    assert len({str(result) for result in serial.values()}) > 1
+
+    assert _run_shots(state_sim, logic, surface.num_qudits, [0], seed=4)[0] != serial[0]
+
+
+@pytest.mark.parametrize('state_sim', [SparseSim, pySparseSim, BitSetSim, GraphSim, PackedTableauSim, StateVecSim])
+def test_measurements_use_rng(state_sim):
+    """
+    Random measurement outcomes should be drawn from the generator given to the runner.
+    """
+
+    circuit = pc.circuits.QuantumCircuit([{'H': set(range(12))}, {'measure Z': set(range(12))}])
+    runner = Standard(seed=0)
+
+    outputs = []
+    for seed in (5, 5, 6):
+        np.random.seed(seed + 100)
+        output, _ = runner.run(state_sim(12), circuit, rng=shot_rng(seed, 0))
+        outputs.append(str(output))
+
+    assert outputs[0] == outputs[1] != outputs[2]
+
+
+def test_shot_rng():
+    """
+    The generator of a shot should be the child of the seed spawned for it.
+    """
+
+    children = np.random.SeedSequence(12).spawn(4)
+    expected = np.random.Generator(np.random.PCG64(children[3])).random(5)
+
+    assert np.array_equal(shot_rng(12, 3).random(5), expected)
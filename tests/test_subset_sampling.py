@@ -0,0 +1,125 @@
+#  =========================================================================  #
+#   Copyright 2018 The PECOS Developers
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#  =========================================================================  #
+
+from math import comb
+import numpy as np
+import pecos as pc
+from pecos.tools import SubsetSampler, codecapacity_subset_sampler, codecapacity_logical_rate
+
+
+def test_configurations():
+    """
+    The enumerated configurations of each weight should be distinct and as many as ``num_configurations`` says.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit(supress_warning=True)
+    logic.append(surface.gate('I', num_syn_extract=1))
+
+    depolar = pc.error_gens.DepolarGen(model_level='code_capacity')
+    sampler = SubsetSampler(depolar.fault_table(logic, {'p': 0.1}), lambda faults: False)
+
+    n = sampler.num_channels
+    assert n == surface.num_data_qudits
+
+    for weight in range(3):
+        configurations = {tuple(faults) for faults in sampler.configurations(weight)}
+        assert len(configurations) == sampler.num_configurations(weight) == comb(n, weight) * 3 ** weight
+
+    for faults in sampler.sample_configurations(2, 10):
+        assert len(faults) == 2 and len(set(faults.channels.tolist())) == 2
+
+
+def test_matches_monte_carlo():
+    """
+    The logical error rate recombined from the weights should agree with plain Monte Carlo.
+    """
+
+    np.random.seed(5)
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    xgen = pc.error_gens.XGen(model_level='code_capacity')
+    decoder = pc.decoders.MWPM2D(surface)
+
+    sampler = codecapacity_subset_sampler(surface, xgen, {'p': 0.1}, decoder).run(max_weight=3, runs=400)
+
+    # A distance-3 code corrects every single fault, and the configurations up to weight 3 are enumerated.
+    assert sampler.failure_rate(0) == sampler.failure_rate(1) == 0
+    assert all(sampler.exact.values())
+
+    runs = 3000
+    p = 0.1
+    rate = sampler.logical_rate(p)
+    std_error, truncation = sampler.uncertainty(p)
+    assert std_error == 0.0
+
+    mc_rate, _ = codecapacity_logical_rate(runs, surface, 3, xgen, {'p': p}, decoder, verbose=False)
+    mc_error = np.sqrt(mc_rate * (1 - mc_rate) / runs)
+
+    assert rate - 5 * mc_error <= mc_rate <= rate + truncation + 5 * mc_error
+
+    rates = sampler.logical_rate([1e-4, 1e-3])
+    assert rates[0] < rates[1] < rate
+
+
+def test_sample_configurations_rng():
+    """
+    Configurations sampled from a generator should not depend on the global state of ``np.random``.
+    """
+
+    surface = pc.qeccs.Surface4444(distance=3)
+    logic = pc.circuits.LogicalCircuit(supress_warning=True)
+    logic.append(surface.gate('I', num_syn_extract=1))
+
+    depolar = pc.error_gens.DepolarGen(model_level='code_capacity')
+    sampler = SubsetSampler(depolar.fault_table(logic, {'p': 0.1}), lambda faults: False)
+
+    samples = []
+    for seed in (1, 2):
+        np.random.seed(seed)
+        samples.append([str(faults.error_circuits()) for faults in
+                        sampler.sample_configurations(3, 20, rng=np.random.default_rng(7))])
+
+    assert samples[0] == samples[1]
+    assert len(set(samples[0])) > 1
+
+
+def test_mixed_option_counts():
+    """
+    Enumerating a weight should weight each configuration by the probability of its faults, so that it agrees with
+    sampling when the channels have different numbers of options.
+    """
+
+    np.random.seed(3)
+
+    qc = pc.circuits.QuantumCircuit([{'H': {0}}, {'CNOT': {(0, 1)}}])
+    depolar = pc.error_gens.DepolarGen(model_level='circuit')
+    table = depolar.fault_table(qc, {'p': 0.1})
+
+    def trial(faults):
+        # Fails if a fault acts on qubit 1, which only 12 of the 15 faults of the CNOT do.
+        return any(isinstance(location, tuple) and symbols[1] != 'I' for _, _, location, symbols in faults)
+
+    exact = SubsetSampler(table, trial).run(max_weight=2, runs=10)
+    assert list(table.num_options[exact.channels]) == [3, 15]
+    assert all(exact.exact.values())
+    assert np.isclose(exact.failure_rate(1), 0.4) and np.isclose(exact.failure_rate(2), 0.8)
+
+    runs = 4000
+    for weight in (1, 2):
+        sampled = np.mean([trial(faults) for faults in exact.sample_configurations(weight, runs)])
+        rate = exact.failure_rate(weight)
+        assert abs(sampled - rate) < 5 * np.sqrt(rate * (1 - rate) / runs)